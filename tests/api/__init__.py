@@ -0,0 +1,14 @@
+"""
+__init__.py - API Package
+KosManager Automated Testing
+"""
+from .auth import AuthError, login_with_credentials, is_session_cookie
+from .client import ApiError, KosManagerClient
+
+__all__ = [
+    'AuthError',
+    'login_with_credentials',
+    'is_session_cookie',
+    'ApiError',
+    'KosManagerClient',
+]
@@ -0,0 +1,66 @@
+"""
+auth.py - NextAuth Credentials Login over HTTP
+KosManager Automated Testing
+"""
+# NextAuth v5 (Auth.js) names; v4 names kept for older deployments.
+# Large JWTs are split into chunks named "<name>.0", "<name>.1", ...
+SESSION_COOKIE_PREFIXES = (
+    "authjs.session-token",
+    "__Secure-authjs.session-token",
+    "next-auth.session-token",
+    "__Secure-next-auth.session-token",
+)
+
+
+class AuthError(RuntimeError):
+    """Raised when NextAuth rejects the credentials."""
+
+
+def is_session_cookie(name):
+    """Check whether a cookie name is a NextAuth session token (or chunk)."""
+    return name.startswith(SESSION_COOKIE_PREFIXES)
+
+
+def login_with_credentials(http, base_url, email, password):
+    """
+    Sign in through /api/auth/callback/credentials without a browser.
+
+    `http` is a requests.Session; on success it holds the session cookies.
+    Returns the cookies in Selenium's get_cookies() format.
+    """
+    csrf = http.get(f"{base_url}/api/auth/csrf", timeout=10)
+    csrf.raise_for_status()
+
+    response = http.post(
+        f"{base_url}/api/auth/callback/credentials",
+        data={
+            "email": email,
+            "password": password,
+            "csrfToken": csrf.json()["csrfToken"],
+            "callbackUrl": f"{base_url}/dashboard",
+        },
+        allow_redirects=False,
+        timeout=10,
+    )
+    cookies = [_to_selenium_cookie(cookie) for cookie in http.cookies
+               if is_session_cookie(cookie.name)]
+    if not cookies:
+        location = response.headers.get("Location", "")
+        raise AuthError(f"Login failed for {email} (status {response.status_code}, {location})")
+    return cookies
+
+
+def _to_selenium_cookie(cookie):
+    """Convert a http.cookiejar.Cookie to the dict shape Selenium uses."""
+    result = {
+        "name": cookie.name,
+        "value": cookie.value,
+        "path": cookie.path or "/",
+        "domain": cookie.domain or "",
+        "secure": bool(cookie.secure),
+        "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+    }
+    if cookie.expires:
+        result["expiry"] = int(cookie.expires)
+    return result
+
@@ -0,0 +1,201 @@
+"""
+client.py - KosManager HTTP API Client
+KosManager Automated Testing
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+from .auth import login_with_credentials
+
+
+class ApiError(RuntimeError):
+    """Raised when the API answers with an unexpected status."""
+
+    def __init__(self, method, path, status, body):
+        self.method = method
+        self.path = path
+        self.status = status
+        self.body = body
+        error = body.get("error") if isinstance(body, dict) else body
+        super().__init__(f"{method} {path} -> {status}: {error}")
+
+
+class KosManagerClient:
+    """
+    Thin client for the KosManager /api routes.
+
+    One keep-alive requests.Session is shared by every call; after
+    login() it carries the NextAuth session cookie. Properties created
+    through the client are remembered so delete_created() can remove them
+    (rooms, tenants and invoices go with them through ON DELETE CASCADE).
+    """
+
+    def __init__(self, base_url, timeout=10, pool_size=10):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self.created_property_ids = []
+        # Set by the conftest fixtures when --record-impact is on
+        self.visit_recorder = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.http.close()
+
+    # ==================== AUTH ====================
+
+    def register(self, full_name, email, password):
+        """Create a user account; returns the new user."""
+        body = self._request("POST", "/api/auth/register", json={
+            "fullName": full_name,
+            "email": email,
+            "password": password,
+            "confirmPassword": password,
+        }, expected=(201,))
+        return body["user"]
+
+    def login(self, email, password):
+        """Log in; returns the session cookies in Selenium format."""
+        return login_with_credentials(self.http, self.base_url, email, password)
+
+    # ==================== PROPERTIES ====================
+
+    def list_properties(self):
+        return self._request("GET", "/api/properties")["properties"]
+
+    def get_property(self, property_id):
+        return self._request("GET", f"/api/properties/{property_id}")["property"]
+
+    def create_property(self, name, address):
+        prop = self._request("POST", "/api/properties", json={
+            "name": name,
+            "address": address,
+        }, expected=(201,))["property"]
+        self.created_property_ids.append(prop["id"])
+        return prop
+
+    def update_property(self, property_id, name, address):
+        return self._request("PUT", f"/api/properties/{property_id}", json={
+            "name": name,
+            "address": address,
+        })["property"]
+
+    def delete_property(self, property_id):
+        self._request("DELETE", f"/api/properties/{property_id}")
+        if property_id in self.created_property_ids:
+            self.created_property_ids.remove(property_id)
+
+    # ==================== ROOMS ====================
+
+    def create_room(self, property_id, room_number, price, status="available", facilities=None):
+        return self._request("POST", f"/api/properties/{property_id}/rooms", json={
+            "roomNumber": room_number,
+            "price": price,
+            "status": status,
+            "facilities": facilities or [],
+        }, expected=(201,))["room"]
+
+    def update_room(self, room_id, room_number, price, status="available", facilities=None):
+        return self._request("PUT", f"/api/rooms/{room_id}", json={
+            "roomNumber": room_number,
+            "price": price,
+            "status": status,
+            "facilities": facilities or [],
+        })["room"]
+
+    def delete_room(self, room_id):
+        self._request("DELETE", f"/api/rooms/{room_id}")
+
+    def list_available_rooms(self):
+        return self._request("GET", "/api/rooms/available")["rooms"]
+
+    # ==================== TENANTS ====================
+
+    def list_tenants(self):
+        return self._request("GET", "/api/tenants")["tenants"]
+
+    def list_active_tenants(self):
+        return self._request("GET", "/api/tenants/active")["tenants"]
+
+    def get_tenant(self, tenant_id):
+        return self._request("GET", f"/api/tenants/{tenant_id}")
+
+    def create_tenant(self, room_id, name, phone_number, start_date, due_date, id_card_photo=None):
+        """Check a tenant into an available room (start_date: YYYY-MM-DD)."""
+        payload = {
+            "roomId": room_id,
+            "name": name,
+            "phoneNumber": phone_number,
+            "startDate": start_date,
+            "dueDate": due_date,
+        }
+        if id_card_photo:
+            payload["idCardPhoto"] = id_card_photo
+        return self._request("POST", "/api/tenants", json=payload, expected=(201,))["tenant"]
+
+    def bulk_create_tenants(self, rows):
+        """
+        Upload tenants like BulkUploadDialog does. Each row has name,
+        phoneNumber, roomNumber, startDate and dueDate (all strings).
+        Returns {"success", "failed", "errors", "message"}.
+        """
+        return self._request("POST", "/api/tenants/bulk", json={"tenants": rows})
+
+    def checkout_tenant(self, tenant_id):
+        return self._request("POST", f"/api/tenants/{tenant_id}/checkout")
+
+    def delete_tenant(self, tenant_id):
+        self._request("DELETE", f"/api/tenants/{tenant_id}")
+
+    # ==================== INVOICES ====================
+
+    def list_invoices(self):
+        return self._request("GET", "/api/invoices")["invoices"]
+
+    def create_invoice(self, tenant_id, amount, period):
+        """Create an unpaid invoice (period: YYYY-MM-01)."""
+        return self._request("POST", "/api/invoices", json={
+            "tenantId": tenant_id,
+            "amount": amount,
+            "period": period,
+        }, expected=(201,))["invoice"]
+
+    def update_invoice_status(self, invoice_id, status):
+        return self._request("PATCH", f"/api/invoices/{invoice_id}",
+                             json={"status": status})["invoice"]
+
+    def delete_invoice(self, invoice_id):
+        self._request("DELETE", f"/api/invoices/{invoice_id}")
+
+    # ==================== CLEANUP ====================
+
+    def delete_created(self):
+        """Delete every property created through this client."""
+        for property_id in list(self.created_property_ids):
+            try:
+                self.delete_property(property_id)
+            except ApiError as error:
+                if error.status != 404:
+                    raise
+                self.created_property_ids.remove(property_id)
+
+    def _request(self, method, path, expected=(200,), **kwargs):
+        if self.visit_recorder is not None:
+            self.visit_recorder.record(path)
+        response = self.http.request(method, f"{self.base_url}{path}",
+                                     timeout=self.timeout, **kwargs)
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        if response.status_code not in expected:
+            raise ApiError(method, path, response.status_code, body)
+        return body
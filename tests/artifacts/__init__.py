@@ -0,0 +1,20 @@
+"""
+__init__.py - Test Artifact Package
+KosManager Automated Testing
+"""
+from .encode import ArtifactError, encode_screenshot, optimise_png
+from .rotation import rotate_from_env, rotate_runs
+from .store import ArtifactStore, artifact_stem, get_artifact_mode
+from .writer import ArtifactWriter
+
+__all__ = [
+    'ArtifactError',
+    'encode_screenshot',
+    'optimise_png',
+    'rotate_from_env',
+    'rotate_runs',
+    'ArtifactStore',
+    'artifact_stem',
+    'get_artifact_mode',
+    'ArtifactWriter',
+]
@@ -0,0 +1,82 @@
+"""
+encode.py - Screenshot Compression (PNG re-deflate or WebP)
+KosManager Automated Testing
+"""
+import io
+import struct
+import zlib
+
+IMAGE_FORMATS = ("png", "webp")
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+WEBP_QUALITY = 80
+
+
+class ArtifactError(RuntimeError):
+    """Raised for an unusable artifact setting."""
+
+
+def _chunks(data):
+    position = len(PNG_SIGNATURE)
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        yield kind, data[position + 8:position + 8 + length]
+        position += length + 12
+
+
+def _chunk(kind, body):
+    return struct.pack(">I", len(body)) + kind + body + \
+        struct.pack(">I", zlib.crc32(kind + body) & 0xFFFFFFFF)
+
+
+def optimise_png(data, level=9):
+    """
+    Re-deflate the image data of a PNG at `level` into one IDAT chunk.
+    Lossless; Chrome encodes screenshots for speed, so this usually saves
+    a tenth or more. Returns `data` unchanged if that would not be smaller.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        raise ArtifactError("Not a PNG image")
+    chunks = list(_chunks(data))
+    pixels = zlib.decompress(b"".join(body for kind, body in chunks if kind == b"IDAT"))
+    out, idat_written = [PNG_SIGNATURE], False
+    for kind, body in chunks:
+        if kind != b"IDAT":
+            out.append(_chunk(kind, body))
+        elif not idat_written:
+            out.append(_chunk(b"IDAT", zlib.compress(pixels, level)))
+            idat_written = True
+    optimised = b"".join(out)
+    return optimised if len(optimised) < len(data) else data
+
+
+def _pillow_image():
+    try:
+        from PIL import Image
+    except ImportError as error:
+        raise ArtifactError(
+            "WebP screenshots need Pillow: pip install Pillow "
+            "(or use TEST_ARTIFACT_FORMAT=png)") from error
+    return Image
+
+
+def to_webp(data, quality=WEBP_QUALITY):
+    Image = _pillow_image()
+    output = io.BytesIO()
+    Image.open(io.BytesIO(data)).save(output, "WEBP", quality=quality, method=4)
+    return output.getvalue()
+
+
+def check_image_format(image_format):
+    """Fail fast on an unknown format or a missing encoder."""
+    if image_format not in IMAGE_FORMATS:
+        raise ArtifactError(f"Unknown screenshot format '{image_format}', use one of {IMAGE_FORMATS}")
+    if image_format == "webp":
+        _pillow_image()
+    return image_format
+
+
+def encode_screenshot(png, image_format="png"):
+    """Compressed bytes of a PNG screenshot in `image_format`."""
+    if image_format == "webp":
+        return to_webp(png)
+    return optimise_png(png)
@@ -0,0 +1,67 @@
+"""
+rotation.py - Removal of Old Run Directories by Age and Size
+KosManager Automated Testing
+"""
+import logging
+import os
+import shutil
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 500
+DEFAULT_MAX_AGE_DAYS = 7
+
+
+def directory_size(path):
+    total = 0
+    for directory, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                pass
+    return total
+
+
+def rotate_runs(runs_dir, keep=(), max_bytes=None, max_age_days=None, now=None):
+    """
+    Delete run directories under `runs_dir` (reports/runs/<run_id>/) older
+    than `max_age_days`, then the oldest ones until the rest fit in
+    `max_bytes`. Runs named in `keep` (the current run) are never removed.
+    Returns the removed run ids, oldest first.
+    """
+    if not os.path.isdir(runs_dir):
+        return []
+    now = time.time() if now is None else now
+    runs = []
+    for name in os.listdir(runs_dir):
+        path = os.path.join(runs_dir, name)
+        if os.path.isdir(path) and name not in keep:
+            runs.append((os.path.getmtime(path), name, directory_size(path)))
+    runs.sort()
+    total = sum(size for _, _, size in runs) + \
+        sum(directory_size(os.path.join(runs_dir, name)) for name in keep
+            if os.path.isdir(os.path.join(runs_dir, name)))
+
+    removed = []
+    for modified, name, size in runs:
+        too_old = max_age_days is not None and now - modified > max_age_days * 86400
+        too_big = max_bytes is not None and total > max_bytes
+        if not (too_old or too_big):
+            continue
+        shutil.rmtree(os.path.join(runs_dir, name), ignore_errors=True)
+        total -= size
+        removed.append(name)
+    if removed:
+        logger.info("Removed %d old run(s) from %s", len(removed), runs_dir)
+    return removed
+
+
+def rotate_from_env(runs_dir, keep=()):
+    """rotate_runs() with TEST_ARTIFACT_MAX_MB and TEST_ARTIFACT_MAX_AGE_DAYS (0 = no limit)."""
+    max_mb = float(os.getenv("TEST_ARTIFACT_MAX_MB", DEFAULT_MAX_MB))
+    max_age_days = float(os.getenv("TEST_ARTIFACT_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+    return rotate_runs(runs_dir, keep,
+                       max_bytes=max_mb * 1024 * 1024 if max_mb > 0 else None,
+                       max_age_days=max_age_days if max_age_days > 0 else None)
@@ -0,0 +1,133 @@
+"""
+store.py - Per-Test Failure Artifacts (Screenshot, DOM, Console Log)
+KosManager Automated Testing
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import Counter
+
+from selenium.common.exceptions import WebDriverException
+
+from .encode import check_image_format, encode_screenshot
+from .writer import ArtifactWriter
+
+logger = logging.getLogger(__name__)
+
+# failed: artifacts for failed tests; all: also after every passing test
+MODES = ("failed", "all", "off")
+STEM_LIMIT = 120
+
+
+def get_artifact_mode(name=None):
+    mode = name or os.getenv("TEST_ARTIFACTS", "failed")
+    if mode not in MODES:
+        raise ValueError(f"Unknown artifact mode '{mode}', use one of {MODES}")
+    return mode
+
+
+def artifact_stem(nodeid, limit=STEM_LIMIT):
+    """
+    File-system safe directory name for a test node id, e.g.
+    tests/test_02_authentication.py::TestLogin::test_x[a] ->
+    tests_test_02_authentication.py__TestLogin__test_x_a. Long ids keep a
+    hash suffix so two parametrizations never share a directory.
+    """
+    stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid.replace("::", "__")).strip("_")
+    if len(stem) > limit:
+        digest = hashlib.sha1(nodeid.encode("utf-8")).hexdigest()[:8]
+        stem = f"{stem[:limit - 9]}_{digest}"
+    return stem
+
+
+class ArtifactStore:
+    """
+    Screenshots, DOM snapshots and browser console logs of one worker,
+    under <root>/<test stem>/. Only taking them from the browser happens
+    on the test thread (WebDriver is not thread-safe); compressing and
+    writing go through the ArtifactWriter.
+
+    Attached to the driver as `driver.artifacts`; BasePage.take_screenshot()
+    saves through it into the directory of the running test.
+    """
+
+    def __init__(self, root, writer=None, image_format="png", mode="failed"):
+        self.root = root
+        self.writer = writer or ArtifactWriter()
+        self.image_format = check_image_format(image_format)
+        self.mode = get_artifact_mode(mode)
+        self.nodeid = None
+        self._names = Counter()
+
+    def begin(self, driver, nodeid):
+        """Start a test: drop console messages left by the previous one."""
+        self.nodeid = nodeid
+        self._console(driver)
+        return self
+
+    def wants(self, report):
+        """Capture after this report? Failed phases, or every call in 'all' mode."""
+        if self.mode == "off":
+            return False
+        return report.failed or (self.mode == "all" and report.when == "call")
+
+    def path(self, nodeid, name, extension):
+        """A new path for `name` in the test's directory (-2, -3... on repeats)."""
+        stem = artifact_stem(nodeid or "session")
+        self._names[(stem, name, extension)] += 1
+        count = self._names[(stem, name, extension)]
+        suffix = "" if count == 1 else f"-{count}"
+        return os.path.join(self.root, stem, f"{name}{suffix}.{extension}")
+
+    def capture(self, driver, nodeid, label):
+        """Queue screenshot, DOM and console log; returns {kind: path}."""
+        paths = {}
+        screenshot = self._screenshot_png(driver)
+        if screenshot is not None:
+            paths["screenshot"] = self._submit_image(nodeid, label, screenshot)
+        try:
+            url, dom = driver.current_url, driver.page_source
+        except WebDriverException as error:
+            logger.warning("Could not read the DOM for %s: %s", nodeid, error)
+        else:
+            paths["dom"] = self.writer.submit(
+                self.path(nodeid, f"{label}-dom", "html"),
+                lambda: f"<!-- {url} -->\n{dom}".encode("utf-8"))
+        console = self._console(driver)
+        paths["console"] = self.writer.submit(
+            self.path(nodeid, f"{label}-console", "json"),
+            lambda: json.dumps(console, indent=1).encode("utf-8"))
+        return paths
+
+    def screenshot(self, driver, name):
+        """Queue a named screenshot of the running test; returns its path."""
+        screenshot = self._screenshot_png(driver)
+        if screenshot is None:
+            return None
+        return self._submit_image(self.nodeid, name, screenshot)
+
+    def close(self):
+        self.writer.close()
+
+    def _submit_image(self, nodeid, name, png):
+        image_format = self.image_format
+        return self.writer.submit(self.path(nodeid, name, image_format),
+                                  lambda: encode_screenshot(png, image_format))
+
+    @staticmethod
+    def _screenshot_png(driver):
+        try:
+            return driver.get_screenshot_as_png()
+        except WebDriverException as error:
+            logger.warning("Could not take a screenshot: %s", error)
+            return None
+
+    @staticmethod
+    def _console(driver):
+        """Browser console entries since the last read (needs goog:loggingPrefs browser)."""
+        try:
+            return driver.get_log("browser")
+        except (WebDriverException, ValueError):
+            return []
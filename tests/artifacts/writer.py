@@ -0,0 +1,82 @@
+"""
+writer.py - Bounded Background Artifact Writer
+KosManager Automated Testing
+"""
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Jobs that may wait for the writer before submit() blocks the test
+DEFAULT_MAX_PENDING = 8
+
+
+class ArtifactWriter:
+    """
+    One daemon thread that encodes and writes artifacts, fed through a
+    bounded queue. The test thread only hands over the raw bytes it took
+    from the browser; compression and disk I/O happen here. When
+    `max_pending` jobs are already waiting, submit() blocks until one is
+    done, so a burst of failures cannot pile up screenshots in memory.
+    """
+
+    def __init__(self, max_pending=DEFAULT_MAX_PENDING):
+        self.jobs = queue.Queue(maxsize=max_pending)
+        self.written = 0
+        self.bytes = 0
+        self.errors = []
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+        return self
+
+    def submit(self, path, produce):
+        """Write `produce()` (bytes, called on the writer thread) to `path`."""
+        self.start()
+        self.jobs.put((path, produce))
+        return path
+
+    def flush(self):
+        """Block until every submitted artifact is on disk."""
+        if self._thread is not None:
+            self.jobs.join()
+
+    def close(self, timeout=30):
+        if self._thread is None:
+            return
+        self.jobs.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            finally:
+                self.jobs.task_done()
+
+    def _write(self, path, produce):
+        try:
+            data = produce()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Never leave a half-written file behind for the report to link
+            partial = f"{path}.part"
+            with open(partial, "wb") as handle:
+                handle.write(data)
+            os.replace(partial, path)
+        except Exception as error:  # a failed artifact must not fail the run
+            logger.warning("Could not write artifact %s: %s", path, error)
+            self.errors.append((path, error))
+            return
+        self.written += 1
+        self.bytes += len(data)
@@ -0,0 +1,50 @@
+"""
+__init__.py - Benchmark Helpers Package
+KosManager Automated Testing
+"""
+from .bulk_upload import (
+    BULK_SIZES,
+    BulkUploadReport,
+    bulk_sizes,
+    preset_for_upload,
+    request_bytes,
+    write_upload_file,
+)
+from .devices import DEVICE_MATRIX, NAV_ROUTES, DeviceReport, device_matrix
+from .export import EXPORT_FILE_PATTERN, ExportReport, export_sizes, preset_for_export
+from .network import FLOWS, THROTTLED_PROFILES, NetworkReport, network_profiles
+from .report import BenchReport
+from .scaling import (
+    INVOICE_SIZES,
+    ScalingReport,
+    growth_exponents,
+    measure,
+    preset_for_invoices,
+)
+
+__all__ = [
+    'BULK_SIZES',
+    'BulkUploadReport',
+    'bulk_sizes',
+    'preset_for_upload',
+    'request_bytes',
+    'write_upload_file',
+    'DEVICE_MATRIX',
+    'NAV_ROUTES',
+    'DeviceReport',
+    'device_matrix',
+    'EXPORT_FILE_PATTERN',
+    'ExportReport',
+    'export_sizes',
+    'preset_for_export',
+    'FLOWS',
+    'THROTTLED_PROFILES',
+    'NetworkReport',
+    'network_profiles',
+    'BenchReport',
+    'INVOICE_SIZES',
+    'ScalingReport',
+    'growth_exponents',
+    'measure',
+    'preset_for_invoices',
+]
@@ -0,0 +1,98 @@
+"""
+bulk_upload.py - Bulk Tenant Upload Files and Report
+KosManager Automated Testing
+"""
+import csv
+import json
+import os
+
+from seeding import ScalePreset
+
+from .report import BenchReport
+
+BULK_SIZES = [10, 100, 1_000, 10_000]
+# Column order of BulkUploadDialog's template (TenantUploadData)
+UPLOAD_COLUMNS = ["name", "phoneNumber", "roomNumber", "startDate", "dueDate"]
+
+CSV_COLUMNS = ["mode", "format", "rows", "file_bytes", "request_bytes", "parse_ms",
+               "server_ms", "total_ms", "rows_per_s", "success", "failed"]
+
+
+def bulk_sizes():
+    """Row counts to benchmark, from TEST_BULK_SIZES (e.g. "10,100") or BULK_SIZES."""
+    value = os.getenv("TEST_BULK_SIZES")
+    return [int(size) for size in value.split(",")] if value else BULK_SIZES
+
+
+def preset_for_upload(rows):
+    """
+    One property with `rows` empty rooms. /api/tenants/bulk only matches
+    rooms of the owner's first property, so the account keeps just one.
+    """
+    return ScalePreset(f"bulk_{rows}_rooms", properties=1, rooms_per_property=rows,
+                       occupancy=0.0, maintenance=0.0, months=1)
+
+
+def request_bytes(rows):
+    """Size of the JSON body BulkUploadDialog posts for these rows."""
+    return len(json.dumps({"tenants": rows}, separators=(",", ":")).encode("utf-8"))
+
+
+def write_csv(rows, path):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=UPLOAD_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def write_xlsx(rows, path):
+    """
+    Write the rows as an .xlsx sheet named "Tenants". Every cell is text,
+    as in the template: the dialog calls .trim() on each value.
+    """
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise RuntimeError("XLSX files need openpyxl: pip install openpyxl")
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Tenants")
+    sheet.append(UPLOAD_COLUMNS)
+    for row in rows:
+        sheet.append([row[column] for column in UPLOAD_COLUMNS])
+    workbook.save(path)
+    return path
+
+
+WRITERS = {"csv": write_csv, "xlsx": write_xlsx}
+
+
+def write_upload_file(rows, directory, file_format):
+    """Write `rows` as tenants_<n>.<format> in `directory`; returns the path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"tenants_{len(rows)}.{file_format}")
+    return WRITERS[file_format](rows, path)
+
+
+class BulkUploadReport(BenchReport):
+    """One row per (mode, format, row count) of the bulk upload benchmark."""
+
+    columns = CSV_COLUMNS
+    sort_key = staticmethod(lambda row: (row["mode"], row["format"], row["rows"]))
+
+    def add(self, mode, file_format, rows, total_s, server_s=None, parse_s=None,
+            file_bytes=None, body_bytes=None, success=None, failed=None):
+        milliseconds = lambda value: None if value is None else round(value * 1000, 1)
+        return self.add_row(
+            mode=mode,
+            format=file_format,
+            rows=rows,
+            file_bytes=file_bytes,
+            request_bytes=body_bytes,
+            parse_ms=milliseconds(parse_s),
+            server_ms=milliseconds(server_s),
+            total_ms=milliseconds(total_s),
+            rows_per_s=round(rows / total_s, 1) if total_s else None,
+            success=success,
+            failed=failed,
+        )
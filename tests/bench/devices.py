@@ -0,0 +1,48 @@
+"""
+devices.py - Phone Matrix Tap Latency Report
+KosManager Automated Testing
+"""
+import os
+import statistics
+
+from .report import BenchReport
+
+# "desktop" is the unthrottled sidebar baseline the phones are compared with
+DEVICE_MATRIX = ["desktop", "pixel-7", "iphone-se", "galaxy-a12", "redmi-9a"]
+# Bottom navigation routes, tapped in this order
+NAV_ROUTES = ["properties", "tenants", "invoices", "dashboard"]
+
+CSV_COLUMNS = ["device", "viewport", "cpu_throttle", "route", "taps", "route_median_ms",
+               "route_max_ms", "input_delay_median_ms", "next_paint_median_ms",
+               "next_paint_max_ms"]
+
+
+def device_matrix():
+    """Devices to benchmark, from TEST_DEVICES (e.g. "desktop,redmi-9a") or DEVICE_MATRIX."""
+    value = os.getenv("TEST_DEVICES")
+    return value.split(",") if value else DEVICE_MATRIX
+
+
+class DeviceReport(BenchReport):
+    """One row per (device, route): tap-to-route and tap-to-next-paint over all taps."""
+
+    columns = CSV_COLUMNS
+    sort_key = staticmethod(lambda row: (
+        DEVICE_MATRIX.index(row["device"]) if row["device"] in DEVICE_MATRIX else 99,
+        NAV_ROUTES.index(row["route"])))
+
+    def add(self, device, route, taps):
+        """`device` is a DeviceProfile or None (desktop); `taps` are perf.measure_tap() results."""
+        median = lambda key: round(statistics.median(tap[key] for tap in taps), 1)
+        return self.add_row(
+            device=device.name if device else "desktop",
+            viewport=device.viewport if device else None,
+            cpu_throttle=device.cpu_throttle if device else 1,
+            route=route,
+            taps=len(taps),
+            route_median_ms=median("route_ms"),
+            route_max_ms=max(tap["route_ms"] for tap in taps),
+            input_delay_median_ms=median("input_delay_ms"),
+            next_paint_median_ms=median("next_paint_ms"),
+            next_paint_max_ms=max(tap["next_paint_ms"] for tap in taps),
+        )
@@ -0,0 +1,55 @@
+"""
+export.py - Tenant Export Benchmark Sizes and Report
+KosManager Automated Testing
+"""
+import math
+import os
+
+from seeding import ScalePreset
+
+from .report import BenchReport
+
+EXPORT_SIZES = [100, 1_000, 10_000]
+ROOMS_PER_PROPERTY = 50
+# Download name set by ExportDataButton: data_penyewa_<YYYY-MM-DD>.<ext>
+EXPORT_FILE_PATTERN = "data_penyewa_*.{}"
+
+CSV_COLUMNS = ["format", "tenants", "time_to_file_ms", "file_bytes", "heap_before_mb",
+               "heap_peak_mb", "heap_after_mb", "heap_total_mb", "script_ms", "task_ms",
+               "layout_ms"]
+
+
+def export_sizes():
+    """Tenant counts to benchmark, from TEST_EXPORT_SIZES (e.g. "100,1000") or EXPORT_SIZES."""
+    value = os.getenv("TEST_EXPORT_SIZES")
+    return [int(size) for size in value.split(",")] if value else EXPORT_SIZES
+
+
+def preset_for_export(tenants):
+    """A fully let account with `tenants` tenants and one invoice each."""
+    properties = max(1, math.ceil(tenants / ROOMS_PER_PROPERTY))
+    return ScalePreset(
+        f"export_{tenants}_tenants",
+        properties=properties,
+        rooms_per_property=math.ceil(tenants / properties),
+        occupancy=1.0,
+        maintenance=0.0,
+        months=1,
+        plan="pro" if properties > 2 else "free",
+    )
+
+
+class ExportReport(BenchReport):
+    """One row per (format, tenant count) of the export benchmark."""
+
+    columns = CSV_COLUMNS
+    sort_key = staticmethod(lambda row: (row["format"], row["tenants"]))
+
+    def add(self, file_format, tenants, time_to_file_s, file_bytes, metrics):
+        return self.add_row(
+            format=file_format,
+            tenants=tenants,
+            time_to_file_ms=round(time_to_file_s * 1000, 1),
+            file_bytes=file_bytes,
+            **{column: metrics.get(column) for column in CSV_COLUMNS[4:]},
+        )
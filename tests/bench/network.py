@@ -0,0 +1,52 @@
+"""
+network.py - Throttled Network Benchmark Profiles and Report
+KosManager Automated Testing
+"""
+import os
+
+from .report import BenchReport
+
+# "none" is the unthrottled baseline the mobile profiles are compared with
+THROTTLED_PROFILES = ["none", "4g", "fast-3g", "slow-3g"]
+FLOWS = ["landing", "login", "dashboard"]
+
+CSV_COLUMNS = ["profile", "flow", "load_ms", "interaction_ms", "ttfb_ms", "fcp_ms", "lcp_ms",
+               "transfer_bytes", "requests", "error"]
+
+
+def network_profiles():
+    """Profiles to benchmark, from TEST_NETWORK_PROFILES (e.g. "none,slow-3g") or the default."""
+    value = os.getenv("TEST_NETWORK_PROFILES")
+    return value.split(",") if value else THROTTLED_PROFILES
+
+
+class NetworkReport(BenchReport):
+    """
+    One row per (profile, flow): wall time of the page load and of the
+    interaction that follows it, plus the browser's own paint timing.
+    """
+
+    columns = CSV_COLUMNS
+    sort_key = staticmethod(lambda row: (row["flow"], THROTTLED_PROFILES.index(row["profile"])
+                                         if row["profile"] in THROTTLED_PROFILES else 99))
+
+    def add(self, profile, flow, load_s, interaction_s=None, page_load=None, error=None):
+        """`page_load` is the perf.collect_page_load() record of the loaded page."""
+        page_load = page_load or {}
+        navigation = page_load.get("navigation") or {}
+        paint = page_load.get("paint") or {}
+        resources = page_load.get("resources") or {}
+        milliseconds = lambda value: None if value is None else round(value * 1000, 1)
+        return self.add_row(
+            profile=profile,
+            flow=flow,
+            load_ms=milliseconds(load_s),
+            interaction_ms=milliseconds(interaction_s),
+            ttfb_ms=navigation.get("ttfb"),
+            fcp_ms=paint.get("fcp"),
+            lcp_ms=paint.get("lcp"),
+            transfer_bytes=(navigation.get("transfer_size") or 0) + resources.get("transfer_bytes", 0)
+            if page_load else None,
+            requests=resources.get("count"),
+            error=error,
+        )
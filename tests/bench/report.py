@@ -0,0 +1,34 @@
+"""
+report.py - CSV Benchmark Report
+KosManager Automated Testing
+"""
+import csv
+import os
+
+
+class BenchReport:
+    """
+    Rows of one benchmark, written as CSV under reports/runs/<run_id>/.
+    Subclasses set `columns` and, optionally, `sort_key`.
+    """
+
+    columns = []
+    sort_key = None
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = []
+
+    def add_row(self, **row):
+        self.rows.append(row)
+        return row
+
+    def write(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        rows = sorted(self.rows, key=self.sort_key) if self.sort_key else self.rows
+        with open(self.path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=self.columns)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+        return self.path
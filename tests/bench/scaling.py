@@ -0,0 +1,107 @@
+"""
+scaling.py - Latency versus Account Size
+KosManager Automated Testing
+"""
+import math
+import statistics
+import time
+
+from seeding import ScalePreset
+
+from .report import BenchReport
+
+# Account sizes measured by the scaling benchmark, in invoices
+INVOICE_SIZES = [10, 100, 1_000, 10_000]
+# Every tenant has this many monthly invoices, so tenants = invoices / 10
+MONTHS = 10
+ROOMS_PER_PROPERTY = 50
+
+CSV_COLUMNS = ["route", "invoices", "tenants", "rooms", "properties", "repeats",
+               "min_ms", "median_ms", "p95_ms", "payload_bytes"]
+
+
+def preset_for_invoices(invoices):
+    """A fully let account holding `invoices` invoices (10 per tenant)."""
+    tenants = max(1, invoices // MONTHS)
+    properties = max(1, math.ceil(tenants / ROOMS_PER_PROPERTY))
+    return ScalePreset(
+        f"{invoices}_invoices_curve",
+        properties=properties,
+        rooms_per_property=math.ceil(tenants / properties),
+        occupancy=1.0,
+        maintenance=0.0,
+        months=MONTHS,
+        plan="pro" if properties > 2 else "free",
+    )
+
+
+def measure(http, url, repeats=5, warmup=1, timeout=60, recorder=None):
+    """
+    GET `url` `warmup + repeats` times with a logged-in requests.Session.
+    Returns (latencies in seconds, payload size of the last response).
+    Direct requests bypass KosManagerClient, so pass its `visit_recorder`
+    to have them count for --record-impact.
+    """
+    if recorder is not None:
+        recorder.record(url)
+    latencies = []
+    size = 0
+    for attempt in range(warmup + repeats):
+        started = time.perf_counter()
+        response = http.get(url, allow_redirects=False, timeout=timeout)
+        elapsed = time.perf_counter() - started
+        if response.status_code != 200:
+            raise AssertionError(f"GET {url} -> {response.status_code}")
+        size = len(response.content)
+        if attempt >= warmup:
+            latencies.append(elapsed)
+    return latencies, size
+
+
+def growth_exponents(points):
+    """
+    Local log-log slopes between consecutive (size, seconds) points.
+    1.0 means latency grows linearly with size, above 1.0 super-linearly.
+    """
+    points = sorted(points)
+    exponents = []
+    for (size_a, time_a), (size_b, time_b) in zip(points, points[1:]):
+        if size_a <= 0 or time_a <= 0 or size_b == size_a:
+            continue
+        exponents.append((size_a, size_b,
+                          round(math.log(time_b / time_a) / math.log(size_b / size_a), 3)))
+    return exponents
+
+
+class ScalingReport(BenchReport):
+    """
+    One row per (route, account size), ready to plot latency or payload
+    against invoices.
+    """
+
+    columns = CSV_COLUMNS
+    sort_key = staticmethod(lambda row: (row["route"], row["invoices"]))
+
+    def add(self, route, preset, latencies, payload_bytes):
+        counts = preset.expected_counts()
+        ordered = sorted(latencies)
+        self.add_row(
+            route=route,
+            invoices=counts["invoices"],
+            tenants=counts["tenants"],
+            rooms=counts["rooms"],
+            properties=counts["properties"],
+            repeats=len(ordered),
+            min_ms=round(ordered[0] * 1000, 1),
+            median_ms=round(statistics.median(ordered) * 1000, 1),
+            p95_ms=round(ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)] * 1000, 1),
+            payload_bytes=payload_bytes,
+        )
+
+    def curve(self, route, column="median_ms"):
+        """(invoices, seconds) points of one route."""
+        return [(row["invoices"], row[column] / 1000) for row in self.rows
+                if row["route"] == route]
+
+    def routes(self):
+        return sorted({row["route"] for row in self.rows})
@@ -0,0 +1,64 @@
+"""
+test_device_matrix.py - Phone Matrix Tap Latency Benchmark
+KosManager Automated Testing
+
+Run with:
+    pytest tests/benchmarks/test_device_matrix.py --benchmark
+    TEST_DEVICES=desktop,redmi-9a pytest tests/benchmarks/test_device_matrix.py --benchmark
+"""
+import os
+
+import pytest
+
+from bench import NAV_ROUTES, DeviceReport, device_matrix
+from drivers.workspace import REPORTS_DIR, get_run_id
+from pages import DashboardPage
+from perf import install_event_timing, measure_tap
+
+DEVICES = device_matrix()
+TAPS = int(os.getenv("TEST_DEVICE_TAPS", "3"))
+
+
+@pytest.fixture(scope="module")
+def device_report():
+    """Module-scoped report, written to reports/runs/<run_id>/devices.csv."""
+    report = DeviceReport(os.path.join(REPORTS_DIR, "runs", get_run_id(), "devices.csv"))
+
+    yield report
+
+    if report.rows:
+        report.write()
+
+
+@pytest.mark.benchmark
+@pytest.mark.mobile
+class TestDeviceMatrix:
+    """Bottom navigation tap latency on emulated phones."""
+
+    @pytest.mark.parametrize("device", DEVICES, indirect=True)
+    def test_BM005_01_bottom_nav_tap_latency(self, driver, device, seeded_owner, base_url,
+                                             device_report):
+        """
+        BM005-01: Tap through the bottom navigation on a phone.
+
+        Steps:
+        1. Seed a small account, emulate the phone (viewport, touch, CPU slowdown)
+        2. Open /dashboard
+        3. Tap Properti, Penyewa, Tagihan, Dashboard; repeat TEST_DEVICE_TAPS times
+
+        Expected: Every tap reaches its route; tap-to-route and
+        tap-to-next-paint per route are reported
+        """
+        install_event_timing(driver)
+        seeded_owner["session"].apply(driver)
+        dashboard = DashboardPage(driver, base_url)
+        if device is not None:
+            assert dashboard.is_bottom_nav_visible(), f"{device.name} should show the bottom nav"
+
+        taps = {route: [] for route in NAV_ROUTES}
+        for _ in range(TAPS):
+            for route in NAV_ROUTES:
+                taps[route].append(measure_tap(driver, getattr(dashboard, f"click_nav_{route}")))
+
+        for route in NAV_ROUTES:
+            device_report.add(device, route, taps[route])
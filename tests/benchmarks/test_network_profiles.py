@@ -0,0 +1,137 @@
+"""
+test_network_profiles.py - Mobile Network Latency Benchmark
+KosManager Automated Testing
+
+Run with:
+    pytest tests/benchmarks/test_network_profiles.py --benchmark
+    TEST_NETWORK_PROFILES=none,slow-3g pytest tests/benchmarks/test_network_profiles.py --benchmark
+"""
+import os
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from bench import NetworkReport, network_profiles
+from drivers.workspace import REPORTS_DIR, get_run_id
+from pages import DashboardPage, LandingPage, LoginPage
+from perf import collect_page_load
+
+PROFILES = network_profiles()
+
+
+@pytest.fixture(scope="module")
+def network_report():
+    """Module-scoped report, written to reports/runs/<run_id>/network_profiles.csv."""
+    report = NetworkReport(os.path.join(REPORTS_DIR, "runs", get_run_id(), "network_profiles.csv"))
+
+    yield report
+
+    if report.rows:
+        report.write()
+
+
+def timed(action):
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+
+def profile_name(network_profile):
+    return network_profile.name if network_profile else "none"
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("network_profile", PROFILES, indirect=True)
+class TestNetworkProfiles:
+    """Load and interaction time of the main owner flows on mobile networks."""
+
+    def test_BM004_01_landing(self, clear_session, network_profile, base_url, network_report):
+        """
+        BM004-01: Landing page on a throttled link.
+
+        Steps:
+        1. Throttle the browser, open /
+        2. Click "Masuk"
+
+        Expected: Both finish within the profile's page timeout; times are reported
+        """
+        landing = LandingPage(clear_session, base_url)
+        load_s = timed(landing.open)
+        page_load = collect_page_load(clear_session)
+        interaction_s = timed(lambda: landing.click_login().wait_for_url_contains("/login"))
+
+        network_report.add(profile_name(network_profile), "landing", load_s, interaction_s,
+                           page_load)
+
+    @pytest.mark.auth
+    def test_BM004_02_login(self, clear_session, network_profile, fresh_owner, base_url,
+                            network_report):
+        """
+        BM004-02: Login form on a throttled link.
+
+        Steps:
+        1. Throttle the browser, open /login
+        2. Submit a valid owner's credentials
+
+        Expected: Dashboard is ready within the profile's page timeout; times are reported
+        """
+        login = LoginPage(clear_session, base_url)
+        load_s = timed(login.open)
+        page_load = collect_page_load(clear_session)
+
+        def submit():
+            login.login(fresh_owner["email"], fresh_owner["password"])
+            login.wait_for_url_contains("/dashboard")
+            login.wait_for_page_ready()
+
+        interaction_s = timed(submit)
+
+        network_report.add(profile_name(network_profile), "login", load_s, interaction_s,
+                           page_load)
+
+    def test_BM004_03_dashboard(self, driver, network_profile, fresh_owner, base_url,
+                                network_report):
+        """
+        BM004-03: Dashboard on a throttled link.
+
+        Steps:
+        1. Restore a logged-in session, throttle the browser, open /dashboard
+        2. Click Properti in the sidebar
+
+        Expected: Both finish within the profile's page timeout; times are reported
+        """
+        fresh_owner["session"].apply(driver)
+        dashboard = DashboardPage(driver, base_url)
+        load_s = timed(dashboard.open)
+        page_load = collect_page_load(driver)
+        interaction_s = timed(dashboard.click_nav_properties)
+
+        network_report.add(profile_name(network_profile), "dashboard", load_s, interaction_s,
+                           page_load)
+
+
+@pytest.mark.benchmark
+class TestOffline:
+    """What an owner sees when the connection drops."""
+
+    @pytest.mark.parametrize("network_profile", ["offline"], indirect=True)
+    def test_BM004_04_offline_fails_fast(self, clear_session, network_profile, base_url,
+                                         network_report):
+        """
+        BM004-04: Open the landing page while offline.
+
+        Steps:
+        1. Switch the browser offline
+        2. Open /
+
+        Expected: Navigation fails with ERR_INTERNET_DISCONNECTED instead of hanging
+        """
+        started = time.perf_counter()
+        with pytest.raises(WebDriverException, match="ERR_INTERNET_DISCONNECTED"):
+            clear_session.get(base_url)
+        elapsed = time.perf_counter() - started
+
+        network_report.add("offline", "landing", elapsed, error="ERR_INTERNET_DISCONNECTED")
+        assert elapsed < network_profile.page_timeout, \
+            f"Offline navigation took {elapsed:.1f}s to fail"
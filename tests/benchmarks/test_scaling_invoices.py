@@ -0,0 +1,79 @@
+"""
+test_scaling_invoices.py - Scaling Curve Benchmark for /api/invoices and /dashboard
+KosManager Automated Testing
+
+Run with:
+    pytest tests/benchmarks --benchmark
+"""
+import os
+
+import pytest
+
+from bench import INVOICE_SIZES, ScalingReport, growth_exponents, measure, preset_for_invoices
+from drivers.workspace import REPORTS_DIR, get_run_id
+
+# Routes whose property -> room -> tenant -> invoice lookups grow with the account
+SCALING_ROUTES = ["/api/invoices", "/dashboard"]
+REPEATS = int(os.getenv("TEST_SCALING_REPEATS", "5"))
+# Fail when latency grows faster than invoices^MAX_EXPONENT between two sizes
+MAX_EXPONENT = float(os.getenv("TEST_SCALING_MAX_EXPONENT", "1.2"))
+
+
+@pytest.fixture(scope="module")
+def scaling_report():
+    """Module-scoped report, written to reports/runs/<run_id>/scaling.csv."""
+    report = ScalingReport(os.path.join(REPORTS_DIR, "runs", get_run_id(), "scaling.csv"))
+
+    yield report
+
+    if report.rows:
+        report.write()
+
+
+@pytest.mark.benchmark
+class TestInvoiceScaling:
+    """Response time and payload of invoice-heavy routes versus account size."""
+
+    @pytest.mark.parametrize(
+        "seeded_owner",
+        [preset_for_invoices(size) for size in INVOICE_SIZES],
+        ids=[f"{size}_invoices" for size in INVOICE_SIZES],
+        indirect=True,
+    )
+    def test_BM001_01_measure_routes(self, seeded_owner, base_url, scaling_report):
+        """
+        BM001-01: Measure /api/invoices and /dashboard for one account size.
+
+        Steps:
+        1. Seed an owner with N invoices (10 per tenant)
+        2. GET each route once to warm up, then REPEATS times
+
+        Expected: Every request returns 200; timings are added to the report
+        """
+        http = seeded_owner["client"].http
+        preset = seeded_owner["plan"].preset
+
+        invoices = seeded_owner["client"].list_invoices()
+        assert len(invoices) == preset.expected_counts()["invoices"], \
+            f"Expected {preset.expected_counts()['invoices']} invoices, got {len(invoices)}"
+
+        for route in SCALING_ROUTES:
+            latencies, size = measure(http, f"{base_url}{route}", repeats=REPEATS,
+                                      recorder=seeded_owner["client"].visit_recorder)
+            scaling_report.add(route, preset, latencies, size)
+
+    def test_BM001_02_growth_is_not_superlinear(self, scaling_report):
+        """
+        BM001-02: Check how latency grows between measured sizes.
+
+        Expected: No step grows faster than invoices^TEST_SCALING_MAX_EXPONENT
+        """
+        if not scaling_report.rows:
+            pytest.skip("No account size was measured")
+
+        too_steep = []
+        for route in scaling_report.routes():
+            for size_a, size_b, exponent in growth_exponents(scaling_report.curve(route)):
+                if exponent > MAX_EXPONENT:
+                    too_steep.append(f"{route} {size_a}->{size_b} invoices: x^{exponent}")
+        assert not too_steep, f"Super-linear growth: {too_steep}"
@@ -0,0 +1,77 @@
+"""
+test_tenant_export.py - Tenant Export Throughput & Memory Benchmark
+KosManager Automated Testing
+
+Run with:
+    pytest tests/benchmarks/test_tenant_export.py --benchmark
+    TEST_EXPORT_SIZES=100,1000 pytest tests/benchmarks/test_tenant_export.py --benchmark
+"""
+import os
+import time
+
+import pytest
+
+from bench import EXPORT_FILE_PATTERN, ExportReport, export_sizes, preset_for_export
+from drivers import DownloadWatcher
+from drivers.workspace import REPORTS_DIR, get_run_id
+from pages import TenantsPage
+from perf import MetricsSampler
+
+SIZES = export_sizes()
+
+
+@pytest.fixture(scope="module")
+def export_report():
+    """Module-scoped report, written to reports/runs/<run_id>/export.csv."""
+    report = ExportReport(os.path.join(REPORTS_DIR, "runs", get_run_id(), "export.csv"))
+
+    yield report
+
+    if report.rows:
+        report.write()
+
+
+@pytest.mark.benchmark
+@pytest.mark.tenant
+class TestTenantExport:
+    """Time-to-file, file size and JS heap of ExportDataButton."""
+
+    @pytest.mark.parametrize("file_format", ["csv", "xlsx"])
+    @pytest.mark.parametrize(
+        "seeded_owner",
+        [preset_for_export(size) for size in SIZES],
+        ids=[f"{size}_tenants" for size in SIZES],
+        indirect=True,
+    )
+    def test_BM003_01_export_tenants(self, driver, seeded_owner, base_url, file_format,
+                                     worker_workspace, export_report):
+        """
+        BM003-01: Export N tenants from /dashboard/tenants.
+
+        Steps:
+        1. Seed an owner with N active tenants
+        2. Open /dashboard/tenants, click Download Data > CSV or Excel
+        3. Wait until the file is fully written to the download directory
+
+        Expected: The file holds N rows; time, size and heap use are reported
+        """
+        tenants = seeded_owner["plan"].counts()["tenants"]
+        watcher = DownloadWatcher(driver, os.path.join(worker_workspace.downloads_dir, "export"))
+
+        seeded_owner["session"].apply(driver, "/dashboard/tenants")
+        tenants_page = TenantsPage(driver, base_url)
+        watcher.start()
+        sampler = MetricsSampler(driver).start()
+
+        started = time.perf_counter()
+        tenants_page.click_export(file_format)
+        path = watcher.wait_for_file(EXPORT_FILE_PATTERN.format(file_format),
+                                     timeout=300, on_poll=sampler.sample)
+        time_to_file = time.perf_counter() - started
+
+        export_report.add(file_format, tenants, time_to_file, os.path.getsize(path), sampler.stop())
+
+        if file_format == "csv":
+            with open(path, encoding="utf-8-sig") as handle:
+                exported = sum(1 for line in handle if line.strip()) - 1
+            assert exported == tenants, f"Expected {tenants} rows in {path}, got {exported}"
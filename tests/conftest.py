@@ -3,45 +3,216 @@ conftest.py - Pytest Configuration & Fixtures
 KosManager Automated Testing
 """
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from datetime import datetime
 import os
+import uuid
 
-# Base URL for testing
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:3000")
+from api import KosManagerClient
+from artifacts import ArtifactStore, get_artifact_mode, rotate_from_env
+from database import TemplateDatabase, clone_name
+from pages.waits import hard_sleep_tracker
+from perf import CdpRecorder, PerfRecorder
+from seeding import DataFactory, ScalePreset, SeedError, get_preset, seed_account
+from settings import (
+    BASE_URL,
+    LOGIN_USER_EMAIL,
+    LOGIN_USER_PASSWORD,
+    TEST_USER_EMAIL,
+    TEST_USER_NAME,
+    TEST_USER_PASSWORD,
+)
+from drivers import (
+    AuthenticatedSession,
+    BrowserPool,
+    WorkerWorkspace,
+    build_chrome,
+    get_device,
+    get_network_profile,
+    get_worker_id,
+    last_resolution,
+    profile_timings,
+    reset_device,
+    reset_network,
+)
+from drivers.workspace import REPORTS_DIR, get_run_id
 
-# Test user credentials (for testing purposes)
-TEST_USER_EMAIL = "testuser@kosmanager.com"
-TEST_USER_PASSWORD = "TestPassword123"
-TEST_USER_NAME = "Test Automation"
+pytest_plugins = [
+    "perf.budget_plugin",
+    "replay.plugin",
+    "sharding.plugin",
+    "impact.plugin",
+    "reporting.plugin",
+]
 
 
 @pytest.fixture(scope="session")
-def browser():
+def worker_workspace():
     """
-    Session-scoped fixture to initialize Chrome WebDriver.
-    Browser will be reused across all tests in the session.
+    Session-scoped fixture with the isolated directories of this worker.
+    Each xdist worker gets its own downloads and screenshot directories.
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-popup-blocking")
-    # Uncomment for headless mode
-    # chrome_options.add_argument("--headless")
-    # chrome_options.add_argument("--no-sandbox")
-    # chrome_options.add_argument("--disable-dev-shm-usage")
+    return WorkerWorkspace().prepare()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(worker_workspace):
+    """
+    Session-scoped browser pool, one per xdist worker.
+    The browser is reused across tests and replaced when it crashes or
+    after TEST_BROWSER_RECYCLE_AFTER tests.
+    """
+    pool = BrowserPool(build_chrome, worker_workspace).start()
+    
+    yield pool
+    
+    # Teardown: close browsers after all tests
+    pool.shutdown()
+    profile_timings.write(os.path.join(worker_workspace.root, "profile_timings.json"))
+
+
+@pytest.fixture(scope="session")
+def artifact_store(worker_workspace):
+    """
+    Session-scoped failure artifact store of this worker, or None.
+    Screenshot, DOM and console log of failed browser tests go to
+    reports/runs/<run_id>/<worker>/artifacts/<test>/, written by a
+    background thread. TEST_ARTIFACTS=all also captures passing tests,
+    TEST_ARTIFACTS=off disables it.
+    """
+    mode = get_artifact_mode()
+    if mode == "off":
+        yield None
+        return
+    store = ArtifactStore(worker_workspace.artifacts_dir, mode=mode,
+                          image_format=os.getenv("TEST_ARTIFACT_FORMAT", "png"))
+    
+    yield store
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.implicitly_wait(10)
+    # Everything must be on disk before the HTML report links it
+    store.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_database():
+    """
+    Session-scoped private Postgres database of this worker, or None.
+    With --worker-db (TEST_WORKER_DB=1) every xdist worker gets its own
+    clone of the template database, and TEST_DATABASE_URL points at it
+    for the session so Postgres seeding writes there. Dropped at the end
+    unless TEST_KEEP_WORKER_DB=1.
+    Only seeding is isolated: the app under BASE_URL keeps writing
+    registrations and properties to its own shared DATABASE_URL.
+    """
+    if os.getenv("TEST_WORKER_DB") != "1":
+        yield None
+        return
+    template = TemplateDatabase(preset=os.getenv("TEST_TEMPLATE_PRESET"))
+    template.ensure()
+    name = clone_name(get_run_id(), get_worker_id())
+    dsn = template.clone(name)
+    previous = os.environ.get("TEST_DATABASE_URL")
+    os.environ["TEST_DATABASE_URL"] = dsn
+    
+    yield dsn
+    
+    if previous is None:
+        os.environ.pop("TEST_DATABASE_URL", None)
+    else:
+        os.environ["TEST_DATABASE_URL"] = previous
+    if os.getenv("TEST_KEEP_WORKER_DB") != "1":
+        template.drop(name)
+
+
+@pytest.fixture(scope="session")
+def perf_recorder(request, worker_workspace):
+    """
+    Session-scoped page performance recorder, or None when disabled.
+    Enable with --perf-capture or TEST_PERF_CAPTURE=1.
+    """
+    enabled = request.config.getoption("--perf-capture") or os.getenv("TEST_PERF_CAPTURE") == "1"
+    if not enabled:
+        return None
+    path = os.path.join(os.path.dirname(worker_workspace.root), "perf.jsonl")
+    return PerfRecorder(path, worker_workspace.run_id, worker_workspace.worker_id)
+
+
+@pytest.fixture(scope="session")
+def cdp_recorder(request, worker_workspace):
+    """
+    Session-scoped CDP network/long-task/heap recorder, or None when disabled.
+    Enable with --cdp-capture or TEST_CDP_CAPTURE=1.
+    """
+    if os.getenv("TEST_CDP_CAPTURE") != "1":
+        return None
+    path = os.path.join(os.path.dirname(worker_workspace.root), "cdp.jsonl")
+    return CdpRecorder(path, worker_workspace.run_id, worker_workspace.worker_id)
+
+
+@pytest.fixture
+def browser(request, browser_pool, perf_recorder, cdp_recorder, artifact_store, visit_recorder):
+    """
+    Fixture that checks out the worker's Chrome WebDriver for one test.
+    """
+    driver = browser_pool.acquire()
+    driver.perf_recorder = perf_recorder
+    driver.cdp_recorder = cdp_recorder
+    driver.artifacts = artifact_store
+    driver.visit_recorder = visit_recorder
+    if artifact_store is not None:
+        artifact_store.begin(driver, request.node.nodeid)
+    if perf_recorder is not None:
+        perf_recorder.begin(request.node)
+    if cdp_recorder is not None:
+        cdp_recorder.begin(driver, request.node)
+    # --network-profile / TEST_NETWORK_PROFILE throttles every test
+    network = get_network_profile()
+    if network is not None:
+        network.apply(driver)
+    # --device / TEST_DEVICE emulates a phone for every test
+    device = get_device()
+    if device is not None:
+        device.apply(driver)
     
     yield driver
     
-    # Teardown: close browser after all tests
-    driver.quit()
+    if perf_recorder is not None:
+        perf_recorder.end()
+    if cdp_recorder is not None:
+        cdp_recorder.end()
+    if browser_pool.is_alive(driver):
+        if getattr(driver, "network_profile", None) is not None:
+            reset_network(driver)
+        if getattr(driver, "device", None) is not None:
+            reset_device(driver)
+    browser_pool.release(driver)
+
+
+@pytest.fixture
+def network_profile(request, browser):
+    """
+    Throttle the browser for one test. Pick the profile by name with
+    indirect parametrization, e.g.
+    @pytest.mark.parametrize("network_profile", ["slow-3g", "4g"], indirect=True);
+    defaults to TEST_NETWORK_PROFILE. Returns the NetworkProfile or None.
+    """
+    profile = get_network_profile(getattr(request, "param", None))
+    if profile is not None:
+        profile.apply(browser)
+    return profile
+
+
+@pytest.fixture
+def device(request, browser):
+    """
+    Emulate a phone (viewport, touch, user agent, CPU slowdown) for one
+    test. Pick it by name with indirect parametrization, e.g.
+    @pytest.mark.parametrize("device", ["galaxy-a12"], indirect=True);
+    defaults to TEST_DEVICE. Returns the DeviceProfile or None (desktop).
+    """
+    profile = get_device(getattr(request, "param", None))
+    if profile is not None:
+        profile.apply(browser)
+    return profile
 
 
 @pytest.fixture(scope="function")
@@ -63,6 +234,110 @@ def clear_session(browser):
     return browser
 
 
+@pytest.fixture(scope="session")
+def auth_session():
+    """
+    Session-scoped login, performed once per worker.
+    Holds the NextAuth cookies of the existing test account.
+    """
+    return AuthenticatedSession(BASE_URL, LOGIN_USER_EMAIL, LOGIN_USER_PASSWORD)
+
+
+@pytest.fixture
+def logged_in(browser, auth_session):
+    """
+    Fixture that restores the cached login and opens /dashboard.
+    Use this instead of logging in through the form before each test.
+    """
+    return auth_session.apply(browser)
+
+
+@pytest.fixture(scope="session")
+def api_client(visit_recorder):
+    """
+    Session-scoped API client logged in as the existing test account.
+    Properties created through it are deleted at the end of the session.
+    """
+    client = KosManagerClient(BASE_URL)
+    client.visit_recorder = visit_recorder
+    client.login(LOGIN_USER_EMAIL, LOGIN_USER_PASSWORD)
+    
+    yield client
+    
+    client.delete_created()
+    client.close()
+
+
+@pytest.fixture
+def fresh_owner(visit_recorder):
+    """
+    Register a brand-new owner through the API (no properties yet).
+    Returns credentials, a logged-in API client and an AuthenticatedSession
+    that opens pages in the browser as this owner.
+    """
+    email = f"owner_{uuid.uuid4().hex[:12]}@kosmanager.com"
+    password = "OwnerPassword123"
+    client = KosManagerClient(BASE_URL)
+    client.visit_recorder = visit_recorder
+    client.register("Fresh Owner", email, password)
+    session = AuthenticatedSession(BASE_URL, email, password)
+    session.cookies = client.login(email, password)
+    
+    yield {
+        "email": email,
+        "password": password,
+        "name": "Fresh Owner",
+        "client": client,
+        "session": session,
+    }
+    
+    client.delete_created()
+    client.close()
+
+
+@pytest.fixture
+def seeded_owner(request, visit_recorder):
+    """
+    Register a new owner and fill the account from a named preset.
+    Pick the preset (a name or a ScalePreset) with indirect parametrization, e.g.
+    @pytest.mark.parametrize("seeded_owner", ["pro_owner_500_rooms"], indirect=True),
+    or TEST_SEED_PRESET (default: small). Same keys as fresh_owner, plus
+    the SeedPlan and SeedResult.
+    """
+    param = getattr(request, "param", None)
+    preset = param if isinstance(param, ScalePreset) else get_preset(param)
+    # The data is deterministic (TEST_SEED); only the email is unique per run
+    email, password = f"owner_{uuid.uuid4().hex[:12]}@kosmanager.com", "OwnerPassword123"
+    plan = DataFactory(seed=int(os.getenv("TEST_SEED", "0"))).build(preset, email=email)
+    client = KosManagerClient(BASE_URL)
+    client.visit_recorder = visit_recorder
+    client.register(plan.owner["full_name"], email, password)
+    session = AuthenticatedSession(BASE_URL, email, password)
+    session.cookies = client.login(email, password)
+    try:
+        result = seed_account(client, plan)
+    except SeedError as error:
+        client.close()
+        pytest.skip(f"Cannot seed preset '{preset.name}': {error}")
+    
+    yield {
+        "email": email,
+        "password": password,
+        "name": plan.owner["full_name"],
+        "client": client,
+        "session": session,
+        "plan": plan,
+        "seed": result,
+    }
+    
+    # Deleting the properties cascades to rooms, tenants and invoices
+    for property_id in result.property_ids.values():
+        if property_id not in client.created_property_ids:
+            client.created_property_ids.append(property_id)
+    client.delete_created()
+    client.close()
+
+
 @pytest.fixture
 def base_url():
     """Return the base URL for testing."""
@@ -86,14 +361,93 @@ def unique_email():
     return f"test_{timestamp}@kosmanager.com"
 
 
+def pytest_addoption(parser):
+    """Register KosManager command line options."""
+    parser.addoption(
+        "--sleep-report", action="store_true", default=False,
+        help="Report hard sleeps (BasePage.wait) taken during the run",
+    )
+    parser.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="Run the benchmarks (tests marked 'benchmark'); skipped otherwise",
+    )
+    parser.addoption(
+        "--perf-capture", action="store_true", default=False,
+        help="Collect Navigation/Paint/Resource timing for every page opened",
+    )
+    parser.addoption(
+        "--network-profile", default=None,
+        help="Throttle every browser: slow-3g, fast-3g, 4g or offline",
+    )
+    parser.addoption(
+        "--device", default=None,
+        help="Emulate a phone in every browser: pixel-7, iphone-se, galaxy-a12 or redmi-9a",
+    )
+    parser.addoption(
+        "--cdp-capture", action="store_true", default=False,
+        help="Record every request, long task and the JS heap per test through CDP",
+    )
+    parser.addoption(
+        "--artifacts", default=None, choices=("failed", "all", "off"),
+        help="Screenshot/DOM/console artifacts: for failed tests (default), all tests or off",
+    )
+    parser.addoption(
+        "--worker-db", action="store_true", default=False,
+        help="Give every worker its own Postgres database for seeding, cloned from a "
+             "template (server: TEST_POSTGRES_ADMIN_URL); the app keeps its own database",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
+    # Share one run id between the controller and its xdist workers
+    if not hasattr(config, "workerinput"):
+        os.environ.setdefault("TEST_RUN_ID", datetime.now().strftime("%Y%m%d_%H%M%S"))
+        # Old runs go by age and total size (TEST_ARTIFACT_MAX_AGE_DAYS / _MAX_MB)
+        rotate_from_env(os.path.join(REPORTS_DIR, "runs"), keep=(os.environ["TEST_RUN_ID"],))
+    if config.getoption("--artifacts"):
+        os.environ["TEST_ARTIFACTS"] = config.getoption("--artifacts")
+    # Chrome must be started with the performance log; workers inherit this
+    if config.getoption("--cdp-capture"):
+        os.environ["TEST_CDP_CAPTURE"] = "1"
+    if config.getoption("--network-profile"):
+        get_network_profile(config.getoption("--network-profile"))  # fail fast on a typo
+        os.environ["TEST_NETWORK_PROFILE"] = config.getoption("--network-profile")
+    if config.getoption("--worker-db"):
+        os.environ["TEST_WORKER_DB"] = "1"
+    if config.getoption("--device"):
+        get_device(config.getoption("--device"))
+        os.environ["TEST_DEVICE"] = config.getoption("--device")
     config.addinivalue_line("markers", "smoke: Quick smoke tests")
     config.addinivalue_line("markers", "regression: Full regression tests")
     config.addinivalue_line("markers", "auth: Authentication tests")
     config.addinivalue_line("markers", "property: Property management tests")
     config.addinivalue_line("markers", "tenant: Tenant management tests")
     config.addinivalue_line("markers", "invoice: Invoice/billing tests")
+    config.addinivalue_line("markers", "mobile: Phone viewport / bottom navigation tests")
+    config.addinivalue_line("markers", "benchmark: Scaling/throughput benchmarks (need --benchmark)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --benchmark is given."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark: run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report chromedriver resolution time and, optionally, hard sleeps."""
+    resolution = last_resolution()
+    if resolution is not None:
+        terminalreporter.write_line(f"Resolved {resolution}")
+    if profile_timings.startups:
+        terminalreporter.write_line(profile_timings.summary_line())
+    if config.getoption("--sleep-report"):
+        for line in hard_sleep_tracker.summary_lines():
+            terminalreporter.write_line(line)
 
 
 def pytest_html_report_title(report):
@@ -104,23 +458,44 @@ def pytest_html_report_title(report):
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook to capture screenshot on test failure.
+    Attach performance data, the CDP summary and failure artifacts to the report.
     """
     outcome = yield
     report = outcome.get_result()
     
-    if report.when == "call" and report.failed:
-        driver = item.funcargs.get("driver")
-        if driver:
-            # Create screenshots directory if not exists
-            screenshot_dir = os.path.join(os.path.dirname(__file__), "reports", "screenshots")
-            os.makedirs(screenshot_dir, exist_ok=True)
-            
-            # Save screenshot
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_path = os.path.join(screenshot_dir, f"{item.name}_{timestamp}.png")
-            driver.save_screenshot(screenshot_path)
-            
-            # Attach to report
-            if hasattr(report, "extra"):
-                report.extra.append(pytest.html.extras.image(screenshot_path))
+    # Attach page performance collected during the test
+    perf_entries = getattr(item, "perf_entries", None)
+    if report.when == "call" and perf_entries:
+        report.user_properties.append(("perf", perf_entries))
+        pytest_html = item.config.pluginmanager.getplugin("html")
+        if pytest_html is not None:
+            extras = getattr(report, "extras", [])
+            extras.append(pytest_html.extras.json(perf_entries, name="Performance"))
+            report.extras = extras
+    
+    # Attach the network/long-task/heap summary recorded through CDP
+    driver = item.funcargs.get("browser")
+    cdp = getattr(driver, "cdp_recorder", None)
+    if report.when == "call" and cdp is not None:
+        summary = cdp.finish(driver)
+        report.user_properties.append(("cdp", summary))
+        pytest_html = item.config.pluginmanager.getplugin("html")
+        if pytest_html is not None:
+            extras = getattr(report, "extras", [])
+            extras.append(pytest_html.extras.json(summary, name="Network & CPU"))
+            report.extras = extras
+    
+    # Screenshot, DOM and console log, per worker and test, written in the background
+    artifacts = getattr(driver, "artifacts", None)
+    if artifacts is not None and artifacts.wants(report):
+        paths = artifacts.capture(driver, item.nodeid, report.when)
+        report.user_properties.append(("artifacts", paths))
+        pytest_html = item.config.pluginmanager.getplugin("html")
+        if pytest_html is not None:
+            extras = getattr(report, "extras", [])
+            if "screenshot" in paths:
+                extras.append(pytest_html.extras.image(paths["screenshot"]))
+            if "dom" in paths:
+                extras.append(pytest_html.extras.url(paths["dom"], name="DOM"))
+            extras.append(pytest_html.extras.url(paths["console"], name="Console"))
+            report.extras = extras
@@ -0,0 +1,22 @@
+"""
+__init__.py - Per-Worker Postgres Package
+KosManager Automated Testing
+"""
+from .provision import (
+    ProvisionError,
+    TemplateDatabase,
+    clone_name,
+    database_dsn,
+    get_admin_dsn,
+)
+from .schema import SCHEMA_SQL, schema_drift
+
+__all__ = [
+    'ProvisionError',
+    'TemplateDatabase',
+    'clone_name',
+    'database_dsn',
+    'get_admin_dsn',
+    'SCHEMA_SQL',
+    'schema_drift',
+]
@@ -0,0 +1,37 @@
+"""
+__main__.py - Template Database Command Line
+KosManager Automated Testing
+
+Usage (from the tests/ directory, local Postgres running):
+    python -m database build                # before a parallel run, e.g. in CI
+    python -m database build --preset small
+    python -m database clean                # drop worker databases left by killed runs
+"""
+import argparse
+import logging
+import sys
+
+from .provision import TemplateDatabase, get_admin_dsn
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the KosManager template database.")
+    parser.add_argument("command", choices=("build", "clean"))
+    parser.add_argument("--admin-url", default=get_admin_dsn())
+    parser.add_argument("--preset", default=None, help="also seed <preset>@kosmanager.com")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    template = TemplateDatabase(args.admin_url, preset=args.preset)
+    if args.command == "build":
+        built = template.ensure()
+        print(f"{template.name} {'built' if built else 'up to date'} ({template.fingerprint()})")
+    else:
+        for name in template.clones():
+            template.drop(name)
+            print(f"Dropped {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+provision.py - Template Database & Per-Worker Clones
+KosManager Automated Testing
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+from standin.store import DEFAULT_FIXTURES, TABLES
+
+from .schema import SCHEMA_SQL, SCHEMA_TS, schema_drift
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADMIN_DSN = "postgresql://postgres@localhost:5432/postgres"
+# Password of the owner seeded from a preset (<preset>@kosmanager.com)
+PRESET_PASSWORD = "password123"
+TEMPLATE_NAME = "kos_test_template"
+CLONE_PREFIX = "kos_test"
+NAME_RE = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
+
+
+class ProvisionError(RuntimeError):
+    """Raised when the template or a worker database cannot be created."""
+
+
+def get_admin_dsn():
+    """Maintenance database to run CREATE/DROP DATABASE from (TEST_POSTGRES_ADMIN_URL)."""
+    return os.getenv("TEST_POSTGRES_ADMIN_URL", DEFAULT_ADMIN_DSN)
+
+
+def database_dsn(dsn, name):
+    """The same server and credentials as `dsn`, on database `name`."""
+    if "://" in dsn:
+        parts = urlsplit(dsn)
+        return urlunsplit(parts._replace(path=f"/{name}"))
+    settings = re.sub(r"(^|\s)dbname=\S+", "", dsn).strip()
+    return f"{settings} dbname={name}".strip()
+
+
+def clone_name(run_id, worker_id, prefix=CLONE_PREFIX):
+    """kos_test_20261017_101500_gw3: unique per run, so parallel runs do not collide."""
+    name = re.sub(r"[^a-z0-9_]", "_", f"{prefix}_{run_id}_{worker_id}".lower())
+    return _checked(name[:63])
+
+
+def psycopg_connect(dsn):
+    try:
+        import psycopg
+    except ImportError:
+        raise ProvisionError("Worker databases need psycopg: pip install 'psycopg[binary]'")
+    return psycopg.connect(dsn, autocommit=True)
+
+
+def _checked(name):
+    if not NAME_RE.match(name):
+        raise ProvisionError(f"Invalid database name '{name}'")
+    return name
+
+
+def _lock_key(name):
+    """pg_advisory_lock key (signed 64-bit) for one template name."""
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+
+
+class TemplateDatabase:
+    """
+    One migrated and seeded database that worker databases are cloned from.
+
+    ensure() builds it once (SCHEMA_SQL, the declarative fixtures shared
+    with the stand-in backend, optionally a seeding preset) and marks it
+    IS_TEMPLATE with connections disabled. A fingerprint of schema.ts,
+    the DDL, the fixtures and the preset is stored as the database
+    comment; a later run reuses the template while it matches and
+    rebuilds it otherwise. xdist workers serialize on a Postgres advisory
+    lock, so only the first one builds.
+
+    clone() is then a file-level copy (CREATE DATABASE ... TEMPLATE),
+    about a second instead of a full migrate-and-seed.
+    """
+
+    def __init__(self, admin_dsn=None, name=TEMPLATE_NAME, fixtures=DEFAULT_FIXTURES,
+                 preset=None, seed=0, connect=psycopg_connect):
+        self.admin_dsn = admin_dsn or get_admin_dsn()
+        self.name = _checked(name)
+        self.fixtures = fixtures
+        self.preset = preset
+        self.seed = seed
+        self.connect = connect
+
+    @property
+    def dsn(self):
+        return database_dsn(self.admin_dsn, self.name)
+
+    def fingerprint(self):
+        digest = hashlib.sha256(SCHEMA_SQL.encode("utf-8"))
+        for path in (SCHEMA_TS, self.fixtures):
+            if path:
+                with open(path, "rb") as handle:
+                    digest.update(handle.read())
+        digest.update(f"{self.preset}:{self.seed}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    # ==================== TEMPLATE ====================
+
+    def ensure(self):
+        """Build the template unless an up-to-date one exists; True when built."""
+        drift = schema_drift()
+        if drift:
+            raise ProvisionError("database/schema.py is out of date with schema.ts: "
+                                 + "; ".join(drift))
+        marker = f"kos-template {self.fingerprint()}"
+        with self.connect(self.admin_dsn) as admin:
+            admin.execute("SELECT pg_advisory_lock(%s)", (_lock_key(self.name),))
+            try:
+                row = admin.execute(
+                    "SELECT shobj_description(oid, 'pg_database') FROM pg_database "
+                    "WHERE datname = %s", (self.name,)).fetchone()
+                if row is not None and row[0] == marker:
+                    return False
+                if row is not None:
+                    logger.info("Template %s is stale, rebuilding", self.name)
+                    self._drop_template(admin)
+                started = time.perf_counter()
+                admin.execute(f'CREATE DATABASE "{self.name}"')
+                try:
+                    self._build()
+                except Exception:
+                    self._drop_template(admin)
+                    raise
+                admin.execute(f"COMMENT ON DATABASE \"{self.name}\" IS '{marker}'")
+                admin.execute(f'ALTER DATABASE "{self.name}" WITH IS_TEMPLATE true '
+                              "ALLOW_CONNECTIONS false")
+                logger.info("Built template %s in %.1fs", self.name, time.perf_counter() - started)
+                return True
+            finally:
+                admin.execute("SELECT pg_advisory_unlock(%s)", (_lock_key(self.name),))
+
+    def _drop_template(self, admin):
+        admin.execute(f'ALTER DATABASE "{self.name}" WITH IS_TEMPLATE false')
+        admin.execute(f'DROP DATABASE IF EXISTS "{self.name}" WITH (FORCE)')
+
+    def _build(self):
+        with self.connect(self.dsn) as connection:
+            connection.execute(SCHEMA_SQL)
+            if self.fixtures:
+                with open(self.fixtures, encoding="utf-8") as handle:
+                    insert_fixtures(connection, json.load(handle))
+        if self.preset:
+            self._seed_preset()
+
+    def _seed_preset(self):
+        from seeding import DataFactory, PostgresSeeder, get_preset
+
+        plan = DataFactory(seed=self.seed).build(get_preset(self.preset),
+                                                 email=f"{self.preset}@kosmanager.com")
+        with self.connect(self.dsn) as connection:
+            insert_fixtures(connection, {"users": [dict(plan.owner, password=PRESET_PASSWORD)]})
+        PostgresSeeder(dsn=self.dsn).seed(plan, plan.owner["email"])
+
+    # ==================== CLONES ====================
+
+    def clone(self, name):
+        """Create (or recreate) database `name` from the template; returns its DSN."""
+        name = _checked(name)
+        started = time.perf_counter()
+        with self.connect(self.admin_dsn) as admin:
+            admin.execute(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+            admin.execute(f'CREATE DATABASE "{name}" TEMPLATE "{self.name}"')
+        logger.info("Cloned %s from %s in %.2fs", name, self.name, time.perf_counter() - started)
+        return database_dsn(self.admin_dsn, name)
+
+    def drop(self, name):
+        with self.connect(self.admin_dsn) as admin:
+            admin.execute(f'DROP DATABASE IF EXISTS "{_checked(name)}" WITH (FORCE)')
+
+    def clones(self, prefix=CLONE_PREFIX):
+        """Names of the worker databases left on the server (not the template)."""
+        with self.connect(self.admin_dsn) as admin:
+            rows = admin.execute("SELECT datname FROM pg_database WHERE datname LIKE %s "
+                                 "AND NOT datistemplate ORDER BY datname",
+                                 (f"{prefix}\\_%",)).fetchall()
+        return [row[0] for row in rows if row[0] != self.name]
+
+
+def insert_fixtures(connection, data):
+    """
+    Insert declarative fixtures ({"users": [...], ...}, columns as in
+    schema.ts). Plain user passwords are hashed with pgcrypto's bcrypt,
+    which the app's bcryptjs accepts.
+    """
+    for table in TABLES:
+        for row in data.get(table, []):
+            columns = list(row)
+            values = ["crypt(%s, gen_salt('bf', 10))" if table == "users" and column == "password"
+                      else "%s" for column in columns]
+            connection.execute(f"INSERT INTO {table} ({', '.join(columns)}) "
+                               f"VALUES ({', '.join(values)})", [row[column] for column in columns])
@@ -0,0 +1,104 @@
+"""
+schema.py - Postgres DDL for src/lib/db/schema.ts
+KosManager Automated Testing
+"""
+import os
+import re
+
+SCHEMA_TS = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         "src", "lib", "db", "schema.ts")
+
+# What drizzle-kit push creates for schema.ts (gen_random_uuid() is built in
+# since Postgres 13; pgcrypto is only needed for bcrypt password hashes).
+SCHEMA_SQL = """
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+CREATE TABLE users (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    email text NOT NULL UNIQUE,
+    password text NOT NULL,
+    full_name text NOT NULL,
+    subscription_plan text NOT NULL DEFAULT 'free',
+    created_at timestamp NOT NULL DEFAULT now(),
+    updated_at timestamp NOT NULL DEFAULT now()
+);
+
+CREATE TABLE properties (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    owner_id uuid NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    name text NOT NULL,
+    address text NOT NULL,
+    total_rooms integer NOT NULL DEFAULT 0,
+    created_at timestamp NOT NULL DEFAULT now(),
+    updated_at timestamp NOT NULL DEFAULT now()
+);
+
+CREATE TABLE rooms (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    property_id uuid NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
+    room_number text NOT NULL,
+    price integer NOT NULL,
+    status text NOT NULL DEFAULT 'available',
+    facilities text[],
+    created_at timestamp NOT NULL DEFAULT now(),
+    updated_at timestamp NOT NULL DEFAULT now()
+);
+
+CREATE TABLE tenants (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    room_id uuid NOT NULL REFERENCES rooms(id) ON DELETE CASCADE,
+    name text NOT NULL,
+    phone_number text NOT NULL,
+    id_card_photo text,
+    start_date date NOT NULL,
+    due_date integer NOT NULL,
+    is_active boolean NOT NULL DEFAULT true,
+    created_at timestamp NOT NULL DEFAULT now(),
+    updated_at timestamp NOT NULL DEFAULT now()
+);
+
+CREATE TABLE invoices (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    tenant_id uuid NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+    amount integer NOT NULL,
+    status text NOT NULL DEFAULT 'unpaid',
+    period date NOT NULL,
+    paid_at timestamp,
+    created_at timestamp NOT NULL DEFAULT now()
+);
+"""
+
+TABLE_RE = re.compile(r'pgTable\(\s*"(\w+)"\s*,\s*\{(.*?)\n\}\)', re.S)
+TS_COLUMN_RE = re.compile(r'^\s*\w+:\s*\w+\(\s*"(\w+)"', re.M)
+SQL_TABLE_RE = re.compile(r"CREATE TABLE (\w+) \((.*?)\n\);", re.S)
+SQL_COLUMN_RE = re.compile(r"^\s{4}(\w+) ", re.M)
+
+
+def ts_columns(path=SCHEMA_TS):
+    """{table: [column, ...]} declared with pgTable() in schema.ts."""
+    with open(path, encoding="utf-8") as handle:
+        source = handle.read()
+    return {table: TS_COLUMN_RE.findall(body) for table, body in TABLE_RE.findall(source)}
+
+
+def sql_columns(ddl=SCHEMA_SQL):
+    return {table: SQL_COLUMN_RE.findall(body) for table, body in SQL_TABLE_RE.findall(ddl)}
+
+
+def schema_drift(path=SCHEMA_TS, ddl=SCHEMA_SQL):
+    """Tables/columns in schema.ts that SCHEMA_SQL lacks, or has in excess."""
+    expected, actual = ts_columns(path), sql_columns(ddl)
+    differences = []
+    for table in sorted(set(expected) | set(actual)):
+        if table not in actual:
+            differences.append(f"{table}: missing table")
+        elif table not in expected:
+            differences.append(f"{table}: not in schema.ts")
+        else:
+            for column in expected[table]:
+                if column not in actual[table]:
+                    differences.append(f"{table}.{column}: missing column")
+            for column in actual[table]:
+                if column not in expected[table]:
+                    differences.append(f"{table}.{column}: not in schema.ts")
+    return differences
@@ -0,0 +1,38 @@
+"""
+__init__.py - Drivers Package
+KosManager Automated Testing
+"""
+from .workspace import WorkerWorkspace, get_worker_id
+from .pool import BrowserPool
+from .chrome import build_chrome, profile_timings
+from .profiles import BrowserProfile, PROFILES, get_profile
+from .session import AuthenticatedSession
+from .resolver import DriverResolver, DriverResolutionError, resolve_chromedriver, last_resolution
+from .downloads import DownloadWatcher
+from .devices import DeviceProfile, DEVICES, get_device, reset_device
+from .network import NetworkProfile, NETWORK_PROFILES, get_network_profile, reset_network
+
+__all__ = [
+    'WorkerWorkspace',
+    'get_worker_id',
+    'BrowserPool',
+    'build_chrome',
+    'profile_timings',
+    'BrowserProfile',
+    'PROFILES',
+    'get_profile',
+    'DriverResolver',
+    'DriverResolutionError',
+    'resolve_chromedriver',
+    'last_resolution',
+    'AuthenticatedSession',
+    'DownloadWatcher',
+    'DeviceProfile',
+    'DEVICES',
+    'get_device',
+    'reset_device',
+    'NetworkProfile',
+    'NETWORK_PROFILES',
+    'get_network_profile',
+    'reset_network',
+]
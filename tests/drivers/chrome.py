@@ -0,0 +1,76 @@
+"""
+chrome.py - Chrome WebDriver Factory
+KosManager Automated Testing
+"""
+import itertools
+import os
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+from perf.cdp import enable_performance_log
+
+from .profiles import get_profile, ProfileTimings
+from .resolver import resolve_chromedriver
+from .workspace import get_worker_index
+
+# Optional fixed chromedriver port range: worker N uses BASE + N*100 + k.
+# When unset, Selenium picks a free port for every service.
+DRIVER_PORT_BASE = os.getenv("TEST_DRIVER_PORT_BASE")
+
+_instance_counter = itertools.count()
+
+# Startup and page-load timings of the active profile in this process
+profile_timings = ProfileTimings(get_profile().name)
+
+
+def _service_port():
+    """Return the chromedriver port for the next instance on this worker."""
+    if not DRIVER_PORT_BASE:
+        return 0
+    return int(DRIVER_PORT_BASE) + get_worker_index() * 100 + next(_instance_counter) % 100
+
+
+def build_chrome(workspace, profile=None):
+    """
+    Start a Chrome instance isolated to the given worker workspace.
+    The browser profile comes from TEST_BROWSER_PROFILE unless given.
+    The returned driver carries its user-data-dir in `driver.profile_dir`
+    so the pool can delete it after quitting.
+    """
+    profile = profile or get_profile()
+    profile_dir = workspace.new_profile_dir(profile.profile_base_dir())
+
+    chrome_options = Options()
+    profile.apply(chrome_options)
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    chrome_options.add_experimental_option("prefs", {
+        "download.default_directory": workspace.downloads_dir,
+        "download.prompt_for_download": False,
+        **profile.prefs,
+    })
+
+    # Console messages for the failure artifacts (artifacts.ArtifactStore)
+    chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    # --cdp-capture: log CDP Network events for perf.CdpRecorder
+    if os.getenv("TEST_CDP_CAPTURE") == "1":
+        enable_performance_log(chrome_options)
+
+    service = Service(resolve_chromedriver().path, port=_service_port())
+    started = time.perf_counter()
+    try:
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    except Exception:
+        workspace.remove_profile_dir(profile_dir)
+        raise
+    profile_timings.record_startup(time.perf_counter() - started)
+    driver.timings = profile_timings
+    # No implicit wait: BasePage uses explicit waits only, so absence
+    # checks and empty find_elements() calls return immediately.
+    driver.implicitly_wait(0)
+    driver.profile_dir = profile_dir
+    return driver
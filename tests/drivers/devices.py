@@ -0,0 +1,92 @@
+"""
+devices.py - Phone Emulation & CPU Throttling Profiles
+KosManager Automated Testing
+"""
+import os
+
+# Tailwind's `md` breakpoint: below it the dashboard shows BottomNav instead of Sidebar
+MD_BREAKPOINT = 768
+
+ANDROID_UA = ("Mozilla/5.0 (Linux; Android {android}; {model}) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/131.0.0.0 Mobile Safari/537.36")
+IPHONE_UA = ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+             "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1")
+
+
+class DeviceProfile:
+    """
+    A phone applied to a running browser with CDP Emulation: viewport,
+    device pixel ratio, touch, user agent and a CPU slowdown factor
+    (Emulation.setCPUThrottlingRate, 4 = four times slower than this
+    machine). Selected with TEST_DEVICE or --device.
+    """
+
+    def __init__(self, name, width, height, pixel_ratio, user_agent, cpu_throttle=1):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.pixel_ratio = pixel_ratio
+        self.user_agent = user_agent
+        self.cpu_throttle = cpu_throttle
+
+    @property
+    def viewport(self):
+        return f"{self.width}x{self.height}"
+
+    def is_mobile_layout(self):
+        """True when the dashboard renders BottomNav for this viewport."""
+        return self.width < MD_BREAKPOINT
+
+    def apply(self, driver):
+        """Emulate this phone until reset_device()."""
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": self.width,
+            "height": self.height,
+            "deviceScaleFactor": self.pixel_ratio,
+            "mobile": True,
+        })
+        driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled",
+                               {"enabled": True, "maxTouchPoints": 5})
+        driver.execute_cdp_cmd("Emulation.setUserAgentOverride", {"userAgent": self.user_agent})
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": self.cpu_throttle})
+        driver.device = self
+        return driver
+
+    def __repr__(self):
+        return f"DeviceProfile({self.name!r})"
+
+
+def reset_device(driver):
+    """Back to the desktop window the pooled browser was started with."""
+    driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+    driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": False})
+    driver.execute_cdp_cmd("Emulation.setUserAgentOverride", {"userAgent": ""})
+    driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": 1})
+    driver.device = None
+    return driver
+
+
+# From a mid-range phone down to the entry-level Androids most owners use
+DEVICES = {
+    "pixel-7": DeviceProfile("pixel-7", 412, 915, 2.625,
+                             ANDROID_UA.format(android=14, model="Pixel 7"), cpu_throttle=2),
+    "iphone-se": DeviceProfile("iphone-se", 375, 667, 2, IPHONE_UA, cpu_throttle=2),
+    "galaxy-a12": DeviceProfile("galaxy-a12", 360, 800, 2,
+                                ANDROID_UA.format(android=12, model="SM-A125F"), cpu_throttle=4),
+    "redmi-9a": DeviceProfile("redmi-9a", 360, 720, 2,
+                              ANDROID_UA.format(android=11, model="M2006C3LG"), cpu_throttle=6),
+}
+
+
+def get_device(name=None):
+    """
+    Return the device named by `name` or TEST_DEVICE, or None when
+    neither is set (or set to "desktop"): the browser's own window.
+    """
+    name = name or os.getenv("TEST_DEVICE", "")
+    if not name or name == "desktop":
+        return None
+    try:
+        return DEVICES[name]
+    except KeyError:
+        raise ValueError(f"Unknown device '{name}', expected one of: {', '.join(DEVICES)}")
@@ -0,0 +1,74 @@
+"""
+downloads.py - Managed Browser Downloads
+KosManager Automated Testing
+"""
+import fnmatch
+import os
+import shutil
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Chrome writes partial downloads under these suffixes
+PARTIAL_SUFFIXES = (".crdownload", ".tmp")
+
+
+class DownloadWatcher:
+    """
+    Sends a browser's downloads into a fresh directory and waits for them.
+
+    `directory` is emptied on start(); downloads are redirected to it via
+    CDP (Browser.setDownloadBehavior), which also works in headless mode.
+    A file counts as complete once no partial file is left and its size
+    is the same on two consecutive polls.
+    """
+
+    def __init__(self, driver, directory):
+        self.driver = driver
+        self.directory = os.path.abspath(directory)
+
+    def start(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory)
+        try:
+            self.driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": self.directory,
+            })
+        except (AttributeError, WebDriverException):
+            # Fall back to Page.setDownloadBehavior on older Chrome versions
+            self.driver.execute_cdp_cmd("Page.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": self.directory,
+            })
+        return self
+
+    def files(self, pattern="*"):
+        return sorted(name for name in os.listdir(self.directory)
+                      if fnmatch.fnmatch(name, pattern) and not name.endswith(PARTIAL_SUFFIXES))
+
+    def is_downloading(self):
+        return any(name.endswith(PARTIAL_SUFFIXES) for name in os.listdir(self.directory))
+
+    def wait_for_file(self, pattern="*", timeout=120, poll=0.05, on_poll=None):
+        """
+        Wait for a completed download matching `pattern`; returns its path.
+        `on_poll(driver)` is called on every poll (e.g. to sample metrics).
+        """
+        sizes = {}
+
+        def completed(driver):
+            if on_poll is not None:
+                on_poll(driver)
+            if self.is_downloading():
+                return False
+            for name in self.files(pattern):
+                path = os.path.join(self.directory, name)
+                size = os.path.getsize(path)
+                if size and sizes.get(name) == size:
+                    return path
+                sizes[name] = size
+            return False
+
+        return WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
+            completed, f"No download matching {pattern} in {self.directory}")
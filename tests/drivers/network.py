@@ -0,0 +1,88 @@
+"""
+network.py - Network Throttling Profiles
+KosManager Automated Testing
+"""
+import os
+
+KBPS = 1000 / 8  # bytes per second in one kilobit per second
+
+
+class NetworkProfile:
+    """
+    A mobile network applied to a running browser with CDP
+    Network.emulateNetworkConditions. Selected with TEST_NETWORK_PROFILE
+    (slow-3g, fast-3g, 4g or offline) or --network-profile.
+
+    `page_timeout` replaces BasePage's 10 s wait while the profile is on,
+    so slow links measure latency instead of timing out.
+    """
+
+    def __init__(self, name, latency_ms, download_kbps, upload_kbps, connection_type,
+                 offline=False, page_timeout=10):
+        self.name = name
+        self.latency_ms = latency_ms
+        self.download_kbps = download_kbps
+        self.upload_kbps = upload_kbps
+        self.connection_type = connection_type
+        self.offline = offline
+        self.page_timeout = page_timeout
+
+    def conditions(self):
+        """Parameters for Network.emulateNetworkConditions (throughput in bytes/s)."""
+        return {
+            "offline": self.offline,
+            "latency": self.latency_ms,
+            "downloadThroughput": self.download_kbps * KBPS,
+            "uploadThroughput": self.upload_kbps * KBPS,
+            "connectionType": self.connection_type,
+        }
+
+    def apply(self, driver):
+        """Throttle every request of this browser until reset()."""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", self.conditions())
+        driver.network_profile = self
+        return driver
+
+    def __repr__(self):
+        return f"NetworkProfile({self.name!r})"
+
+
+def reset_network(driver):
+    """Remove throttling so the pooled browser is back on the local link."""
+    driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+        "offline": False,
+        "latency": 0,
+        "downloadThroughput": -1,
+        "uploadThroughput": -1,
+    })
+    driver.network_profile = None
+    return driver
+
+
+# Same numbers as the Chrome DevTools throttling presets
+NETWORK_PROFILES = {
+    "slow-3g": NetworkProfile("slow-3g", latency_ms=2000, download_kbps=400, upload_kbps=400,
+                              connection_type="cellular3g", page_timeout=180),
+    "fast-3g": NetworkProfile("fast-3g", latency_ms=563, download_kbps=1440, upload_kbps=675,
+                              connection_type="cellular3g", page_timeout=90),
+    "4g": NetworkProfile("4g", latency_ms=165, download_kbps=8100, upload_kbps=1350,
+                         connection_type="cellular4g", page_timeout=30),
+    "offline": NetworkProfile("offline", latency_ms=0, download_kbps=0, upload_kbps=0,
+                              connection_type="none", offline=True),
+}
+
+
+def get_network_profile(name=None):
+    """
+    Return the profile named by `name` or TEST_NETWORK_PROFILE, or None
+    when neither is set (or set to "none"): the local link, unthrottled.
+    """
+    name = name or os.getenv("TEST_NETWORK_PROFILE", "")
+    if not name or name == "none":
+        return None
+    try:
+        return NETWORK_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown network profile '{name}', expected one of: {', '.join(NETWORK_PROFILES)}")
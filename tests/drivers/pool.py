@@ -0,0 +1,126 @@
+"""
+pool.py - Worker-Scoped Browser Pool
+KosManager Automated Testing
+"""
+import logging
+import os
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# Recycle the browser after this many tests (0 = only on crash).
+RECYCLE_AFTER = int(os.getenv("TEST_BROWSER_RECYCLE_AFTER", "0"))
+# Keep a spare browser warming in the background so recycling is instant.
+# Defaults to on only when recycling is enabled.
+PREWARM = os.getenv("TEST_BROWSER_PREWARM", "1" if RECYCLE_AFTER else "0") != "0"
+
+
+class BrowserPool:
+    """
+    Hands one browser at a time to the tests of a single xdist worker.
+
+    The first browser is started as soon as the pool is created. When
+    prewarm is on, a spare browser is started in a background thread so
+    replacing a crashed or recycled browser does not block the next test.
+    """
+
+    def __init__(self, factory, workspace, recycle_after=RECYCLE_AFTER, prewarm=PREWARM):
+        self.factory = factory
+        self.workspace = workspace
+        self.recycle_after = recycle_after
+        self.prewarm = prewarm
+        self.driver = None
+        self.tests_on_driver = 0
+        self.recycled = 0
+        self._spare = None
+        self._spare_thread = None
+        self._spare_error = None
+
+    def start(self):
+        """Start the first browser (and the spare, if prewarm is on)."""
+        self.workspace.prepare()
+        self.driver = self.factory(self.workspace)
+        self._warm_spare()
+        return self
+
+    def acquire(self):
+        """Return a live browser for the next test."""
+        if self.driver is None or not self.is_alive(self.driver):
+            logger.warning("Browser on %s is not responding, replacing it", self.workspace.worker_id)
+            self._replace()
+        return self.driver
+
+    def release(self, driver):
+        """Hand the browser back after a test; recycle it if it is due."""
+        self.tests_on_driver += 1
+        if not self.is_alive(driver):
+            self._replace()
+        elif self.recycle_after and self.tests_on_driver >= self.recycle_after:
+            self._replace()
+        return self
+
+    def is_alive(self, driver):
+        """Check whether the browser still answers WebDriver commands."""
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def shutdown(self):
+        """Quit every browser and delete the profile dirs."""
+        if self._spare_thread:
+            self._spare_thread.join()
+        for driver in (self.driver, self._spare):
+            if driver is not None:
+                self._quit(driver)
+        self.driver = None
+        self._spare = None
+        self.workspace.cleanup()
+
+    def _replace(self):
+        """Swap the current browser for the spare (or a new one)."""
+        if self.driver is not None:
+            self._quit(self.driver)
+        self.driver = self._take_spare() or self.factory(self.workspace)
+        self.tests_on_driver = 0
+        self.recycled += 1
+        self._warm_spare()
+
+    def _warm_spare(self):
+        """Start a spare browser in the background."""
+        if not self.prewarm or self._spare_thread is not None:
+            return
+
+        def start_spare():
+            try:
+                self._spare = self.factory(self.workspace)
+            except Exception as error:  # surfaced when the spare is needed
+                self._spare_error = error
+
+        self._spare_thread = threading.Thread(target=start_spare, daemon=True)
+        self._spare_thread.start()
+
+    def _take_spare(self):
+        """Return the warmed spare browser, or None if it failed to start."""
+        if self._spare_thread is None:
+            return None
+        self._spare_thread.join()
+        spare, self._spare = self._spare, None
+        self._spare_thread = None
+        if self._spare_error is not None:
+            logger.warning("Spare browser failed to start: %s", self._spare_error)
+            self._spare_error = None
+        return spare
+
+    def _quit(self, driver):
+        """Quit a browser, ignoring errors from an already dead one."""
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        profile_dir = getattr(driver, "profile_dir", None)
+        if profile_dir:
+            self.workspace.remove_profile_dir(profile_dir)
@@ -0,0 +1,140 @@
+"""
+profiles.py - Selectable Chrome Profiles
+KosManager Automated Testing
+"""
+import json
+import os
+import statistics
+
+TMPFS_DIR = "/dev/shm"
+
+# Flags that keep Chrome from throttling or doing background work the
+# tests never look at.
+_QUIET_ARGUMENTS = [
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+]
+
+
+class BrowserProfile:
+    """
+    A named set of Chrome options.
+    Selected with TEST_BROWSER_PROFILE (debug, ci or fast).
+    """
+
+    def __init__(self, name, arguments, prefs=None, window_size=None, tmpfs=False):
+        self.name = name
+        self.arguments = arguments
+        self.prefs = prefs or {}
+        self.window_size = window_size
+        self.tmpfs = tmpfs
+
+    def apply(self, chrome_options):
+        """Add this profile's arguments and prefs to ChromeOptions."""
+        for argument in self.arguments:
+            chrome_options.add_argument(argument)
+        if self.window_size:
+            chrome_options.add_argument("--window-size={},{}".format(*self.window_size))
+        return chrome_options
+
+    def profile_base_dir(self):
+        """Directory for user-data-dirs: tmpfs when requested and available."""
+        if self.tmpfs and os.path.isdir(TMPFS_DIR):
+            return TMPFS_DIR
+        return None
+
+
+PROFILES = {
+    # Local development: visible, maximized browser
+    "debug": BrowserProfile(
+        "debug",
+        arguments=["--start-maximized"],
+    ),
+    # CI: headless with the container-safe flags, full-size desktop viewport
+    "ci": BrowserProfile(
+        "ci",
+        arguments=[
+            "--headless=new",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+        ],
+        window_size=(1920, 1080),
+    ),
+    # Fastest: headless, no images/remote fonts/background work, profile on tmpfs
+    "fast": BrowserProfile(
+        "fast",
+        arguments=[
+            "--headless=new",
+            "--no-sandbox",
+            "--disable-gpu",
+            "--disable-remote-fonts",
+            "--blink-settings=imagesEnabled=false",
+        ] + _QUIET_ARGUMENTS,
+        prefs={"profile.managed_default_content_settings.images": 2},
+        window_size=(1366, 768),
+        tmpfs=True,
+    ),
+}
+
+
+def get_profile(name=None):
+    """Return the profile named by `name` or TEST_BROWSER_PROFILE (default: debug)."""
+    name = name or os.getenv("TEST_BROWSER_PROFILE", "debug")
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown TEST_BROWSER_PROFILE '{name}', expected one of: {', '.join(PROFILES)}")
+
+
+class ProfileTimings:
+    """Browser startup and page-load durations for one profile."""
+
+    def __init__(self, profile_name):
+        self.profile_name = profile_name
+        self.startups = []
+        self.page_loads = []
+
+    def record_startup(self, seconds):
+        self.startups.append(seconds)
+
+    def record_page_load(self, path, seconds):
+        self.page_loads.append((path, seconds))
+
+    def summary(self):
+        """Return the timings as a JSON-serializable dict."""
+        load_times = [seconds for _, seconds in self.page_loads]
+        return {
+            "profile": self.profile_name,
+            "startups": len(self.startups),
+            "startup_median_s": _median(self.startups),
+            "startup_total_s": round(sum(self.startups), 3),
+            "page_loads": len(load_times),
+            "page_load_median_s": _median(load_times),
+            "page_load_total_s": round(sum(load_times), 3),
+        }
+
+    def summary_line(self):
+        summary = self.summary()
+        return (f"Browser profile '{summary['profile']}': "
+                f"{summary['startups']} start(s), median {summary['startup_median_s']}s; "
+                f"{summary['page_loads']} page load(s), median {summary['page_load_median_s']}s")
+
+    def write(self, path):
+        """Write the summary as JSON."""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.summary(), handle, indent=2)
+        return path
+
+
+def _median(values):
+    return round(statistics.median(values), 3) if values else None
@@ -0,0 +1,151 @@
+"""
+resolver.py - Cached Chromedriver Resolution
+KosManager Automated Testing
+"""
+import json
+import logging
+import os
+import platform
+import tempfile
+import time
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+logger = logging.getLogger(__name__)
+
+# Explicit chromedriver binary; skips detection and caching entirely.
+CHROMEDRIVER_PATH = os.getenv("TEST_CHROMEDRIVER_PATH")
+# Never touch the network: only the cache (or TEST_CHROMEDRIVER_PATH) is used.
+OFFLINE = os.getenv("TEST_DRIVER_OFFLINE", "0") == "1"
+CACHE_FILE = os.getenv(
+    "TEST_DRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "kosmanager-tests", "chromedriver.json"),
+)
+
+
+class DriverResolutionError(RuntimeError):
+    """Raised when no usable chromedriver binary can be found."""
+
+
+class Resolution:
+    """Result of resolving the chromedriver binary."""
+
+    def __init__(self, path, source, chrome_version, seconds):
+        self.path = path
+        self.source = source
+        self.chrome_version = chrome_version
+        self.seconds = seconds
+
+    def __str__(self):
+        version = self.chrome_version or "unknown"
+        return (f"chromedriver from {self.source} in {self.seconds:.3f}s "
+                f"(Chrome {version}): {self.path}")
+
+
+class DriverResolver:
+    """
+    Resolves the chromedriver path once and pins it on disk.
+
+    The cache maps "<os>:<chrome version>" to a binary path, so the slow
+    ChromeDriverManager().install() only runs when Chrome is upgraded.
+    """
+
+    def __init__(self, cache_file=CACHE_FILE, explicit_path=CHROMEDRIVER_PATH,
+                 offline=OFFLINE, installer=None, version_detector=None):
+        self.cache_file = cache_file
+        self.explicit_path = explicit_path
+        self.offline = offline
+        self.installer = installer or (lambda: ChromeDriverManager().install())
+        self.version_detector = version_detector or self._detect_chrome_version
+        self.last = None
+
+    def resolve(self):
+        """Return a Resolution, reusing the previous one in this process."""
+        if self.last is not None:
+            return self.last
+
+        started = time.perf_counter()
+        path, source, version = self._resolve()
+        self.last = Resolution(path, source, version, time.perf_counter() - started)
+        logger.info("Resolved %s", self.last)
+        return self.last
+
+    def _resolve(self):
+        if self.explicit_path:
+            if not _is_executable(self.explicit_path):
+                raise DriverResolutionError(
+                    f"TEST_CHROMEDRIVER_PATH is not an executable file: {self.explicit_path}")
+            return self.explicit_path, "TEST_CHROMEDRIVER_PATH", None
+
+        version = self.version_detector()
+        cache = self._read_cache()
+        key = f"{platform.system().lower()}:{version}"
+
+        cached = cache.get(key)
+        if cached and _is_executable(cached):
+            return cached, "cache", version
+
+        if self.offline:
+            fallback = self._latest_cached(cache) if version is None else None
+            if fallback:
+                return fallback, "cache (version unknown)", None
+            raise DriverResolutionError(
+                f"Offline mode: no cached chromedriver for Chrome {version} in "
+                f"{self.cache_file}. Set TEST_CHROMEDRIVER_PATH or run once online.")
+
+        path = self.installer()
+        if version is not None:
+            cache[key] = path
+            self._write_cache(cache)
+        return path, "download", version
+
+    def _detect_chrome_version(self):
+        """Return the installed Chrome version, or None if not detectable."""
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+
+    def _latest_cached(self, cache):
+        """Return the newest usable cached binary for this OS."""
+        prefix = f"{platform.system().lower()}:"
+        entries = sorted(
+            (key for key in cache if key.startswith(prefix)),
+            key=lambda key: [int(part) for part in key[len(prefix):].split(".") if part.isdigit()],
+            reverse=True,
+        )
+        for key in entries:
+            if _is_executable(cache[key]):
+                return cache[key]
+        return None
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, cache):
+        """Write the cache atomically so parallel workers never see half a file."""
+        directory = os.path.dirname(self.cache_file)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(cache, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_file)
+
+
+def _is_executable(path):
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+_default_resolver = DriverResolver()
+
+
+def resolve_chromedriver():
+    """Return the process-wide chromedriver Resolution."""
+    return _default_resolver.resolve()
+
+
+def last_resolution():
+    """Return the Resolution made by this process, or None."""
+    return _default_resolver.last
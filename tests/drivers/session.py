@@ -0,0 +1,95 @@
+"""
+session.py - Cached Authenticated Browser Session
+KosManager Automated Testing
+"""
+import logging
+import os
+import time
+
+import requests
+
+from api import login_with_credentials, is_session_cookie
+from pages import BasePage, LoginPage
+
+logger = logging.getLogger(__name__)
+
+# How to obtain the session cookie: "api" (NextAuth callback) or "ui" (login form)
+LOGIN_MODE = os.getenv("TEST_LOGIN_MODE", "api")
+# Re-login this many seconds before the cookie actually expires
+EXPIRY_MARGIN = 60
+
+
+class AuthenticatedSession:
+    """
+    Logs in once per worker and replays the NextAuth cookies into the browser.
+
+    The cookies are captured on the first use and injected through CDP
+    before every test, so tests start on /dashboard without going through
+    the login form. When the cookies expire, or the app sends the browser
+    back to /login, the session logs in again.
+    """
+
+    def __init__(self, base_url, email, password, login_mode=LOGIN_MODE):
+        self.base_url = base_url
+        self.email = email
+        self.password = password
+        self.login_mode = login_mode
+        self.cookies = []
+        self.logins = 0
+
+    def apply(self, driver, path="/dashboard", wait_ready=True):
+        """
+        Inject the session cookies and open `path` as a logged-in user
+        (wait_ready as in BasePage.open).
+        """
+        if self.is_expired():
+            self.login(driver)
+        self._inject(driver)
+        page = BasePage(driver, self.base_url).open(path, wait_ready)
+
+        if "/login" in driver.current_url:
+            logger.info("Session for %s was rejected, logging in again", self.email)
+            self.login(driver)
+            self._inject(driver)
+            page.open(path, wait_ready)
+        return driver
+
+    def is_expired(self):
+        """Check whether the cached cookies are missing or about to expire."""
+        if not self.cookies:
+            return True
+        expiries = [cookie["expiry"] for cookie in self.cookies if "expiry" in cookie]
+        return bool(expiries) and min(expiries) - EXPIRY_MARGIN <= time.time()
+
+    def login(self, driver):
+        """Capture fresh session cookies."""
+        if self.login_mode == "ui":
+            self.cookies = self._login_via_ui(driver)
+        else:
+            with requests.Session() as http:
+                self.cookies = login_with_credentials(http, self.base_url, self.email, self.password)
+        self.logins += 1
+        return self
+
+    def _login_via_ui(self, driver):
+        """Log in through the /login form and read the cookies back."""
+        login = LoginPage(driver, self.base_url)
+        login.open()
+        login.login(email=self.email, password=self.password)
+        login.wait_for_url_contains("/dashboard")
+        return [cookie for cookie in driver.get_cookies() if is_session_cookie(cookie["name"])]
+
+    def _inject(self, driver):
+        """Set the cookies through CDP, which works before visiting the site."""
+        for cookie in self.cookies:
+            params = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "url": self.base_url,
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            }
+            if "expiry" in cookie:
+                params["expires"] = cookie["expiry"]
+            driver.execute_cdp_cmd("Network.setCookie", params)
@@ -0,0 +1,76 @@
+"""
+workspace.py - Per-Worker Browser Workspace
+KosManager Automated Testing
+"""
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime
+
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports")
+
+
+def get_worker_id():
+    """Return the pytest-xdist worker id, or 'master' when not distributed."""
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def get_worker_index():
+    """Return the numeric worker index (gw3 -> 3, master -> 0)."""
+    match = re.search(r"(\d+)$", get_worker_id())
+    return int(match.group(1)) if match else 0
+
+
+def get_run_id():
+    """
+    Return an id shared by every worker of the current run.
+    The controller sets TEST_RUN_ID before workers are spawned, so all
+    workers inherit the same value.
+    """
+    run_id = os.getenv("TEST_RUN_ID")
+    if not run_id:
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.environ["TEST_RUN_ID"] = run_id
+    return run_id
+
+
+class WorkerWorkspace:
+    """
+    Isolated directories for one xdist worker.
+
+    Every worker gets its own downloads and artifact directories under
+    reports/runs/<run_id>/<worker_id>/, and every browser started by the
+    worker gets a fresh throwaway user-data-dir.
+    """
+
+    def __init__(self, worker_id=None, run_id=None, reports_dir=REPORTS_DIR):
+        self.worker_id = worker_id or get_worker_id()
+        self.run_id = run_id or get_run_id()
+        self.root = os.path.join(reports_dir, "runs", self.run_id, self.worker_id)
+        self.downloads_dir = os.path.join(self.root, "downloads")
+        self.artifacts_dir = os.path.join(self.root, "artifacts")
+        self._profile_dirs = []
+
+    def prepare(self):
+        """Create the worker directories."""
+        os.makedirs(self.downloads_dir, exist_ok=True)
+        os.makedirs(self.artifacts_dir, exist_ok=True)
+        return self
+
+    def new_profile_dir(self, base_dir=None):
+        """Create a fresh Chrome user-data-dir for one browser instance."""
+        path = tempfile.mkdtemp(prefix=f"kos-{self.worker_id}-", dir=base_dir)
+        self._profile_dirs.append(path)
+        return path
+
+    def remove_profile_dir(self, path):
+        """Delete a user-data-dir once its browser has quit."""
+        shutil.rmtree(path, ignore_errors=True)
+        if path in self._profile_dirs:
+            self._profile_dirs.remove(path)
+
+    def cleanup(self):
+        """Delete every profile dir still owned by this workspace."""
+        for path in list(self._profile_dirs):
+            self.remove_profile_dir(path)
@@ -0,0 +1,21 @@
+"""
+__init__.py - Test-Impact Selection Package
+KosManager Automated Testing
+"""
+from .graph import SourceGraph
+from .selection import Impact, ImpactError, ImpactSelector, analyze, changed_files
+from .testmap import StaticTestMap
+from .visits import VisitLog, VisitMap, visit_log
+
+__all__ = [
+    'SourceGraph',
+    'Impact',
+    'ImpactError',
+    'ImpactSelector',
+    'analyze',
+    'changed_files',
+    'StaticTestMap',
+    'VisitLog',
+    'VisitMap',
+    'visit_log',
+]
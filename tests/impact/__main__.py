@@ -0,0 +1,46 @@
+"""
+__main__.py - Test-Impact Command Line
+KosManager Automated Testing
+
+Usage (from the tests/ directory):
+    python -m impact diff --since origin/main     # what a branch affects
+    python -m impact diff src/components/invoices/invoice-actions.tsx
+    python -m impact routes                        # route -> source files
+"""
+import argparse
+import sys
+
+from .graph import SourceGraph
+from .selection import ImpactError, analyze, changed_files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show which app routes a change affects.")
+    parser.add_argument("command", choices=("diff", "routes"))
+    parser.add_argument("files", nargs="*", help="changed files, relative to the repository root")
+    parser.add_argument("--since", default="origin/main", help="git ref to diff against")
+    args = parser.parse_args(argv)
+
+    graph = SourceGraph()
+    if args.command == "routes":
+        for route in sorted(graph.routes):
+            files = sorted(graph.closure(route))
+            print(f"{route} ({len(files)} file(s))")
+            for path in files:
+                print(f"  {path}")
+        return 0
+
+    try:
+        changed = args.files or changed_files(args.since)
+    except ImpactError as error:
+        print(f"Cannot diff against {args.since}: {error}", file=sys.stderr)
+        return 1
+    impact = analyze(changed, graph)
+    for path in changed:
+        print(f"  {path}")
+    print(f"Impact: {impact.summary()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
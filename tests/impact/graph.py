@@ -0,0 +1,168 @@
+"""
+graph.py - Static Route → Source File Map of the Next.js App
+KosManager Automated Testing
+"""
+import os
+import re
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(TESTS_DIR)
+
+SOURCE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx")
+# Files of a route segment that wrap its page (besides page.tsx itself)
+SEGMENT_FILES = ("layout", "template", "loading", "error", "not-found")
+
+IMPORT_RE = re.compile(r"""\bfrom\s*["']([^"']+)["']|\bimport\s*\(?\s*["']([^"']+)["']""")
+API_LITERAL_RE = re.compile(r"""["'`](/api/[^"'`?#\s]*)""")
+TEMPLATE_RE = re.compile(r"\$\{[^}]*\}")
+# Client helpers that call /api routes without a literal URL in our code
+CLIENT_API_CALLS = {
+    "signIn(": "/api/auth/callback/credentials",
+    "signOut(": "/api/auth/signout",
+    "useSession(": "/api/auth/session",
+}
+
+
+def match_route(pattern, path):
+    """
+    Specificity of `pattern` (e.g. /dashboard/properties/[id]) for the
+    concrete `path`, or None when it does not match. Lower is more
+    specific: static segments beat [param], which beats [...catchAll].
+    """
+    wanted = [part for part in pattern.split("/") if part]
+    parts = [part for part in path.split("/") if part]
+    rank = []
+    for index, segment in enumerate(wanted):
+        if segment.startswith("[[..."):
+            return tuple(rank) + (3,)
+        if segment.startswith("[..."):
+            return tuple(rank) + (2,) if len(parts) > index else None
+        if index >= len(parts):
+            return None
+        if segment.startswith("["):
+            rank.append(1)
+        elif segment == parts[index]:
+            rank.append(0)
+        else:
+            return None
+    return tuple(rank) if len(parts) == len(wanted) else None
+
+
+class SourceGraph:
+    """
+    Import graph of src/ and the routes built on it.
+
+    Every src/app page.tsx is a route with its own layouts (and those of
+    the parent segments) as entry files; every route.ts is an API route.
+    A route depends on all files reachable from its entries through
+    `@/` and relative imports, plus the API routes those files fetch
+    (`/api/...` literals, with `${...}` standing in for a segment).
+    """
+
+    def __init__(self, root=REPO_ROOT, src="src"):
+        self.root = root
+        self.src = src
+        self.imports = {}
+        self.api_refs = {}
+        self.routes = {}
+        self._closures = {}
+        self._scan()
+
+    # ==================== SCANNING ====================
+
+    def _scan(self):
+        app = f"{self.src}/app"
+        for directory, _, names in os.walk(os.path.join(self.root, self.src)):
+            for name in sorted(names):
+                path = os.path.relpath(os.path.join(directory, name), self.root).replace(os.sep, "/")
+                if name.endswith(SOURCE_EXTENSIONS):
+                    self._parse(path)
+                else:
+                    self.imports.setdefault(path, set())
+        for path in sorted(self.imports):
+            if not path.startswith(f"{app}/"):
+                continue
+            stem, name = os.path.splitext(path)[0], os.path.basename(path)
+            if os.path.splitext(name)[0] == "page":
+                self.routes[self._route_path(app, stem)] = self._page_entries(app, path)
+            elif os.path.splitext(name)[0] == "route":
+                self.routes[self._route_path(app, stem)] = {path}
+
+    def _parse(self, path):
+        with open(os.path.join(self.root, path), encoding="utf-8") as handle:
+            text = handle.read()
+        imports = set()
+        for match in IMPORT_RE.finditer(text):
+            resolved = self._resolve(path, match.group(1) or match.group(2))
+            if resolved is not None:
+                imports.add(resolved)
+        self.imports[path] = imports
+        refs = {TEMPLATE_RE.sub("x", literal).rstrip("/") for literal in API_LITERAL_RE.findall(text)}
+        refs.update(url for call, url in CLIENT_API_CALLS.items() if call in text)
+        self.api_refs[path] = refs
+
+    def _resolve(self, importer, spec):
+        if spec.startswith("@/"):
+            base = f"{self.src}/{spec[2:]}"
+        elif spec.startswith("."):
+            base = os.path.normpath(os.path.join(os.path.dirname(importer), spec)).replace(os.sep, "/")
+        else:
+            return None  # npm package
+        candidates = [base] + [base + ext for ext in SOURCE_EXTENSIONS] + \
+                     [f"{base}/index{ext}" for ext in SOURCE_EXTENSIONS]
+        for candidate in candidates:
+            if os.path.isfile(os.path.join(self.root, candidate)):
+                return candidate
+        return None
+
+    @staticmethod
+    def _route_path(app, stem):
+        segments = stem[len(app):].split("/")[:-1]
+        # Route groups like (marketing) do not appear in the URL
+        return "/" + "/".join(part for part in segments if part and not part.startswith("("))
+
+    def _page_entries(self, app, page):
+        entries = {page}
+        directory = os.path.dirname(page)
+        while True:
+            for name in SEGMENT_FILES:
+                for ext in SOURCE_EXTENSIONS:
+                    if f"{directory}/{name}{ext}" in self.imports:
+                        entries.add(f"{directory}/{name}{ext}")
+            if directory == app:
+                return entries
+            directory = os.path.dirname(directory)
+
+    # ==================== QUERIES ====================
+
+    def route_of(self, path):
+        """The route pattern serving a concrete URL path, or None."""
+        path = path.split("?", 1)[0].split("#", 1)[0] or "/"
+        ranked = [(match_route(pattern, path), pattern) for pattern in self.routes]
+        ranked = [(rank, pattern) for rank, pattern in ranked if rank is not None]
+        return min(ranked)[1] if ranked else None
+
+    def reachable(self, entries):
+        """Every src file imported, directly or not, by `entries`."""
+        seen, stack = set(), list(entries)
+        while stack:
+            path = stack.pop()
+            if path not in seen:
+                seen.add(path)
+                stack.extend(self.imports.get(path, ()))
+        return seen
+
+    def closure(self, route):
+        """Files `route` depends on, including the API routes it fetches."""
+        if route not in self._closures:
+            files = self.reachable(self.routes[route])
+            if not route.startswith("/api"):
+                fetched = {self.route_of(ref) for path in files for ref in self.api_refs.get(path, ())}
+                for api in sorted(filter(None, fetched)):
+                    files |= self.reachable(self.routes[api])
+            self._closures[route] = files
+        return self._closures[route]
+
+    def routes_for(self, path):
+        """Routes whose closure contains the src file `path`."""
+        return {route for route in self.routes if path in self.closure(route)}
@@ -0,0 +1,132 @@
+"""
+plugin.py - Pytest Plugin for Test-Impact Selection
+KosManager Automated Testing
+"""
+import os
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from .graph import REPO_ROOT, SourceGraph
+from .selection import ImpactError, ImpactSelector, analyze, changed_files
+from .testmap import APP_INDEPENDENT, StaticTestMap
+from .visits import DEFAULT_IMPACT_MAP, VisitMap, visit_log
+
+# Recorded paths per test id and tests that were skipped, on the controller
+_visited = {}
+_skipped = set()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "test-impact selection")
+    group.addoption(
+        "--impact-since", default=os.getenv("TEST_IMPACT_SINCE"),
+        help="Run only tests affected by changes since this git ref, e.g. origin/main "
+             "(default: TEST_IMPACT_SINCE)",
+    )
+    group.addoption(
+        "--impact-map", default=os.getenv("TEST_IMPACT_MAP", DEFAULT_IMPACT_MAP),
+        help="Recorded paths per test used for impact selection",
+    )
+    group.addoption(
+        "--record-impact", action="store_true", default=False,
+        help="Update --impact-map with the pages and API routes each test opens",
+    )
+
+
+def pytest_configure(config):
+    config.impact = None
+
+
+@pytest.fixture(scope="session")
+def visit_recorder(request):
+    """
+    The visit log when --record-impact is on, else None. The conftest
+    fixtures attach it to drivers and API clients as `visit_recorder`.
+    """
+    return visit_log if request.config.getoption("--record-impact") else None
+
+
+def item_location(item):
+    """(repo-relative module path, "Class::test" without parameters)."""
+    relpath = os.path.relpath(str(item.path), REPO_ROOT).replace(os.sep, "/")
+    name, cls = getattr(item, "originalname", item.name), getattr(item, "cls", None)
+    qualname = name if cls is None else f"{cls.__name__}::{name}"
+    return relpath, qualname
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep only the tests affected by the diff against --impact-since."""
+    since = config.getoption("--impact-since")
+    if not since or not items:
+        return
+    graph = SourceGraph()
+    try:
+        impact = analyze(changed_files(since), graph)
+    except ImpactError as error:
+        impact = analyze([], graph)
+        impact.full_reasons.append(str(error))
+    config.impact = impact
+    if impact.full:
+        return
+    visit_map = VisitMap.load(config.getoption("--impact-map"))
+    selector = ImpactSelector(impact, graph, StaticTestMap(), visit_map, APP_INDEPENDENT)
+    selected, deselected = [], []
+    for item in items:
+        relpath, qualname = item_location(item)
+        affected = selector.affected(relpath, qualname, item.nodeid, item.fixturenames)
+        (selected if affected else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def pytest_runtest_setup(item):
+    if item.config.getoption("--record-impact"):
+        visit_log.begin()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Send the paths the test opened with its teardown report (reaches the xdist controller)."""
+    report = yield
+    if not visit_log.active:
+        return report
+    driver = item.funcargs.get("browser")
+    if report.when == "call" and driver is not None:
+        # Pages reached by clicking links rather than BasePage.open
+        try:
+            visit_log.record(driver.current_url)
+        except WebDriverException:
+            pass
+    if report.when == "teardown":
+        report.user_properties.append(("visited_paths", visit_log.end()))
+    return report
+
+
+def pytest_runtest_logreport(report):
+    if report.skipped:
+        _skipped.add(report.nodeid)
+    for name, value in report.user_properties:
+        if name == "visited_paths":
+            _visited[report.nodeid] = value
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput") or not config.getoption("--record-impact"):
+        return
+    visit_map = VisitMap.load(config.getoption("--impact-map"))
+    for nodeid, paths in _visited.items():
+        if nodeid not in _skipped:
+            visit_map.update(nodeid, paths)
+    visit_map.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.impact is not None:
+        terminalreporter.write_line(f"Impact: {config.impact.summary()}")
+    if config.getoption("--record-impact") and _visited:
+        recorded = len(set(_visited) - _skipped)
+        terminalreporter.write_line(
+            f"Recorded visited paths of {recorded} test(s) in {config.getoption('--impact-map')}")
@@ -0,0 +1,123 @@
+"""
+selection.py - Changed Files → Affected Routes → Affected Tests
+KosManager Automated Testing
+"""
+import fnmatch
+import subprocess
+
+from .graph import REPO_ROOT
+
+# Changes that cannot affect a test run
+IGNORED = (
+    "*.md", "docs/*", "env.example", ".gitignore", "eslint.config.mjs", "run_tests.bat",
+    "requests.jsonl", "tests/.test_durations.json", "tests/.test_impact.json",
+)
+
+
+class ImpactError(RuntimeError):
+    """Raised when the changed files cannot be determined."""
+
+
+def _git(*args, root=REPO_ROOT):
+    try:
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=True)
+    except FileNotFoundError as error:
+        raise ImpactError("git is not installed") from error
+    except subprocess.CalledProcessError as error:
+        raise ImpactError(f"git {' '.join(args)}: {error.stderr.strip()}") from error
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def changed_files(since, root=REPO_ROOT):
+    """
+    Files changed on this branch since it left `since` (e.g. origin/main),
+    committed or not, plus untracked files. Renames count as a delete
+    and an add.
+    """
+    base = _git("merge-base", since, "HEAD", root=root)[0]
+    changed = set(_git("diff", "--name-only", "--no-renames", base, root=root))
+    changed.update(_git("ls-files", "--others", "--exclude-standard", root=root))
+    return sorted(changed)
+
+
+class Impact:
+    """
+    What a set of changed files affects: app routes, test modules, or
+    everything (`full`, with the first reason found).
+    """
+
+    def __init__(self, changed):
+        self.changed = list(changed)
+        self.routes = set()
+        self.test_modules = set()
+        self.full_reasons = []
+
+    @property
+    def full(self):
+        return bool(self.full_reasons)
+
+    @property
+    def reason(self):
+        return self.full_reasons[0] if self.full_reasons else None
+
+    def summary(self):
+        if self.full:
+            return f"full suite ({self.reason})"
+        parts = [f"{len(self.changed)} changed file(s)"]
+        if self.routes:
+            parts.append(f"routes: {', '.join(sorted(self.routes))}")
+        if self.test_modules:
+            parts.append(f"test modules: {', '.join(sorted(self.test_modules))}")
+        return "; ".join(parts)
+
+
+def analyze(changed, graph):
+    """Classify every changed path; anything not understood means the full suite."""
+    impact = Impact(changed)
+    for path in changed:
+        if any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED):
+            continue
+        if path.startswith(f"{graph.src}/"):
+            routes = graph.routes_for(path) if path in graph.imports else set()
+            if routes:
+                impact.routes |= routes
+            else:
+                impact.full_reasons.append(f"{path} is not reached from any route")
+        elif path.startswith("tests/") and path.rsplit("/", 1)[-1].startswith("test_") \
+                and path.endswith(".py"):
+            impact.test_modules.add(path)
+        else:
+            # Config, dependencies, public assets, test infrastructure
+            impact.full_reasons.append(f"{path} changed")
+    return impact
+
+
+class ImpactSelector:
+    """
+    Decides per test whether `impact` affects it. A test is affected
+    when its module changed, or when a path it visited (recorded map)
+    or is expected to visit (static map) is served by an affected route.
+    Tests with no known paths always run, except APP_INDEPENDENT ones.
+    """
+
+    def __init__(self, impact, graph, static_map, visit_map, app_independent=()):
+        self.impact = impact
+        self.graph = graph
+        self.static_map = static_map
+        self.visit_map = visit_map
+        self.app_independent = tuple(app_independent)
+
+    def routes(self, relpath, qualname, nodeid, fixturenames=()):
+        """Routes of a test, or None when nothing is known about it."""
+        if relpath.startswith(self.app_independent):
+            return set()
+        paths = set(self.visit_map.paths(nodeid))
+        paths |= self.static_map.paths(relpath, qualname, fixturenames)
+        routes = {self.graph.route_of(path) for path in paths} - {None}
+        return routes or None
+
+    def affected(self, relpath, qualname, nodeid, fixturenames=()):
+        if self.impact.full or relpath in self.impact.test_modules:
+            return True
+        routes = self.routes(relpath, qualname, nodeid, fixturenames)
+        return routes is None or bool(routes & self.impact.routes)
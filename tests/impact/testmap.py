@@ -0,0 +1,143 @@
+"""
+testmap.py - Static Test → URL Map from the Test Sources
+KosManager Automated Testing
+"""
+import ast
+import os
+
+from .graph import REPO_ROOT, TESTS_DIR
+
+# Tests that never talk to the app (fakes only); they run when their own
+# module changes
+APP_INDEPENDENT = ("tests/unit/",)
+
+# What the conftest fixtures open before the test body runs
+LOGIN = "/api/auth/callback/credentials"
+FIXTURE_VISITS = {
+    "auth_session": (LOGIN,),
+    "logged_in": (LOGIN, "/dashboard"),
+    "api_client": (LOGIN,),
+    "fresh_owner": ("/api/auth/register", LOGIN),
+    "seeded_owner": ("/api/auth/register", LOGIN, "/api/properties", "/api/properties/x/rooms",
+                     "/api/tenants", "/api/tenants/bulk", "/api/invoices", "/api/invoices/x"),
+}
+
+
+def literal_path(node):
+    """A "/..." string or f-string (`{...}` becomes x), else None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        text = node.value
+    elif isinstance(node, ast.JoinedStr):
+        text = "".join(part.value if isinstance(part, ast.Constant) else "x"
+                       for part in node.values)
+    else:
+        return None
+    return text if text.startswith("/") and " " not in text else None
+
+
+# "/" passed to these is a separator, not a URL
+STRING_METHODS = {"split", "rsplit", "strip", "rstrip", "lstrip", "startswith", "endswith", "join"}
+
+
+def scan(node):
+    """URL-like literals and the names/attributes referenced under `node`."""
+    paths, names, skip = set(), set(), set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.JoinedStr):
+            skip.update(id(part) for part in child.values)
+        elif isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute) \
+                and child.func.attr in STRING_METHODS:
+            skip.update(id(arg) for arg in child.args)
+    for child in ast.walk(node):
+        path = literal_path(child) if id(child) not in skip else None
+        if path is not None:
+            paths.add(path)
+        elif isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, ast.Attribute):
+            names.add(child.attr)
+    return paths, names
+
+
+def _parse(path):
+    with open(path, encoding="utf-8") as handle:
+        return ast.parse(handle.read(), filename=path)
+
+
+def class_paths(path):
+    """{ClassName: paths} for the page objects in `path`."""
+    return {node.name: scan(node)[0] for node in _parse(path).body if isinstance(node, ast.ClassDef)}
+
+
+def method_paths(path, class_name):
+    """{method: paths} for the methods of `class_name` that use a literal path."""
+    for node in _parse(path).body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            methods = {item.name: scan(item)[0] for item in node.body
+                       if isinstance(item, ast.FunctionDef)}
+            return {name: paths for name, paths in methods.items() if paths}
+    return {}
+
+
+class StaticTestMap:
+    """
+    Paths a test is expected to open, read from the sources: "/..."
+    literals in the test and in the fixtures/helpers of its module it
+    uses (functions and module-level path constants), the pages of the
+    page objects it names (pages/*.py), the routes of the
+    KosManagerClient methods it calls (api/client.py), and
+    FIXTURE_VISITS for the conftest fixtures it requests.
+    """
+
+    def __init__(self, tests_dir=TESTS_DIR, root=REPO_ROOT):
+        self.root = root
+        self.known = {}
+        pages_dir = os.path.join(tests_dir, "pages")
+        for name in sorted(os.listdir(pages_dir)):
+            if name.endswith("_pages.py"):
+                self.known.update(class_paths(os.path.join(pages_dir, name)))
+        self.known.update(method_paths(os.path.join(tests_dir, "api", "client.py"), "KosManagerClient"))
+        self.modules = {}
+
+    def _module(self, relpath):
+        """
+        {qualname: (paths, names)} for every function of a test module,
+        plus module-level constants holding paths (ROUTES = ["/dashboard"]),
+        which count as helpers of the tests that name them.
+        """
+        if relpath not in self.modules:
+            functions = {}
+            tree = _parse(os.path.join(self.root, relpath))
+            for node in tree.body:
+                if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+                    constant = scan(node.value)
+                    if constant[0]:
+                        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                        for target in targets:
+                            if isinstance(target, ast.Name):
+                                functions[target.id] = constant
+                elif isinstance(node, ast.ClassDef):
+                    for item in node.body:
+                        if isinstance(item, ast.FunctionDef):
+                            functions[f"{node.name}::{item.name}"] = scan(item)
+                elif isinstance(node, ast.FunctionDef):
+                    functions[node.name] = scan(node)
+            self.modules[relpath] = functions
+        return self.modules[relpath]
+
+    def paths(self, relpath, qualname, fixturenames=()):
+        """Paths for the test `qualname` ("Class::test" or "test") of `relpath`."""
+        functions = self._module(relpath)
+        scope, _, test = qualname.rpartition("::")
+        own_paths, own_names = functions.get(qualname, (set(), set()))
+        paths, names = set(own_paths), set(own_names) | set(fixturenames)
+        # Helpers and fixtures defined in the module, one level deep
+        for name in names - {test}:
+            helper = functions.get(f"{scope}::{name}") or functions.get(name)
+            if helper is not None:
+                paths |= helper[0]
+                names = names | helper[1]
+        for name in names:
+            paths.update(self.known.get(name, ()))
+            paths.update(FIXTURE_VISITS.get(name, ()))
+        return paths
@@ -0,0 +1,81 @@
+"""
+visits.py - URLs Each Test Visited, Recorded at Runtime
+KosManager Automated Testing
+"""
+import json
+import os
+from urllib.parse import urlsplit
+
+from .graph import TESTS_DIR
+
+DEFAULT_IMPACT_MAP = os.path.join(TESTS_DIR, ".test_impact.json")
+IMPACT_MAP_VERSION = 1
+
+
+def url_path(url):
+    """Path of a page or API URL, without host, query and fragment."""
+    return urlsplit(url).path or "/"
+
+
+class VisitLog:
+    """
+    Paths opened by the current test. The visit_recorder fixture attaches
+    it to drivers (BasePage.open, and so AuthenticatedSession.apply) and
+    KosManagerClient instances only with --record-impact; recording is
+    off until begin().
+    """
+
+    def __init__(self):
+        self.paths = None
+
+    @property
+    def active(self):
+        return self.paths is not None
+
+    def begin(self):
+        self.paths = set()
+
+    def record(self, url):
+        if self.paths is not None and url:
+            self.paths.add(url_path(url))
+
+    def end(self):
+        paths, self.paths = sorted(self.paths or ()), None
+        return paths
+
+
+visit_log = VisitLog()
+
+
+class VisitMap:
+    """Recorded paths per test id, kept in one JSON file next to the tests."""
+
+    def __init__(self, path=DEFAULT_IMPACT_MAP, tests=None):
+        self.path = path
+        self.tests = tests or {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_IMPACT_MAP):
+        if not os.path.exists(path):
+            return cls(path)
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != IMPACT_MAP_VERSION:
+            return cls(path)
+        return cls(path, data.get("tests", {}))
+
+    def update(self, nodeid, paths):
+        self.tests[nodeid] = sorted(set(paths))
+
+    def paths(self, nodeid):
+        return self.tests.get(nodeid, [])
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump({"version": IMPACT_MAP_VERSION, "tests": self.tests}, handle,
+                      indent=1, sort_keys=True)
+            handle.write("\n")
+        return self.path
@@ -0,0 +1,23 @@
+"""
+__init__.py - Cross-Platform Test Runner Package
+KosManager Automated Testing
+"""
+from .install import InstallError, InstallStamp, ensure_requirements, ensure_venv, requirements_hash
+from .plan import RunPlan, auto_profile, auto_workers, build_plan, ci_shard
+from .timing import PhaseTimer, breakdown_lines, browser_startups
+
+__all__ = [
+    'InstallError',
+    'InstallStamp',
+    'ensure_requirements',
+    'ensure_venv',
+    'requirements_hash',
+    'RunPlan',
+    'auto_profile',
+    'auto_workers',
+    'build_plan',
+    'ci_shard',
+    'PhaseTimer',
+    'breakdown_lines',
+    'browser_startups',
+]
@@ -0,0 +1,99 @@
+"""
+__main__.py - Cross-Platform Test Runner
+KosManager Automated Testing
+
+Usage (from the tests/ directory):
+    python -m kostest                      # all tests
+    python -m kostest smoke                # -m smoke (also: auth, property)
+    python -m kostest test_02_authentication.py -k login
+    python -m kostest all --workers 4 --profile fast
+    python -m kostest all --venv ../venv   # create/use a virtualenv
+    python -m kostest smoke --dry-run      # show the plan only
+
+Options it does not know are passed on to pytest.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from reporting.events import event_files
+from reporting.index import build_index
+
+from .install import REPO_ROOT, InstallError, ensure_requirements, ensure_venv
+from .plan import build_plan
+from .timing import PhaseTimer, breakdown_lines, browser_startups
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m kostest",
+        description="Run the KosManager test suite: all, smoke, auth, property or a test file.")
+    parser.add_argument("target", nargs="?", default="all",
+                        help="all (default), smoke, auth, property, or a test file / node id")
+    parser.add_argument("--workers", default=None,
+                        help="xdist workers, or 'auto' (default: TEST_WORKERS, else from CPUs and memory)")
+    parser.add_argument("--profile", default=None,
+                        help="browser profile debug/ci/fast (default: TEST_BROWSER_PROFILE, else auto)")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="number of CI shards (default: TEST_SHARDS or the CI provider's parallel jobs)")
+    parser.add_argument("--shard", type=int, default=None, help="this node's shard, 1-based")
+    parser.add_argument("--venv", default=None,
+                        help="create/use this virtualenv instead of the current interpreter")
+    parser.add_argument("--no-install", action="store_true",
+                        help="never run pip install")
+    parser.add_argument("--reinstall", action="store_true",
+                        help="run pip install even if requirements.txt is unchanged")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the plan and the pytest command, run nothing")
+    return parser.parse_known_args(argv)
+
+
+def main(argv=None):
+    args, pytest_args = parse_args(argv)
+    timer = PhaseTimer()
+    workers = None if args.workers in (None, "auto") else int(args.workers)
+    plan = build_plan(args.target, workers, args.profile, args.shards, args.shard, pytest_args)
+    print(plan.describe())
+
+    python = sys.executable
+    with timer.phase("setup"):
+        try:
+            if args.venv and not args.dry_run:
+                python = ensure_venv(args.venv)
+            if args.no_install or args.dry_run:
+                timer.note("setup", "install skipped")
+            elif ensure_requirements(python, force=args.reinstall):
+                timer.note("setup", "requirements installed")
+            else:
+                timer.note("setup", "requirements unchanged, install skipped")
+        except InstallError as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+
+    command = plan.command(python)
+    print(" ".join(command))
+    if args.dry_run:
+        return 0
+
+    with timer.phase("tests"):
+        exit_code = subprocess.run(command, cwd=REPO_ROOT, env=plan.environment()).returncode
+    timer.note("tests", f"pytest exit code {exit_code}")
+
+    index = None
+    with timer.phase("reporting"):
+        files = event_files([plan.run_dir]) if os.path.isdir(plan.run_dir) else []
+        if files:
+            index, builder = build_index(files, plan.run_dir)
+            timer.note("reporting", f"{sum(builder.totals.values())} test(s) indexed")
+
+    print()
+    for line in breakdown_lines(timer, browser_startups(plan.run_dir)):
+        print(line)
+    if index:
+        print(f"Report: {index}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
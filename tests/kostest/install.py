@@ -0,0 +1,86 @@
+"""
+install.py - Virtualenv and Requirements Install, Skipped When Unchanged
+KosManager Automated Testing
+"""
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(TESTS_DIR)
+REQUIREMENTS_FILE = os.path.join(TESTS_DIR, "requirements.txt")
+# Requirements hash last installed per interpreter
+INSTALL_STAMP_FILE = os.path.join(TESTS_DIR, ".kostest_install.json")
+
+
+class InstallError(RuntimeError):
+    """Raised when the virtualenv or the requirements cannot be installed."""
+
+
+def venv_python(venv_dir):
+    """Interpreter of a virtualenv (Scripts\\python.exe on Windows)."""
+    if os.name == "nt":
+        return os.path.join(venv_dir, "Scripts", "python.exe")
+    return os.path.join(venv_dir, "bin", "python")
+
+
+def ensure_venv(venv_dir):
+    """Create `venv_dir` if it does not exist yet; returns its interpreter."""
+    python = venv_python(venv_dir)
+    if not os.path.exists(python):
+        print(f"[INFO] Creating virtual environment {venv_dir}...")
+        result = subprocess.run([sys.executable, "-m", "venv", venv_dir])
+        if result.returncode != 0 or not os.path.exists(python):
+            raise InstallError(f"Could not create the virtual environment {venv_dir}")
+    return python
+
+
+def requirements_hash(path=REQUIREMENTS_FILE):
+    """sha256 of the requirements file, ignoring comments, blank lines and line endings."""
+    with open(path, encoding="utf-8") as handle:
+        lines = [line.split("#", 1)[0].strip() for line in handle]
+    content = "\n".join(line for line in lines if line)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class InstallStamp:
+    """The requirements hash each interpreter was last installed with."""
+
+    def __init__(self, path=INSTALL_STAMP_FILE, installed=None):
+        self.path = path
+        self.installed = installed or {}
+
+    @classmethod
+    def load(cls, path=INSTALL_STAMP_FILE):
+        try:
+            with open(path, encoding="utf-8") as handle:
+                return cls(path, json.load(handle))
+        except (OSError, ValueError):
+            return cls(path)
+
+    def is_current(self, python, digest):
+        return self.installed.get(os.path.abspath(python)) == digest
+
+    def mark(self, python, digest):
+        self.installed[os.path.abspath(python)] = digest
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(self.installed, handle, indent=1, sort_keys=True)
+
+
+def ensure_requirements(python, requirements=REQUIREMENTS_FILE, stamp=None, force=False):
+    """
+    pip install -r `requirements` into `python`, unless the same
+    requirements were already installed there. Returns True if pip ran.
+    """
+    stamp = stamp or InstallStamp.load()
+    digest = requirements_hash(requirements)
+    if not force and stamp.is_current(python, digest):
+        return False
+    print("[INFO] Installing dependencies...")
+    result = subprocess.run([python, "-m", "pip", "install", "-r", requirements, "--quiet"])
+    if result.returncode != 0:
+        raise InstallError(f"pip install -r {requirements} failed (exit code {result.returncode})")
+    stamp.mark(python, digest)
+    return True
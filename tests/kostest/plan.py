@@ -0,0 +1,159 @@
+"""
+plan.py - Pick Workers, Browser Profile and Shard for a Run
+KosManager Automated Testing
+"""
+import os
+import sys
+from datetime import datetime
+
+from .install import REPO_ROOT, TESTS_DIR
+
+# Same modes as the old run_tests.bat; anything else is a test file or node id
+MODES = {
+    "all": [],
+    "smoke": ["-m", "smoke"],
+    "auth": ["-m", "auth"],
+    "property": ["-m", "property"],
+}
+# Chrome plus its xdist worker; more workers than memory allows start swapping
+MEMORY_PER_WORKER = 1024 ** 3
+# Beyond this the app server, not the browsers, is the bottleneck
+MAX_WORKERS = 8
+DURATIONS_FILE = os.path.join(TESTS_DIR, ".test_durations.json")
+
+# (total, index, index base) environment variables of CI providers with parallel jobs
+CI_NODE_VARIABLES = [
+    ("CI_NODE_TOTAL", "CI_NODE_INDEX", 1),                              # GitLab
+    ("CIRCLE_NODE_TOTAL", "CIRCLE_NODE_INDEX", 0),                      # CircleCI
+    ("BUILDKITE_PARALLEL_JOB_COUNT", "BUILDKITE_PARALLEL_JOB", 0),      # Buildkite
+]
+
+
+def is_ci(env=None):
+    env = os.environ if env is None else env
+    return env.get("CI", "").lower() in ("1", "true", "yes")
+
+
+def has_display(env=None, platform=sys.platform):
+    """Can a visible browser open? Linux needs X11 or Wayland."""
+    env = os.environ if env is None else env
+    if not platform.startswith("linux"):
+        return True
+    return bool(env.get("DISPLAY") or env.get("WAYLAND_DISPLAY"))
+
+
+def total_memory():
+    """Physical memory in bytes, or None where sysconf does not report it (Windows)."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def auto_workers(cpus=None, memory=None, ci=False):
+    """
+    One worker per CPU on CI; half the CPUs locally, where the app server
+    and the desktop share the machine. Capped by memory and MAX_WORKERS.
+    """
+    cpus = cpus or os.cpu_count() or 1
+    workers = cpus if ci else cpus // 2
+    if memory:
+        workers = min(workers, memory // MEMORY_PER_WORKER)
+    return int(max(1, min(workers, MAX_WORKERS)))
+
+
+def auto_profile(workers, env=None, platform=sys.platform):
+    """
+    TEST_BROWSER_PROFILE if set; otherwise headless 'ci' on CI, without a
+    display or with several workers, and the visible 'debug' browser for
+    a single local worker.
+    """
+    env = os.environ if env is None else env
+    if env.get("TEST_BROWSER_PROFILE"):
+        return env["TEST_BROWSER_PROFILE"]
+    if is_ci(env) or not has_display(env, platform) or workers > 1:
+        return "ci"
+    return "debug"
+
+
+def ci_shard(env=None):
+    """
+    (shards, shard) with shard 1-based: TEST_SHARDS/TEST_SHARD, else the
+    parallel job of a CI provider, else (1, 1).
+    """
+    env = os.environ if env is None else env
+    if env.get("TEST_SHARDS"):
+        return int(env["TEST_SHARDS"]), int(env.get("TEST_SHARD", "1"))
+    for total, index, base in CI_NODE_VARIABLES:
+        if env.get(total) and env.get(index):
+            return int(env[total]), int(env[index]) - base + 1
+    return 1, 1
+
+
+class RunPlan:
+    """The pytest command and environment of one run."""
+
+    def __init__(self, target, workers, profile, shards=1, shard=1, run_id=None,
+                 duration_dist=False, pytest_args=()):
+        self.target = target
+        self.workers = workers
+        self.profile = profile
+        self.shards = shards
+        self.shard = shard
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.duration_dist = duration_dist
+        self.pytest_args = list(pytest_args)
+
+    @property
+    def run_dir(self):
+        return os.path.join(TESTS_DIR, "reports", "runs", self.run_id)
+
+    def selection(self):
+        if self.target in MODES:
+            return ["tests"] + MODES[self.target]
+        # A file or node id, relative to where the runner was started
+        path, separator, rest = self.target.partition("::")
+        if os.path.exists(path):
+            path = os.path.relpath(os.path.abspath(path), REPO_ROOT)
+        return [path + separator + rest]
+
+    def command(self, python=sys.executable):
+        """pytest command line, run from the repository root (pytest.ini)."""
+        command = [python, "-m", "pytest"] + self.selection()
+        if self.workers > 1:
+            command += ["-n", str(self.workers)]
+            if self.duration_dist:
+                command.append("--duration-dist")
+        if self.shards > 1:
+            command += ["--shards", str(self.shards), "--shard", str(self.shard)]
+        # The runner builds index.html itself to time the reporting step
+        command.append("--no-report-index")
+        return command + self.pytest_args
+
+    def environment(self, base=None):
+        env = dict(os.environ if base is None else base)
+        env["TEST_BROWSER_PROFILE"] = self.profile
+        env["TEST_RUN_ID"] = self.run_id
+        return env
+
+    def describe(self):
+        shard = f", shard {self.shard}/{self.shards}" if self.shards > 1 else ""
+        return (f"Run {self.run_id}: {self.target}, {self.workers} worker(s), "
+                f"browser profile '{self.profile}'{shard}")
+
+
+def build_plan(target="all", workers=None, profile=None, shards=None, shard=None,
+               pytest_args=(), env=None, cpus=None, memory=None, platform=sys.platform):
+    """A RunPlan with every setting not given picked from the machine and CI environment."""
+    env = os.environ if env is None else env
+    if workers is None:
+        workers = int(env["TEST_WORKERS"]) if env.get("TEST_WORKERS") else \
+            auto_workers(cpus, memory if memory is not None else total_memory(), is_ci(env))
+    if shards is None:
+        shards, detected = ci_shard(env)
+        shard = shard or detected
+    return RunPlan(
+        target, workers, profile or auto_profile(workers, env, platform),
+        shards=shards, shard=shard or 1, run_id=env.get("TEST_RUN_ID"),
+        duration_dist=os.path.exists(DURATIONS_FILE), pytest_args=pytest_args,
+    )
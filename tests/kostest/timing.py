@@ -0,0 +1,68 @@
+"""
+timing.py - Timing Breakdown of a Runner Invocation
+KosManager Automated Testing
+"""
+import glob
+import json
+import os
+import time
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """Wall-clock time of the runner phases (setup, tests, reporting), in order."""
+
+    def __init__(self):
+        self.phases = {}
+        self.notes = {}
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def note(self, name, text):
+        self.notes[name] = text
+
+    @property
+    def total(self):
+        return time.perf_counter() - self.started
+
+
+def browser_startups(run_dir):
+    """(starts, seconds, workers) summed over the profile_timings.json of every worker."""
+    starts, seconds, workers = 0, 0.0, 0
+    for path in glob.glob(os.path.join(run_dir, "*", "profile_timings.json")):
+        try:
+            with open(path, encoding="utf-8") as handle:
+                summary = json.load(handle)
+        except (OSError, ValueError):
+            continue
+        workers += 1
+        starts += summary.get("startups", 0)
+        seconds += summary.get("startup_total_s") or 0.0
+    return starts, seconds, workers
+
+
+def breakdown_lines(timer, browser=(0, 0.0, 0)):
+    """
+    Setup, browser start, tests and reporting. Browser starts happen
+    inside the test phase, on every worker at once, so they are shown
+    summed over workers and not added to the total.
+    """
+    starts, seconds, workers = browser
+    rows = [("setup", timer.phases.get("setup", 0.0), timer.notes.get("setup", ""))]
+    if starts:
+        rows.append(("browser start", seconds,
+                     f"{starts} start(s) on {workers} worker(s), part of tests"))
+    rows.append(("tests", timer.phases.get("tests", 0.0), timer.notes.get("tests", "")))
+    rows.append(("reporting", timer.phases.get("reporting", 0.0), timer.notes.get("reporting", "")))
+    rows.append(("total", timer.total, ""))
+    lines = ["Timing:"]
+    for name, seconds, note in rows:
+        lines.append(f"  {name:<14}{seconds:>8.1f}s" + (f"  ({note})" if note else ""))
+    return lines
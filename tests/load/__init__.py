@@ -0,0 +1,15 @@
+"""
+__init__.py - Load Testing Package
+KosManager Automated Testing
+"""
+from .runner import DEFAULT_ENDPOINTS, Endpoint, LoadTest
+from .stats import EndpointStats, LoadStats, percentile
+
+__all__ = [
+    'DEFAULT_ENDPOINTS',
+    'Endpoint',
+    'LoadTest',
+    'EndpointStats',
+    'LoadStats',
+    'percentile',
+]
@@ -0,0 +1,84 @@
+"""
+__main__.py - Load Test Command Line
+KosManager Automated Testing
+
+Usage (from the tests/ directory, app running):
+    python -m load --users 20 --duration 120
+    python -m load --users 50 --owners 10 --seed-preset free_owner_full
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import uuid
+
+from api import KosManagerClient
+from settings import BASE_URL, LOGIN_USER_EMAIL, LOGIN_USER_PASSWORD
+from drivers.workspace import REPORTS_DIR, get_run_id
+from seeding import DataFactory, get_preset, seed_account
+
+from .runner import LoadTest
+
+
+def register_owners(base_url, count, preset_name, password="OwnerPassword123"):
+    """Register `count` owners seeded with a preset; returns (email, password) pairs."""
+    preset = get_preset(preset_name)
+    accounts = []
+    for index in range(count):
+        email = f"load_{uuid.uuid4().hex[:12]}@kosmanager.com"
+        with KosManagerClient(base_url) as client:
+            plan = DataFactory(seed=index).build(preset, email=email)
+            client.register(plan.owner["full_name"], email, password)
+            client.login(email, password)
+            seed_account(client, plan)
+        accounts.append((email, password))
+    return accounts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent KosManager owners.")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--users", type=int, default=10, help="concurrent owners")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of load")
+    parser.add_argument("--ramp-up", type=float, default=10, help="seconds to start all users")
+    parser.add_argument("--think-min", type=float, default=1.0)
+    parser.add_argument("--think-max", type=float, default=3.0)
+    parser.add_argument("--owners", type=int, default=0,
+                        help="register and seed this many owners instead of using TEST_LOGIN_EMAIL")
+    parser.add_argument("--seed-preset", default=None, help="preset for --owners (default: small)")
+    parser.add_argument("--output", default=None,
+                        help="JSON report path (default: reports/runs/<run_id>/load.json)")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="exit with status 1 when the overall error rate is higher")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    if args.owners:
+        accounts = register_owners(args.base_url, args.owners, args.seed_preset)
+    else:
+        accounts = [(LOGIN_USER_EMAIL, LOGIN_USER_PASSWORD)]
+
+    load_test = LoadTest(args.base_url, accounts, users=args.users, duration=args.duration,
+                         think_time=(args.think_min, args.think_max), ramp_up=args.ramp_up)
+    stats = load_test.run()
+    for line in stats.table_lines():
+        print(line)
+
+    output = args.output or os.path.join(REPORTS_DIR, "runs", get_run_id(), "load.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    summary = dict(stats.summary(), users=args.users, accounts=len(accounts),
+                   base_url=args.base_url)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(summary, handle, indent=2)
+    print(f"Report written to {output}")
+
+    error_rate = summary["total"]["error_rate"]
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(f"Error rate {error_rate:.2%} is above {args.max_error_rate:.2%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+runner.py - Concurrent Owner Load Test
+KosManager Automated Testing
+"""
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from api import login_with_credentials
+
+from .stats import LoadStats
+
+logger = logging.getLogger(__name__)
+
+
+class Endpoint:
+    """A page or API route a virtual owner requests, picked by weight."""
+
+    def __init__(self, name, path, weight=1):
+        self.name = name
+        self.path = path
+        self.weight = weight
+
+
+# What an owner does after logging in: mostly the dashboard and the lists
+# behind it, whose property -> room -> tenant -> invoice lookups grow with
+# the account.
+DEFAULT_ENDPOINTS = [
+    Endpoint("dashboard", "/dashboard", weight=3),
+    Endpoint("api/properties", "/api/properties", weight=2),
+    Endpoint("api/tenants", "/api/tenants", weight=2),
+    Endpoint("api/invoices", "/api/invoices", weight=3),
+]
+
+
+class LoadTest:
+    """
+    Simulates `users` owners hitting the app at the same time.
+
+    Every virtual owner runs as an asyncio task: it logs in through the
+    NextAuth credentials callback, then keeps requesting weighted random
+    endpoints with a think time of `think_time` (min, max) seconds until
+    `duration` has passed. Users start spread over `ramp_up` seconds.
+    HTTP calls are blocking requests.Session calls run on a thread pool
+    sized to the user count, so each owner has one connection in flight.
+    """
+
+    def __init__(self, base_url, accounts, users=10, duration=60, think_time=(1.0, 3.0),
+                 ramp_up=10, endpoints=None, timeout=30, seed=None):
+        if not accounts:
+            raise ValueError("At least one (email, password) account is needed")
+        self.base_url = base_url.rstrip("/")
+        self.accounts = accounts
+        self.users = users
+        self.duration = duration
+        self.think_time = think_time
+        self.ramp_up = ramp_up
+        self.endpoints = endpoints or DEFAULT_ENDPOINTS
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.stats = LoadStats()
+
+    def run(self):
+        """Run the load test and return its LoadStats."""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self):
+        executor = ThreadPoolExecutor(max_workers=self.users, thread_name_prefix="owner")
+        started = time.perf_counter()
+        deadline = started + self.duration
+        try:
+            await asyncio.gather(*(self._owner(index, deadline, executor)
+                                   for index in range(self.users)))
+        finally:
+            executor.shutdown(wait=False)
+            self.stats.duration = time.perf_counter() - started
+        return self.stats
+
+    async def _owner(self, index, deadline, executor):
+        loop = asyncio.get_running_loop()
+        rng = random.Random(self.rng.random())
+        email, password = self.accounts[index % len(self.accounts)]
+        http = requests.Session()
+
+        await asyncio.sleep(self.ramp_up * index / self.users)
+        try:
+            ok, elapsed, error = await loop.run_in_executor(
+                executor, self._login, http, email, password)
+            self.stats.record("login", elapsed, ok, error=error)
+            if not ok:
+                logger.warning("Owner %d could not log in as %s: %s", index, email, error)
+                return
+
+            weights = [endpoint.weight for endpoint in self.endpoints]
+            while time.perf_counter() < deadline:
+                endpoint = rng.choices(self.endpoints, weights)[0]
+                ok, elapsed, size, error = await loop.run_in_executor(
+                    executor, self._get, http, endpoint.path)
+                self.stats.record(endpoint.name, elapsed, ok, size, error)
+                await asyncio.sleep(rng.uniform(*self.think_time))
+        finally:
+            http.close()
+
+    def _login(self, http, email, password):
+        started = time.perf_counter()
+        try:
+            login_with_credentials(http, self.base_url, email, password)
+            return True, time.perf_counter() - started, None
+        except Exception as error:
+            return False, time.perf_counter() - started, error
+
+    def _get(self, http, path):
+        started = time.perf_counter()
+        try:
+            response = http.get(f"{self.base_url}{path}", allow_redirects=False,
+                                timeout=self.timeout)
+        except requests.RequestException as error:
+            return False, time.perf_counter() - started, 0, type(error).__name__
+        elapsed = time.perf_counter() - started
+        if response.status_code != 200:
+            # A redirect here means the session was dropped (back to /login)
+            location = response.headers.get("Location", "")
+            return False, elapsed, len(response.content), f"HTTP {response.status_code} {location}"
+        return True, elapsed, len(response.content), None
@@ -0,0 +1,97 @@
+"""
+stats.py - Load Test Statistics
+KosManager Automated Testing
+"""
+import math
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list (None when empty)."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class EndpointStats:
+    """Latencies, payload sizes and failures of one endpoint."""
+
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.bytes = 0
+        self.errors = 0
+        self.error_samples = {}
+
+    @property
+    def requests(self):
+        return len(self.latencies)
+
+    def record(self, seconds, ok=True, size=0, error=None):
+        self.latencies.append(seconds)
+        self.bytes += size
+        if not ok:
+            self.errors += 1
+            key = str(error)[:120]
+            self.error_samples[key] = self.error_samples.get(key, 0) + 1
+
+    def summary(self, duration):
+        latencies = sorted(self.latencies)
+        milliseconds = lambda value: None if value is None else round(value * 1000, 1)
+        return {
+            "endpoint": self.name,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "rps": round(self.requests / duration, 2) if duration else 0.0,
+            "p50_ms": milliseconds(percentile(latencies, 0.50)),
+            "p95_ms": milliseconds(percentile(latencies, 0.95)),
+            "p99_ms": milliseconds(percentile(latencies, 0.99)),
+            "max_ms": milliseconds(latencies[-1] if latencies else None),
+            "avg_kb": round(self.bytes / self.requests / 1024, 1) if self.requests else 0.0,
+            "top_errors": sorted(self.error_samples.items(), key=lambda item: -item[1])[:3],
+        }
+
+
+class LoadStats:
+    """Per-endpoint statistics of one load test run."""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.duration = 0.0
+
+    def record(self, name, seconds, ok=True, size=0, error=None):
+        if name not in self.endpoints:
+            self.endpoints[name] = EndpointStats(name)
+        self.endpoints[name].record(seconds, ok, size, error)
+
+    def total(self):
+        """All endpoints merged into one EndpointStats."""
+        merged = EndpointStats("TOTAL")
+        for stats in self.endpoints.values():
+            merged.latencies.extend(stats.latencies)
+            merged.bytes += stats.bytes
+            merged.errors += stats.errors
+        return merged
+
+    def summary(self):
+        rows = [self.endpoints[name].summary(self.duration) for name in sorted(self.endpoints)]
+        return {"duration_s": round(self.duration, 2), "endpoints": rows,
+                "total": self.total().summary(self.duration)}
+
+    def table_lines(self):
+        """Human-readable report, one line per endpoint."""
+        header = (f"{'endpoint':<24}{'reqs':>7}{'err%':>7}{'rps':>8}"
+                  f"{'p50':>9}{'p95':>9}{'p99':>9}")
+        lines = [header, "-" * len(header)]
+        summary = self.summary()
+        for row in summary["endpoints"] + [summary["total"]]:
+            lines.append(
+                f"{row['endpoint']:<24}{row['requests']:>7}{row['error_rate'] * 100:>6.1f}%"
+                f"{row['rps']:>8}{_ms(row['p50_ms']):>9}{_ms(row['p95_ms']):>9}"
+                f"{_ms(row['p99_ms']):>9}")
+        return lines
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.0f}ms"
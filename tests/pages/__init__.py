@@ -4,7 +4,7 @@ KosManager Automated Testing
 """
 from .base_page import BasePage
 from .auth_pages import LoginPage, RegisterPage
-from .dashboard_pages import LandingPage, DashboardPage, PropertiesPage, NewPropertyPage
+from .dashboard_pages import LandingPage, DashboardPage, PropertiesPage, NewPropertyPage, TenantsPage
 from .locators import *
 
 __all__ = [
@@ -15,4 +15,5 @@ __all__ = [
     'DashboardPage',
     'PropertiesPage',
     'NewPropertyPage',
+    'TenantsPage',
 ]
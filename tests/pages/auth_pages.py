@@ -15,9 +15,9 @@ class LoginPage(BasePage):
         super().__init__(driver, base_url)
         self.locators = LoginPageLocators
     
-    def open(self):
+    def open(self, wait_ready=True):
         """Navigate to login page."""
-        super().open("/login")
+        super().open("/login", wait_ready)
         return self
     
     def enter_email(self, email):
@@ -72,10 +72,9 @@ class RegisterPage(BasePage):
         super().__init__(driver, base_url)
         self.locators = RegisterPageLocators
     
-    def open(self):
+    def open(self, wait_ready=True):
         """Navigate to registration page."""
-        super().open("/register")
-        self.wait(1)  # Wait for page to fully load
+        super().open("/register", wait_ready)
         return self
     
     def enter_name(self, name):
@@ -5,11 +5,29 @@ KosManager Automated Testing
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import logging
+import os
 import time
 
+from .instrumentation import InstrumentedPageMixin
+from .waits import (
+    hard_sleep_tracker,
+    NETWORK_TRACKER_JS,
+    PENDING_REQUESTS_JS,
+    HYDRATED_JS,
+    TOAST_COUNT_JS,
+    IN_VIEWPORT_JS,
+    MOBILE_VIEWPORT_JS,
+)
 
-class BasePage:
+logger = logging.getLogger(__name__)
+
+# Absolute, so screenshots land in tests/reports/ whatever the working directory
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "reports")
+
+
+class BasePage(InstrumentedPageMixin):
     """
     Base class for all Page Objects.
     Contains common methods used across all pages.
@@ -18,12 +36,41 @@ class BasePage:
     def __init__(self, driver, base_url="http://localhost:3000"):
         self.driver = driver
         self.base_url = base_url
-        self.timeout = 10
+        # Throttled browsers (drivers.NetworkProfile) get a longer wait
+        network_profile = getattr(driver, "network_profile", None)
+        self.timeout = network_profile.page_timeout if network_profile else 10
+        self.poll_frequency = 0.1
     
-    def open(self, path=""):
-        """Navigate to a specific path."""
+    def open(self, path="", wait_ready=True):
+        """
+        Navigate to a specific path and wait until the page is ready
+        (hydration + network idle); a page that never gets there raises
+        TimeoutException. Pass wait_ready=False for pages known never to
+        idle (polling, long-lived requests) and wait on an element instead.
+        """
         url = f"{self.base_url}{path}"
+        # Set by the browser fixture when --record-impact is on
+        visit_recorder = getattr(self.driver, "visit_recorder", None)
+        if visit_recorder is not None:
+            visit_recorder.record(url)
+        self.install_network_tracker()
+        # Set by the cdp_recorder fixture when --cdp-capture is on
+        cdp_recorder = getattr(self.driver, "cdp_recorder", None)
+        if cdp_recorder is not None:
+            cdp_recorder.before_navigation(self.driver)
+        started = time.perf_counter()
         self.driver.get(url)
+        if wait_ready:
+            self.wait_for_page_ready()
+        elapsed = time.perf_counter() - started
+        # Drivers built by drivers.build_chrome collect per-profile timings
+        timings = getattr(self.driver, "timings", None)
+        if timings is not None:
+            timings.record_page_load(path or "/", elapsed)
+        # Set by the perf_recorder fixture when --perf-capture is on
+        recorder = getattr(self.driver, "perf_recorder", None)
+        if recorder is not None:
+            recorder.record_load(self.driver, elapsed)
         return self
     
     def get_current_url(self):
@@ -42,29 +89,100 @@ class BasePage:
         """Find multiple elements."""
         return self.driver.find_elements(*locator)
     
-    def wait_for_element(self, locator, timeout=None):
-        """Wait for element to be visible."""
+    def count_now(self, locator):
+        """Count matching elements right now, without waiting."""
+        return len(self.driver.find_elements(*locator))
+    
+    def exists_now(self, locator):
+        """Check if any matching element is in the DOM right now, without waiting."""
+        return self.count_now(locator) > 0
+    
+    def wait_until(self, condition, timeout=None, poll=None, message=""):
+        """Wait until condition(driver) returns a truthy value."""
         timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=poll or self.poll_frequency)
+        return wait.until(condition, message)
+    
+    def wait_for_element(self, locator, timeout=None, poll=None):
+        """Wait for element to be visible."""
+        return self.wait_until(EC.visibility_of_element_located(locator), timeout, poll)
     
-    def wait_for_element_clickable(self, locator, timeout=None):
+    def wait_for_element_clickable(self, locator, timeout=None, poll=None):
         """Wait for element to be clickable."""
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        return self.wait_until(EC.element_to_be_clickable(locator), timeout, poll)
     
-    def wait_for_url_contains(self, text, timeout=None):
+    def wait_for_url_contains(self, text, timeout=None, poll=None):
         """Wait for URL to contain specific text."""
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.url_contains(text))
+        return self.wait_until(EC.url_contains(text), timeout, poll)
+    
+    def wait_for_url_change(self, old_url, timeout=None, poll=None):
+        """Wait for URL to differ from old_url."""
+        return self.wait_until(EC.url_changes(old_url), timeout, poll,
+                               f"URL did not change from {old_url}")
     
-    def wait_for_text_in_element(self, locator, text, timeout=None):
+    def wait_for_absent(self, locator, timeout=None, poll=None):
+        """Wait until no matching element is left in the DOM."""
+        return self.wait_until(lambda driver: not driver.find_elements(*locator),
+                               timeout, poll, f"Element still present: {locator}")
+    
+    def wait_for_text_in_element(self, locator, text, timeout=None, poll=None):
         """Wait for specific text in element."""
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.text_to_be_present_in_element(locator, text))
+        return self.wait_until(EC.text_to_be_present_in_element(locator, text), timeout, poll)
+    
+    def install_network_tracker(self):
+        """Count in-flight fetch/XHR requests on every new document (once per driver)."""
+        if getattr(self.driver, "network_tracker_installed", False):
+            return self
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                        {"source": NETWORK_TRACKER_JS})
+        except (AttributeError, WebDriverException):
+            logger.debug("CDP not available, network idle waits fall back to readyState")
+        self.driver.network_tracker_installed = True
+        return self
+    
+    def wait_for_network_idle(self, timeout=None, poll=None, idle_time=0.3):
+        """Wait until no fetch/XHR request has been pending for idle_time seconds."""
+        state = {"idle_since": None}
+        
+        def network_idle(driver):
+            if driver.execute_script(PENDING_REQUESTS_JS) > 0:
+                state["idle_since"] = None
+                return False
+            now = time.monotonic()
+            state["idle_since"] = state["idle_since"] or now
+            return now - state["idle_since"] >= idle_time
+        
+        return self.wait_until(network_idle, timeout, poll, "Network did not become idle")
+    
+    def wait_for_hydration(self, timeout=None, poll=None):
+        """Wait until the document is loaded and React has hydrated it."""
+        return self.wait_until(lambda driver: driver.execute_script(HYDRATED_JS),
+                               timeout, poll, "Page was not hydrated by React")
+    
+    def wait_for_page_ready(self, timeout=None, poll=None):
+        """Wait for hydration and network idle."""
+        self.wait_for_hydration(timeout, poll)
+        self.wait_for_network_idle(timeout, poll)
+        return self
+    
+    def wait_for_toasts_dismissed(self, timeout=None, poll=None):
+        """Wait until no Sonner toast is mounted."""
+        return self.wait_until(lambda driver: driver.execute_script(TOAST_COUNT_JS) == 0,
+                               timeout, poll, "Toast notifications were not dismissed")
+    
+    def navigate_by_click(self, locator):
+        """Click a link/button and wait for the resulting navigation to settle."""
+        recorder = getattr(self.driver, "perf_recorder", None)
+        mark = recorder.mark(self.driver) if recorder is not None else None
+        old_url = self.driver.current_url
+        started = time.perf_counter()
+        self.click(locator)
+        self.wait_for_url_change(old_url)
+        self.wait_for_page_ready()
+        if recorder is not None:
+            recorder.record_navigation(self.driver, mark, time.perf_counter() - started)
+        return self
     
     def click(self, locator):
         """Click on an element."""
@@ -100,11 +218,7 @@ class BasePage:
     
     def is_element_present(self, locator):
         """Check if element is present in DOM."""
-        try:
-            self.find_element(locator)
-            return True
-        except NoSuchElementException:
-            return False
+        return self.exists_now(locator)
     
     def hover(self, locator):
         """Hover over an element."""
@@ -116,7 +230,7 @@ class BasePage:
         """Scroll element into view."""
         element = self.find_element(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)
+        self.wait_until(lambda driver: driver.execute_script(IN_VIEWPORT_JS, element))
         return self
     
     def scroll_to_bottom(self):
@@ -129,14 +243,28 @@ class BasePage:
         self.driver.execute_script("window.scrollTo(0, 0);")
         return self
     
+    def is_mobile_viewport(self):
+        """Check if the viewport is below the md breakpoint (BottomNav layout)."""
+        return self.driver.execute_script(MOBILE_VIEWPORT_JS)
+    
     def take_screenshot(self, name):
-        """Take a screenshot."""
-        self.driver.save_screenshot(f"tests/reports/screenshots/{name}.png")
+        """
+        Take a screenshot into the running test's artifact directory
+        (written in the background), or reports/screenshots/ without one.
+        """
+        artifacts = getattr(self.driver, "artifacts", None)
+        if artifacts is not None:
+            artifacts.screenshot(self.driver, name)
+            return self
+        directory = os.path.join(REPORTS_DIR, "screenshots")
+        os.makedirs(directory, exist_ok=True)
+        self.driver.save_screenshot(os.path.join(directory, f"{name}.png"))
         return self
     
     def wait(self, seconds):
-        """Explicit wait (use sparingly)."""
-        time.sleep(seconds)
+        """Hard sleep (avoid; prefer a wait_for_* condition). Counted by sleep_lint."""
+        hard_sleep_tracker.record(seconds)
+        time.sleep(seconds)  # hard-sleep: ok
         return self
     
     def refresh(self):
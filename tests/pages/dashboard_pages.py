@@ -7,9 +7,38 @@ from .locators import (
     DashboardPageLocators, 
     PropertiesPageLocators,
     NewPropertyPageLocators,
-    LandingPageLocators
+    LandingPageLocators,
+    TenantsPageLocators,
+    BulkUploadDialogLocators
 )
 
+# Times BulkUploadDialog's client-side parsing: from the file input's
+# change event until the "Data Valid" count is rendered.
+BULK_PARSE_TIMER_JS = """
+const timer = window.__bulkParse = {start: null, end: null, valid: null};
+const input = document.querySelector("[role='dialog'] input[type='file']");
+input.addEventListener('change', () => { timer.start = performance.now(); },
+                       {capture: true, once: true});
+const observer = new MutationObserver(() => {
+    const label = [...document.querySelectorAll("[role='dialog'] span")]
+        .find(span => span.textContent === 'Data Valid');
+    const count = label && label.parentElement.nextElementSibling;
+    if (count && count.textContent.trim() !== '') {
+        timer.end = performance.now();
+        timer.valid = parseInt(count.textContent, 10);
+        observer.disconnect();
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+"""
+
+BULK_REQUEST_TIMING_JS = """
+const entry = performance.getEntriesByType('resource')
+    .filter(e => e.name.includes('/api/tenants/bulk')).pop();
+return entry ? {server: entry.responseStart - entry.requestStart,
+                total: entry.responseEnd - entry.startTime} : null;
+"""
+
 
 class LandingPage(BasePage):
     """
@@ -20,9 +49,9 @@ class LandingPage(BasePage):
         super().__init__(driver, base_url)
         self.locators = LandingPageLocators
     
-    def open(self):
+    def open(self, wait_ready=True):
         """Navigate to landing page."""
-        super().open("/")
+        super().open("/", wait_ready)
         return self
     
     def get_hero_title(self):
@@ -49,7 +78,7 @@ class LandingPage(BasePage):
     
     def get_feature_cards_count(self):
         """Get number of feature cards."""
-        return len(self.find_elements(self.locators.FEATURE_CARDS))
+        return self.count_now(self.locators.FEATURE_CARDS)
     
     def is_footer_visible(self):
         """Check if footer is visible."""
@@ -66,56 +95,76 @@ class DashboardPage(BasePage):
         super().__init__(driver, base_url)
         self.locators = DashboardPageLocators
     
-    def open(self):
+    def open(self, wait_ready=True):
         """Navigate to dashboard."""
-        super().open("/dashboard")
+        super().open("/dashboard", wait_ready)
         return self
     
     def get_greeting_text(self):
         """Get greeting/title text."""
         # Try to find greeting first, fallback to page title
-        if self.is_element_visible(self.locators.GREETING, timeout=2):
+        self.wait_for_page_ready()
+        if self.exists_now(self.locators.GREETING):
             return self.get_text(self.locators.GREETING)
         # Fallback - check page title or H1
         return self.get_text(self.locators.PAGE_TITLE)
     
     def get_stats_cards_count(self):
         """Get number of stats cards."""
-        return len(self.find_elements(self.locators.STATS_CARDS))
+        self.wait_for_page_ready()
+        return self.count_now(self.locators.STATS_CARDS)
     
     def is_sidebar_visible(self):
         """Check if sidebar is visible (desktop)."""
         return self.is_element_visible(self.locators.SIDEBAR, timeout=3)
     
-    def click_nav_properties(self):
-        """Navigate to Properties via sidebar."""
-        self.click(self.locators.NAV_PROPERTIES)
+    def is_bottom_nav_visible(self):
+        """Check if the bottom navigation is visible (mobile)."""
+        return self.is_element_visible(self.locators.BOTTOM_NAV, timeout=3)
+    
+    def get_bottom_nav_labels(self):
+        """Get the labels of the bottom navigation items."""
+        self.wait_for_element(self.locators.BOTTOM_NAV)
+        return [item.text for item in self.find_elements(self.locators.BOTTOM_NAV_ITEMS)]
+    
+    def _navigate(self, sidebar_locator, bottom_nav_locator):
+        """Use the bottom navigation on phone viewports, the sidebar otherwise."""
+        if self.is_mobile_viewport():
+            self.navigate_by_click(bottom_nav_locator)
+        else:
+            self.navigate_by_click(sidebar_locator)
         return self
     
+    def click_nav_dashboard(self):
+        """Navigate to Dashboard via sidebar or bottom navigation."""
+        return self._navigate(self.locators.NAV_DASHBOARD, self.locators.BOTTOM_NAV_DASHBOARD)
+    
+    def click_nav_properties(self):
+        """Navigate to Properties via sidebar or bottom navigation."""
+        return self._navigate(self.locators.NAV_PROPERTIES, self.locators.BOTTOM_NAV_PROPERTIES)
+    
     def click_nav_tenants(self):
-        """Navigate to Tenants via sidebar."""
-        self.click(self.locators.NAV_TENANTS)
-        return self
+        """Navigate to Tenants via sidebar or bottom navigation."""
+        return self._navigate(self.locators.NAV_TENANTS, self.locators.BOTTOM_NAV_TENANTS)
     
     def click_nav_invoices(self):
-        """Navigate to Invoices via sidebar."""
-        self.click(self.locators.NAV_INVOICES)
-        return self
+        """Navigate to Invoices via sidebar or bottom navigation."""
+        return self._navigate(self.locators.NAV_INVOICES, self.locators.BOTTOM_NAV_INVOICES)
     
     def click_nav_settings(self):
         """Navigate to Settings via sidebar."""
-        self.click(self.locators.NAV_SETTINGS)
+        self.navigate_by_click(self.locators.NAV_SETTINGS)
         return self
     
     def click_add_property(self):
         """Click add property button."""
-        self.click(self.locators.BTN_ADD_PROPERTY)
+        self.navigate_by_click(self.locators.BTN_ADD_PROPERTY)
         return self
     
     def click_user_avatar(self):
         """Click user avatar to open dropdown."""
         # Wait for any toast notifications to disappear
-        self.wait(1)
+        self.wait_for_toasts_dismissed()
         # Use JavaScript click to avoid overlay issues with toast
         try:
             element = self.wait_for_element_clickable(self.locators.USER_AVATAR, timeout=5)
@@ -132,8 +181,7 @@ class DashboardPage(BasePage):
     def click_logout(self):
         """Click logout in dropdown menu."""
         self.click_user_avatar()
-        self.wait(0.5)
-        self.click(self.locators.MENU_LOGOUT)
+        self.navigate_by_click(self.locators.MENU_LOGOUT)
         return self
 
 
@@ -146,9 +194,9 @@ class PropertiesPage(BasePage):
         super().__init__(driver, base_url)
         self.locators = PropertiesPageLocators
     
-    def open(self):
+    def open(self, wait_ready=True):
         """Navigate to properties page."""
-        super().open("/dashboard/properties")
+        super().open("/dashboard/properties", wait_ready)
         return self
     
     def get_page_title(self):
@@ -157,22 +205,27 @@ class PropertiesPage(BasePage):
     
     def click_add_property(self):
         """Click add property button."""
-        self.click(self.locators.BTN_ADD_PROPERTY)
+        self.navigate_by_click(self.locators.BTN_ADD_PROPERTY)
         return self
     
     def get_property_cards_count(self):
         """Get number of property cards."""
-        return len(self.find_elements(self.locators.PROPERTY_CARDS))
+        self.wait_for_page_ready()
+        return self.count_now(self.locators.PROPERTY_CARDS)
     
     def is_empty_state_visible(self):
         """Check if empty state is displayed."""
-        return self.is_element_visible(self.locators.EMPTY_STATE, timeout=3)
+        self.wait_for_page_ready()
+        return self.exists_now(self.locators.EMPTY_STATE)
     
     def click_first_property(self):
         """Click the first property card."""
         cards = self.find_elements(self.locators.PROPERTY_CARDS)
         if cards:
+            old_url = self.driver.current_url
             cards[0].click()
+            self.wait_for_url_change(old_url)
+            self.wait_for_page_ready()
         return self
 
 
@@ -185,9 +238,9 @@ class NewPropertyPage(BasePage):
         super().__init__(driver, base_url)
         self.locators = NewPropertyPageLocators
     
-    def open(self):
+    def open(self, wait_ready=True):
         """Navigate to new property page."""
-        super().open("/dashboard/properties/new")
+        super().open("/dashboard/properties/new", wait_ready)
         return self
     
     def enter_name(self, name):
@@ -216,3 +269,62 @@ class NewPropertyPage(BasePage):
         """Click cancel button."""
         self.click(self.locators.BTN_CANCEL)
         return self
+
+
+class TenantsPage(BasePage):
+    """
+    Page Object for Tenants Page (/dashboard/tenants), including the
+    bulk upload dialog.
+    """
+    
+    def __init__(self, driver, base_url="http://localhost:3000"):
+        super().__init__(driver, base_url)
+        self.locators = TenantsPageLocators
+        self.dialog = BulkUploadDialogLocators
+    
+    def open(self, wait_ready=True):
+        """Navigate to tenants page."""
+        super().open("/dashboard/tenants", wait_ready)
+        return self
+    
+    def open_bulk_upload(self):
+        """Open the bulk upload dialog."""
+        self.click(self.locators.BTN_BULK_UPLOAD)
+        self.wait_for_element(self.dialog.DIALOG)
+        return self
+    
+    def is_bulk_upload_locked(self):
+        """Check if the dialog shows the upgrade prompt instead of the form."""
+        return self.exists_now(self.dialog.UPGRADE_PROMPT)
+    
+    def select_upload_file(self, path, timeout=120):
+        """
+        Choose a CSV/XLSX file and wait until the dialog has parsed it.
+        Returns (valid rows, parse seconds measured in the browser).
+        """
+        self.driver.execute_script(BULK_PARSE_TIMER_JS)
+        self.find_element(self.dialog.INPUT_FILE).send_keys(path)
+        self.wait_until(lambda driver: driver.execute_script("return window.__bulkParse.end !== null"),
+                        timeout, None, f"Upload preview not shown for {path}")
+        timer = self.driver.execute_script("return window.__bulkParse")
+        return timer["valid"], (timer["end"] - timer["start"]) / 1000
+    
+    def click_upload(self, timeout=600):
+        """Upload the parsed rows and wait for the dialog to close."""
+        self.click(self.dialog.BTN_UPLOAD)
+        self.wait_for_absent(self.dialog.DIALOG, timeout)
+        return self
+    
+    def click_export(self, file_format):
+        """Open the Download Data menu and pick "csv" or "xlsx"."""
+        self.click(self.locators.BTN_EXPORT)
+        item = self.locators.MENU_EXPORT_CSV if file_format == "csv" else self.locators.MENU_EXPORT_XLSX
+        self.click(item)
+        return self
+    
+    def get_bulk_request_timing(self):
+        """Server wait and total time (seconds) of the last /api/tenants/bulk call."""
+        timing = self.driver.execute_script(BULK_REQUEST_TIMING_JS)
+        if timing is None:
+            return None
+        return {name: value / 1000 for name, value in timing.items()}
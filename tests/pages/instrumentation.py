@@ -0,0 +1,48 @@
+"""
+instrumentation.py - CDP Instrumentation Mixin for Page Objects
+KosManager Automated Testing
+"""
+
+
+class InstrumentedPageMixin:
+    """
+    Lets a page object read what CDP captured during the current test.
+
+    Works when the run uses --cdp-capture (the driver then carries a
+    CdpRecorder as `driver.cdp_recorder`); otherwise every accessor
+    returns an empty result.
+    """
+
+    @property
+    def cdp_recorder(self):
+        return getattr(self.driver, "cdp_recorder", None)
+
+    def is_instrumented(self):
+        return self.cdp_recorder is not None
+
+    def network_requests(self, url_contains=None):
+        """Requests finished so far in this test, optionally filtered by URL."""
+        recorder = self.cdp_recorder
+        if recorder is None:
+            return []
+        requests = recorder.poll(self.driver).requests
+        if url_contains:
+            requests = [request for request in requests if url_contains in request["url"]]
+        return requests
+
+    def api_requests(self):
+        """Requests to /api/* made so far in this test."""
+        return self.network_requests("/api/")
+
+    def slowest_requests(self, count=5):
+        requests = sorted(self.network_requests(), key=lambda request: request["duration_ms"] or 0,
+                          reverse=True)
+        return requests[:count]
+
+    def long_tasks(self):
+        """Main-thread tasks over 50 ms seen so far in this test."""
+        recorder = self.cdp_recorder
+        if recorder is None:
+            return []
+        recorder.before_navigation(self.driver)
+        return list(recorder.long_tasks)
@@ -79,6 +79,14 @@ class DashboardPageLocators:
     NAV_INVOICES = (By.CSS_SELECTOR, "a[href='/dashboard/invoices']")
     NAV_SETTINGS = (By.CSS_SELECTOR, "a[href='/dashboard/settings']")
     
+    # Bottom Navigation (below the md breakpoint, replaces the sidebar)
+    BOTTOM_NAV = (By.CSS_SELECTOR, "nav.fixed.bottom-0")
+    BOTTOM_NAV_ITEMS = (By.CSS_SELECTOR, "nav.fixed.bottom-0 a")
+    BOTTOM_NAV_DASHBOARD = (By.CSS_SELECTOR, "nav.fixed.bottom-0 a[href='/dashboard']")
+    BOTTOM_NAV_PROPERTIES = (By.CSS_SELECTOR, "nav.fixed.bottom-0 a[href='/dashboard/properties']")
+    BOTTOM_NAV_TENANTS = (By.CSS_SELECTOR, "nav.fixed.bottom-0 a[href='/dashboard/tenants']")
+    BOTTOM_NAV_INVOICES = (By.CSS_SELECTOR, "nav.fixed.bottom-0 a[href='/dashboard/invoices']")
+    
     # Actions
     BTN_ADD_PROPERTY = (By.CSS_SELECTOR, "a[href='/dashboard/properties/new']")
     
@@ -132,6 +140,21 @@ class TenantsPageLocators:
     TENANT_CARDS = (By.CSS_SELECTOR, ".grid > div[class*='card']")
     EMPTY_STATE = (By.CSS_SELECTOR, ".border-dashed")
     STAT_ACTIVE = (By.XPATH, "//p[contains(text(),'Penyewa Aktif')]/preceding-sibling::p")
+    BTN_BULK_UPLOAD = (By.XPATH, "//button[contains(., 'Upload CSV/Excel')]")
+    BTN_EXPORT = (By.XPATH, "//button[contains(., 'Download Data')]")
+    MENU_EXPORT_XLSX = (By.XPATH, "//div[@role='menuitem' and contains(., 'Excel (.xlsx)')]")
+    MENU_EXPORT_CSV = (By.XPATH, "//div[@role='menuitem' and contains(., 'CSV (.csv)')]")
+
+
+class BulkUploadDialogLocators:
+    """Locators for the Bulk Upload (CSV/Excel) dialog on the Tenants Page."""
+    
+    DIALOG = (By.CSS_SELECTOR, "[role='dialog']")
+    UPGRADE_PROMPT = (By.XPATH, "//div[@role='dialog']//*[contains(text(),'Bulk Upload Premium Feature')]")
+    INPUT_FILE = (By.CSS_SELECTOR, "[role='dialog'] input[type='file']")
+    VALID_COUNT = (By.XPATH, "//div[@role='dialog']//span[text()='Data Valid']/parent::div/following-sibling::p")
+    INVALID_COUNT = (By.XPATH, "//div[@role='dialog']//span[text()='Data Invalid']/parent::div/following-sibling::p")
+    BTN_UPLOAD = (By.XPATH, "//div[@role='dialog']//button[contains(., 'Upload') and contains(., 'Penyewa')]")
 
 
 class NewTenantPageLocators:
@@ -0,0 +1,88 @@
+"""
+sleep_lint.py - Hard Sleep Lint
+KosManager Automated Testing
+
+Usage (from the tests/ directory):
+    python -m pages.sleep_lint              # list hard sleeps
+    python -m pages.sleep_lint --max 0      # fail if any remain
+"""
+import argparse
+import ast
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def is_page_receiver(node):
+    """
+    self, a *page name or attribute (login_page, self.page) or a fluent
+    page chain (LoginPage(driver).open()). Anything else, such as a
+    threading.Event, has its own .wait(timeout) that is not a hard sleep.
+    """
+    if isinstance(node, ast.Call):
+        return True
+    if isinstance(node, ast.Name):
+        return node.id == "self" or node.id.lower().endswith("page")
+    if isinstance(node, ast.Attribute):
+        return node.attr.lower().endswith("page")
+    return False
+
+
+def find_hard_sleeps(source, filename="<source>"):
+    """
+    Return (filename, lineno, code) for every hard sleep in the source:
+    time.sleep(...) and page-object .wait(<number>) calls. Lines marked
+    with "# hard-sleep: ok" are skipped.
+    """
+    lines = source.splitlines()
+    found = []
+    for node in ast.walk(ast.parse(source, filename)):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            continue
+        name = node.func.attr
+        is_time_sleep = name == "sleep" and isinstance(node.func.value, ast.Name) \
+            and node.func.value.id == "time"
+        is_page_wait = name == "wait" and len(node.args) == 1 \
+            and is_page_receiver(node.func.value) \
+            and isinstance(node.args[0], ast.Constant) \
+            and isinstance(node.args[0].value, (int, float))
+        if (is_time_sleep or is_page_wait) and "# hard-sleep: ok" not in lines[node.lineno - 1]:
+            found.append((filename, node.lineno, ast.get_source_segment(source, node)))
+    return found
+
+
+def scan_paths(paths):
+    """Scan .py files under the given paths for hard sleeps."""
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            files = [path]
+        else:
+            files = [os.path.join(root, name)
+                     for root, _, names in os.walk(path) for name in names
+                     if name.endswith(".py")]
+        for filename in sorted(files):
+            with open(filename, encoding="utf-8") as handle:
+                found.extend(find_hard_sleeps(handle.read(), filename))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count hard sleeps in the test suite.")
+    parser.add_argument("paths", nargs="*", default=[TESTS_DIR])
+    parser.add_argument("--max", type=int, default=None,
+                        help="exit with status 1 when more hard sleeps than this remain")
+    args = parser.parse_args(argv)
+
+    found = scan_paths(args.paths)
+    for filename, lineno, code in found:
+        print(f"{filename}:{lineno}: {code}")
+    print(f"{len(found)} hard sleep(s) found")
+    if args.max is not None and len(found) > args.max:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+waits.py - Smart Wait Signals & Hard Sleep Tracking
+KosManager Automated Testing
+"""
+import os
+import traceback
+from collections import Counter
+
+# Counts in-flight fetch/XHR requests in window.__kosPendingRequests.
+# Installed on every new document so requests made during hydration count.
+NETWORK_TRACKER_JS = """
+(() => {
+    if (window.__kosPendingRequests !== undefined) return;
+    window.__kosPendingRequests = 0;
+    const done = () => { window.__kosPendingRequests -= 1; };
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (...args) {
+            window.__kosPendingRequests += 1;
+            return originalFetch.apply(this, args).finally(done);
+        };
+    }
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        window.__kosPendingRequests += 1;
+        this.addEventListener("loadend", done, { once: true });
+        return originalSend.apply(this, args);
+    };
+})();
+"""
+
+# Number of in-flight requests, or 0 when the tracker is not installed.
+PENDING_REQUESTS_JS = "return window.__kosPendingRequests || 0;"
+
+# True once the document is loaded and React has hydrated <body>
+# (React attaches __reactFiber$<id> keys to hydrated DOM nodes).
+HYDRATED_JS = """
+if (document.readyState !== "complete" || !document.body) return false;
+return Object.keys(document.body).some(
+    (key) => key.startsWith("__reactFiber") || key.startsWith("__reactContainer")
+);
+"""
+
+# Number of Sonner toasts currently mounted.
+TOAST_COUNT_JS = "return document.querySelectorAll('[data-sonner-toast]').length;"
+
+# True below Tailwind's md breakpoint, where BottomNav replaces the sidebar.
+MOBILE_VIEWPORT_JS = "return !window.matchMedia('(min-width: 768px)').matches;"
+
+# True when the element's box is inside the viewport.
+IN_VIEWPORT_JS = """
+const rect = arguments[0].getBoundingClientRect();
+return rect.top >= 0 && rect.top < window.innerHeight;
+"""
+
+
+class HardSleepTracker:
+    """Records every hard sleep taken at runtime, keyed by call site."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = Counter()
+
+    def record(self, seconds, stack_depth=3):
+        """Record a sleep; the call site is taken from the caller's caller."""
+        frame = traceback.extract_stack(limit=stack_depth)[0]
+        site = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+        self.calls[site] += 1
+        self.seconds[site] += seconds
+
+    @property
+    def total_seconds(self):
+        return sum(self.seconds.values())
+
+    def summary_lines(self, top=10):
+        """Return report lines, slowest call sites first."""
+        lines = [f"Hard sleeps: {sum(self.calls.values())} calls, {self.total_seconds:.1f}s total"]
+        for site, seconds in self.seconds.most_common(top):
+            lines.append(f"  {seconds:6.1f}s  {self.calls[site]:4d}x  {site}")
+        return lines
+
+
+hard_sleep_tracker = HardSleepTracker()
@@ -0,0 +1,24 @@
+"""
+__init__.py - Performance Package
+KosManager Automated Testing
+"""
+from .capture import collect_page_load, collect_soft_navigation, mark_now
+from .recorder import PerfRecorder
+from .metrics import MetricsSampler, enable_metrics, get_metrics
+from .cdp import CdpRecorder, parse_network_events
+from .interaction import install_event_timing, measure_tap, tap_latency
+
+__all__ = [
+    'collect_page_load',
+    'collect_soft_navigation',
+    'mark_now',
+    'PerfRecorder',
+    'MetricsSampler',
+    'enable_metrics',
+    'get_metrics',
+    'CdpRecorder',
+    'parse_network_events',
+    'install_event_timing',
+    'measure_tap',
+    'tap_latency',
+]
@@ -0,0 +1,100 @@
+"""
+budget.py - Route Performance Budgets
+KosManager Automated Testing
+"""
+import fnmatch
+import json
+import os
+
+DEFAULT_BUDGET_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "perf_budgets.json",
+)
+
+MODES = ("off", "warn", "fail")
+
+
+def _navigation(record, key):
+    return (record.get("navigation") or {}).get(key)
+
+
+def _paint(record, key):
+    return (record.get("paint") or {}).get(key)
+
+
+def _transfer_kb(record):
+    document = _navigation(record, "transfer_size") or 0
+    return (document + record["resources"]["transfer_bytes"]) / 1024
+
+
+# Budget keys and how to read them from a perf record (None = not measured)
+METRICS = {
+    "lcp_ms": lambda record: _paint(record, "lcp"),
+    "fcp_ms": lambda record: _paint(record, "fcp"),
+    "ttfb_ms": lambda record: _navigation(record, "ttfb"),
+    "load_ms": lambda record: _navigation(record, "load"),
+    "navigation_ms": lambda record: _navigation(record, "duration"),
+    "wall_ms": lambda record: record["wall_s"] * 1000,
+    "transfer_kb": _transfer_kb,
+    "api_calls": lambda record: record["resources"]["api_calls"],
+    "requests": lambda record: record["resources"]["count"],
+}
+
+
+class BudgetViolation:
+    """One metric of one page over its limit."""
+
+    def __init__(self, route, metric, value, limit):
+        self.route = route
+        self.metric = metric
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        return f"{self.route}: {self.metric} {self.value:.0f} > {self.limit}"
+
+
+class BudgetFile:
+    """
+    Per-route limits loaded from perf_budgets.json.
+
+    Routes are matched exactly first, then as fnmatch patterns
+    ("/dashboard/properties/*"); limits from "defaults" apply to every
+    route unless the route overrides them.
+    """
+
+    def __init__(self, routes, defaults=None, mode="fail"):
+        unknown = {key for limits in [defaults or {}] + list(routes.values())
+                   for key in limits} - set(METRICS)
+        if unknown:
+            raise ValueError(f"Unknown budget metric(s): {', '.join(sorted(unknown))}")
+        self.routes = routes
+        self.defaults = defaults or {}
+        self.mode = mode
+
+    @classmethod
+    def load(cls, path=DEFAULT_BUDGET_FILE):
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        return cls(data.get("routes", {}), data.get("defaults"))
+
+    def limits_for(self, route):
+        """Return the merged limits for a route."""
+        limits = dict(self.defaults)
+        if route in self.routes:
+            limits.update(self.routes[route])
+            return limits
+        for pattern, route_limits in self.routes.items():
+            if fnmatch.fnmatchcase(route, pattern):
+                limits.update(route_limits)
+                break
+        return limits
+
+    def check(self, record):
+        """Return the BudgetViolations of one perf record."""
+        violations = []
+        for metric, limit in self.limits_for(record["route"]).items():
+            value = METRICS[metric](record)
+            if value is not None and value > limit:
+                violations.append(BudgetViolation(record["route"], metric, value, limit))
+        return violations
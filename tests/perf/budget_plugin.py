@@ -0,0 +1,60 @@
+"""
+budget_plugin.py - Pytest Plugin Enforcing Performance Budgets
+KosManager Automated Testing
+"""
+import os
+import warnings
+
+import pytest
+
+from .budget import BudgetFile, DEFAULT_BUDGET_FILE, MODES
+
+
+class PerfBudgetWarning(UserWarning):
+    """A page exceeded its budget while the budget mode is 'warn'."""
+
+
+class PerfBudgetExceeded(AssertionError):
+    """A page exceeded its budget while the budget mode is 'fail'."""
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-budget", choices=MODES, default=os.getenv("TEST_PERF_BUDGET"),
+        help="Check every page against perf_budgets.json: off, warn or fail "
+             "(default: TEST_PERF_BUDGET, or off)",
+    )
+    parser.addoption(
+        "--perf-budget-file", default=DEFAULT_BUDGET_FILE,
+        help="Path of the performance budget file",
+    )
+
+
+def pytest_configure(config):
+    mode = config.getoption("--perf-budget")
+    if not mode or mode == "off":
+        config.perf_budgets = None
+        return
+    budgets = BudgetFile.load(config.getoption("--perf-budget-file"))
+    budgets.mode = mode
+    config.perf_budgets = budgets
+    # Budgets need measurements: turn on capture for every page
+    config.option.perf_capture = True
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    result = yield
+    budgets = getattr(item.config, "perf_budgets", None)
+    entries = getattr(item, "perf_entries", None)
+    if budgets is None or not entries:
+        return result
+
+    violations = [violation for record in entries for violation in budgets.check(record)]
+    if violations:
+        item.user_properties.append(("perf_budget_violations", [str(v) for v in violations]))
+        message = "Performance budget exceeded:\n  " + "\n  ".join(str(v) for v in violations)
+        if budgets.mode == "fail":
+            raise PerfBudgetExceeded(message)
+        warnings.warn(PerfBudgetWarning(message))
+    return result
@@ -0,0 +1,123 @@
+"""
+capture.py - Browser Performance API Collection
+KosManager Automated Testing
+"""
+
+# Collects Navigation Timing, Paint Timing (FCP/LCP) and Resource Timing.
+# arguments[0]: only resources that started at or after this
+#               performance.now() value are returned.
+# LCP is only exposed through a PerformanceObserver; buffered entries are
+# delivered asynchronously, hence the async script and short timeout.
+PERFORMANCE_JS = """
+const since = arguments[0];
+const done = arguments[arguments.length - 1];
+const nav = performance.getEntriesByType("navigation")[0];
+const paint = {};
+performance.getEntriesByType("paint").forEach((entry) => { paint[entry.name] = entry.startTime; });
+let lcp = null;
+
+const finish = () => done({
+    url: location.href,
+    route: location.pathname,
+    now: performance.now(),
+    navigation: nav ? {
+        type: nav.type,
+        dns: nav.domainLookupEnd - nav.domainLookupStart,
+        connect: nav.connectEnd - nav.connectStart,
+        ttfb: nav.responseStart - nav.requestStart,
+        response_end: nav.responseEnd,
+        dom_interactive: nav.domInteractive,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        transfer_size: nav.transferSize,
+    } : null,
+    paint: {
+        fp: paint["first-paint"] ?? null,
+        fcp: paint["first-contentful-paint"] ?? null,
+        lcp: lcp,
+    },
+    resources: performance.getEntriesByType("resource")
+        .filter((entry) => entry.startTime >= since)
+        .map((entry) => ({
+            name: entry.name,
+            type: entry.initiatorType,
+            start: entry.startTime,
+            duration: entry.duration,
+            transfer_size: entry.transferSize,
+            body_size: entry.encodedBodySize,
+        })),
+});
+
+try {
+    const observer = new PerformanceObserver((list) => {
+        const entries = list.getEntries();
+        if (entries.length) lcp = entries[entries.length - 1].startTime;
+    });
+    observer.observe({ type: "largest-contentful-paint", buffered: true });
+    setTimeout(() => { observer.disconnect(); finish(); }, 50);
+} catch (error) {
+    finish();
+}
+"""
+
+MARK_JS = "return performance.now();"
+
+SLOWEST_RESOURCES = 5
+
+
+def mark_now(driver):
+    """Return the page's performance.now(), used to scope soft navigations."""
+    return driver.execute_script(MARK_JS)
+
+
+def collect_page_load(driver):
+    """Collect metrics for the document that was just loaded."""
+    raw = driver.execute_async_script(PERFORMANCE_JS, 0)
+    return _shape(raw, kind="load")
+
+
+def collect_soft_navigation(driver, since):
+    """
+    Collect metrics for a client-side (Next.js router) navigation that
+    started at `since`. Navigation and paint timing belong to the original
+    document, so only the elapsed time and new resources are reported.
+    """
+    raw = driver.execute_async_script(PERFORMANCE_JS, since)
+    if raw["now"] < since:
+        # The click caused a full document load (e.g. signOut redirect)
+        return collect_page_load(driver)
+    metrics = _shape(raw, kind="navigation")
+    metrics["navigation"] = {"duration": raw["now"] - since}
+    metrics["paint"] = {}
+    return metrics
+
+
+def _shape(raw, kind):
+    """Turn the raw script result into a compact record (times in ms)."""
+    resources = raw["resources"]
+    api_calls = [entry for entry in resources if "/api/" in entry["name"]]
+    slowest = sorted(resources, key=lambda entry: entry["duration"], reverse=True)
+    return {
+        "kind": kind,
+        "route": raw["route"],
+        "url": raw["url"],
+        "navigation": _rounded(raw["navigation"]),
+        "paint": _rounded(raw["paint"]),
+        "resources": {
+            "count": len(resources),
+            "transfer_bytes": sum(entry["transfer_size"] or 0 for entry in resources),
+            "api_calls": len(api_calls),
+            "slowest": [
+                {"name": entry["name"], "type": entry["type"],
+                 "duration": round(entry["duration"], 1)}
+                for entry in slowest[:SLOWEST_RESOURCES]
+            ],
+        },
+    }
+
+
+def _rounded(values):
+    if values is None:
+        return None
+    return {key: round(value, 1) if isinstance(value, float) else value
+            for key, value in values.items()}
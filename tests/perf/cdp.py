@@ -0,0 +1,246 @@
+"""
+cdp.py - Chrome DevTools Protocol Network & CPU Instrumentation
+KosManager Automated Testing
+"""
+import json
+import logging
+import os
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from .metrics import MB, enable_metrics, get_metrics
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_REQUESTS = 10
+
+# Records main-thread tasks over 50 ms on every new document.
+LONG_TASK_OBSERVER_JS = """
+window.__longTasks = [];
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) {
+            window.__longTasks.push({start: entry.startTime, duration: entry.duration,
+                                     url: location.pathname});
+        }
+    }).observe({type: "longtask", buffered: true});
+} catch (error) {}
+"""
+
+TAKE_LONG_TASKS_JS = """
+const tasks = window.__longTasks || [];
+window.__longTasks = [];
+return tasks;
+"""
+
+
+def enable_performance_log(chrome_options):
+    """
+    Ask chromedriver to log CDP Network events (read with get_log("performance")).
+    Must be set before the browser starts.
+    """
+    logging_prefs = dict(chrome_options.capabilities.get("goog:loggingPrefs", {}))
+    logging_prefs["performance"] = "ALL"
+    chrome_options.set_capability("goog:loggingPrefs", logging_prefs)
+    chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True,
+                                                                "enablePage": False})
+    return chrome_options
+
+
+def parse_network_events(log_entries):
+    """
+    Turn performance log entries into one dict per finished or failed request:
+    url, method, type, status, protocol, duration_ms, ttfb_ms,
+    transfer_bytes, cache ("memory", "disk", "service-worker" or None).
+    """
+    requests = {}
+    finished = []
+    for entry in log_entries:
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method", "")
+        if not method.startswith("Network."):
+            continue
+        params = message["params"]
+        request_id = params.get("requestId")
+
+        if method == "Network.requestWillBeSent":
+            if params.get("redirectResponse") and request_id in requests:
+                # A redirect reuses the request id; close the previous hop
+                hop = requests.pop(request_id)
+                hop["status"] = params["redirectResponse"].get("status")
+                hop["duration_ms"] = _ms(params["timestamp"] - hop.pop("_started"))
+                finished.append(hop)
+            requests[request_id] = {
+                "url": params["request"]["url"],
+                "method": params["request"]["method"],
+                "type": params.get("type"),
+                "status": None,
+                "protocol": None,
+                "duration_ms": None,
+                "ttfb_ms": None,
+                "transfer_bytes": 0,
+                "cache": None,
+                "failed": None,
+                "_started": params["timestamp"],
+            }
+            continue
+
+        request = requests.get(request_id)
+        if request is None:
+            continue
+        if method == "Network.requestServedFromCache":
+            request["cache"] = "memory"
+        elif method == "Network.responseReceived":
+            response = params["response"]
+            request["status"] = response.get("status")
+            request["protocol"] = response.get("protocol")
+            if response.get("fromServiceWorker"):
+                request["cache"] = "service-worker"
+            elif response.get("fromDiskCache"):
+                request["cache"] = request["cache"] or "disk"
+            timing = response.get("timing")
+            if timing:
+                request["ttfb_ms"] = round(timing["receiveHeadersEnd"] - timing["sendStart"], 1)
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            requests.pop(request_id)
+            if method == "Network.loadingFinished":
+                request["transfer_bytes"] = int(params.get("encodedDataLength", 0))
+            else:
+                request["failed"] = params.get("errorText") or "failed"
+            request["duration_ms"] = _ms(params["timestamp"] - request.pop("_started"))
+            finished.append(request)
+    return finished
+
+
+def summarize(requests, long_tasks, metrics):
+    """Compact per-test summary for the HTML report and cdp.jsonl."""
+    slowest = sorted(requests, key=lambda request: request["duration_ms"] or 0, reverse=True)
+    api_calls = [request for request in requests if "/api/" in request["url"]]
+    return {
+        "requests": {
+            "count": len(requests),
+            "api_calls": len(api_calls),
+            "transfer_bytes": sum(request["transfer_bytes"] for request in requests),
+            "cache_hits": sum(1 for request in requests if request["cache"]),
+            "failed": [request["url"] for request in requests if request["failed"]],
+            "errors": [f"{request['status']} {request['url']}" for request in requests
+                       if request["status"] and request["status"] >= 400],
+            "slowest": [
+                {key: request[key] for key in ("url", "status", "duration_ms", "ttfb_ms",
+                                               "transfer_bytes", "cache")}
+                for request in slowest[:SLOWEST_REQUESTS]
+            ],
+        },
+        "long_tasks": {
+            "count": len(long_tasks),
+            "total_ms": round(sum(task["duration"] for task in long_tasks), 1),
+            "longest_ms": round(max((task["duration"] for task in long_tasks), default=0), 1),
+            "by_route": _count_by(long_tasks, "url"),
+        },
+        "js_heap": {
+            "used_mb": round(metrics.get("JSHeapUsedSize", 0) / MB, 2),
+            "total_mb": round(metrics.get("JSHeapTotalSize", 0) / MB, 2),
+        },
+    }
+
+
+class CdpRecorder:
+    """
+    Per-test network, long-task and heap capture through CDP.
+
+    Network events come from chromedriver's performance log (the browser
+    is started with enable_performance_log()); long tasks from a
+    PerformanceObserver added to every new document; heap from
+    Performance.getMetrics. The recorder is attached to the driver as
+    `driver.cdp_recorder`; page objects read it via InstrumentedPageMixin.
+    Summaries are appended to reports/runs/<run_id>/cdp.jsonl.
+    """
+
+    def __init__(self, path, run_id, worker_id):
+        self.path = path
+        self.run_id = run_id
+        self.worker_id = worker_id
+        self.item = None
+        self.requests = []
+        self.long_tasks = []
+        self._log_entries = []
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def begin(self, driver, item):
+        """Start a test: install the observers once and drop earlier events."""
+        if not getattr(driver, "cdp_instrumented", False):
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                   {"source": LONG_TASK_OBSERVER_JS})
+            driver.cdp_instrumented = True
+        enable_metrics(driver)
+        self.item = item
+        self.requests = []
+        self.long_tasks = []
+        self._log_entries = []
+        self._read_log(driver)
+        self._log_entries = []
+        self._take_long_tasks(driver)
+        self.long_tasks = []
+        return self
+
+    def poll(self, driver):
+        """Pull the events logged since the last poll into this test's buffers."""
+        self._read_log(driver)
+        self.requests = parse_network_events(self._log_entries)
+        return self
+
+    def before_navigation(self, driver):
+        """Keep the current document's long tasks before it is replaced."""
+        self._take_long_tasks(driver)
+
+    def finish(self, driver):
+        """Collect everything for the running test; returns the summary."""
+        self._take_long_tasks(driver)
+        self.poll(driver)
+        summary = summarize(self.requests, self.long_tasks, get_metrics(driver))
+        summary.update({
+            "run_id": self.run_id,
+            "worker": self.worker_id,
+            "test": self.item.nodeid if self.item else None,
+            "timestamp": time.time(),
+        })
+        self._append(summary)
+        return summary
+
+    def end(self):
+        self.item = None
+        return self
+
+    def _read_log(self, driver):
+        try:
+            self._log_entries.extend(driver.get_log("performance"))
+        except WebDriverException as error:
+            logger.warning("Performance log not available (start Chrome with --cdp-capture): %s",
+                           error)
+
+    def _take_long_tasks(self, driver):
+        try:
+            self.long_tasks.extend(driver.execute_script(TAKE_LONG_TASKS_JS) or [])
+        except WebDriverException:
+            pass
+
+    def _append(self, summary):
+        """Append one line with a single O_APPEND write so workers don't interleave."""
+        line = (json.dumps(summary, sort_keys=True) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+def _count_by(entries, key):
+    counts = {}
+    for entry in entries:
+        counts[entry.get(key)] = counts.get(entry.get(key), 0) + 1
+    return counts
@@ -0,0 +1,84 @@
+"""
+interaction.py - Tap-to-Next-Paint Measurement (Event Timing API)
+KosManager Automated Testing
+"""
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+# Buffers Event Timing entries (input delay, handler time and the next
+# paint after the input) on every new document.
+EVENT_TIMING_OBSERVER_JS = """
+window.__kosInteractions = [];
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) {
+            window.__kosInteractions.push({
+                name: entry.name,
+                start: entry.startTime,
+                input_delay: entry.processingStart - entry.startTime,
+                processing: entry.processingEnd - entry.processingStart,
+                duration: entry.duration,
+            });
+        }
+    }).observe({type: "event", durationThreshold: 16, buffered: true});
+} catch (error) {}
+"""
+
+TAKE_INTERACTIONS_JS = """
+const entries = window.__kosInteractions || [];
+window.__kosInteractions = [];
+return entries;
+"""
+
+# Input events a tap produces; Event Timing reports each separately
+TAP_EVENTS = ("pointerdown", "pointerup", "mousedown", "mouseup", "click", "touchstart",
+              "touchend")
+
+
+def install_event_timing(driver):
+    """Observe input events on every new document (once per driver)."""
+    if getattr(driver, "event_timing_installed", False):
+        return
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                           {"source": EVENT_TIMING_OBSERVER_JS})
+    driver.event_timing_installed = True
+
+
+def take_interactions(driver):
+    """Return and clear the Event Timing entries buffered in the page."""
+    try:
+        return driver.execute_script(TAKE_INTERACTIONS_JS) or []
+    except WebDriverException:
+        return []
+
+
+def tap_latency(entries):
+    """
+    Summarize the entries of one tap: the slowest event's input delay and
+    its duration up to the next paint (what INP reports), in ms.
+    Event Timing only reports events over 16 ms, so a fast tap gives 0.
+    """
+    taps = [entry for entry in entries if entry["name"] in TAP_EVENTS]
+    if not taps:
+        return {"input_delay_ms": 0.0, "next_paint_ms": 0.0, "events": 0}
+    slowest = max(taps, key=lambda entry: entry["duration"])
+    return {
+        "input_delay_ms": round(slowest["input_delay"], 1),
+        "next_paint_ms": round(slowest["duration"], 1),
+        "events": len(taps),
+    }
+
+
+def measure_tap(driver, tap):
+    """
+    Run `tap()` (a click that navigates and waits for the new route) and
+    return its tap_latency() plus `route_ms`: wall time until the route is ready.
+    """
+    take_interactions(driver)
+    started = time.perf_counter()
+    tap()
+    route_ms = round((time.perf_counter() - started) * 1000, 1)
+    latency = tap_latency(take_interactions(driver))
+    latency["route_ms"] = route_ms
+    return latency
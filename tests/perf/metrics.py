@@ -0,0 +1,61 @@
+"""
+metrics.py - Chrome Performance Domain Metrics
+KosManager Automated Testing
+"""
+from selenium.common.exceptions import WebDriverException
+
+MB = 1024 * 1024
+
+
+def enable_metrics(driver):
+    """Turn on the CDP Performance domain (needed once per page target)."""
+    driver.execute_cdp_cmd("Performance.enable", {"timeDomain": "timeTicks"})
+
+
+def get_metrics(driver):
+    """Return Performance.getMetrics as a {name: value} dict ({} without CDP)."""
+    try:
+        result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    except (AttributeError, WebDriverException):
+        return {}
+    return {metric["name"]: metric["value"] for metric in result["metrics"]}
+
+
+class MetricsSampler:
+    """
+    Samples JS heap and main-thread time while something runs in the page.
+
+    start() takes a baseline, sample() can be called repeatedly (e.g. from
+    a wait's poll) to track the peak heap, and stop() returns the summary:
+    heap before/peak/after in MB and the script/task/layout time spent
+    since start() in milliseconds.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.before = {}
+        self.peak_heap = 0
+
+    def start(self):
+        enable_metrics(self.driver)
+        self.before = get_metrics(self.driver)
+        self.peak_heap = self.before.get("JSHeapUsedSize", 0)
+        return self
+
+    def sample(self, driver=None):
+        metrics = get_metrics(driver or self.driver)
+        self.peak_heap = max(self.peak_heap, metrics.get("JSHeapUsedSize", 0))
+        return metrics
+
+    def stop(self):
+        after = self.sample()
+        delta_ms = lambda name: round((after.get(name, 0) - self.before.get(name, 0)) * 1000, 1)
+        return {
+            "heap_before_mb": round(self.before.get("JSHeapUsedSize", 0) / MB, 2),
+            "heap_peak_mb": round(self.peak_heap / MB, 2),
+            "heap_after_mb": round(after.get("JSHeapUsedSize", 0) / MB, 2),
+            "heap_total_mb": round(after.get("JSHeapTotalSize", 0) / MB, 2),
+            "script_ms": delta_ms("ScriptDuration"),
+            "task_ms": delta_ms("TaskDuration"),
+            "layout_ms": delta_ms("LayoutDuration"),
+        }
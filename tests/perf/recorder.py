@@ -0,0 +1,81 @@
+"""
+recorder.py - Per-Run Performance Record Writer
+KosManager Automated Testing
+"""
+import json
+import logging
+import os
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from .capture import collect_page_load, collect_soft_navigation, mark_now
+
+logger = logging.getLogger(__name__)
+
+
+class PerfRecorder:
+    """
+    Collects page performance for the running test and appends it to
+    reports/runs/<run_id>/perf.jsonl (one JSON object per page).
+
+    The recorder is attached to the driver as `driver.perf_recorder`;
+    BasePage.open() and BasePage.navigate_by_click() report to it.
+    """
+
+    def __init__(self, path, run_id, worker_id):
+        self.path = path
+        self.run_id = run_id
+        self.worker_id = worker_id
+        self.item = None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def begin(self, item):
+        """Start collecting for a pytest item."""
+        self.item = item
+        item.perf_entries = []
+        return self
+
+    def end(self):
+        self.item = None
+        return self
+
+    def mark(self, driver):
+        """Return a performance mark taken just before a navigation click."""
+        return mark_now(driver)
+
+    def record_load(self, driver, wall_seconds):
+        """Record a full page load."""
+        return self._record(lambda: collect_page_load(driver), wall_seconds)
+
+    def record_navigation(self, driver, since, wall_seconds):
+        """Record a client-side navigation started at performance mark `since`."""
+        return self._record(lambda: collect_soft_navigation(driver, since), wall_seconds)
+
+    def _record(self, collect, wall_seconds):
+        try:
+            metrics = collect()
+        except WebDriverException as error:
+            logger.warning("Could not collect performance metrics: %s", error)
+            return None
+
+        metrics.update({
+            "run_id": self.run_id,
+            "worker": self.worker_id,
+            "test": self.item.nodeid if self.item else None,
+            "timestamp": time.time(),
+            "wall_s": round(wall_seconds, 3),
+        })
+        if self.item is not None:
+            self.item.perf_entries.append(metrics)
+        self._append(metrics)
+        return metrics
+
+    def _append(self, metrics):
+        """Append one line with a single O_APPEND write so workers don't interleave."""
+        line = (json.dumps(metrics, sort_keys=True) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
@@ -0,0 +1,17 @@
+"""
+__init__.py - Recorded API Fixtures Package
+KosManager Automated Testing
+"""
+from .cassette import CASSETTE_VERSION, Cassette, CassetteError, cassette_path, request_key
+from .interceptor import MODES, FetchInterceptor, ReplaySession
+
+__all__ = [
+    'CASSETTE_VERSION',
+    'Cassette',
+    'CassetteError',
+    'cassette_path',
+    'request_key',
+    'MODES',
+    'FetchInterceptor',
+    'ReplaySession',
+]
@@ -0,0 +1,236 @@
+"""
+cassette.py - Recorded /api/* Responses
+KosManager Automated Testing
+"""
+import base64
+import json
+import os
+import re
+import subprocess
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Bump when the file layout changes; older cassettes must be re-recorded
+CASSETTE_VERSION = 1
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "fixtures", "api")
+
+UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I)
+DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+
+# Headers replayed with the body; the rest (date, set-cookie, ...) is per run
+KEPT_HEADERS = {"content-type", "cache-control", "location"}
+# Keys whose values change on every request, ignored when comparing
+VOLATILE_KEYS = {"expires"}
+
+
+class CassetteError(Exception):
+    """A cassette is missing, unreadable or from another CASSETTE_VERSION."""
+
+
+def request_key(method, url):
+    """
+    "GET /api/tenants/{id}?status=active": method, path and sorted query,
+    with ids replaced so a replay matches rows created in another run.
+    """
+    parts = urlsplit(url)
+    path = UUID_RE.sub("{id}", parts.path)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    query = UUID_RE.sub("{id}", query)
+    return f"{method.upper()} {path}" + (f"?{query}" if query else "")
+
+
+def cassette_path(nodeid, directory=FIXTURES_DIR):
+    """tests/test_04_properties.py::TestX::test_y[a] -> <directory>/test_04_properties/TestX.test_y[a].json"""
+    module, _, name = nodeid.partition("::")
+    stem = os.path.splitext(os.path.basename(module))[0]
+    name = re.sub(r"[^\w.\[\]-]+", "_", name.replace("::", "."))
+    return os.path.join(directory, stem, f"{name}.json")
+
+
+def encode_body(body, content_type=""):
+    """Store JSON as JSON, other text as text and binary as base64 (readable diffs)."""
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(body).decode("ascii")}
+    if "json" in content_type:
+        try:
+            return {"json": json.loads(text)}
+        except ValueError:
+            pass
+    return {"text": text}
+
+
+def decode_body(stored):
+    if "json" in stored:
+        return json.dumps(stored["json"], separators=(",", ":")).encode("utf-8")
+    if "text" in stored:
+        return stored["text"].encode("utf-8")
+    return base64.b64decode(stored["base64"])
+
+
+def normalize(value):
+    """Replace ids and timestamps so two runs of the same flow compare equal."""
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items() if key not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    if isinstance(value, str):
+        if UUID_RE.fullmatch(value):
+            return "{id}"
+        if DATETIME_RE.match(value):
+            return "{datetime}"
+    return value
+
+
+def diff_json(recorded, live, path="$"):
+    """List the differences between two normalized JSON values, as 'path: old -> new'."""
+    if type(recorded) is not type(live):
+        return [f"{path}: {_short(recorded)} -> {_short(live)}"]
+    if isinstance(recorded, dict):
+        differences = []
+        for key in sorted(set(recorded) | set(live)):
+            if key not in live:
+                differences.append(f"{path}.{key}: removed")
+            elif key not in recorded:
+                differences.append(f"{path}.{key}: added")
+            else:
+                differences.extend(diff_json(recorded[key], live[key], f"{path}.{key}"))
+        return differences
+    if isinstance(recorded, list):
+        if len(recorded) != len(live):
+            return [f"{path}: {len(recorded)} items -> {len(live)} items"]
+        differences = []
+        for index, (old, new) in enumerate(zip(recorded, live)):
+            differences.extend(diff_json(old, new, f"{path}[{index}]"))
+        return differences
+    if recorded != live:
+        return [f"{path}: {_short(recorded)} -> {_short(live)}"]
+    return []
+
+
+def _short(value):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+def _app_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Cassette:
+    """
+    The /api/* responses one test received, in order.
+
+    Responses are grouped by request_key(); replaying a key returns its
+    responses in recorded order and then keeps returning the last one,
+    so "GET /api/properties" before and after a create both match.
+    """
+
+    def __init__(self, path, interactions=None, meta=None):
+        self.path = path
+        self.interactions = interactions or []
+        self.meta = meta or {}
+        self._cursors = {}
+        self.misses = []
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            raise CassetteError(f"No recorded API fixtures at {path}")
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != CASSETTE_VERSION:
+            raise CassetteError(f"{path} is cassette version {data.get('version')}, "
+                                f"expected {CASSETTE_VERSION}; re-record it")
+        return cls(path, data["interactions"], data.get("meta"))
+
+    def record(self, method, url, status, headers, body, request_body=None):
+        """Add one live response (headers: {name: value}, body: bytes)."""
+        headers = {name.lower(): value for name, value in headers.items()}
+        interaction = {
+            "key": request_key(method, url),
+            "request": {"method": method.upper(), "url": urlsplit(url).path},
+            "response": {
+                "status": status,
+                "headers": {name: value for name, value in headers.items()
+                            if name in KEPT_HEADERS},
+                "body": encode_body(body, headers.get("content-type", "")),
+            },
+        }
+        if request_body:
+            interaction["request"]["body"] = encode_body(request_body.encode("utf-8"),
+                                                         "application/json")
+        self.interactions.append(interaction)
+        return interaction
+
+    def responses(self, key):
+        return [interaction["response"] for interaction in self.interactions
+                if interaction["key"] == key]
+
+    def next_response(self, method, url):
+        """The response to replay for this request, or None (recorded in `misses`)."""
+        key = request_key(method, url)
+        responses = self.responses(key)
+        if not responses:
+            self.misses.append(key)
+            return None
+        cursor = self._cursors.get(key, 0)
+        self._cursors[key] = cursor + 1
+        return responses[min(cursor, len(responses) - 1)]
+
+    def drift(self, live):
+        """Compare this (recorded) cassette with a `live` one from the same test."""
+        differences = []
+        for key in _ordered_keys(self.interactions + live.interactions):
+            recorded, current = self.responses(key), live.responses(key)
+            if not current:
+                continue
+            if not recorded:
+                differences.append(f"{key}: not recorded")
+                continue
+            for index, (old, new) in enumerate(zip(recorded, current)):
+                label = key if len(current) == 1 else f"{key} #{index + 1}"
+                if old["status"] != new["status"]:
+                    differences.append(f"{label}: status {old['status']} -> {new['status']}")
+                    continue
+                changes = diff_json(normalize(_content(old["body"])),
+                                    normalize(_content(new["body"])))
+                differences.extend(f"{label} {change}" for change in changes)
+        return differences
+
+    def save(self, base_url=None):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.meta.update({
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "app_commit": _app_commit(),
+            "base_url": base_url,
+        })
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump({"version": CASSETTE_VERSION, "meta": self.meta,
+                       "interactions": self.interactions},
+                      handle, indent=2, ensure_ascii=False, sort_keys=True)
+            handle.write("\n")
+        return self.path
+
+
+def _content(stored):
+    """The comparable value of a stored body: parsed JSON, text or base64."""
+    for kind in ("json", "text", "base64"):
+        if kind in stored:
+            return stored[kind]
+    return None
+
+
+def _ordered_keys(interactions):
+    keys = []
+    for interaction in interactions:
+        if interaction["key"] not in keys:
+            keys.append(interaction["key"])
+    return keys
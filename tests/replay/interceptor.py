@@ -0,0 +1,159 @@
+"""
+interceptor.py - CDP Fetch Interception for /api/* Record & Replay
+KosManager Automated Testing
+"""
+import base64
+import logging
+import threading
+
+import requests
+import trio
+from selenium.webdriver.common.bidi import cdp
+
+from .cassette import Cassette, CassetteError, decode_body
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "record", "replay", "drift")
+# Only the app's API; pages, RSC payloads and static assets stay live
+URL_PATTERN = "*/api/*"
+START_TIMEOUT = 10
+
+
+class ReplaySession:
+    """
+    What to do with each intercepted /api/* request in one test.
+
+    record: let it through and store the response in `cassette`.
+    replay: answer from `cassette` without touching the server.
+    drift:  let it through, store it in `live` and compare with the
+            recorded cassette afterwards (drift()).
+    """
+
+    def __init__(self, mode, cassette, live=None):
+        if mode not in MODES[1:]:
+            raise ValueError(f"Unknown API fixture mode '{mode}', expected one of: {', '.join(MODES)}")
+        self.mode = mode
+        self.cassette = cassette
+        self.live = live if live is not None else Cassette(cassette.path)
+
+    @property
+    def stage(self):
+        """Intercept before the request (replay) or once the response arrived."""
+        return "request" if self.mode == "replay" else "response"
+
+    def on_request(self, method, url):
+        """Replay only: the recorded response, or None to fail the request."""
+        response = self.cassette.next_response(method, url)
+        if response is None:
+            logger.warning("No recorded response for %s %s", method, url)
+        return response
+
+    def on_response(self, method, url, status, headers, body, request_body=None):
+        target = self.cassette if self.mode == "record" else self.live
+        target.record(method, url, status, headers, body, request_body)
+
+    def drift(self):
+        return self.cassette.drift(self.live) if self.mode == "drift" else []
+
+
+def devtools_endpoint(driver):
+    """Browser websocket URL and major version from chromedriver's debuggerAddress."""
+    address = (driver.caps.get("goog:chromeOptions") or {}).get("debuggerAddress")
+    if not address:
+        raise CassetteError("Browser has no DevTools debuggerAddress; API fixtures need Chrome")
+    version = requests.get(f"http://{address}/json/version", timeout=5).json()
+    return version["webSocketDebuggerUrl"], version["Browser"].split("/")[1].split(".")[0]
+
+
+class FetchInterceptor:
+    """
+    Runs a ReplaySession against the driver's current tab.
+
+    Fetch.requestPaused is an event, which execute_cdp_cmd cannot receive,
+    so the interceptor opens its own DevTools websocket (Selenium's trio
+    CDP client) in a background thread for the duration of one test.
+    """
+
+    def __init__(self, driver, session):
+        self.driver = driver
+        self.session = session
+        self.errors = []
+        self._thread = None
+        self._ready = threading.Event()
+        self._token = None
+        self._scope = None
+
+    def start(self):
+        url, version = devtools_endpoint(self.driver)
+        target_id = self.driver.current_window_handle  # chromedriver handles are target ids
+        self._thread = threading.Thread(target=trio.run, args=(self._serve, url, version, target_id),
+                                        name="api-fixtures", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(START_TIMEOUT) or self.errors:
+            raise CassetteError(f"Could not start Fetch interception: {self.errors or 'timeout'}")
+        return self
+
+    def stop(self):
+        if self._scope is not None:
+            try:
+                trio.from_thread.run_sync(self._scope.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+        if self._thread is not None:
+            self._thread.join(START_TIMEOUT)
+        return self
+
+    async def _serve(self, url, version, target_id):
+        self._token = trio.lowlevel.current_trio_token()
+        devtools = cdp.import_devtools(version)
+        fetch = devtools.fetch
+        stage = (fetch.RequestStage.REQUEST if self.session.stage == "request"
+                 else fetch.RequestStage.RESPONSE)
+        try:
+            async with cdp.open_cdp(url) as connection:
+                async with connection.open_session(target_id) as cdp_session:
+                    await cdp_session.execute(fetch.enable(
+                        patterns=[fetch.RequestPattern(url_pattern=URL_PATTERN, request_stage=stage)]))
+                    events = cdp_session.listen(fetch.RequestPaused, buffer_size=100)
+                    with trio.CancelScope() as scope:
+                        self._scope = scope
+                        self._ready.set()
+                        async for event in events:
+                            await self._handle(cdp_session, devtools, event)
+        except Exception as error:  # reported by the plugin after the test
+            self.errors.append(repr(error))
+            self._ready.set()
+
+    async def _handle(self, cdp_session, devtools, event):
+        fetch = devtools.fetch
+        request = event.request
+        try:
+            if self.session.stage == "request":
+                response = self.session.on_request(request.method, request.url)
+                if response is None:
+                    await cdp_session.execute(fetch.fail_request(
+                        event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT))
+                    return
+                await cdp_session.execute(fetch.fulfill_request(
+                    event.request_id,
+                    response_code=response["status"],
+                    response_headers=[fetch.HeaderEntry(name=name, value=value)
+                                      for name, value in response["headers"].items()],
+                    body=base64.b64encode(decode_body(response["body"])).decode("ascii"),
+                ))
+                return
+
+            if event.response_status_code is not None:
+                body = b""
+                if not 300 <= event.response_status_code < 400:
+                    text, is_base64 = await cdp_session.execute(
+                        fetch.get_response_body(event.request_id))
+                    body = base64.b64decode(text) if is_base64 else text.encode("utf-8")
+                headers = {header.name: header.value for header in event.response_headers or []}
+                self.session.on_response(request.method, request.url, event.response_status_code,
+                                         headers, body, request.post_data)
+            await cdp_session.execute(fetch.continue_request(event.request_id))
+        except Exception as error:
+            self.errors.append(f"{request.method} {request.url}: {error!r}")
+            logger.warning("API fixture interception failed for %s: %s", request.url, error)
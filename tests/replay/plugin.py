@@ -0,0 +1,118 @@
+"""
+plugin.py - Pytest Plugin for Recorded API Fixtures
+KosManager Automated Testing
+"""
+import json
+import os
+import warnings
+
+import pytest
+
+from drivers.workspace import REPORTS_DIR, get_run_id
+
+from .cassette import FIXTURES_DIR, Cassette, CassetteError, cassette_path
+from .interceptor import MODES, FetchInterceptor, ReplaySession
+
+
+# Drift per test id, collected from the reports of every worker
+_drift = {}
+
+
+class ApiDriftWarning(UserWarning):
+    """Live /api/* responses differ from the recorded fixtures (mode 'drift')."""
+
+
+class ApiFixtureMissWarning(UserWarning):
+    """A replayed test made an /api/* request that was never recorded."""
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--api-fixtures", choices=MODES, default=os.getenv("TEST_API_FIXTURES"),
+        help="Record /api/* responses, replay them through CDP Fetch, or report drift "
+             "against them: off, record, replay or drift (default: TEST_API_FIXTURES, or off)",
+    )
+    parser.addoption(
+        "--api-fixtures-dir", default=os.getenv("TEST_API_FIXTURES_DIR", FIXTURES_DIR),
+        help="Directory of the recorded API fixtures",
+    )
+
+
+def pytest_configure(config):
+    mode = config.getoption("--api-fixtures") or "off"
+    config.api_fixtures_mode = mode
+
+
+@pytest.fixture(autouse=True)
+def api_fixtures(request):
+    """
+    Wrap every browser test in a ReplaySession when --api-fixtures is on.
+    Returns the session (or None) so a test can inspect what was recorded.
+    """
+    mode = request.config.api_fixtures_mode
+    if mode == "off" or "browser" not in request.fixturenames:
+        yield None
+        return
+
+    path = cassette_path(request.node.nodeid, request.config.getoption("--api-fixtures-dir"))
+    if mode == "record":
+        cassette = Cassette(path)
+    else:
+        try:
+            cassette = Cassette.load(path)
+        except CassetteError as error:
+            pytest.skip(f"{error} (record it with --api-fixtures=record)")
+
+    driver = request.getfixturevalue("browser")
+    session = ReplaySession(mode, cassette)
+    interceptor = FetchInterceptor(driver, session).start()
+
+    yield session
+
+    interceptor.stop()
+    for error in interceptor.errors:
+        warnings.warn(ApiFixtureMissWarning(f"Interception error: {error}"))
+    if mode == "record":
+        report = getattr(request.node, "rep_call", None)
+        if report is None or report.passed:
+            cassette.save(base_url=request.getfixturevalue("base_url"))
+    elif mode == "replay" and cassette.misses:
+        warnings.warn(ApiFixtureMissWarning(
+            f"Not recorded in {os.path.relpath(path)}: {', '.join(sorted(set(cassette.misses)))}"))
+    elif mode == "drift":
+        differences = session.drift()
+        if differences:
+            # Reaches the controller through the teardown report, also under xdist
+            request.node.user_properties.append(("api_drift", differences))
+            warnings.warn(ApiDriftWarning(
+                f"{len(differences)} difference(s) from {os.path.relpath(path)}:\n  "
+                + "\n  ".join(differences[:20])))
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Keep the call-phase report so only passing tests overwrite their fixtures."""
+    report = yield
+    if report.when == "call":
+        item.rep_call = report
+    return report
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, differences in report.user_properties:
+        if name == "api_drift":
+            _drift[report.nodeid] = differences
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.api_fixtures_mode != "drift" or not _drift:
+        return
+    path = os.path.join(REPORTS_DIR, "runs", get_run_id(), "api_drift.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(_drift, handle, indent=2, ensure_ascii=False)
+    changed = sum(len(differences) for differences in _drift.values())
+    terminalreporter.write_line(
+        f"API drift: {changed} difference(s) in {len(_drift)} test(s), written to {path}")
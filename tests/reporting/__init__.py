@@ -0,0 +1,16 @@
+"""
+__init__.py - Streaming Test Report Package
+KosManager Automated Testing
+"""
+from .events import EventWriter, merge_events, phase_event, read_events
+from .index import IndexBuilder, build_index, final_outcome
+
+__all__ = [
+    'EventWriter',
+    'merge_events',
+    'phase_event',
+    'read_events',
+    'IndexBuilder',
+    'build_index',
+    'final_outcome',
+]
@@ -0,0 +1,45 @@
+"""
+__main__.py - Streaming Report Command Line
+KosManager Automated Testing
+
+Usage (from the tests/ directory):
+    python -m reporting index reports/runs/20261017_101500          # rebuild index.html
+    python -m reporting index shard-1/ shard-2/ --out reports/ci      # several CI shards
+    python -m reporting merge shard-*/events*.jsonl --out all.jsonl
+"""
+import argparse
+import os
+import sys
+
+from .events import event_files, merge_events
+from .index import build_index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge JSONL test events and build the HTML index.")
+    parser.add_argument("command", choices=("index", "merge"))
+    parser.add_argument("paths", nargs="+", help="events*.jsonl files or directories holding them")
+    parser.add_argument("--out", help="index: output directory (default: the first directory); "
+                                      "merge: output file")
+    args = parser.parse_args(argv)
+
+    files = event_files(args.paths)
+    if not files:
+        print("No events*.jsonl files found", file=sys.stderr)
+        return 1
+    if args.command == "merge":
+        if not args.out:
+            parser.error("merge needs --out FILE")
+        count = merge_events(files, args.out)
+        print(f"Merged {count} event(s) from {len(files)} file(s) into {args.out}")
+        return 0
+
+    out_dir = args.out or (args.paths[0] if os.path.isdir(args.paths[0]) else os.path.dirname(files[0]))
+    path, builder = build_index(files, out_dir)
+    tests = sum(builder.totals.values())
+    print(f"Indexed {tests} test(s) from {len(files)} file(s): {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
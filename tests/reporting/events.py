@@ -0,0 +1,120 @@
+"""
+events.py - JSONL Event Stream of a Test Run
+KosManager Automated Testing
+"""
+import glob
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+EVENTS_VERSION = 1
+# Keep single events small: a runaway log must not bloat the stream
+MAX_LONGREPR_CHARS = 20000
+MAX_SECTION_CHARS = 10000
+
+
+def _truncate(text, limit):
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}\n... ({len(text) - limit} more characters)"
+
+
+def report_worker(report):
+    """xdist worker id of a report seen on the controller, or 'master'."""
+    node = getattr(report, "node", None)
+    return getattr(node, "workerinput", {}).get("workerid", "master")
+
+
+def phase_event(report, run_id, shard=None):
+    """
+    One event per setup/call/teardown report. Artifacts and other
+    user_properties go by value as recorded (artifact files by path).
+    """
+    event = {
+        "event": "phase",
+        "run_id": run_id,
+        "worker": report_worker(report),
+        "shard": shard,
+        "nodeid": report.nodeid,
+        "when": report.when,
+        "outcome": report.outcome,
+        "duration": round(report.duration, 4),
+        "stop": round(getattr(report, "stop", time.time()), 3),
+    }
+    if hasattr(report, "wasxfail"):
+        event["xfail"] = report.wasxfail or True
+    if report.failed or report.skipped:
+        longrepr = report.longrepr
+        if isinstance(longrepr, tuple):  # skip: (path, line, reason)
+            longrepr = longrepr[-1]
+        event["longrepr"] = _truncate(str(longrepr), MAX_LONGREPR_CHARS)
+    if report.failed:
+        event["sections"] = [[title, _truncate(content, MAX_SECTION_CHARS)]
+                             for title, content in report.sections]
+    if report.user_properties:
+        event["properties"] = dict(report.user_properties)
+    return event
+
+
+class EventWriter:
+    """
+    Appends events to one JSONL file, a line per event, flushed as it is
+    written: nothing is kept in memory and a killed run still leaves every
+    finished phase on disk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._handle = open(path, "a", encoding="utf-8")
+
+    def write(self, event):
+        self._handle.write(json.dumps(event, default=str, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        self.count += 1
+
+    def close(self):
+        self._handle.close()
+
+
+def event_files(paths):
+    """Expand directories into their events*.jsonl files (sorted)."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", "events*.jsonl"), recursive=True)))
+        else:
+            files.append(path)
+    return files
+
+
+def read_events(paths):
+    """Stream the events of several files, one at a time, skipping torn lines."""
+    for path in event_files(paths):
+        with open(path, encoding="utf-8") as handle:
+            for number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping unreadable event %s:%d", path, number)
+
+
+def merge_events(paths, output):
+    """Concatenate event files (workers, CI shards) into `output`, line by line."""
+    count = 0
+    with open(output, "w", encoding="utf-8") as out:
+        for path in event_files(paths):
+            if os.path.abspath(path) == os.path.abspath(output):
+                continue
+            with open(path, encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        out.write(line if line.endswith("\n") else line + "\n")
+                        count += 1
+    return count
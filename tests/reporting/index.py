@@ -0,0 +1,309 @@
+"""
+index.py - Static, Lazily Loading HTML Index over Event Streams
+KosManager Automated Testing
+"""
+import json
+import os
+from collections import Counter
+
+from .events import read_events
+
+# Tests per data chunk; the page loads detail chunks only when opened
+CHUNK_SIZE = 200
+DATA_DIR = "index-data"
+
+
+def final_outcome(phases):
+    """passed / failed / error / skipped / xfailed / xpassed for one test's phases."""
+    by_when = {phase["when"]: phase for phase in phases}
+    if by_when.get("setup", {}).get("outcome") == "failed":
+        return "error"
+    call = by_when.get("call")
+    if call is None:
+        return "skipped" if by_when.get("setup", {}).get("outcome") == "skipped" else "incomplete"
+    if "xfail" in call:
+        return "xfailed" if call["outcome"] == "skipped" else "xpassed"
+    if call["outcome"] == "passed" and by_when.get("teardown", {}).get("outcome") == "failed":
+        return "error"
+    return call["outcome"]
+
+
+def _script(callback, *args):
+    payload = ",".join(json.dumps(arg, separators=(",", ":"), default=str) for arg in args)
+    payload = payload.replace("</", "<\\/")
+    return f"kosReport.{callback}({payload});\n"
+
+
+class IndexBuilder:
+    """
+    Builds <out_dir>/index.html from events fed one at a time. Finished
+    tests are written out in chunks of `chunk_size` (a rows-NNNN.js and a
+    details-NNNN.js each), so memory holds only the tests still running
+    plus one chunk, whatever the size of the suite.
+    """
+
+    def __init__(self, out_dir, chunk_size=CHUNK_SIZE):
+        self.out_dir = out_dir
+        self.data_dir = os.path.join(out_dir, DATA_DIR)
+        self.chunk_size = chunk_size
+        self.pending = {}
+        self.rows = []
+        self.details = {}
+        self.chunks = 0
+        self.totals = Counter()
+        self.duration = 0.0
+        self.runs = set()
+        self.shards = set()
+        self.workers = set()
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def add(self, event):
+        if event.get("event") != "phase":
+            return
+        nodeid = event["nodeid"]
+        self.runs.add(event.get("run_id"))
+        if event.get("shard"):
+            self.shards.add(event["shard"])
+        test = self.pending.get(nodeid)
+        if test is None or event["when"] == "setup" and test["phases"]:
+            if test is not None:  # a rerun: close the earlier attempt
+                self._complete(nodeid)
+            test = self.pending[nodeid] = {"nodeid": nodeid, "worker": event.get("worker"),
+                                           "phases": [], "artifacts": {}, "properties": {}}
+        properties = dict(event.get("properties") or {})
+        artifacts = properties.pop("artifacts", None)
+        if artifacts:
+            test["artifacts"][event["when"]] = {kind: self._link(path) for kind, path in artifacts.items()}
+        test["properties"].update(properties)
+        test["phases"].append({key: event[key] for key in
+                               ("when", "outcome", "duration", "xfail", "longrepr", "sections")
+                               if key in event})
+        if event["when"] == "teardown":
+            self._complete(nodeid)
+
+    def _link(self, path):
+        """Artifact path relative to the index, so the folder can be moved or zipped."""
+        try:
+            return os.path.relpath(path, self.out_dir).replace(os.sep, "/")
+        except ValueError:  # another drive on Windows
+            return path
+
+    def _complete(self, nodeid):
+        test = self.pending.pop(nodeid)
+        outcome = test["outcome"] = final_outcome(test["phases"])
+        duration = round(sum(phase.get("duration", 0) for phase in test["phases"]), 3)
+        self.totals[outcome] += 1
+        self.duration += duration
+        self.workers.add(test["worker"])
+        self.rows.append([nodeid, outcome, duration, test["worker"], self.chunks])
+        self.details[str(len(self.rows) - 1)] = test
+        if len(self.rows) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if not self.rows:
+            return
+        name = f"{self.chunks:04d}.js"
+        with open(os.path.join(self.data_dir, f"rows-{name}"), "w", encoding="utf-8") as handle:
+            handle.write(_script("rows", self.chunks, self.rows))
+        with open(os.path.join(self.data_dir, f"details-{name}"), "w", encoding="utf-8") as handle:
+            handle.write(_script("details", self.chunks, self.details))
+        self.chunks += 1
+        self.rows, self.details = [], {}
+
+    def finish(self):
+        """Write the remaining chunk and index.html; returns the index path."""
+        for nodeid in list(self.pending):
+            self._complete(nodeid)
+        self._flush()
+        summary = {
+            "runs": sorted(run for run in self.runs if run),
+            "shards": sorted(self.shards),
+            "workers": sorted(worker for worker in self.workers if worker),
+            "totals": dict(self.totals),
+            "tests": sum(self.totals.values()),
+            "duration": round(self.duration, 1),
+            "chunks": self.chunks,
+        }
+        path = os.path.join(self.out_dir, "index.html")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(INDEX_HTML.replace("__SUMMARY__", json.dumps(summary).replace("</", "<\\/"))
+                                   .replace("__DATA_DIR__", DATA_DIR))
+        return path
+
+
+def build_index(paths, out_dir, chunk_size=CHUNK_SIZE):
+    """Stream the events of `paths` (files or directories) into out_dir/index.html."""
+    builder = IndexBuilder(out_dir, chunk_size)
+    for event in read_events(paths):
+        builder.add(event)
+    return builder.finish(), builder
+
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>KOMA - Test Report</title>
+<style>
+body { font: 14px/1.4 system-ui, sans-serif; margin: 0 24px 24px; color: #222; }
+h1 { font-size: 20px; margin: 16px 0 4px; }
+.meta { color: #666; margin-bottom: 12px; }
+.bar label { margin-right: 12px; }
+.bar input[type=search] { width: 320px; padding: 4px; }
+table { border-collapse: collapse; width: 100%; margin-top: 12px; }
+td, th { text-align: left; padding: 4px 8px; border-bottom: 1px solid #eee; vertical-align: top; }
+tr.test { cursor: pointer; }
+tr.test:hover { background: #f6f8fa; }
+.passed { color: #1a7f37; } .failed, .error { color: #cf222e; } .skipped, .incomplete { color: #9a6700; }
+.xfailed, .xpassed { color: #8250df; }
+td.num { text-align: right; font-variant-numeric: tabular-nums; }
+pre { background: #f6f8fa; padding: 8px; overflow-x: auto; max-height: 480px; white-space: pre-wrap; }
+img.shot { max-width: 640px; border: 1px solid #ddd; display: block; margin: 6px 0; }
+#more { margin-top: 12px; }
+</style>
+</head>
+<body>
+<h1>KOMA - Automated Test Report</h1>
+<div class="meta" id="meta"></div>
+<div class="bar" id="filters"></div>
+<table>
+<thead><tr><th>Test</th><th>Hasil</th><th>Durasi (s)</th><th>Worker</th></tr></thead>
+<tbody id="rows"></tbody>
+</table>
+<button id="more" hidden>Tampilkan lebih banyak</button>
+<script>
+var SUMMARY = __SUMMARY__;
+var PAGE = 500;
+var kosReport = {
+  all: [], chunks: {}, waiting: {}, shown: PAGE, timer: null,
+  rows: function (chunk, rows) {
+    rows.forEach(function (row, index) { row.push(index); kosReport.all.push(row); });
+    // Chunks arrive one script at a time: redraw once they settle
+    clearTimeout(kosReport.timer);
+    kosReport.timer = setTimeout(render, 50);
+  },
+  details: function (chunk, details) {
+    kosReport.chunks[chunk] = details;
+    (kosReport.waiting[chunk] || []).forEach(function (callback) { callback(details); });
+    delete kosReport.waiting[chunk];
+  }
+};
+
+function load(src) {
+  var script = document.createElement("script");
+  script.src = src;
+  document.body.appendChild(script);
+}
+
+function chunkName(chunk) { return ("000" + chunk).slice(-4) + ".js"; }
+
+function withDetails(chunk, callback) {
+  if (kosReport.chunks[chunk]) return callback(kosReport.chunks[chunk]);
+  if (!kosReport.waiting[chunk]) {
+    kosReport.waiting[chunk] = [];
+    load("__DATA_DIR__/details-" + chunkName(chunk));
+  }
+  kosReport.waiting[chunk].push(callback);
+}
+
+function el(tag, attrs, text) {
+  var node = document.createElement(tag);
+  Object.keys(attrs || {}).forEach(function (key) { node.setAttribute(key, attrs[key]); });
+  if (text !== undefined) node.textContent = text;
+  return node;
+}
+
+var active = {}, query = "";
+function matches(row) {
+  return active[row[1]] !== false && (!query || row[0].toLowerCase().indexOf(query) >= 0);
+}
+
+function render() {
+  var body = document.getElementById("rows"), count = 0, total = 0;
+  body.textContent = "";
+  kosReport.all.forEach(function (row) {
+    if (!matches(row)) return;
+    total += 1;
+    if (count >= kosReport.shown) return;
+    count += 1;
+    var tr = el("tr", {"class": "test"});
+    tr.appendChild(el("td", {}, row[0]));
+    tr.appendChild(el("td", {"class": row[1]}, row[1]));
+    tr.appendChild(el("td", {"class": "num"}, row[2].toFixed(2)));
+    tr.appendChild(el("td", {}, row[3] || ""));
+    tr.onclick = function () { toggle(tr, row); };
+    body.appendChild(tr);
+  });
+  var more = document.getElementById("more");
+  more.hidden = total <= count;
+  more.textContent = "Tampilkan lebih banyak (" + (total - count) + " lagi)";
+}
+
+function toggle(tr, row) {
+  if (tr.nextSibling && tr.nextSibling.className === "detail") {
+    tr.parentNode.removeChild(tr.nextSibling);
+    return;
+  }
+  var detail = el("tr", {"class": "detail"}), cell = el("td", {colspan: 4}, "Memuat...");
+  detail.appendChild(cell);
+  tr.parentNode.insertBefore(detail, tr.nextSibling);
+  withDetails(row[4], function (details) { showDetail(cell, details[String(row[5])]); });
+}
+
+function showDetail(cell, test) {
+  cell.textContent = "";
+  test.phases.forEach(function (phase) {
+    cell.appendChild(el("div", {"class": phase.outcome},
+      phase.when + ": " + phase.outcome + " (" + (phase.duration || 0).toFixed(2) + "s)"));
+    if (phase.longrepr) cell.appendChild(el("pre", {}, phase.longrepr));
+    (phase.sections || []).forEach(function (section) {
+      var box = el("details");
+      box.appendChild(el("summary", {}, section[0]));
+      box.appendChild(el("pre", {}, section[1]));
+      cell.appendChild(box);
+    });
+  });
+  Object.keys(test.artifacts).forEach(function (when) {
+    var files = test.artifacts[when];
+    if (files.screenshot) cell.appendChild(el("img", {"class": "shot", src: files.screenshot, loading: "lazy"}));
+    Object.keys(files).forEach(function (kind) {
+      var link = el("a", {href: files[kind], target: "_blank"}, when + " " + kind);
+      cell.appendChild(link);
+      cell.appendChild(document.createTextNode(" "));
+    });
+  });
+  if (Object.keys(test.properties).length) {
+    var box = el("details");
+    box.appendChild(el("summary", {}, "Properties"));
+    box.appendChild(el("pre", {}, JSON.stringify(test.properties, null, 1)));
+    cell.appendChild(box);
+  }
+}
+
+(function init() {
+  var totals = SUMMARY.totals;
+  document.getElementById("meta").textContent =
+    SUMMARY.tests + " test, " + SUMMARY.duration + "s total" +
+    (SUMMARY.runs.length ? " | run " + SUMMARY.runs.join(", ") : "") +
+    (SUMMARY.shards.length ? " | shard " + SUMMARY.shards.join(", ") : "") +
+    (SUMMARY.workers.length ? " | worker " + SUMMARY.workers.join(", ") : "");
+  var filters = document.getElementById("filters");
+  Object.keys(totals).sort().forEach(function (outcome) {
+    var label = el("label", {"class": outcome}), box = el("input", {type: "checkbox"});
+    box.checked = true;
+    box.onchange = function () { active[outcome] = box.checked; kosReport.shown = PAGE; render(); };
+    label.appendChild(box);
+    label.appendChild(document.createTextNode(" " + outcome + " (" + totals[outcome] + ")"));
+    filters.appendChild(label);
+  });
+  var search = el("input", {type: "search", placeholder: "Cari test..."});
+  search.oninput = function () { query = search.value.toLowerCase(); kosReport.shown = PAGE; render(); };
+  filters.appendChild(search);
+  document.getElementById("more").onclick = function () { kosReport.shown += PAGE; render(); };
+  for (var chunk = 0; chunk < SUMMARY.chunks; chunk++) load("__DATA_DIR__/rows-" + chunkName(chunk));
+})();
+</script>
+</body>
+</html>
+"""
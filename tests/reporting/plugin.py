@@ -0,0 +1,72 @@
+"""
+plugin.py - Pytest Plugin for the Streaming JSONL Report
+KosManager Automated Testing
+"""
+import os
+import time
+
+from drivers.workspace import REPORTS_DIR, get_run_id
+
+from .events import EVENTS_VERSION, EventWriter, phase_event
+from .index import build_index
+
+# Event stream of this run and its CI shard ("2/4"), on the controller
+_writer = None
+_shard = None
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("reporting", "streaming test report")
+    group.addoption(
+        "--no-stream-report", action="store_true",
+        default=os.getenv("TEST_STREAM_REPORT", "1") == "0",
+        help="Do not write reports/runs/<run_id>/events.jsonl and its index.html "
+             "(default: on, TEST_STREAM_REPORT=0 disables)",
+    )
+    group.addoption(
+        "--no-report-index", action="store_true",
+        default=os.getenv("TEST_REPORT_INDEX", "1") == "0",
+        help="Write events.jsonl only; build index.html later with python -m reporting index",
+    )
+
+
+def events_name(shards, shard):
+    """events.jsonl, or events-shard<k>of<n>.jsonl so CI shards merge by copying files."""
+    return f"events-shard{shard}of{shards}.jsonl" if shards > 1 else "events.jsonl"
+
+
+def pytest_configure(config):
+    global _writer, _shard
+    config.report_index = None
+    if hasattr(config, "workerinput") or config.getoption("--no-stream-report"):
+        return
+    # The controller sees every worker's reports, so one file covers the run
+    shards, shard = config.getoption("--shards", 1), config.getoption("--shard", 1)
+    _shard = f"{shard}/{shards}" if shards > 1 else None
+    path = os.path.join(REPORTS_DIR, "runs", get_run_id(), events_name(shards, shard))
+    _writer = EventWriter(path)
+    _writer.write({"event": "session", "state": "start", "version": EVENTS_VERSION,
+                   "run_id": get_run_id(), "shard": _shard, "time": round(time.time(), 3)})
+
+
+def pytest_runtest_logreport(report):
+    if _writer is not None:
+        _writer.write(phase_event(report, get_run_id(), _shard))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    global _writer
+    writer, _writer = _writer, None
+    if writer is None:
+        return
+    writer.write({"event": "session", "state": "finish", "run_id": get_run_id(),
+                  "shard": _shard, "exitstatus": int(exitstatus), "time": round(time.time(), 3)})
+    writer.close()
+    config = session.config
+    if not config.option.collectonly and not config.getoption("--no-report-index"):
+        config.report_index, _ = build_index([writer.path], os.path.dirname(writer.path))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.report_index is not None:
+        terminalreporter.write_line(f"Report: {config.report_index}")
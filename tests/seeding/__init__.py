@@ -0,0 +1,20 @@
+"""
+__init__.py - Test Data Seeding Package
+KosManager Automated Testing
+"""
+from .factory import DataFactory, SeedPlan
+from .presets import ScalePreset, PRESETS, get_preset
+from .seeder import ApiSeeder, PostgresSeeder, SeedError, SeedResult, seed_account
+
+__all__ = [
+    'DataFactory',
+    'SeedPlan',
+    'ScalePreset',
+    'PRESETS',
+    'get_preset',
+    'ApiSeeder',
+    'PostgresSeeder',
+    'SeedError',
+    'SeedResult',
+    'seed_account',
+]
@@ -0,0 +1,237 @@
+"""
+factory.py - Deterministic Test Data Factory
+KosManager Automated Testing
+"""
+import random
+import uuid
+from datetime import date, datetime, timedelta
+
+# Same options as src/components/rooms/room-dialog.tsx
+FACILITY_OPTIONS = [
+    "AC", "Kamar Mandi Dalam", "WiFi", "Kasur", "Lemari", "Meja",
+    "Kursi", "TV", "Dapur", "Parkir Motor", "Parkir Mobil",
+]
+
+FIRST_NAMES = [
+    "Budi", "Siti", "Agus", "Dewi", "Rina", "Andi", "Putri", "Rizky", "Fajar", "Nur",
+    "Ayu", "Dimas", "Indah", "Yusuf", "Wahyu", "Sari", "Bayu", "Lestari", "Hendra", "Fitri",
+]
+LAST_NAMES = [
+    "Santoso", "Wijaya", "Saputra", "Lestari", "Pratama", "Hidayat", "Nugroho", "Kusuma",
+    "Setiawan", "Rahmawati", "Gunawan", "Susanto", "Permata", "Firmansyah", "Utami",
+]
+STREETS = ["Melati", "Mawar", "Kenanga", "Dago", "Sudirman", "Cihampelas", "Kaliurang",
+           "Margonda", "Diponegoro", "Gejayan"]
+CITIES = ["Bandung", "Yogyakarta", "Depok", "Malang", "Semarang", "Jakarta Selatan"]
+
+# Monthly prices between Rp 500.000 and Rp 2.500.000
+PRICE_STEPS = range(500_000, 2_500_001, 50_000)
+
+
+class SeedPlan:
+    """
+    Everything one owner account should contain, before it is seeded.
+
+    Records are dicts with snake_case keys matching the columns in
+    src/lib/db/schema.ts. Each carries a pre-generated `id`; foreign keys
+    point at those ids, so a seeder that gets new ids from the server only
+    has to remap them.
+    """
+
+    def __init__(self, preset, owner, properties, rooms, tenants, invoices):
+        self.preset = preset
+        self.owner = owner
+        self.properties = properties
+        self.rooms = rooms
+        self.tenants = tenants
+        self.invoices = invoices
+
+    def counts(self):
+        return {
+            "properties": len(self.properties),
+            "rooms": len(self.rooms),
+            "tenants": len(self.tenants),
+            "invoices": len(self.invoices),
+        }
+
+    def rooms_of(self, property_id):
+        return [room for room in self.rooms if room["property_id"] == property_id]
+
+    def invoices_of(self, tenant_id):
+        return [invoice for invoice in self.invoices if invoice["tenant_id"] == tenant_id]
+
+    def tenant_upload_rows(self):
+        """Tenants in the TenantUploadData shape used by /api/tenants/bulk."""
+        room_numbers = {room["id"]: room["room_number"] for room in self.rooms}
+        return [{
+            "name": tenant["name"],
+            "phoneNumber": tenant["phone_number"],
+            "roomNumber": room_numbers[tenant["room_id"]],
+            "startDate": tenant["start_date"].isoformat(),
+            "dueDate": str(tenant["due_date"]),
+        } for tenant in self.tenants]
+
+
+class DataFactory:
+    """
+    Builds users, properties, rooms, tenants and invoices.
+
+    The output depends only on `seed` and `anchor` (the current billing
+    month, default: the first day of this month), so the same preset
+    always produces the same account.
+    """
+
+    def __init__(self, seed=0, anchor=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.anchor = (anchor or date.today()).replace(day=1)
+
+    # ==================== SINGLE RECORDS ====================
+
+    def uuid(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def person_name(self):
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def phone_number(self):
+        """Indonesian mobile number accepted by tenantSchema."""
+        return "08" + str(self.rng.randint(1, 9)) + "".join(
+            str(self.rng.randint(0, 9)) for _ in range(9))
+
+    def user(self, email=None, plan="free"):
+        name = self.person_name()
+        user_id = self.uuid()
+        return {
+            "id": user_id,
+            "email": email or f"owner_{user_id[:12]}@kosmanager.com",
+            "full_name": name,
+            "subscription_plan": plan,
+        }
+
+    def property(self, owner_id, index):
+        street = self.rng.choice(STREETS)
+        return {
+            "id": self.uuid(),
+            "owner_id": owner_id,
+            "name": f"Kos {street} {property_code(index)}",
+            "address": f"Jl. {street} No. {self.rng.randint(1, 250)}, {self.rng.choice(CITIES)}",
+            "total_rooms": 0,
+        }
+
+    def room(self, property_id, room_number, status="available"):
+        facilities = self.rng.sample(FACILITY_OPTIONS, self.rng.randint(2, 6))
+        return {
+            "id": self.uuid(),
+            "property_id": property_id,
+            "room_number": room_number,
+            "price": self.rng.choice(PRICE_STEPS),
+            "status": status,
+            "facilities": [f for f in FACILITY_OPTIONS if f in facilities],
+        }
+
+    def tenant(self, room_id, start_month):
+        day = self.rng.randint(1, 28)
+        return {
+            "id": self.uuid(),
+            "room_id": room_id,
+            "name": self.person_name(),
+            "phone_number": self.phone_number(),
+            "id_card_photo": None,
+            "start_date": start_month.replace(day=day),
+            # Due on the move-in day, so the first invoice is for the start month
+            "due_date": day,
+            "is_active": True,
+        }
+
+    def invoice(self, tenant, amount, period, paid):
+        paid_at = None
+        if paid:
+            paid_day = period + timedelta(days=tenant["due_date"] - 1 + self.rng.randint(-3, 3))
+            paid_at = datetime.combine(max(paid_day, period), datetime.min.time()).replace(hour=10)
+        return {
+            "id": self.uuid(),
+            "tenant_id": tenant["id"],
+            "amount": amount,
+            "status": "paid" if paid else "unpaid",
+            "period": period,
+            "paid_at": paid_at,
+        }
+
+    def tenant_upload_rows(self, rooms, start_month=None):
+        """One new tenant per room, in the TenantUploadData shape."""
+        rows = []
+        for room in rooms:
+            tenant = self.tenant(room["id"], start_month or self.anchor)
+            rows.append({
+                "name": tenant["name"],
+                "phoneNumber": tenant["phone_number"],
+                "roomNumber": room["room_number"],
+                "startDate": tenant["start_date"].isoformat(),
+                "dueDate": str(tenant["due_date"]),
+            })
+        return rows
+
+    # ==================== WHOLE ACCOUNTS ====================
+
+    def build(self, preset, email=None):
+        """Build the SeedPlan for one owner sized by `preset`."""
+        owner = self.user(email=email, plan=preset.plan)
+        periods = [add_months(self.anchor, offset - preset.months + 1)
+                   for offset in range(preset.months)]
+        paid_months = int(preset.months * preset.paid_ratio)
+        occupied_per_property = int(preset.rooms_per_property * preset.occupancy)
+        maintenance_per_property = int(preset.rooms_per_property * preset.maintenance)
+
+        properties, rooms, tenants, invoices = [], [], [], []
+        for index in range(preset.properties):
+            prop = self.property(owner["id"], index)
+            properties.append(prop)
+
+            numbers = [room_number(index, n) for n in range(preset.rooms_per_property)]
+            order = list(range(len(numbers)))
+            self.rng.shuffle(order)
+            statuses = {}
+            for position, n in enumerate(order):
+                if position < occupied_per_property:
+                    statuses[n] = "occupied"
+                elif position < occupied_per_property + maintenance_per_property:
+                    statuses[n] = "maintenance"
+                else:
+                    statuses[n] = "available"
+
+            for n, number in enumerate(numbers):
+                room = self.room(prop["id"], number, statuses[n])
+                rooms.append(room)
+                if room["status"] != "occupied":
+                    continue
+                tenant = self.tenant(room["id"], periods[0])
+                tenants.append(tenant)
+                for month, period in enumerate(periods):
+                    invoices.append(self.invoice(tenant, room["price"], period,
+                                                 paid=month < paid_months))
+            prop["total_rooms"] = preset.rooms_per_property
+
+        return SeedPlan(preset, owner, properties, rooms, tenants, invoices)
+
+
+def property_code(index):
+    """A, B, ..., Z, AA, AB, ... (prefix of the property's room numbers)."""
+    code = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        code = chr(ord("A") + remainder) + code
+    return code
+
+
+def room_number(property_index, n):
+    """Room numbers unique per owner: A101..A110, A201, ..., B101, ..."""
+    floor, position = divmod(n, 10)
+    return f"{property_code(property_index)}{floor + 1}{position + 1:02d}"
+
+
+def add_months(day, months):
+    """Shift a first-of-month date by `months` (may be negative)."""
+    month_index = day.year * 12 + day.month - 1 + months
+    return day.replace(year=month_index // 12, month=month_index % 12 + 1)
@@ -0,0 +1,79 @@
+"""
+presets.py - Named Account Sizes for Seeding
+KosManager Automated Testing
+"""
+import os
+
+
+class ScalePreset:
+    """
+    The shape of one seeded owner account.
+
+    `occupancy` is the share of rooms that get an active tenant,
+    `maintenance` the share kept under maintenance; the rest stay available.
+    Every tenant gets `months` monthly invoices, the oldest `paid_ratio`
+    of them marked paid.
+    """
+
+    def __init__(self, name, properties, rooms_per_property, occupancy=0.8,
+                 maintenance=0.05, months=3, paid_ratio=0.7, plan="free"):
+        self.name = name
+        self.properties = properties
+        self.rooms_per_property = rooms_per_property
+        self.occupancy = occupancy
+        self.maintenance = maintenance
+        self.months = months
+        self.paid_ratio = paid_ratio
+        self.plan = plan
+
+    @property
+    def total_rooms(self):
+        return self.properties * self.rooms_per_property
+
+    def expected_counts(self):
+        """Rough sizes of the account, as the factory will build it."""
+        occupied = int(self.rooms_per_property * self.occupancy) * self.properties
+        return {
+            "properties": self.properties,
+            "rooms": self.total_rooms,
+            "tenants": occupied,
+            "invoices": occupied * self.months,
+        }
+
+    def scaled(self, name, properties=None, rooms_per_property=None, months=None):
+        """Return a copy with some sizes replaced (used by benchmarks)."""
+        return ScalePreset(
+            name,
+            properties or self.properties,
+            rooms_per_property or self.rooms_per_property,
+            occupancy=self.occupancy,
+            maintenance=self.maintenance,
+            months=months or self.months,
+            paid_ratio=self.paid_ratio,
+            plan=self.plan,
+        )
+
+
+PRESETS = {
+    # Within the free plan: one property, a handful of tenants
+    "small": ScalePreset("small", properties=1, rooms_per_property=8, occupancy=0.75, months=3),
+    # Free plan at its limits: 2 properties
+    "free_owner_full": ScalePreset("free_owner_full", properties=2, rooms_per_property=10,
+                                   occupancy=0.9, months=6),
+    # Typical large customer: 20 properties x 25 rooms
+    "pro_owner_500_rooms": ScalePreset("pro_owner_500_rooms", properties=20, rooms_per_property=25,
+                                       occupancy=0.85, months=6, plan="pro"),
+    # One year of billing: 10 x 84 rooms, fully let, 12 invoices each (10,080)
+    "10k_invoices": ScalePreset("10k_invoices", properties=10, rooms_per_property=84,
+                                occupancy=1.0, maintenance=0.0, months=12, plan="pro"),
+}
+
+
+def get_preset(name=None):
+    """Return the preset named by `name` or TEST_SEED_PRESET (default: small)."""
+    name = name or os.getenv("TEST_SEED_PRESET", "small")
+    try:
+        return PRESETS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown TEST_SEED_PRESET '{name}', expected one of: {', '.join(PRESETS)}")
@@ -0,0 +1,239 @@
+"""
+seeder.py - Load a SeedPlan through the API or straight into Postgres
+KosManager Automated Testing
+"""
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class SeedError(RuntimeError):
+    """Raised when an account cannot be seeded as planned."""
+
+
+class SeedResult:
+    """Server-side ids of the seeded records and how long each stage took."""
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.owner_id = None
+        self.property_ids = {}
+        self.room_ids = {}
+        self.tenant_ids = {}
+        self.timings = {}
+
+    def timed(self, stage, started):
+        self.timings[stage] = round(time.perf_counter() - started, 3)
+
+    def summary(self):
+        return {"preset": self.plan.preset.name, "counts": self.plan.counts(),
+                "timings_s": dict(self.timings)}
+
+
+class ApiSeeder:
+    """
+    Seeds through the /api routes with a logged-in KosManagerClient.
+
+    Rooms, tenants and invoices are sent from `workers` threads over the
+    client's keep-alive pool. When the account has a single property the
+    tenants go through /api/tenants/bulk in chunks of `batch_size` rows
+    (the route then also creates each tenant's first invoice).
+    The free plan allows 2 properties, so "pro" presets need PostgresSeeder.
+    """
+
+    def __init__(self, client, workers=8, batch_size=200):
+        self.client = client
+        self.workers = workers
+        self.batch_size = batch_size
+
+    def seed(self, plan):
+        result = SeedResult(plan)
+        rooms_by_id = {room["id"]: room for room in plan.rooms}
+
+        started = time.perf_counter()
+        for prop in plan.properties:
+            created = self.client.create_property(prop["name"], prop["address"])
+            result.property_ids[prop["id"]] = created["id"]
+        result.timed("properties", started)
+
+        started = time.perf_counter()
+
+        def create_room(room):
+            # Occupied rooms are created available and filled by the check-in
+            status = "available" if room["status"] == "occupied" else room["status"]
+            created = self.client.create_room(result.property_ids[room["property_id"]],
+                                              room["room_number"], room["price"],
+                                              status=status, facilities=room["facilities"])
+            return room["id"], created["id"]
+
+        result.room_ids.update(self._parallel(create_room, plan.rooms))
+        result.timed("rooms", started)
+
+        started = time.perf_counter()
+        use_bulk = len(plan.properties) == 1
+        if use_bulk:
+            self._bulk_tenants(plan, result, rooms_by_id)
+        else:
+            def create_tenant(tenant):
+                created = self.client.create_tenant(
+                    result.room_ids[tenant["room_id"]], tenant["name"], tenant["phone_number"],
+                    tenant["start_date"].isoformat(), tenant["due_date"])
+                return tenant["id"], created["id"]
+
+            result.tenant_ids.update(self._parallel(create_tenant, plan.tenants))
+        result.timed("tenants", started)
+
+        started = time.perf_counter()
+        first_periods = {}
+        if use_bulk:
+            for invoice in plan.invoices:
+                period = first_periods.get(invoice["tenant_id"])
+                if period is None or invoice["period"] < period:
+                    first_periods[invoice["tenant_id"]] = invoice["period"]
+        pending = [invoice for invoice in plan.invoices
+                   if first_periods.get(invoice["tenant_id"]) != invoice["period"]]
+
+        def create_invoice(invoice):
+            created = self.client.create_invoice(result.tenant_ids[invoice["tenant_id"]],
+                                                 invoice["amount"], invoice["period"].isoformat())
+            if invoice["status"] == "paid":
+                self.client.update_invoice_status(created["id"], "paid")
+            return invoice["id"], created["id"]
+
+        list(self._parallel(create_invoice, pending))
+        if use_bulk:
+            self._mark_bulk_invoices_paid(plan, rooms_by_id, first_periods)
+        result.timed("invoices", started)
+        return result
+
+    def _bulk_tenants(self, plan, result, rooms_by_id):
+        rows = plan.tenant_upload_rows()
+        for offset in range(0, len(rows), self.batch_size):
+            response = self.client.bulk_create_tenants(rows[offset:offset + self.batch_size])
+            if response["failed"]:
+                raise SeedError(f"Bulk upload rejected {response['failed']} row(s): "
+                                f"{response['errors'][:3]}")
+
+        by_room_number = {tenant["roomNumber"]: tenant["id"]
+                          for tenant in self.client.list_tenants() if tenant["isActive"]}
+        for tenant in plan.tenants:
+            room_number = rooms_by_id[tenant["room_id"]]["room_number"]
+            result.tenant_ids[tenant["id"]] = by_room_number[room_number]
+
+    def _mark_bulk_invoices_paid(self, plan, rooms_by_id, first_periods):
+        room_numbers = {tenant["id"]: rooms_by_id[tenant["room_id"]]["room_number"]
+                        for tenant in plan.tenants}
+        to_pay = {(room_numbers[invoice["tenant_id"]], invoice["period"].isoformat())
+                  for invoice in plan.invoices
+                  if invoice["status"] == "paid"
+                  and first_periods.get(invoice["tenant_id"]) == invoice["period"]}
+        if not to_pay:
+            return
+        invoice_ids = [invoice["id"] for invoice in self.client.list_invoices()
+                       if (invoice["roomNumber"], invoice["period"]) in to_pay
+                       and invoice["status"] == "unpaid"]
+        list(self._parallel(lambda invoice_id: self.client.update_invoice_status(invoice_id, "paid"),
+                            invoice_ids))
+
+    def _parallel(self, function, items):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(function, items))
+
+
+class PostgresSeeder:
+    """
+    Seeds by inserting rows with psycopg (v3), `batch_size` rows per
+    executemany. Orders of magnitude faster than the API for large presets.
+
+    The owner must already exist (register it through the API so the
+    password hash is the app's own); its plan is set to the preset's plan.
+    The connection string comes from TEST_DATABASE_URL or DATABASE_URL.
+    """
+
+    def __init__(self, dsn=None, batch_size=1000):
+        self.dsn = dsn or os.getenv("TEST_DATABASE_URL") or os.getenv("DATABASE_URL")
+        self.batch_size = batch_size
+        if not self.dsn:
+            raise SeedError("Set TEST_DATABASE_URL (or DATABASE_URL) to seed through Postgres")
+
+    def seed(self, plan, owner_email):
+        try:
+            import psycopg
+        except ImportError:
+            raise SeedError("Postgres seeding needs psycopg: pip install 'psycopg[binary]'")
+
+        result = SeedResult(plan)
+        with psycopg.connect(self.dsn) as connection, connection.cursor() as cursor:
+            cursor.execute("SELECT id FROM users WHERE email = %s", (owner_email,))
+            row = cursor.fetchone()
+            if row is None:
+                raise SeedError(f"No user with email {owner_email}; register it first")
+            result.owner_id = str(row[0])
+            cursor.execute("UPDATE users SET subscription_plan = %s WHERE id = %s",
+                           (plan.owner["subscription_plan"], result.owner_id))
+
+            started = time.perf_counter()
+            self._insert(cursor, "properties", ["id", "owner_id", "name", "address", "total_rooms"],
+                         [dict(prop, owner_id=result.owner_id) for prop in plan.properties])
+            result.timed("properties", started)
+
+            started = time.perf_counter()
+            self._insert(cursor, "rooms",
+                         ["id", "property_id", "room_number", "price", "status", "facilities"],
+                         plan.rooms)
+            result.timed("rooms", started)
+
+            started = time.perf_counter()
+            self._insert(cursor, "tenants",
+                         ["id", "room_id", "name", "phone_number", "id_card_photo",
+                          "start_date", "due_date", "is_active"],
+                         plan.tenants)
+            result.timed("tenants", started)
+
+            started = time.perf_counter()
+            self._insert(cursor, "invoices",
+                         ["id", "tenant_id", "amount", "status", "period", "paid_at"],
+                         plan.invoices)
+            result.timed("invoices", started)
+
+        # Ids were generated client-side, so they are the server ids
+        result.property_ids = {prop["id"]: prop["id"] for prop in plan.properties}
+        result.room_ids = {room["id"]: room["id"] for room in plan.rooms}
+        result.tenant_ids = {tenant["id"]: tenant["id"] for tenant in plan.tenants}
+        return result
+
+    def _insert(self, cursor, table, columns, records):
+        statement = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                     f"VALUES ({', '.join(['%s'] * len(columns))})")
+        for offset in range(0, len(records), self.batch_size):
+            batch = records[offset:offset + self.batch_size]
+            cursor.executemany(statement, [[record[column] for column in columns]
+                                           for record in batch])
+        logger.info("Inserted %d row(s) into %s", len(records), table)
+
+
+def seed_account(client, plan, backend=None):
+    """
+    Seed `plan` into the account of plan.owner, which `client` is logged in as.
+
+    `backend` is "api" or "postgres" (default: TEST_SEED_BACKEND, else
+    "postgres" for pro presets and "api" otherwise).
+    """
+    preset = plan.preset
+    backend = backend or os.getenv("TEST_SEED_BACKEND") or (
+        "postgres" if preset.plan == "pro" else "api")
+
+    if backend == "postgres":
+        result = PostgresSeeder().seed(plan, plan.owner["email"])
+    elif backend == "api":
+        if preset.plan == "pro" and preset.properties > 2:
+            raise SeedError(f"Preset '{preset.name}' exceeds the free plan; "
+                            "use TEST_SEED_BACKEND=postgres")
+        result = ApiSeeder(client).seed(plan)
+    else:
+        raise SeedError(f"Unknown TEST_SEED_BACKEND '{backend}', expected api or postgres")
+    logger.info("Seeded %s: %s", plan.owner["email"], result.summary())
+    return result
@@ -0,0 +1,20 @@
+"""
+settings.py - Shared Test Settings
+KosManager Automated Testing
+
+Plain constants only (no selenium, no pytest), so the command line tools
+(python -m load, python -m standin) can import them without the fixtures.
+"""
+import os
+
+# Base URL for testing
+BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:3000")
+
+# Test user credentials (for testing purposes)
+TEST_USER_EMAIL = "testuser@kosmanager.com"
+TEST_USER_PASSWORD = "TestPassword123"
+TEST_USER_NAME = "Test Automation"
+
+# Existing account used by the dashboard and property suites
+LOGIN_USER_EMAIL = os.getenv("TEST_LOGIN_EMAIL", "test@example.com")
+LOGIN_USER_PASSWORD = os.getenv("TEST_LOGIN_PASSWORD", "password123")
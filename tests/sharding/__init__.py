@@ -0,0 +1,13 @@
+"""
+__init__.py - Duration-Aware Sharding Package
+KosManager Automated Testing
+"""
+from .history import DurationHistory, fixture_needs
+from .planner import ShardPlan, bundle_key
+
+__all__ = [
+    'DurationHistory',
+    'fixture_needs',
+    'ShardPlan',
+    'bundle_key',
+]
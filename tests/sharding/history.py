@@ -0,0 +1,88 @@
+"""
+history.py - Recorded Test Durations & Fixture Needs
+KosManager Automated Testing
+"""
+import json
+import os
+import statistics
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DURATIONS_FILE = os.path.join(TESTS_DIR, ".test_durations.json")
+HISTORY_VERSION = 1
+
+# Weight of the newest run; older runs fade out instead of one slow CI
+# machine overwriting the estimate
+SMOOTHING = 0.3
+# Estimate for a test never seen before when the history is empty
+DEFAULT_DURATION = 5.0
+
+# Fixture categories a test needs, by the conftest fixtures that provide them
+NEEDS = {
+    "browser": {"browser", "driver"},
+    "logged_in": {"logged_in", "auth_session", "api_client"},
+    "fresh_session": {"fresh_owner", "seeded_owner"},
+    "mutating": {"api_client", "fresh_owner", "seeded_owner", "unique_email"},
+}
+
+
+def fixture_needs(fixturenames):
+    """Sorted NEEDS categories covered by a test's fixture names."""
+    names = set(fixturenames)
+    return sorted(need for need, fixtures in NEEDS.items() if names & fixtures)
+
+
+class DurationHistory:
+    """
+    Per-test duration (setup + call + teardown, seconds) and fixture
+    needs from earlier runs, kept in one JSON file that CI can cache.
+    """
+
+    def __init__(self, path=DEFAULT_DURATIONS_FILE, tests=None):
+        self.path = path
+        self.tests = tests or {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_DURATIONS_FILE):
+        if not os.path.exists(path):
+            return cls(path)
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != HISTORY_VERSION:
+            return cls(path)
+        return cls(path, data.get("tests", {}))
+
+    def update(self, nodeid, duration, needs=None):
+        """Fold one measured run into the estimate for `nodeid`."""
+        entry = self.tests.get(nodeid)
+        if entry is None:
+            entry = self.tests[nodeid] = {"duration": round(duration, 3), "runs": 0}
+        else:
+            smoothed = SMOOTHING * duration + (1 - SMOOTHING) * entry["duration"]
+            entry["duration"] = round(smoothed, 3)
+        entry["runs"] += 1
+        if needs is not None:
+            entry["needs"] = list(needs)
+
+    def default_duration(self):
+        """The median known duration, used for tests without history."""
+        known = [entry["duration"] for entry in self.tests.values()]
+        return statistics.median(known) if known else DEFAULT_DURATION
+
+    def duration(self, nodeid, default=None):
+        entry = self.tests.get(nodeid)
+        if entry is not None:
+            return entry["duration"]
+        return self.default_duration() if default is None else default
+
+    def needs(self, nodeid):
+        return (self.tests.get(nodeid) or {}).get("needs", [])
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump({"version": HISTORY_VERSION, "tests": self.tests}, handle,
+                      indent=1, sort_keys=True)
+            handle.write("\n")
+        return self.path
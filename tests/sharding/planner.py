@@ -0,0 +1,118 @@
+"""
+planner.py - Longest-Job-First Shard Planning
+KosManager Automated Testing
+"""
+
+
+def bundle_key(nodeid):
+    """
+    Tests that must stay together, in order: the class of a method, or the
+    module of a plain function (tests in one class share browser state).
+    """
+    module, _, rest = nodeid.split("[", 1)[0].partition("::")
+    if "::" in rest:
+        return f"{module}::{rest.split('::', 1)[0]}"
+    return module
+
+
+class Bundle:
+    """Consecutive tests of one class or module, scheduled as one job."""
+
+    def __init__(self, key, position):
+        self.key = key
+        self.position = position
+        self.nodeids = []
+        self.duration = 0.0
+        self.needs = set()
+
+    def add(self, nodeid, duration, needs):
+        self.nodeids.append(nodeid)
+        self.duration += duration
+        self.needs.update(needs)
+
+
+class Shard:
+    def __init__(self, index):
+        self.index = index
+        self.bundles = []
+        self.load = 0.0
+        self.needs = set()
+
+    def add(self, bundle):
+        self.bundles.append(bundle)
+        self.load += bundle.duration
+        self.needs.update(bundle.needs)
+
+    def nodeids(self):
+        """This shard's tests in collection order (test_01_ before test_02_ ...)."""
+        bundles = sorted(self.bundles, key=lambda bundle: bundle.position)
+        return [nodeid for bundle in bundles for nodeid in bundle.nodeids]
+
+    def summary(self):
+        return {"shard": self.index + 1, "tests": len(self.nodeids()),
+                "bundles": len(self.bundles), "predicted_s": round(self.load, 1),
+                "needs": sorted(self.needs)}
+
+
+class ShardPlan:
+    """
+    `count` shards built from bundles by longest-processing-time-first:
+    the longest remaining bundle goes to the least loaded shard, which
+    keeps the longest shard within 4/3 of the optimum. Among shards whose
+    load is within `affinity` of the least loaded one, a shard already
+    holding bundles with the same fixture needs is preferred, so
+    logged-in and data-mutating tests cluster on the same nodes.
+    """
+
+    def __init__(self, tests, count, history, affinity=0.05):
+        """`tests`: [(nodeid, needs)] in collection order."""
+        if count < 1:
+            raise ValueError(f"Need at least one shard, got {count}")
+        self.count = count
+        self.shards = [Shard(index) for index in range(count)]
+        self.bundles = self._bundle(tests, history)
+        self.total = sum(bundle.duration for bundle in self.bundles)
+        slack = affinity * self.total / count
+
+        for bundle in sorted(self.bundles, key=lambda bundle: (-bundle.duration, bundle.position)):
+            least = min(shard.load for shard in self.shards)
+            candidates = [shard for shard in self.shards if shard.load <= least + slack]
+            shard = min(candidates, key=lambda shard: (not (bundle.needs & shard.needs),
+                                                       shard.load, shard.index))
+            shard.add(bundle)
+
+    @staticmethod
+    def _bundle(tests, history):
+        bundles = {}
+        for nodeid, needs in tests:
+            key = bundle_key(nodeid)
+            if key not in bundles:
+                bundles[key] = Bundle(key, len(bundles))
+            bundles[key].add(nodeid, history.duration(nodeid), needs)
+        return list(bundles.values())
+
+    def shard_of(self, nodeid):
+        key = bundle_key(nodeid)
+        for shard in self.shards:
+            if any(bundle.key == key for bundle in shard.bundles):
+                return shard.index
+        return None
+
+    @property
+    def wall_time(self):
+        """Predicted wall time: the longest shard."""
+        return max(shard.load for shard in self.shards)
+
+    @property
+    def ideal(self):
+        return self.total / self.count
+
+    def summary_lines(self):
+        lines = [f"Shard plan: {len(self.bundles)} bundle(s) on {self.count} shard(s), "
+                 f"predicted {self.wall_time:.1f}s wall (total {self.total:.1f}s, "
+                 f"ideal {self.ideal:.1f}s)"]
+        for shard in self.shards:
+            summary = shard.summary()
+            lines.append(f"  shard {summary['shard']}: {summary['tests']} test(s), "
+                         f"{summary['predicted_s']}s, needs: {', '.join(summary['needs']) or '-'}")
+        return lines
@@ -0,0 +1,152 @@
+"""
+plugin.py - Pytest Plugin for Duration-Aware Sharding
+KosManager Automated Testing
+"""
+import os
+
+import pytest
+
+from .history import DEFAULT_DURATIONS_FILE, DurationHistory, fixture_needs
+from .planner import ShardPlan, bundle_key
+
+# Measured setup + call + teardown time per test id, on the controller
+_durations = {}
+_needs = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sharding", "duration-aware sharding")
+    group.addoption(
+        "--shards", type=int, default=int(os.getenv("TEST_SHARDS", "1")),
+        help="Split the suite into this many balanced shards, one per CI node "
+             "(default: TEST_SHARDS, or 1)",
+    )
+    group.addoption(
+        "--shard", type=int, default=int(os.getenv("TEST_SHARD", "1")),
+        help="Which shard (1..--shards) this node runs (default: TEST_SHARD, or 1)",
+    )
+    group.addoption(
+        "--durations-file", default=os.getenv("TEST_DURATIONS_FILE", DEFAULT_DURATIONS_FILE),
+        help="Recorded test durations used to balance shards",
+    )
+    group.addoption(
+        "--store-durations", action="store_true", default=False,
+        help="Update --durations-file with the durations measured in this run",
+    )
+    group.addoption(
+        "--duration-dist", action="store_true", default=False,
+        help="With -n, hand each xdist worker the longest remaining class/module first",
+    )
+
+
+def pytest_configure(config):
+    shards, shard = config.getoption("--shards"), config.getoption("--shard")
+    if not 1 <= shard <= shards:
+        raise pytest.UsageError(f"--shard must be between 1 and --shards ({shards}), got {shard}")
+    config.duration_history = DurationHistory.load(config.getoption("--durations-file"))
+    config.shard_plan = None
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep only this node's shard (after -k/-m deselection, in collection order)."""
+    shards = config.getoption("--shards")
+    if shards <= 1 or not items:
+        return
+    plan = ShardPlan([(item.nodeid, fixture_needs(item.fixturenames)) for item in items],
+                     shards, config.duration_history)
+    config.shard_plan = plan
+    keep = set(plan.shards[config.getoption("--shard") - 1].nodeids())
+    selected = [item for item in items if item.nodeid in keep]
+    deselected = [item for item in items if item.nodeid not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Send the test's fixture needs with its setup report (reaches the xdist controller)."""
+    report = yield
+    if report.when == "setup":
+        report.user_properties.append(("fixture_needs", fixture_needs(item.fixturenames)))
+    return report
+
+
+def pytest_runtest_logreport(report):
+    _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + report.duration
+    for name, value in report.user_properties:
+        if name == "fixture_needs":
+            _needs[report.nodeid] = value
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput") or not config.getoption("--store-durations"):
+        return
+    history = config.duration_history
+    for nodeid, duration in _durations.items():
+        history.update(nodeid, duration, _needs.get(nodeid))
+    history.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    plan = config.shard_plan
+    if plan is not None:
+        shard = plan.shards[config.getoption("--shard") - 1]
+        terminalreporter.write_line(
+            f"Shard {shard.index + 1}/{plan.count}: {len(shard.nodeids())} test(s), "
+            f"predicted {shard.load:.1f}s (total {plan.total:.1f}s, ideal {plan.ideal:.1f}s)")
+        if config.option.collectonly:
+            for line in plan.summary_lines():
+                terminalreporter.write_line(line)
+    if config.getoption("--store-durations") and _durations:
+        terminalreporter.write_line(
+            f"Stored {len(_durations)} test duration(s) in {config.getoption('--durations-file')}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduling(config, log):
+    if not config.getoption("--duration-dist"):
+        return None
+    return make_duration_scheduling(config, log)
+
+
+def make_duration_scheduling(config, log):
+    from xdist.scheduler import LoadScopeScheduling
+
+    class DurationScheduling(LoadScopeScheduling):
+        """
+        xdist LoadScope (a class or module never splits across workers),
+        but an idle worker gets the longest remaining bundle by recorded
+        duration instead of the one with the most tests. Among bundles
+        close to the longest, one with the fixture needs the worker last
+        ran is preferred.
+        """
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            self.history = config.duration_history
+            self.last_needs = {}
+
+        def _split_scope(self, nodeid):
+            return bundle_key(nodeid)
+
+        def _unit_duration(self, scope):
+            return sum(self.history.duration(nodeid) for nodeid in self.workqueue[scope])
+
+        def _unit_needs(self, scope):
+            return {need for nodeid in self.workqueue[scope] for need in self.history.needs(nodeid)}
+
+        def _assign_work_unit(self, node):
+            durations = {scope: self._unit_duration(scope) for scope in self.workqueue}
+            longest = max(durations.values())
+            close = [scope for scope, duration in durations.items() if duration >= 0.8 * longest]
+            previous = self.last_needs.get(node, set())
+            scope = max(close, key=lambda scope: (bool(self._unit_needs(scope) & previous),
+                                                  durations[scope]))
+            self.last_needs[node] = self._unit_needs(scope)
+            self.workqueue.move_to_end(scope, last=False)
+            super()._assign_work_unit(node)
+
+    return DurationScheduling(config, log)
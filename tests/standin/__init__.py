@@ -0,0 +1,15 @@
+"""
+__init__.py - Stand-in KosManager Backend Package
+KosManager Automated Testing
+"""
+from .routes import HttpError
+from .server import Faults, StandinServer
+from .store import DEFAULT_FIXTURES, Store
+
+__all__ = [
+    'HttpError',
+    'Faults',
+    'StandinServer',
+    'DEFAULT_FIXTURES',
+    'Store',
+]
@@ -0,0 +1,75 @@
+"""
+__main__.py - Run the Stand-in Backend
+KosManager Automated Testing
+
+Usage (from the tests/ directory):
+    python -m standin --port 3100
+    python -m standin --port 3100 --preset pro_owner_500_rooms --latency-ms 80 --error-rate 0.02
+    TEST_BASE_URL=http://127.0.0.1:3100 pytest unit/ -k api
+"""
+import argparse
+import logging
+import sys
+
+from settings import LOGIN_USER_PASSWORD
+from seeding import DataFactory, get_preset
+
+from .server import Faults, StandinServer
+from .store import DEFAULT_FIXTURES, Store
+
+
+def build_store(fixtures=DEFAULT_FIXTURES, preset=None, email=None,
+                password=LOGIN_USER_PASSWORD, seed=0):
+    """
+    Load the fixtures file, then optionally an owner seeded from `preset`
+    (email default: <preset>@kosmanager.com).
+    """
+    store = Store.from_file(fixtures) if fixtures else Store()
+    if preset:
+        email = email or f"{preset}@kosmanager.com"
+        if store.user_by_email(email):
+            raise ValueError(f"{email} is already in {fixtures}; pass another --email")
+        store.seed(DataFactory(seed=seed).build(get_preset(preset), email=email), password)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the KosManager API from memory.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3100)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES,
+                        help="declarative fixtures JSON ('' for an empty store)")
+    parser.add_argument("--preset", default=None,
+                        help="also seed an owner from this preset (small, 10k_invoices, ...)")
+    parser.add_argument("--email", default=None,
+                        help="owner email for --preset (default: <preset>@kosmanager.com)")
+    parser.add_argument("--password", default=LOGIN_USER_PASSWORD)
+    parser.add_argument("--seed", type=int, default=0)
+    defaults = Faults.from_env()
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate,
+                        help="share of requests under the fault paths answered with a 500")
+    parser.add_argument("--fault-paths", default=",".join(defaults.paths),
+                        help="comma-separated path prefixes that get latency and errors")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format="%(asctime)s [%(levelname)s] %(message)s")
+
+    store = build_store(args.fixtures, args.preset, args.email, args.password, args.seed)
+    faults = Faults(args.latency_ms, args.jitter_ms, args.error_rate,
+                    paths=args.fault_paths.split(","))
+    server = StandinServer(store, host=args.host, port=args.port, faults=faults)
+    print(f"Stand-in backend on {server.url} with {store.counts()}")
+    for user in store.rows("users"):
+        print(f"  login: {user['email']}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,448 @@
+"""
+routes.py - /api Route Handlers of the Stand-in Backend
+KosManager Automated Testing
+
+Each handler mirrors one route in src/app/api: same validation messages
+(src/lib/validations.ts), status codes and response shapes, including the
+app's quirks (the session has no subscriptionPlan, so every owner is on
+the free plan; /api/tenants/bulk only finds rooms for single-property
+owners). Handlers get (store, user_id, body, **path_params) and return
+(status, body), or raise HttpError.
+"""
+import re
+from datetime import date
+
+from .store import hash_password, now
+
+UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I)
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+PHONE_RE = re.compile(r"^(\+62|62|0)8[1-9][0-9]{6,10}$")
+ROOM_STATUSES = ("available", "occupied", "maintenance")
+INVOICE_STATUSES = ("unpaid", "paid")
+# src/lib/subscription.ts PLAN_LIMITS
+MAX_PROPERTIES = {"free": 2, "pro": None}
+
+
+class HttpError(Exception):
+    """An error response: {"error": message} with `status`."""
+
+    def __init__(self, status, message, **extra):
+        super().__init__(message)
+        self.status = status
+        self.body = dict(error=message, **extra)
+
+
+def camel(row, *, exclude=("password",)):
+    """snake_case columns to the camelCase keys drizzle returns."""
+    return {re.sub(r"_([a-z])", lambda match: match.group(1).upper(), key): value
+            for key, value in row.items() if key not in exclude}
+
+
+# ==================== VALIDATION (zod schemas) ====================
+
+def _text(body, field, minimum, message):
+    value = body.get(field)
+    if not isinstance(value, str) or len(value) < minimum:
+        raise HttpError(400, message)
+    return value
+
+
+def _number(body, field, minimum, message, maximum=None, maximum_message=None):
+    """z.coerce.number(): strings are converted, NaN is a type error."""
+    try:
+        value = float(body.get(field))
+    except (TypeError, ValueError):
+        raise HttpError(400, "Expected number, received nan")
+    if value < minimum:
+        raise HttpError(400, message)
+    if maximum is not None and value > maximum:
+        raise HttpError(400, maximum_message)
+    return int(value) if value.is_integer() else value
+
+
+def _choice(body, field, choices, default=None):
+    value = body.get(field, default)
+    if value not in choices:
+        options = " | ".join(f"'{choice}'" for choice in choices)
+        raise HttpError(400, f"Invalid enum value. Expected {options}, received '{value}'")
+    return value
+
+
+def _uuid(body, field, message):
+    value = body.get(field)
+    if not isinstance(value, str) or not UUID_RE.match(value):
+        raise HttpError(400, message)
+    return value
+
+
+def _property_input(body):
+    return {
+        "name": _text(body, "name", 2, "Nama properti minimal 2 karakter"),
+        "address": _text(body, "address", 5, "Alamat minimal 5 karakter"),
+    }
+
+
+def _room_input(body):
+    return {
+        "room_number": _text(body, "roomNumber", 1, "Nomor kamar wajib diisi"),
+        "price": _number(body, "price", 100000, "Harga minimal Rp 100.000"),
+        "status": _choice(body, "status", ROOM_STATUSES, default="available"),
+        "facilities": body.get("facilities") or [],
+    }
+
+
+# ==================== AUTH ====================
+
+def register(store, user_id, body):
+    full_name = _text(body, "fullName", 2, "Nama lengkap minimal 2 karakter")
+    email = body.get("email")
+    if not isinstance(email, str) or not EMAIL_RE.match(email):
+        raise HttpError(400, "Email tidak valid")
+    password = _text(body, "password", 6, "Password minimal 6 karakter")
+    if body.get("confirmPassword") != password:
+        raise HttpError(400, "Password tidak sama")
+    if store.user_by_email(email):
+        raise HttpError(400, "Email sudah terdaftar")
+    user = store.insert("users", {"full_name": full_name, "email": email,
+                                  "password": hash_password(password)})
+    return 201, {"message": "Registrasi berhasil",
+                 "user": {"id": user["id"], "email": email, "fullName": full_name}}
+
+
+# ==================== PROPERTIES ====================
+
+def _own_property(store, user_id, property_id):
+    prop = store.get("properties", property_id)
+    if prop is None or prop["owner_id"] != user_id:
+        raise HttpError(404, "Properti tidak ditemukan")
+    return prop
+
+
+def list_properties(store, user_id, body):
+    rows = sorted(store.rows("properties", owner_id=user_id),
+                  key=lambda row: row["created_at"], reverse=True)
+    return 200, {"properties": [camel(row) for row in rows]}
+
+
+def create_property(store, user_id, body):
+    # The session carries no subscriptionPlan, so the app always checks 'free'
+    limit = MAX_PROPERTIES["free"]
+    if limit is not None and len(store.property_ids(user_id)) >= limit:
+        raise HttpError(403, "Limit properti tercapai. Upgrade ke PRO untuk unlimited properti.",
+                        upgradeRequired=True)
+    values = _property_input(body)
+    prop = store.insert("properties", dict(values, owner_id=user_id, total_rooms=0))
+    return 201, {"message": "Properti berhasil ditambahkan", "property": camel(prop)}
+
+
+def get_property(store, user_id, body, id):
+    return 200, {"property": camel(_own_property(store, user_id, id))}
+
+
+def update_property(store, user_id, body, id):
+    _own_property(store, user_id, id)
+    prop = store.update("properties", id, updated_at=now(), **_property_input(body))
+    return 200, {"message": "Properti berhasil diperbarui", "property": camel(prop)}
+
+
+def delete_property(store, user_id, body, id):
+    _own_property(store, user_id, id)
+    store.delete("properties", id)
+    return 200, {"message": "Properti berhasil dihapus"}
+
+
+# ==================== ROOMS ====================
+
+def _own_room(store, user_id, room_id):
+    room = store.get("rooms", room_id)
+    if room is None:
+        raise HttpError(404, "Kamar tidak ditemukan")
+    if store.owner_of("rooms", room_id) != user_id:
+        raise HttpError(403, "Unauthorized")
+    return room
+
+
+def create_room(store, user_id, body, id):
+    prop = _own_property(store, user_id, id)
+    values = _room_input(body)
+    if store.rows("rooms", property_id=id, room_number=values["room_number"]):
+        raise HttpError(400, "Nomor kamar sudah ada")
+    room = store.insert("rooms", dict(values, property_id=id))
+    store.update("properties", id, total_rooms=prop["total_rooms"] + 1)
+    return 201, {"message": "Kamar berhasil ditambahkan", "room": camel(room)}
+
+
+def update_room(store, user_id, body, id):
+    _own_room(store, user_id, id)
+    room = store.update("rooms", id, updated_at=now(), **_room_input(body))
+    return 200, {"message": "Kamar berhasil diperbarui", "room": camel(room)}
+
+
+def delete_room(store, user_id, body, id):
+    room = _own_room(store, user_id, id)
+    if room["status"] == "occupied":
+        raise HttpError(400, "Tidak dapat menghapus kamar yang sedang terisi")
+    # totalRooms is not decremented, as in the app
+    store.delete("rooms", id)
+    return 200, {"message": "Kamar berhasil dihapus"}
+
+
+def list_available_rooms(store, user_id, body):
+    rows = []
+    for prop in store.rows("properties", owner_id=user_id):
+        for room in store.rows("rooms", property_id=prop["id"], status="available"):
+            rows.append({"id": room["id"], "roomNumber": room["room_number"],
+                         "price": room["price"], "propertyId": prop["id"],
+                         "propertyName": prop["name"]})
+    rows.sort(key=lambda row: (row["propertyName"], row["roomNumber"]))
+    return 200, {"rooms": rows}
+
+
+# ==================== TENANTS ====================
+
+def _joined_tenants(store, user_id):
+    """(tenant, room, property) for every tenant of the owner."""
+    for prop in store.rows("properties", owner_id=user_id):
+        for room in store.rows("rooms", property_id=prop["id"]):
+            for tenant in store.rows("tenants", room_id=room["id"]):
+                yield tenant, room, prop
+
+
+def _tenant_with_owner(store, user_id, tenant_id):
+    tenant = store.get("tenants", tenant_id)
+    if tenant is None:
+        raise HttpError(404, "Tenant not found")
+    if store.owner_of("tenants", tenant_id) != user_id:
+        raise HttpError(403, "Unauthorized")
+    return tenant
+
+
+def list_tenants(store, user_id, body):
+    joined = sorted(_joined_tenants(store, user_id),
+                    key=lambda item: item[0]["created_at"], reverse=True)
+    return 200, {"tenants": [{
+        "id": tenant["id"], "name": tenant["name"], "phoneNumber": tenant["phone_number"],
+        "startDate": tenant["start_date"], "dueDate": tenant["due_date"],
+        "isActive": tenant["is_active"], "roomNumber": room["room_number"],
+        "propertyName": prop["name"],
+    } for tenant, room, prop in joined]}
+
+
+def list_active_tenants(store, user_id, body):
+    rows = [{
+        "id": tenant["id"], "name": tenant["name"], "roomId": room["id"],
+        "roomNumber": room["room_number"], "propertyId": prop["id"],
+        "propertyName": prop["name"], "price": room["price"],
+    } for tenant, room, prop in _joined_tenants(store, user_id) if tenant["is_active"]]
+    rows.sort(key=lambda row: (row["propertyName"], row["roomNumber"]))
+    return 200, {"tenants": rows}
+
+
+def create_tenant(store, user_id, body):
+    name = _text(body, "name", 2, "Nama penyewa minimal 2 karakter")
+    phone = _text(body, "phoneNumber", 10, "Nomor telepon minimal 10 digit")
+    if not PHONE_RE.match(phone):
+        raise HttpError(400, "Format nomor telepon tidak valid. Contoh: +62812345678")
+    room_id = _uuid(body, "roomId", "Pilih kamar yang valid")
+    start_date = _text(body, "startDate", 1, "Tanggal mulai wajib diisi")
+    due_date = _number(body, "dueDate", 1, "Tanggal jatuh tempo minimal 1",
+                       31, "Tanggal jatuh tempo maksimal 31")
+
+    room = store.get("rooms", room_id)
+    if room is None or store.owner_of("rooms", room_id) != user_id:
+        raise HttpError(404, "Kamar tidak ditemukan")
+    if room["status"] != "available":
+        raise HttpError(400, "Kamar tidak tersedia")
+
+    tenant = store.insert("tenants", {
+        "room_id": room_id, "name": name, "phone_number": phone, "start_date": start_date,
+        "due_date": due_date, "id_card_photo": body.get("idCardPhoto"), "is_active": True,
+    })
+    store.update("rooms", room_id, status="occupied", updated_at=now())
+    return 201, {"message": "Check-in berhasil", "tenant": camel(tenant)}
+
+
+def bulk_create_tenants(store, user_id, body):
+    rows = body.get("tenants") if isinstance(body, dict) else None
+    if not rows or not isinstance(rows, list):
+        raise HttpError(400, "Data penyewa tidak valid")
+    property_ids = store.property_ids(user_id)
+    if not property_ids:
+        raise HttpError(400, "Anda belum memiliki properti")
+
+    # The route ANDs one propertyId condition per property, so only owners
+    # with a single property ever get rooms; the list is read once up front.
+    candidates = [room for room in store.rows("rooms", status="available")
+                  if all(room["property_id"] == property_id for property_id in property_ids)]
+
+    success, errors = 0, []
+    for row in rows:
+        name = row.get("name")
+        room = next((room for room in candidates
+                     if room["room_number"].lower() == str(row.get("roomNumber", "")).lower()), None)
+        if room is None:
+            errors.append({"name": name, "error": f"Kamar {row.get('roomNumber')} tidak "
+                                                  "ditemukan atau sudah terisi"})
+            continue
+        due_date = _parse_int(row.get("dueDate"))
+        if due_date is None or not 1 <= due_date <= 31:
+            errors.append({"name": name, "error": "Tanggal jatuh tempo harus antara 1-31"})
+            continue
+        try:
+            start_date = date.fromisoformat(str(row.get("startDate"))[:10])
+        except ValueError:
+            errors.append({"name": name, "error": "Format tanggal mulai tidak valid"})
+            continue
+
+        tenant = store.insert("tenants", {
+            "name": name, "phone_number": row.get("phoneNumber"), "room_id": room["id"],
+            "start_date": start_date, "due_date": due_date, "is_active": True,
+        })
+        store.update("rooms", room["id"], status="occupied", updated_at=now())
+        period = start_date.replace(day=1)
+        if start_date.day > due_date:
+            period = date(period.year + period.month // 12, period.month % 12 + 1, 1)
+        store.insert("invoices", {"tenant_id": tenant["id"], "amount": room["price"],
+                                  "period": period, "status": "unpaid"})
+        success += 1
+
+    failed = len(errors)
+    return 200, {"message": f"Upload selesai: {success} berhasil, {failed} gagal",
+                 "success": success, "failed": failed, "errors": errors}
+
+
+def get_tenant(store, user_id, body, id):
+    tenant = _tenant_with_owner(store, user_id, id)
+    room = store.get("rooms", tenant["room_id"])
+    prop = store.get("properties", room["property_id"])
+    invoices = sorted(store.rows("invoices", tenant_id=id),
+                      key=lambda row: row["period"], reverse=True)
+    return 200, {
+        "id": tenant["id"], "name": tenant["name"], "phoneNumber": tenant["phone_number"],
+        "idCardPhoto": tenant["id_card_photo"], "startDate": tenant["start_date"],
+        "dueDate": tenant["due_date"], "isActive": tenant["is_active"],
+        "createdAt": tenant["created_at"],
+        "room": {
+            "id": room["id"], "roomNumber": room["room_number"], "price": room["price"],
+            "property": {"id": prop["id"], "name": prop["name"], "address": prop["address"]},
+        },
+        "invoices": [{"id": row["id"], "amount": row["amount"], "period": row["period"],
+                      "status": row["status"], "paidAt": row["paid_at"],
+                      "createdAt": row["created_at"]} for row in invoices],
+    }
+
+
+def delete_tenant(store, user_id, body, id):
+    tenant = _tenant_with_owner(store, user_id, id)
+    store.update("rooms", tenant["room_id"], status="available")
+    store.delete("tenants", id)
+    return 200, {"success": True}
+
+
+def checkout_tenant(store, user_id, body, id):
+    tenant = _tenant_with_owner(store, user_id, id)
+    if not tenant["is_active"]:
+        raise HttpError(400, "Tenant already checked out")
+    store.update("tenants", id, is_active=False)
+    store.update("rooms", tenant["room_id"], status="available")
+    return 200, {"success": True, "message": "Tenant checked out successfully"}
+
+
+# ==================== INVOICES ====================
+
+def _own_invoice(store, user_id, invoice_id):
+    invoice = store.get("invoices", invoice_id)
+    if invoice is None or store.owner_of("invoices", invoice_id) != user_id:
+        raise HttpError(404, "Tagihan tidak ditemukan")
+    return invoice
+
+
+def list_invoices(store, user_id, body):
+    rows = []
+    for tenant, room, prop in _joined_tenants(store, user_id):
+        for invoice in store.rows("invoices", tenant_id=tenant["id"]):
+            rows.append({
+                "id": invoice["id"], "amount": invoice["amount"], "status": invoice["status"],
+                "period": invoice["period"], "createdAt": invoice["created_at"],
+                "paidAt": invoice["paid_at"], "tenantName": tenant["name"],
+                "tenantPhone": tenant["phone_number"], "roomNumber": room["room_number"],
+                "propertyName": prop["name"],
+            })
+    rows.sort(key=lambda row: row["createdAt"], reverse=True)
+    return 200, {"invoices": rows}
+
+
+def create_invoice(store, user_id, body):
+    tenant_id = _uuid(body, "tenantId", "Pilih penyewa yang valid")
+    amount = _number(body, "amount", 1, "Jumlah tagihan wajib diisi")
+    period = _text(body, "period", 1, "Periode tagihan wajib diisi")
+    if store.get("tenants", tenant_id) is None or store.owner_of("tenants", tenant_id) != user_id:
+        raise HttpError(404, "Penyewa tidak ditemukan")
+    if store.rows("invoices", tenant_id=tenant_id, period=period):
+        raise HttpError(400, "Tagihan untuk periode ini sudah ada")
+    invoice = store.insert("invoices", {"tenant_id": tenant_id, "amount": amount,
+                                        "period": period, "status": "unpaid"})
+    return 201, {"message": "Tagihan berhasil dibuat", "invoice": camel(invoice)}
+
+
+def update_invoice(store, user_id, body, id):
+    status = _choice(body, "status", INVOICE_STATUSES)
+    _own_invoice(store, user_id, id)
+    invoice = store.update("invoices", id, status=status,
+                           paid_at=now() if status == "paid" else None)
+    message = "Tagihan ditandai sebagai lunas" if status == "paid" else "Status tagihan diperbarui"
+    return 200, {"message": message, "invoice": camel(invoice)}
+
+
+def delete_invoice(store, user_id, body, id):
+    _own_invoice(store, user_id, id)
+    store.delete("invoices", id)
+    return 200, {"message": "Tagihan berhasil dihapus"}
+
+
+def _parse_int(value):
+    """parseInt(): the leading digits, or None."""
+    match = re.match(r"\s*([+-]?\d+)", str(value))
+    return int(match.group(1)) if match else None
+
+
+# (method, path pattern, handler, needs a session)
+ROUTES = [
+    ("POST", r"/api/auth/register", register, False),
+    ("GET", r"/api/properties", list_properties, True),
+    ("POST", r"/api/properties", create_property, True),
+    ("GET", r"/api/properties/(?P<id>[^/]+)", get_property, True),
+    ("PUT", r"/api/properties/(?P<id>[^/]+)", update_property, True),
+    ("DELETE", r"/api/properties/(?P<id>[^/]+)", delete_property, True),
+    ("POST", r"/api/properties/(?P<id>[^/]+)/rooms", create_room, True),
+    ("GET", r"/api/rooms/available", list_available_rooms, True),
+    ("PUT", r"/api/rooms/(?P<id>[^/]+)", update_room, True),
+    ("DELETE", r"/api/rooms/(?P<id>[^/]+)", delete_room, True),
+    ("GET", r"/api/tenants", list_tenants, True),
+    ("POST", r"/api/tenants", create_tenant, True),
+    ("GET", r"/api/tenants/active", list_active_tenants, True),
+    ("POST", r"/api/tenants/bulk", bulk_create_tenants, True),
+    ("GET", r"/api/tenants/(?P<id>[^/]+)", get_tenant, True),
+    ("DELETE", r"/api/tenants/(?P<id>[^/]+)", delete_tenant, True),
+    ("POST", r"/api/tenants/(?P<id>[^/]+)/checkout", checkout_tenant, True),
+    ("GET", r"/api/invoices", list_invoices, True),
+    ("POST", r"/api/invoices", create_invoice, True),
+    ("PATCH", r"/api/invoices/(?P<id>[^/]+)", update_invoice, True),
+    ("DELETE", r"/api/invoices/(?P<id>[^/]+)", delete_invoice, True),
+]
+COMPILED_ROUTES = [(method, re.compile(pattern + "$"), handler, private)
+                   for method, pattern, handler, private in ROUTES]
+
+
+def match_route(method, path):
+    """(handler, needs_session, params), or None; 405 when only the method differs."""
+    allowed = False
+    for route_method, pattern, handler, private in COMPILED_ROUTES:
+        match = pattern.match(path)
+        if match:
+            if route_method == method:
+                return handler, private, match.groupdict()
+            allowed = True
+    if allowed:
+        raise HttpError(405, "Method Not Allowed")
+    return None
@@ -0,0 +1,276 @@
+"""
+server.py - HTTP Server of the Stand-in Backend
+KosManager Automated Testing
+"""
+import json
+import logging
+import os
+import random
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from .routes import HttpError, match_route
+from .store import Store, hash_password, now
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "authjs.session-token"
+CSRF_COOKIE = "authjs.csrf-token"
+# Routes whose data comes from the database in the real app
+DATA_PATHS = ("/api/properties", "/api/rooms", "/api/tenants", "/api/invoices", "/dashboard")
+SERVER_ERROR = {"error": "Terjadi kesalahan server"}
+PAGE = ("<!DOCTYPE html><html lang=\"id\"><head><title>KOMA - Stand-in</title></head>"
+        "<body><main data-standin=\"{path}\"></main></body></html>")
+
+
+class Faults:
+    """
+    Artificial latency and error injection for requests under `paths`.
+
+    Every matching request waits latency_ms +/- jitter_ms, then fails with
+    a 500 (the app's own "Terjadi kesalahan server") with probability
+    error_rate. Defaults come from TEST_STANDIN_LATENCY_MS,
+    TEST_STANDIN_JITTER_MS, TEST_STANDIN_ERROR_RATE and
+    TEST_STANDIN_FAULT_PATHS (comma-separated path prefixes).
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, paths=DATA_PATHS, seed=None):
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.paths = tuple(paths)
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        paths = os.getenv("TEST_STANDIN_FAULT_PATHS")
+        return cls(latency_ms=float(os.getenv("TEST_STANDIN_LATENCY_MS", "0")),
+                   jitter_ms=float(os.getenv("TEST_STANDIN_JITTER_MS", "0")),
+                   error_rate=float(os.getenv("TEST_STANDIN_ERROR_RATE", "0")),
+                   paths=paths.split(",") if paths else DATA_PATHS)
+
+    def applies_to(self, path):
+        return path.startswith(self.paths)
+
+    def delay(self):
+        """Seconds to wait before answering."""
+        with self._lock:
+            jitter = self.rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(self.latency_ms + jitter, 0) / 1000
+
+    def should_fail(self):
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self.rng.random() < self.error_rate
+
+
+class StandinServer:
+    """
+    A KosManager backend without Next.js or Postgres: the /api routes of
+    src/app/api over an in-memory Store, NextAuth's credentials login and
+    bare HTML for the pages (with /dashboard* redirecting to /login
+    without a session, like the dashboard layout).
+
+    Sessions are opaque tokens in the authjs.session-token cookie, kept in
+    memory. Use start()/stop() (or a `with` block) to run it on a thread,
+    or serve_forever() from `python -m standin`.
+    """
+
+    def __init__(self, store=None, host="127.0.0.1", port=0, faults=None):
+        self.store = store if store is not None else Store()
+        self.faults = faults or Faults()
+        self.sessions = {}
+        self.csrf_tokens = set()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.standin = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        # A short poll interval keeps stop() (and each unit test) fast
+        self._thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,),
+                                        name="standin", daemon=True)
+        self._thread.start()
+        logger.info("Stand-in backend listening on %s", self.url)
+        return self
+
+    def serve_forever(self):
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    # ==================== AUTH ====================
+
+    def sign_in(self, email, password):
+        """Session token for valid credentials, else None (authorize() in src/lib/auth.ts)."""
+        user = self.store.user_by_email(email or "")
+        if user is None or len(password or "") < 6 or user["password"] != hash_password(password):
+            return None
+        token = secrets.token_urlsafe(32)
+        self.sessions[token] = user["id"]
+        return token
+
+    def session_json(self, user_id):
+        user = self.store.get("users", user_id)
+        return {"user": {"id": user["id"], "name": user["full_name"], "email": user["email"]},
+                "expires": now() + timedelta(days=30)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        self._dispatch()
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+    # ==================== DISPATCH ====================
+
+    def _dispatch(self):
+        standin = self.server.standin
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/") or "/"
+        self._cookies_out = []
+        body = self._read_body()
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        token = cookies[SESSION_COOKIE].value if SESSION_COOKIE in cookies else None
+        user_id = standin.sessions.get(token)
+        if user_id is not None and standin.store.get("users", user_id) is None:
+            user_id = None
+
+        if standin.faults.applies_to(path):
+            delay = standin.faults.delay()
+            if delay:
+                time.sleep(delay)  # hard-sleep: ok (injected latency)
+            if standin.faults.should_fail():
+                return self._json(500, SERVER_ERROR)
+
+        try:
+            if path.startswith("/api/auth/") and path != "/api/auth/register":
+                return self._auth(path, body, token, user_id)
+            if not path.startswith("/api/"):
+                return self._page(path, user_id)
+            route = match_route(self.command, path)
+            if route is None:
+                return self._json(404, {"error": "Not Found"})
+            handler, private, params = route
+            if private and user_id is None:
+                return self._json(401, {"error": "Unauthorized"})
+            payload = self._parse_json(body)
+            with standin.store.lock:
+                status, response = handler(standin.store, user_id, payload, **params)
+            self._json(status, response)
+        except HttpError as error:
+            self._json(error.status, error.body)
+        except Exception:
+            logger.exception("Stand-in error on %s %s", self.command, self.path)
+            self._json(500, SERVER_ERROR)
+
+    def _auth(self, path, body, token, user_id):
+        standin = self.server.standin
+        action = path[len("/api/auth/"):]
+        if action == "csrf":
+            csrf = secrets.token_hex(32)
+            standin.csrf_tokens.add(csrf)
+            self._cookies_out.append(f"{CSRF_COOKIE}={csrf}; Path=/; HttpOnly; SameSite=Lax")
+            return self._json(200, {"csrfToken": csrf})
+        if action == "session":
+            return self._json(200, standin.session_json(user_id) if user_id else None)
+        if action == "callback/credentials" and self.command == "POST":
+            form = dict(parse_qsl(body.decode("utf-8")))
+            callback = form.get("callbackUrl") or "/"
+            if form.get("csrfToken") not in standin.csrf_tokens:
+                return self._redirect(302, "/api/auth/error?error=MissingCSRF")
+            new_token = standin.sign_in(form.get("email"), form.get("password"))
+            if new_token is None:
+                return self._redirect(302, "/login?error=CredentialsSignin&code=credentials")
+            self._cookies_out.append(f"{SESSION_COOKIE}={new_token}; Path=/; HttpOnly; SameSite=Lax")
+            return self._redirect(302, callback)
+        if action == "signout" and self.command == "POST":
+            standin.sessions.pop(token, None)
+            self._cookies_out.append(f"{SESSION_COOKIE}=; Path=/; Max-Age=0")
+            form = dict(parse_qsl(body.decode("utf-8")))
+            return self._redirect(302, form.get("callbackUrl") or "/")
+        return self._json(400, {"error": "UnknownAction"})
+
+    def _page(self, path, user_id):
+        if path.startswith("/dashboard") and user_id is None:
+            return self._redirect(307, "/login")
+        if self.command != "GET":
+            return self._json(405, {"error": "Method Not Allowed"})
+        self._send(200, "text/html; charset=utf-8", PAGE.format(path=path).encode("utf-8"))
+
+    # ==================== I/O ====================
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _parse_json(self, body):
+        if not body:
+            return {}
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise HttpError(500, SERVER_ERROR["error"])
+
+    def _json(self, status, payload):
+        body = json.dumps(payload, default=_json_default).encode("utf-8")
+        self._send(status, "application/json", body)
+
+    def _redirect(self, status, location):
+        self.send_response(status)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self._send_cookies()
+        self.end_headers()
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self._send_cookies()
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_cookies(self):
+        for cookie in self._cookies_out:
+            self.send_header("Set-Cookie", cookie)
+
+
+def _json_default(value):
+    """Timestamps as JSON.stringify(Date) writes them: 2026-10-17T10:00:00.000Z"""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
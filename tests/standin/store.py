@@ -0,0 +1,161 @@
+"""
+store.py - In-Memory Tables for the Stand-in Backend
+KosManager Automated Testing
+"""
+import hashlib
+import json
+import os
+import threading
+import uuid
+from datetime import date, datetime, timezone
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "fixtures", "standin")
+DEFAULT_FIXTURES = os.path.join(FIXTURES_DIR, "default.json")
+
+# Same tables and defaults as src/lib/db/schema.ts (snake_case columns)
+TABLES = ("users", "properties", "rooms", "tenants", "invoices")
+DEFAULTS = {
+    "users": {"subscription_plan": "free"},
+    "properties": {"total_rooms": 0},
+    "rooms": {"status": "available", "facilities": None},
+    "tenants": {"id_card_photo": None, "is_active": True},
+    "invoices": {"status": "unpaid", "paid_at": None},
+}
+# Tables without an updated_at column
+NO_UPDATED_AT = {"invoices"}
+# Parent of each child row, for ON DELETE CASCADE
+PARENTS = {"properties": ("owner_id", "users"), "rooms": ("property_id", "properties"),
+           "tenants": ("room_id", "rooms"), "invoices": ("tenant_id", "tenants")}
+
+
+def hash_password(password):
+    """Stand-in for bcrypt: only this process ever checks the hash."""
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def now():
+    return datetime.now(timezone.utc)
+
+
+class Store:
+    """
+    The rows of one stand-in backend, as {table: {id: row}}.
+
+    Rows are dicts with the snake_case columns of src/lib/db/schema.ts,
+    the same shape as SeedPlan records. Every route handler runs under
+    `lock`, so a request sees and leaves the tables consistent.
+    """
+
+    def __init__(self):
+        self.tables = {table: {} for table in TABLES}
+        # {table: {parent_id: {id: row}}}, so the joins up from a property
+        # stay fast on the 10k_invoices preset
+        self.children = {table: {} for table in PARENTS}
+        self.lock = threading.RLock()
+
+    # ==================== LOADING ====================
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_FIXTURES):
+        store = cls()
+        with open(path, encoding="utf-8") as handle:
+            store.load_fixtures(json.load(handle))
+        return store
+
+    def load_fixtures(self, data):
+        """
+        Load declarative fixtures: {"users": [...], "properties": [...], ...}.
+        Users carry a plain `password`; missing columns get the schema defaults.
+        """
+        unknown = set(data) - set(TABLES)
+        if unknown:
+            raise ValueError(f"Unknown fixture table(s): {', '.join(sorted(unknown))}")
+        for table in TABLES:
+            for row in data.get(table, []):
+                row = dict(row)
+                if table == "users" and "password" in row:
+                    row["password"] = hash_password(row["password"])
+                self.insert(table, row)
+        return self
+
+    def seed(self, plan, password):
+        """Load a SeedPlan (seeding.DataFactory) as its owner, like PostgresSeeder."""
+        owner = dict(plan.owner, password=hash_password(password))
+        self.insert("users", owner)
+        for table in TABLES[1:]:
+            for row in getattr(plan, table):
+                self.insert(table, row)
+        return owner["id"]
+
+    # ==================== ROWS ====================
+
+    def insert(self, table, row):
+        """Add a row; `id`, timestamps and defaults are filled in like Postgres would."""
+        parent = PARENTS.get(table)
+        if parent and row.get(parent[0]) not in self.tables[parent[1]]:
+            raise ValueError(f"{table}.{parent[0]} {row.get(parent[0])} does not exist")
+        created = now()
+        record = dict(DEFAULTS[table], id=str(uuid.uuid4()), created_at=created)
+        if table not in NO_UPDATED_AT:
+            record["updated_at"] = created
+        record.update({column: _column_value(value) for column, value in row.items()})
+        self.tables[table][record["id"]] = record
+        if parent:
+            self.children[table].setdefault(record[parent[0]], {})[record["id"]] = record
+        return record
+
+    def get(self, table, row_id):
+        return self.tables[table].get(row_id)
+
+    def update(self, table, row_id, **values):
+        """Set columns; like the app's UPDATEs, updated_at only changes when passed."""
+        record = self.tables[table][row_id]
+        record.update({column: _column_value(value) for column, value in values.items()})
+        return record
+
+    def delete(self, table, row_id):
+        """Delete a row and, through ON DELETE CASCADE, everything below it."""
+        record = self.tables[table].pop(row_id, None)
+        if record is not None and table in PARENTS:
+            self.children[table][record[PARENTS[table][0]]].pop(row_id, None)
+        for child, (column, parent) in PARENTS.items():
+            if parent == table:
+                for child_id in list(self.children[child].get(row_id, ())):
+                    self.delete(child, child_id)
+
+    def rows(self, table, **where):
+        """Rows matching every column=value, in insertion order."""
+        candidates = self.tables[table]
+        if table in PARENTS and PARENTS[table][0] in where:
+            candidates = self.children[table].get(where[PARENTS[table][0]], {})
+        return [row for row in candidates.values()
+                if all(row.get(column) == value for column, value in where.items())]
+
+    def user_by_email(self, email):
+        return next(iter(self.rows("users", email=email)), None)
+
+    def counts(self):
+        return {table: len(rows) for table, rows in self.tables.items()}
+
+    # ==================== OWNERSHIP ====================
+
+    def owner_of(self, table, row_id):
+        """The owner_id above a row (rooms, tenants and invoices join up to properties)."""
+        row = self.get(table, row_id)
+        while row is not None and table != "properties":
+            column, table = PARENTS[table]
+            row = self.get(table, row[column])
+        return row["owner_id"] if row else None
+
+    def property_ids(self, owner_id):
+        return {row["id"] for row in self.rows("properties", owner_id=owner_id)}
+
+
+def _column_value(value):
+    """Dates become ISO strings (Postgres `date`); datetimes stay for timestamps."""
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
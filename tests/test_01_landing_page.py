@@ -76,7 +76,6 @@ class TestLandingPage:
         landing = LandingPage(driver, base_url)
         landing.open()
         landing.scroll_to_bottom()
-        landing.wait(0.5)
         
         cards_count = landing.get_feature_cards_count()
         assert cards_count >= 4, \
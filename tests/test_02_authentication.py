@@ -58,7 +58,7 @@ class TestRegistration:
         )
         
         # Wait for redirect
-        register.wait(2)
+        register.wait_for_url_contains("/login")
         
         # Should redirect to login
         assert "/login" in driver.current_url, \
@@ -85,7 +85,7 @@ class TestRegistration:
             confirm_password="DifferentPassword123"
         )
         
-        register.wait(1)
+        register.wait_for_network_idle()
         
         # Check for error - should still be on register page
         assert "/register" in driver.current_url, \
@@ -106,7 +106,7 @@ class TestRegistration:
         
         # Click submit without entering data
         register.click_register()
-        register.wait(0.5)
+        register.wait_for_network_idle()
         
         # Should stay on register page
         assert "/register" in driver.current_url, \
@@ -165,7 +165,7 @@ class TestLogin:
         )
         
         # Wait for redirect
-        login.wait(2)
+        login.wait_for_url_contains("/dashboard")
         
         # Should redirect to dashboard
         assert "/dashboard" in driver.current_url, \
@@ -191,7 +191,7 @@ class TestLogin:
         )
         
         # Wait for response
-        login.wait(2)
+        login.wait_for_network_idle()
         
         # Should stay on login page
         assert "/login" in driver.current_url, \
@@ -217,7 +217,7 @@ class TestLogin:
         )
         
         # Wait for response
-        login.wait(2)
+        login.wait_for_network_idle()
         
         # Should stay on login page
         assert "/login" in driver.current_url, \
@@ -5,7 +5,7 @@ KosManager Automated Testing
 Test Cases: TC004
 """
 import pytest
-from pages import LoginPage, DashboardPage
+from pages import DashboardPage
 
 
 @pytest.mark.smoke
@@ -14,15 +14,8 @@ class TestDashboard:
     """Test suite for Dashboard functionality."""
     
     @pytest.fixture(autouse=True)
-    def login_first(self, driver, base_url):
-        """Login before each dashboard test."""
-        login = LoginPage(driver, base_url)
-        login.open()
-        login.login(
-            email="test@example.com",
-            password="password123"
-        )
-        login.wait(2)
+    def login_first(self, logged_in):
+        """Restore the cached login session before each dashboard test."""
     
     def test_TC004_01_dashboard_access(self, driver, base_url):
         """
@@ -104,7 +97,6 @@ class TestDashboard:
         
         if dashboard.is_sidebar_visible():
             dashboard.click_nav_properties()
-            dashboard.wait(1)
             
             assert "/dashboard/properties" in driver.current_url, \
                 f"Expected /dashboard/properties, got: {driver.current_url}"
@@ -125,7 +117,6 @@ class TestDashboard:
         
         if dashboard.is_sidebar_visible():
             dashboard.click_nav_tenants()
-            dashboard.wait(1)
             
             assert "/dashboard/tenants" in driver.current_url, \
                 f"Expected /dashboard/tenants, got: {driver.current_url}"
@@ -146,7 +137,6 @@ class TestDashboard:
         
         if dashboard.is_sidebar_visible():
             dashboard.click_nav_invoices()
-            dashboard.wait(1)
             
             assert "/dashboard/invoices" in driver.current_url, \
                 f"Expected /dashboard/invoices, got: {driver.current_url}"
@@ -166,7 +156,6 @@ class TestDashboard:
         dashboard = DashboardPage(driver, base_url)
         
         dashboard.click_user_avatar()
-        dashboard.wait(0.5)
         
         assert dashboard.is_dropdown_visible(), \
             "User dropdown menu should be visible"
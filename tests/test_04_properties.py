@@ -6,7 +6,7 @@ Test Cases: TC005
 """
 import pytest
 from datetime import datetime
-from pages import LoginPage, DashboardPage, PropertiesPage, NewPropertyPage
+from pages import DashboardPage, PropertiesPage, NewPropertyPage
 
 
 @pytest.mark.property
@@ -15,15 +15,8 @@ class TestPropertyManagement:
     """Test suite for Property Management functionality."""
     
     @pytest.fixture(autouse=True)
-    def login_first(self, driver, base_url):
-        """Login before each property test."""
-        login = LoginPage(driver, base_url)
-        login.open()
-        login.login(
-            email="test@example.com",
-            password="password123"
-        )
-        login.wait(2)
+    def login_first(self, logged_in):
+        """Restore the cached login session before each property test."""
     
     def test_TC005_01_properties_page_loads(self, driver, base_url):
         """
@@ -43,28 +36,21 @@ class TestPropertyManagement:
         assert "Properti" in page_title or "KosManager" in page_title or "/properties" in driver.current_url, \
             f"Expected to be on properties page, got title: {page_title}"
     
-    def test_TC005_02_empty_state_displayed(self, driver, base_url):
+    def test_TC005_02_empty_state_displayed(self, driver, base_url, fresh_owner):
         """
         TC005-02: Verify empty state when no properties.
         
         Steps:
-        1. Login (new user with no properties)
+        1. Register a new owner via API and login as that owner
         2. Navigate to /dashboard/properties
         
         Expected: Empty state with "Belum Ada Properti" message
-        
-        Note: This test may fail if user already has properties
         """
+        fresh_owner["session"].apply(driver, "/dashboard/properties")
         properties = PropertiesPage(driver, base_url)
-        properties.open()
         
-        # Check if empty state is visible OR properties exist
-        if properties.is_empty_state_visible():
-            assert True, "Empty state is displayed correctly"
-        else:
-            # User has properties, which is also valid
-            cards_count = properties.get_property_cards_count()
-            assert cards_count > 0, "Either empty state or properties should be visible"
+        assert properties.is_empty_state_visible(), \
+            "Empty state should be displayed for an owner without properties"
     
     def test_TC005_03_navigate_to_add_property(self, driver, base_url):
         """
@@ -81,7 +67,6 @@ class TestPropertyManagement:
         properties.open()
         
         properties.click_add_property()
-        properties.wait(1)
         
         assert "/properties/new" in driver.current_url, \
             f"Expected /properties/new, got: {driver.current_url}"
@@ -111,8 +96,8 @@ class TestPropertyManagement:
             address=property_address
         )
         
-        # Wait for redirect
-        new_property.wait(2)
+        # Wait for the create request to finish
+        new_property.wait_for_network_idle()
         
         # Should redirect to properties list or property detail
         assert "/properties" in driver.current_url, \
@@ -154,7 +139,7 @@ class TestPropertyManagement:
         
         # Click submit without filling anything
         new_property.click_submit()
-        new_property.wait(0.5)
+        new_property.wait_for_network_idle()
         
         # Should stay on the same page
         assert "/properties/new" in driver.current_url, \
@@ -166,15 +151,8 @@ class TestPropertyDetail:
     """Test suite for Property Detail functionality."""
     
     @pytest.fixture(autouse=True)
-    def login_first(self, driver, base_url):
-        """Login before each test."""
-        login = LoginPage(driver, base_url)
-        login.open()
-        login.login(
-            email="test@example.com",
-            password="password123"
-        )
-        login.wait(2)
+    def login_first(self, logged_in):
+        """Restore the cached login session before each test."""
     
     def test_TC005_07_click_property_card(self, driver, base_url):
         """
@@ -194,7 +172,6 @@ class TestPropertyDetail:
         
         if cards_count > 0:
             properties.click_first_property()
-            properties.wait(1)
             
             # Should navigate to property detail page
             assert "/properties/" in driver.current_url, \
@@ -36,7 +36,7 @@ class TestLogout:
             email="test@example.com",
             password="password123"
         )
-        login.wait(2)
+        login.wait_for_url_contains("/dashboard")
         
         # Verify we're logged in
         assert "/dashboard" in driver.current_url, \
@@ -45,7 +45,6 @@ class TestLogout:
         # Now logout
         dashboard = DashboardPage(driver, base_url)
         dashboard.click_logout()
-        dashboard.wait(2)
         
         # Should be redirected away from dashboard
         # Could be landing page or login page
@@ -70,16 +69,15 @@ class TestLogout:
             email="test@example.com",
             password="password123"
         )
-        login.wait(2)
+        login.wait_for_url_contains("/dashboard")
         
         # Logout
         dashboard = DashboardPage(driver, base_url)
         dashboard.click_logout()
-        dashboard.wait(2)
         
         # Try to access dashboard directly
         driver.get(f"{base_url}/dashboard")
-        dashboard.wait(2)
+        dashboard.wait_for_page_ready()
         
         # Should be redirected to login
         current_url = driver.current_url
@@ -0,0 +1,74 @@
+"""
+test_06_mobile_layout.py - Mobile Layout Tests
+KosManager Automated Testing
+
+Test Cases: TC010
+"""
+import pytest
+from drivers import DEVICES
+from pages import DashboardPage, PropertiesPage
+
+
+@pytest.mark.mobile
+@pytest.mark.regression
+@pytest.mark.parametrize("device", list(DEVICES), indirect=True)
+class TestMobileLayout:
+    """Dashboard and property pages on emulated phones (viewport + CPU throttle)."""
+
+    @pytest.fixture(autouse=True)
+    def login_first(self, logged_in):
+        """Restore the cached login session before each mobile test."""
+
+    def test_TC010_01_bottom_nav_replaces_sidebar(self, driver, device, base_url):
+        """
+        TC010-01: Verify bottom navigation is shown instead of the sidebar.
+
+        Steps:
+        1. Emulate the phone
+        2. Open /dashboard
+
+        Expected: Bottom nav with Dashboard, Properti, Penyewa, Tagihan; no sidebar
+        """
+        dashboard = DashboardPage(driver, base_url).open()
+
+        assert dashboard.is_mobile_viewport(), f"{device.viewport} should use the mobile layout"
+        assert dashboard.is_bottom_nav_visible(), "Bottom navigation should be visible"
+        assert not dashboard.is_sidebar_visible(), "Sidebar should be hidden on phones"
+        assert dashboard.get_bottom_nav_labels() == ["Dashboard", "Properti", "Penyewa", "Tagihan"]
+
+    def test_TC010_02_bottom_nav_navigation(self, driver, device, base_url):
+        """
+        TC010-02: Navigate with the bottom navigation.
+
+        Steps:
+        1. Open /dashboard on the phone
+        2. Tap Properti, Penyewa, Tagihan, then Dashboard
+
+        Expected: Each tap opens the matching page
+        """
+        dashboard = DashboardPage(driver, base_url).open()
+
+        dashboard.click_nav_properties()
+        assert "/dashboard/properties" in driver.current_url
+        dashboard.click_nav_tenants()
+        assert "/dashboard/tenants" in driver.current_url
+        dashboard.click_nav_invoices()
+        assert "/dashboard/invoices" in driver.current_url
+        dashboard.click_nav_dashboard()
+        assert driver.current_url.rstrip("/").endswith("/dashboard")
+
+    def test_TC010_03_properties_page_on_phone(self, driver, device, base_url):
+        """
+        TC010-03: Open Add Property from the properties page on a phone.
+
+        Steps:
+        1. Open /dashboard/properties on the phone
+        2. Tap Tambah Properti
+
+        Expected: /dashboard/properties/new opens
+        """
+        properties = PropertiesPage(driver, base_url).open()
+
+        assert "Properti" in properties.get_page_title()
+        properties.click_add_property()
+        assert "/dashboard/properties/new" in driver.current_url
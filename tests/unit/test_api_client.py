@@ -0,0 +1,74 @@
+"""
+test_api_client.py - API Client Unit Tests
+KosManager Automated Testing
+"""
+import json
+
+import pytest
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+from api import ApiError, KosManagerClient
+
+
+class RecordingAdapter(BaseAdapter):
+    """Answers requests from a {(method, path): (status, body)} table."""
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        path = request.path_url
+        self.requests.append((request.method, path, request.body))
+        status, body = self.routes[(request.method, path)]
+        response = Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def make_client(routes):
+    client = KosManagerClient("http://app.test")
+    adapter = RecordingAdapter(routes)
+    client.http.mount("http://", adapter)
+    return client, adapter
+
+
+class TestKosManagerClient:
+    """Unit tests for request shapes and cleanup."""
+
+    def test_create_property_is_tracked_and_cleaned_up(self):
+        client, adapter = make_client({
+            ("POST", "/api/properties"): (201, {"property": {"id": "p1", "name": "Kos A"}}),
+            ("DELETE", "/api/properties/p1"): (200, {"message": "ok"}),
+        })
+        assert client.create_property("Kos A", "Jl. Mawar 1")["id"] == "p1"
+        client.delete_created()
+        assert adapter.requests[-1][:2] == ("DELETE", "/api/properties/p1")
+        assert client.created_property_ids == []
+
+    def test_bulk_upload_payload(self):
+        client, adapter = make_client({
+            ("POST", "/api/tenants/bulk"): (200, {"success": 1, "failed": 0, "errors": []}),
+        })
+        row = {"name": "Budi", "phoneNumber": "081234567890", "roomNumber": "A1",
+               "startDate": "2025-01-05", "dueDate": "5"}
+        assert client.bulk_create_tenants([row])["success"] == 1
+        assert json.loads(adapter.requests[0][2]) == {"tenants": [row]}
+
+    def test_unexpected_status_raises(self):
+        client, _ = make_client({
+            ("POST", "/api/properties"): (403, {"error": "Limit properti tercapai"}),
+        })
+        with pytest.raises(ApiError) as error:
+            client.create_property("Kos B", "Jl. Melati 2")
+        assert error.value.status == 403
+        assert client.created_property_ids == []
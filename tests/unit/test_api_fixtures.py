@@ -0,0 +1,142 @@
+"""
+test_api_fixtures.py - Recorded API Fixtures Unit Tests
+KosManager Automated Testing
+"""
+import json
+
+import pytest
+
+from replay import CASSETTE_VERSION, Cassette, CassetteError, ReplaySession, cassette_path, request_key
+from replay.cassette import decode_body
+
+BASE = "http://localhost:3000"
+TENANT_ID = "3f2b8c1e-9a4d-4e6f-8b7a-1c2d3e4f5a6b"
+JSON = {"Content-Type": "application/json", "Date": "Sat, 17 Oct 2026 10:00:00 GMT"}
+
+
+def body(data):
+    return json.dumps(data).encode("utf-8")
+
+
+class TestCassette:
+    """Unit tests for recording and replaying responses."""
+
+    def test_request_key(self):
+        assert request_key("get", f"{BASE}/api/tenants/{TENANT_ID}") == "GET /api/tenants/{id}"
+        assert request_key("GET", f"{BASE}/api/invoices?status=unpaid&month=10") == \
+            "GET /api/invoices?month=10&status=unpaid"
+
+    def test_cassette_path(self, tmp_path):
+        path = cassette_path("tests/test_04_properties.py::TestPropertyManagement::test_TC005_01[a b]",
+                             str(tmp_path))
+
+        assert path == str(tmp_path / "test_04_properties"
+                           / "TestPropertyManagement.test_TC005_01[a_b].json")
+
+    def test_save_and_load(self, tmp_path):
+        cassette = Cassette(str(tmp_path / "t" / "case.json"))
+        cassette.record("GET", f"{BASE}/api/properties", 200, JSON, body([{"name": "Kos Melati"}]))
+        cassette.record("POST", f"{BASE}/api/properties", 201, JSON, body({"id": TENANT_ID}),
+                        request_body='{"name": "Kos Mawar"}')
+        cassette.save(base_url=BASE)
+
+        loaded = Cassette.load(cassette.path)
+        response = loaded.interactions[0]["response"]
+
+        assert response["headers"] == {"content-type": "application/json"}
+        assert response["body"] == {"json": [{"name": "Kos Melati"}]}
+        assert loaded.interactions[1]["request"]["body"] == {"json": {"name": "Kos Mawar"}}
+        assert loaded.meta["base_url"] == BASE
+        assert json.loads(decode_body(response["body"])) == [{"name": "Kos Melati"}]
+
+    def test_load_rejects_missing_and_old_cassettes(self, tmp_path):
+        with pytest.raises(CassetteError, match="No recorded"):
+            Cassette.load(str(tmp_path / "missing.json"))
+
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({"version": CASSETTE_VERSION - 1, "interactions": []}))
+        with pytest.raises(CassetteError, match="re-record"):
+            Cassette.load(str(path))
+
+    def test_responses_replay_in_order_then_repeat(self):
+        cassette = Cassette("unused.json")
+        cassette.record("GET", f"{BASE}/api/properties", 200, JSON, body([]))
+        cassette.record("GET", f"{BASE}/api/properties", 200, JSON, body([{"name": "Kos A"}]))
+
+        bodies = [cassette.next_response("GET", f"{BASE}/api/properties")["body"]
+                  for _ in range(3)]
+
+        assert bodies == [{"json": []}, {"json": [{"name": "Kos A"}]}, {"json": [{"name": "Kos A"}]}]
+        assert cassette.next_response("GET", f"{BASE}/api/rooms/available") is None
+        assert cassette.misses == ["GET /api/rooms/available"]
+
+    def test_binary_body(self):
+        cassette = Cassette("unused.json")
+        cassette.record("GET", f"{BASE}/api/export", 200, {}, b"\xff\xfe\x00")
+
+        assert decode_body(cassette.interactions[0]["response"]["body"]) == b"\xff\xfe\x00"
+
+
+class TestDrift:
+    """Unit tests for comparing live responses with recorded ones."""
+
+    def test_ids_and_timestamps_are_not_drift(self):
+        recorded, live = Cassette("r.json"), Cassette("l.json")
+        recorded.record("GET", f"{BASE}/api/tenants/{TENANT_ID}", 200, JSON,
+                        body({"id": TENANT_ID, "name": "Budi", "createdAt": "2026-10-01T10:00:00Z"}))
+        live.record("GET", f"{BASE}/api/tenants/0a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d", 200, JSON,
+                    body({"id": "0a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d", "name": "Budi",
+                          "createdAt": "2026-10-17T08:30:00Z"}))
+
+        assert recorded.drift(live) == []
+
+    def test_reports_changed_fields(self):
+        recorded, live = Cassette("r.json"), Cassette("l.json")
+        recorded.record("GET", f"{BASE}/api/invoices", 200, JSON,
+                        body([{"amount": 1_000_000, "status": "unpaid", "room": "A101"}]))
+        recorded.record("GET", f"{BASE}/api/rooms/available", 200, JSON, body([]))
+        live.record("GET", f"{BASE}/api/invoices", 200, JSON,
+                    body([{"amount": "1000000", "status": "unpaid", "tenant": "Budi"}]))
+        live.record("GET", f"{BASE}/api/rooms/available", 500, JSON, body({"error": "x"}))
+        live.record("GET", f"{BASE}/api/tenants/active", 200, JSON, body([]))
+
+        assert recorded.drift(live) == [
+            'GET /api/invoices $[0].amount: 1000000 -> "1000000"',
+            "GET /api/invoices $[0].room: removed",
+            "GET /api/invoices $[0].tenant: added",
+            "GET /api/rooms/available: status 200 -> 500",
+            "GET /api/tenants/active: not recorded",
+        ]
+
+
+class TestReplaySession:
+    """Unit tests for routing intercepted requests by mode."""
+
+    def test_record_stores_in_cassette(self):
+        session = ReplaySession("record", Cassette("c.json"))
+        session.on_response("GET", f"{BASE}/api/properties", 200, JSON, body([]))
+
+        assert session.stage == "response"
+        assert len(session.cassette.interactions) == 1
+
+    def test_drift_stores_live_responses(self):
+        recorded = Cassette("c.json")
+        recorded.record("GET", f"{BASE}/api/properties", 200, JSON, body([]))
+        session = ReplaySession("drift", recorded)
+        session.on_response("GET", f"{BASE}/api/properties", 200, JSON, body([{"name": "Kos A"}]))
+
+        assert len(recorded.interactions) == 1
+        assert session.drift() == ["GET /api/properties $: 0 items -> 1 items"]
+
+    def test_replay_answers_from_cassette(self):
+        recorded = Cassette("c.json")
+        recorded.record("GET", f"{BASE}/api/properties", 200, JSON, body([]))
+        session = ReplaySession("replay", recorded)
+
+        assert session.stage == "request"
+        assert session.on_request("GET", f"{BASE}/api/properties")["status"] == 200
+        assert session.on_request("DELETE", f"{BASE}/api/properties/{TENANT_ID}") is None
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="record"):
+            ReplaySession("rewind", Cassette("c.json"))
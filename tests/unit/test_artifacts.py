@@ -0,0 +1,214 @@
+"""
+test_artifacts.py - Failure Artifact Pipeline Unit Tests
+KosManager Automated Testing
+"""
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from artifacts import (
+    ArtifactError,
+    ArtifactStore,
+    ArtifactWriter,
+    artifact_stem,
+    encode_screenshot,
+    optimise_png,
+    rotate_runs,
+)
+from artifacts.encode import check_image_format
+
+
+def make_png(width=160, height=120, level=1):
+    """An RGB PNG with a busy pattern, deflated at `level` like a fast encoder."""
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+    rows = b"".join(b"\x00" + b"".join(bytes(((x * y) % 251, (x + y) % 256, (x ^ y) & 255))
+                                        for x in range(width)) for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + \
+        chunk(b"IDAT", zlib.compress(rows, level)) + chunk(b"IEND", b"")
+
+
+class FakeDriver:
+    def __init__(self, png=None, alive=True):
+        self.png = png or make_png()
+        self.alive = alive
+        self.console = [{"level": "SEVERE", "message": "old error"}]
+        self.current_url = "http://localhost:3000/dashboard"
+        self.page_source = "<html><body>Dashboard</body></html>"
+
+    def get_screenshot_as_png(self):
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        return self.png
+
+    def get_log(self, kind):
+        entries, self.console = self.console, []
+        return entries
+
+
+class Report:
+    def __init__(self, when, failed):
+        self.when = when
+        self.failed = failed
+
+
+class TestEncoding:
+    """Unit tests for screenshot compression."""
+
+    def test_png_is_recompressed_losslessly(self):
+        png = make_png(level=1)
+        optimised = optimise_png(png)
+
+        assert len(optimised) < len(png)
+        assert optimised.startswith(b"\x89PNG")
+        idat = optimised.index(b"IDAT")
+        length = struct.unpack(">I", optimised[idat - 4:idat])[0]
+        original = png.index(b"IDAT")
+        original_length = struct.unpack(">I", png[original - 4:original])[0]
+        assert zlib.decompress(optimised[idat + 4:idat + 4 + length]) == \
+            zlib.decompress(png[original + 4:original + 4 + original_length])
+
+    def test_already_small_png_is_kept(self):
+        png = make_png(level=9)
+        assert optimise_png(png) == png
+        assert encode_screenshot(png, "png") == png
+
+    def test_bad_input_and_formats(self):
+        with pytest.raises(ArtifactError):
+            optimise_png(b"GIF89a")
+        with pytest.raises(ArtifactError):
+            check_image_format("bmp")
+
+
+class TestWriter:
+    """Unit tests for the bounded background writer."""
+
+    def test_writes_off_the_calling_thread(self, tmp_path):
+        writer = ArtifactWriter(max_pending=2)
+        threads = []
+
+        def produce():
+            threads.append(threading.current_thread().name)
+            return b"data"
+
+        path = writer.submit(str(tmp_path / "a" / "b.bin"), produce)
+        writer.flush()
+
+        assert open(path, "rb").read() == b"data"
+        assert threads == ["artifact-writer"]
+        assert not os.path.exists(f"{path}.part")
+        assert (writer.written, writer.bytes) == (1, 4)
+        writer.close()
+
+    def test_submit_blocks_when_the_queue_is_full(self, tmp_path):
+        writer = ArtifactWriter(max_pending=1)
+        release = threading.Event()
+        writer.submit(str(tmp_path / "1"), lambda: release.wait(5) and b"1")
+        writer.submit(str(tmp_path / "2"), lambda: b"2")  # fills the queue
+
+        blocked = threading.Thread(target=writer.submit, args=(str(tmp_path / "3"), lambda: b"3"))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()  # still waiting for room in the queue
+
+        release.set()
+        blocked.join(5)
+        writer.close()
+        assert sorted(os.listdir(tmp_path)) == ["1", "2", "3"]
+
+    def test_errors_are_logged_not_raised(self, tmp_path):
+        writer = ArtifactWriter()
+
+        def broken():
+            raise ValueError("bad image")
+
+        writer.submit(str(tmp_path / "x.png"), broken)
+        writer.close()
+
+        assert writer.errors[0][0] == str(tmp_path / "x.png")
+        assert not os.listdir(tmp_path)
+
+
+class TestArtifactStore:
+    """Unit tests for capturing per-test artifacts."""
+
+    def test_stem(self):
+        assert artifact_stem("tests/test_02_authentication.py::TestLogin::test_TC003_01[pixel-7]") == \
+            "tests_test_02_authentication.py__TestLogin__test_TC003_01_pixel-7"
+        long_a, long_b = "t.py::test_" + "a" * 200 + "[1]", "t.py::test_" + "a" * 200 + "[2]"
+        assert len(artifact_stem(long_a)) == 120
+        assert artifact_stem(long_a) != artifact_stem(long_b)
+
+    def test_capture_failure(self, tmp_path):
+        store = ArtifactStore(str(tmp_path))
+        driver = FakeDriver()
+        store.begin(driver, "tests/test_03.py::TestDashboard::test_a")
+        driver.console.append({"level": "SEVERE", "message": "TypeError: x is undefined"})
+
+        paths = store.capture(driver, "tests/test_03.py::TestDashboard::test_a", "call")
+        again = store.capture(driver, "tests/test_03.py::TestDashboard::test_a", "call")
+        store.close()
+
+        directory = tmp_path / "tests_test_03.py__TestDashboard__test_a"
+        assert paths == {"screenshot": str(directory / "call.png"),
+                         "dom": str(directory / "call-dom.html"),
+                         "console": str(directory / "call-console.json")}
+        assert again["screenshot"] == str(directory / "call-2.png")
+        assert json.loads(open(paths["console"]).read()) == \
+            [{"level": "SEVERE", "message": "TypeError: x is undefined"}]
+        assert open(paths["dom"]).read().startswith("<!-- http://localhost:3000/dashboard -->")
+        assert open(paths["screenshot"], "rb").read().startswith(b"\x89PNG")
+
+    def test_dead_browser_still_gives_console(self, tmp_path):
+        store = ArtifactStore(str(tmp_path))
+        paths = store.capture(FakeDriver(alive=False), "t.py::test_x", "setup")
+        store.close()
+
+        assert "screenshot" not in paths
+        assert os.path.exists(paths["console"])
+
+    def test_modes(self, tmp_path):
+        failed, passed = Report("call", True), Report("call", False)
+        assert ArtifactStore(str(tmp_path)).wants(failed)
+        assert not ArtifactStore(str(tmp_path)).wants(passed)
+        assert ArtifactStore(str(tmp_path), mode="all").wants(passed)
+        assert not ArtifactStore(str(tmp_path), mode="all").wants(Report("teardown", False))
+        with pytest.raises(ValueError):
+            ArtifactStore(str(tmp_path), mode="sometimes")
+
+
+class TestRotation:
+    """Unit tests for removing old runs."""
+
+    def make_run(self, root, name, size, age_days, now):
+        path = root / name
+        path.mkdir()
+        (path / "perf.jsonl").write_bytes(b"x" * size)
+        os.utime(path, (now - age_days * 86400, now - age_days * 86400))
+
+    def test_by_age_and_size(self, tmp_path):
+        now = time.time()
+        self.make_run(tmp_path, "20260101_000000", 100, 30, now)
+        self.make_run(tmp_path, "20261010_000000", 100, 6, now)
+        self.make_run(tmp_path, "20261015_000000", 100, 2, now)
+        self.make_run(tmp_path, "20261017_000000", 100, 0, now)
+
+        removed = rotate_runs(str(tmp_path), keep=("20261017_000000",), max_bytes=250,
+                              max_age_days=7, now=now)
+
+        assert removed == ["20260101_000000", "20261010_000000"]
+        assert sorted(os.listdir(tmp_path)) == ["20261015_000000", "20261017_000000"]
+
+    def test_current_run_is_kept(self, tmp_path):
+        now = time.time()
+        self.make_run(tmp_path, "current", 1000, 30, now)
+
+        assert rotate_runs(str(tmp_path), keep=("current",), max_bytes=1, max_age_days=1) == []
+        assert rotate_runs(str(tmp_path / "missing")) == []
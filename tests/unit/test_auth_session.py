@@ -0,0 +1,68 @@
+"""
+test_auth_session.py - Authenticated Session Unit Tests
+KosManager Automated Testing
+"""
+import time
+
+from drivers import AuthenticatedSession
+
+
+class FakeDriver:
+    """Records CDP cookies and navigations; bounces to /login when told to."""
+
+    def __init__(self, reject_first=False):
+        self.cookies = []
+        self.current_url = ""
+        self.reject_next = reject_first
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Network.setCookie":
+            self.cookies.append(params)
+
+    def execute_script(self, script, *args):
+        # Page is always hydrated with no requests in flight
+        return 0 if "PendingRequests" in script else True
+
+    def get(self, url):
+        if self.reject_next:
+            self.reject_next = False
+            self.current_url = url.replace("/dashboard", "/login")
+        else:
+            self.current_url = url
+
+
+def make_session(expiry):
+    """Create a session whose login() hands out one cookie."""
+    session = AuthenticatedSession("http://app.test", "a@b.c", "secret")
+
+    def login(driver):
+        session.cookies = [{"name": "authjs.session-token", "value": "jwt", "expiry": expiry}]
+        session.logins += 1
+        return session
+
+    session.login = login
+    return session
+
+
+class TestAuthenticatedSession:
+    """Unit tests for cookie replay and re-login."""
+
+    def test_logs_in_once_for_many_tests(self):
+        session = make_session(int(time.time()) + 3600)
+        for _ in range(3):
+            driver = session.apply(FakeDriver())
+        assert session.logins == 1
+        assert driver.current_url == "http://app.test/dashboard"
+        assert driver.cookies[0]["url"] == "http://app.test"
+
+    def test_relogs_in_when_cookie_expired(self):
+        session = make_session(int(time.time()) - 10)
+        session.apply(FakeDriver())
+        session.apply(FakeDriver())
+        assert session.logins == 2
+
+    def test_relogs_in_when_redirected_to_login(self):
+        session = make_session(int(time.time()) + 3600)
+        driver = session.apply(FakeDriver(reject_first=True))
+        assert session.logins == 2
+        assert driver.current_url.endswith("/dashboard")
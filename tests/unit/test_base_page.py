@@ -0,0 +1,41 @@
+"""
+test_base_page.py - BasePage Navigation Unit Tests
+KosManager Automated Testing
+"""
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pages.base_page import BasePage
+
+
+class PollingDriver:
+    """A hydrated page that always has one request in flight."""
+
+    def __init__(self):
+        self.network_tracker_installed = True
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script, *args):
+        return 1
+
+
+class TestOpen:
+    """Unit tests for BasePage.open readiness waits."""
+
+    def test_page_that_never_idles_raises(self):
+        driver = PollingDriver()
+        page = BasePage(driver, "http://localhost:3000")
+        page.timeout, page.poll_frequency = 0.2, 0.01
+
+        with pytest.raises(TimeoutException):
+            page.open("/dashboard")
+
+    def test_wait_ready_false_skips_the_wait(self):
+        driver = PollingDriver()
+        page = BasePage(driver, "http://localhost:3000")
+
+        assert page.open("/dashboard", wait_ready=False) is page
+        assert driver.visited == ["http://localhost:3000/dashboard"]
@@ -0,0 +1,57 @@
+"""
+test_bench_bulk_upload.py - Bulk Upload Benchmark Helper Unit Tests
+KosManager Automated Testing
+"""
+import csv
+import json
+
+import pytest
+
+from bench import BulkUploadReport, bulk_sizes, preset_for_upload, request_bytes, write_upload_file
+from seeding import DataFactory
+
+
+@pytest.fixture
+def rows():
+    plan = DataFactory().build(preset_for_upload(12))
+    return DataFactory(seed=1).tenant_upload_rows(plan.rooms)
+
+
+class TestBulkUploadHelpers:
+    """Unit tests for generated upload files and the report."""
+
+    def test_preset_has_only_empty_rooms(self):
+        plan = DataFactory().build(preset_for_upload(12))
+        assert plan.counts() == {"properties": 1, "rooms": 12, "tenants": 0, "invoices": 0}
+
+    def test_rows_fill_every_room_once(self, rows):
+        assert len({row["roomNumber"] for row in rows}) == 12
+
+    def test_csv_matches_template(self, rows, tmp_path):
+        path = write_upload_file(rows, str(tmp_path), "csv")
+        with open(path, newline="") as handle:
+            assert list(csv.DictReader(handle)) == rows
+
+    def test_xlsx_cells_are_text(self, rows, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        path = write_upload_file(rows, str(tmp_path), "xlsx")
+        sheet = openpyxl.load_workbook(path)["Tenants"]
+        values = list(sheet.iter_rows(values_only=True))
+        assert values[0] == ("name", "phoneNumber", "roomNumber", "startDate", "dueDate")
+        assert all(isinstance(cell, str) for row in values[1:] for cell in row)
+        assert values[1][1].startswith("08")
+
+    def test_request_bytes_is_compact_json(self, rows):
+        assert request_bytes(rows) == len(json.dumps({"tenants": rows}).replace(", ", ",")
+                                          .replace(": ", ":"))
+
+    def test_sizes_from_environment(self, monkeypatch):
+        monkeypatch.setenv("TEST_BULK_SIZES", "5,50")
+        assert bulk_sizes() == [5, 50]
+
+    def test_report_rows_per_second(self, tmp_path):
+        report = BulkUploadReport(str(tmp_path / "bulk.csv"))
+        row = report.add("api", "json", 100, 2.0, server_s=1.5, body_bytes=9000)
+        assert row["rows_per_s"] == 50.0
+        assert row["server_ms"] == 1500.0
+        assert row["parse_ms"] is None
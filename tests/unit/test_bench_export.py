@@ -0,0 +1,93 @@
+"""
+test_bench_export.py - Export Benchmark Helper Unit Tests
+KosManager Automated Testing
+"""
+import os
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from bench import ExportReport, preset_for_export
+from drivers import DownloadWatcher
+from perf import MetricsSampler
+
+MB = 1024 * 1024
+
+
+class FakeDriver:
+    """Answers the CDP commands used by DownloadWatcher and MetricsSampler."""
+
+    def __init__(self, heap_samples=()):
+        self.commands = []
+        self.heap_samples = list(heap_samples)
+        self.script = 0.0
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        if command != "Performance.getMetrics":
+            return {}
+        heap = self.heap_samples.pop(0) if len(self.heap_samples) > 1 else self.heap_samples[0]
+        self.script += 0.25
+        return {"metrics": [{"name": "JSHeapUsedSize", "value": heap},
+                            {"name": "ScriptDuration", "value": self.script}]}
+
+
+class TestDownloadWatcher:
+    """Unit tests for the managed download directory."""
+
+    def test_start_redirects_downloads(self, tmp_path):
+        directory = tmp_path / "export"
+        directory.mkdir()
+        (directory / "old.csv").write_text("stale")
+        driver = FakeDriver()
+        watcher = DownloadWatcher(driver, str(directory)).start()
+        assert watcher.files() == []
+        assert driver.commands[0] == ("Browser.setDownloadBehavior",
+                                      {"behavior": "allow", "downloadPath": str(directory)})
+
+    def test_waits_for_complete_file(self, tmp_path):
+        watcher = DownloadWatcher(FakeDriver(), str(tmp_path / "export")).start()
+        partial = os.path.join(watcher.directory, "data_penyewa_2025-01-01.csv.crdownload")
+        open(partial, "w").write("a,b\n")
+        polls = []
+
+        def finish_download(driver):
+            polls.append(driver)
+            if len(polls) == 2:
+                os.rename(partial, partial[:-len(".crdownload")])
+
+        path = watcher.wait_for_file("data_penyewa_*.csv", timeout=5, poll=0.01,
+                                     on_poll=finish_download)
+        assert path.endswith("data_penyewa_2025-01-01.csv")
+        assert len(polls) >= 3
+
+    def test_times_out_without_file(self, tmp_path):
+        watcher = DownloadWatcher(FakeDriver(), str(tmp_path / "export")).start()
+        with pytest.raises(TimeoutException):
+            watcher.wait_for_file("*.xlsx", timeout=0.1, poll=0.01)
+
+
+class TestExportHelpers:
+    """Unit tests for metrics sampling and export sizes."""
+
+    def test_sampler_tracks_peak_heap(self):
+        driver = FakeDriver(heap_samples=[10 * MB, 50 * MB, 20 * MB])
+        sampler = MetricsSampler(driver).start()
+        sampler.sample()
+        summary = sampler.stop()
+        assert summary["heap_before_mb"] == 10.0
+        assert summary["heap_peak_mb"] == 50.0
+        assert summary["heap_after_mb"] == 20.0
+        assert summary["script_ms"] == 500.0
+        assert driver.commands[0][0] == "Performance.enable"
+
+    def test_export_presets(self):
+        assert preset_for_export(100).expected_counts()["tenants"] == 100
+        assert preset_for_export(10_000).plan == "pro"
+
+    def test_report_row(self, tmp_path):
+        report = ExportReport(str(tmp_path / "export.csv"))
+        row = report.add("csv", 100, 0.5, 4096, {"heap_peak_mb": 12.5})
+        assert row["time_to_file_ms"] == 500.0
+        assert row["heap_peak_mb"] == 12.5
+        assert row["script_ms"] is None
@@ -0,0 +1,35 @@
+"""
+test_bench_scaling.py - Scaling Benchmark Helper Unit Tests
+KosManager Automated Testing
+"""
+import csv
+
+from bench import INVOICE_SIZES, ScalingReport, growth_exponents, preset_for_invoices
+
+
+class TestScalingHelpers:
+    """Unit tests for account sizing, slopes and the CSV report."""
+
+    def test_presets_hold_requested_invoices(self):
+        for size in INVOICE_SIZES:
+            assert preset_for_invoices(size).expected_counts()["invoices"] == size
+
+    def test_only_large_accounts_need_pro(self):
+        assert preset_for_invoices(1_000).plan == "free"
+        assert preset_for_invoices(10_000).plan == "pro"
+
+    def test_growth_exponents(self):
+        points = [(10, 0.1), (100, 0.1), (1000, 1.0), (10000, 100.0)]
+        assert [exponent for _, _, exponent in growth_exponents(points)] == [0.0, 1.0, 2.0]
+
+    def test_report_csv(self, tmp_path):
+        report = ScalingReport(str(tmp_path / "scaling.csv"))
+        report.add("/api/invoices", preset_for_invoices(100), [0.2, 0.1, 0.3], 5120)
+        report.add("/api/invoices", preset_for_invoices(10), [0.05], 512)
+        assert report.curve("/api/invoices") == [(100, 0.2), (10, 0.05)]
+
+        with open(report.write(), newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        assert [row["invoices"] for row in rows] == ["10", "100"]
+        assert rows[1]["median_ms"] == "200.0"
+        assert rows[1]["p95_ms"] == "300.0"
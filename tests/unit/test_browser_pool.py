@@ -0,0 +1,74 @@
+"""
+test_browser_pool.py - Browser Pool Unit Tests
+KosManager Automated Testing
+"""
+from selenium.common.exceptions import WebDriverException
+
+from drivers import BrowserPool, WorkerWorkspace
+
+
+class FakeDriver:
+    """Minimal stand-in for a WebDriver instance."""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    @property
+    def current_window_handle(self):
+        if not self.alive:
+            raise WebDriverException("browser crashed")
+        return "handle"
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(tmp_path, **kwargs):
+    """Create a pool whose factory hands out FakeDrivers."""
+    started = []
+
+    def factory(workspace):
+        driver = FakeDriver()
+        started.append(driver)
+        return driver
+
+    workspace = WorkerWorkspace(worker_id="gw0", run_id="unit", reports_dir=str(tmp_path))
+    pool = BrowserPool(factory, workspace, **kwargs).start()
+    return pool, started
+
+
+class TestBrowserPool:
+    """Unit tests for BrowserPool recycling."""
+
+    def test_reuses_browser_between_tests(self, tmp_path):
+        pool, started = make_pool(tmp_path, recycle_after=0, prewarm=False)
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        assert len(started) == 1
+
+    def test_recycles_after_n_tests(self, tmp_path):
+        pool, started = make_pool(tmp_path, recycle_after=2, prewarm=False)
+        first = pool.acquire()
+        pool.release(first)
+        pool.release(pool.acquire())
+        assert first.quit_called
+        assert pool.acquire() is not first
+        assert pool.recycled == 1
+
+    def test_replaces_crashed_browser_with_spare(self, tmp_path):
+        pool, started = make_pool(tmp_path, recycle_after=0, prewarm=True)
+        first = pool.acquire()
+        first.alive = False
+        pool.release(first)
+        replacement = pool.acquire()
+        assert replacement is started[1]
+        pool.shutdown()
+        assert replacement.quit_called
+
+    def test_worker_directories_are_isolated(self, tmp_path):
+        pool, _ = make_pool(tmp_path, prewarm=False)
+        other = WorkerWorkspace(worker_id="gw1", run_id="unit", reports_dir=str(tmp_path))
+        assert pool.workspace.downloads_dir != other.downloads_dir
+        assert "gw0" in pool.workspace.artifacts_dir
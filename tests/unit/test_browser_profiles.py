@@ -0,0 +1,37 @@
+"""
+test_browser_profiles.py - Browser Profile Unit Tests
+KosManager Automated Testing
+"""
+import pytest
+from selenium.webdriver.chrome.options import Options
+
+from drivers import get_profile
+from drivers.profiles import ProfileTimings
+
+
+class TestBrowserProfiles:
+    """Unit tests for TEST_BROWSER_PROFILE selection."""
+
+    def test_debug_is_default(self, monkeypatch):
+        monkeypatch.delenv("TEST_BROWSER_PROFILE", raising=False)
+        assert get_profile().name == "debug"
+
+    def test_fast_profile_is_headless_with_fixed_viewport(self):
+        options = get_profile("fast").apply(Options())
+        assert "--headless=new" in options.arguments
+        assert "--window-size=1366,768" in options.arguments
+        assert "--start-maximized" not in options.arguments
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError):
+            get_profile("turbo")
+
+    def test_timings_summary(self):
+        timings = ProfileTimings("fast")
+        timings.record_startup(1.0)
+        timings.record_page_load("/dashboard", 0.4)
+        timings.record_page_load("/login", 0.2)
+        summary = timings.summary()
+        assert summary["startups"] == 1
+        assert summary["startup_total_s"] == 1.0
+        assert summary["page_load_median_s"] == 0.3
@@ -0,0 +1,195 @@
+"""
+test_cdp_recorder.py - CDP Instrumentation Unit Tests
+KosManager Automated Testing
+"""
+import json
+
+from pages.instrumentation import InstrumentedPageMixin
+from perf import CdpRecorder, parse_network_events
+from perf.cdp import summarize
+
+BASE = "http://localhost:3000"
+
+
+def log_entry(method, **params):
+    """One chromedriver performance log entry."""
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def sent(request_id, url, timestamp, method="GET", **params):
+    return log_entry("Network.requestWillBeSent", requestId=request_id, timestamp=timestamp,
+                     type=params.pop("type", "Fetch"),
+                     request={"url": url, "method": method}, **params)
+
+
+def received(request_id, status=200, **response):
+    response.setdefault("protocol", "h2")
+    return log_entry("Network.responseReceived", requestId=request_id,
+                     response={"status": status, **response})
+
+
+def finished(request_id, timestamp, size):
+    return log_entry("Network.loadingFinished", requestId=request_id, timestamp=timestamp,
+                     encodedDataLength=size)
+
+
+class FakeDriver:
+    """Serves a performance log once and a fixed list of long tasks."""
+
+    def __init__(self, entries=(), long_tasks=()):
+        self.entries = list(entries)
+        self.long_tasks = list(long_tasks)
+        self.commands = []
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_script(self, script):
+        tasks, self.long_tasks = self.long_tasks, []
+        return tasks
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        if command == "Performance.getMetrics":
+            return {"metrics": [{"name": "JSHeapUsedSize", "value": 8 * 1024 * 1024}]}
+        return {}
+
+
+class FakeItem:
+    nodeid = "tests/test_dashboard.py::test_TC_DASH_01"
+
+
+class TestParseNetworkEvents:
+    """Unit tests for turning Network.* events into requests."""
+
+    def test_finished_request(self):
+        requests = parse_network_events([
+            sent("1", f"{BASE}/api/properties", 10.0),
+            received("1", timing={"sendStart": 2.0, "receiveHeadersEnd": 42.5}),
+            finished("1", 10.120, 2048),
+        ])
+
+        assert requests == [{
+            "url": f"{BASE}/api/properties", "method": "GET", "type": "Fetch", "status": 200,
+            "protocol": "h2", "duration_ms": 120.0, "ttfb_ms": 40.5, "transfer_bytes": 2048,
+            "cache": None, "failed": None,
+        }]
+
+    def test_cache_sources(self):
+        requests = parse_network_events([
+            sent("1", f"{BASE}/_next/static/app.js", 1.0),
+            log_entry("Network.requestServedFromCache", requestId="1"),
+            received("1", fromDiskCache=True),
+            finished("1", 1.001, 0),
+            sent("2", f"{BASE}/logo.png", 1.0),
+            received("2", fromDiskCache=True),
+            finished("2", 1.002, 0),
+            sent("3", f"{BASE}/sw.js", 1.0),
+            received("3", fromServiceWorker=True),
+            finished("3", 1.003, 0),
+        ])
+
+        assert [request["cache"] for request in requests] == ["memory", "disk", "service-worker"]
+
+    def test_failed_and_unfinished_requests(self):
+        requests = parse_network_events([
+            sent("1", f"{BASE}/api/invoices", 1.0, method="POST"),
+            log_entry("Network.loadingFailed", requestId="1", timestamp=1.5,
+                      errorText="net::ERR_CONNECTION_REFUSED"),
+            sent("2", f"{BASE}/api/tenants", 1.0),
+            log_entry("Page.frameNavigated", frame={}),
+        ])
+
+        assert len(requests) == 1
+        assert requests[0]["failed"] == "net::ERR_CONNECTION_REFUSED"
+        assert requests[0]["duration_ms"] == 500.0
+
+    def test_redirect_closes_previous_hop(self):
+        requests = parse_network_events([
+            sent("1", f"{BASE}/dashboard", 1.0, type="Document"),
+            sent("1", f"{BASE}/login", 1.2, type="Document",
+                 redirectResponse={"status": 307}),
+            received("1"),
+            finished("1", 1.5, 900),
+        ])
+
+        assert [(request["url"], request["status"]) for request in requests] == [
+            (f"{BASE}/dashboard", 307), (f"{BASE}/login", 200)]
+        assert requests[0]["duration_ms"] == 200.0
+
+
+class TestSummary:
+    """Unit tests for the per-test summary."""
+
+    def test_summarize(self):
+        requests = parse_network_events([
+            sent("1", f"{BASE}/api/properties", 1.0), received("1"), finished("1", 1.3, 100),
+            sent("2", f"{BASE}/api/rooms", 1.0), received("2", status=500), finished("2", 1.1, 50),
+            sent("3", f"{BASE}/app.js", 1.0), received("3", fromDiskCache=True),
+            finished("3", 1.01, 0),
+        ])
+        long_tasks = [{"start": 1, "duration": 80, "url": "/dashboard"},
+                      {"start": 5, "duration": 120.5, "url": "/dashboard"}]
+
+        summary = summarize(requests, long_tasks, {"JSHeapUsedSize": 3 * 1024 * 1024})
+
+        assert summary["requests"]["count"] == 3
+        assert summary["requests"]["api_calls"] == 2
+        assert summary["requests"]["transfer_bytes"] == 150
+        assert summary["requests"]["cache_hits"] == 1
+        assert summary["requests"]["errors"] == [f"500 {BASE}/api/rooms"]
+        assert summary["requests"]["slowest"][0]["url"] == f"{BASE}/api/properties"
+        assert summary["long_tasks"] == {"count": 2, "total_ms": 200.5, "longest_ms": 120.5,
+                                         "by_route": {"/dashboard": 2}}
+        assert summary["js_heap"]["used_mb"] == 3.0
+
+    def test_recorder_appends_one_line_per_test(self, tmp_path):
+        path = tmp_path / "run" / "cdp.jsonl"
+        recorder = CdpRecorder(str(path), "run1", "gw0")
+        driver = FakeDriver(entries=[sent("0", f"{BASE}/", 0.5), finished("0", 0.6, 10)],
+                            long_tasks=[{"start": 0, "duration": 60, "url": "/"}])
+
+        recorder.begin(driver, FakeItem())
+        driver.entries = [sent("1", f"{BASE}/api/properties", 1.0), received("1"),
+                          finished("1", 1.2, 300)]
+        driver.long_tasks = [{"start": 3, "duration": 75, "url": "/dashboard"}]
+        summary = recorder.finish(driver)
+        recorder.end()
+
+        assert driver.commands[0] == "Page.addScriptToEvaluateOnNewDocument"
+        assert summary["requests"]["count"] == 1
+        assert summary["long_tasks"]["count"] == 1
+        assert summary["test"] == FakeItem.nodeid
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["worker"] == "gw0"
+
+
+class TestInstrumentedPageMixin:
+    """Unit tests for the page object accessors."""
+
+    class Page(InstrumentedPageMixin):
+        def __init__(self, driver):
+            self.driver = driver
+
+    def test_without_recorder(self):
+        page = self.Page(FakeDriver())
+
+        assert not page.is_instrumented()
+        assert page.network_requests() == []
+        assert page.long_tasks() == []
+
+    def test_with_recorder(self, tmp_path):
+        driver = FakeDriver()
+        driver.cdp_recorder = CdpRecorder(str(tmp_path / "cdp.jsonl"), "run1", "gw0")
+        driver.cdp_recorder.begin(driver, FakeItem())
+        driver.entries = [
+            sent("1", f"{BASE}/api/tenants", 1.0), received("1"), finished("1", 1.4, 10),
+            sent("2", f"{BASE}/app.js", 1.0), received("2"), finished("2", 1.1, 10),
+        ]
+        page = self.Page(driver)
+
+        assert page.is_instrumented()
+        assert [request["url"] for request in page.api_requests()] == [f"{BASE}/api/tenants"]
+        assert page.slowest_requests(1)[0]["duration_ms"] == 400.0
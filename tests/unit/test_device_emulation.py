@@ -0,0 +1,109 @@
+"""
+test_device_emulation.py - Phone Emulation & Tap Latency Unit Tests
+KosManager Automated Testing
+"""
+import pytest
+
+from bench import DeviceReport, device_matrix
+from drivers import DEVICES, get_device, reset_device
+from perf import measure_tap, tap_latency
+
+
+class FakeDriver:
+    """Records CDP commands and serves buffered Event Timing entries."""
+
+    def __init__(self, interactions=()):
+        self.commands = []
+        self.interactions = list(interactions)
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {}
+
+    def execute_script(self, script):
+        entries, self.interactions = self.interactions, []
+        return entries
+
+
+def event(name, duration, input_delay=2.0):
+    return {"name": name, "start": 100.0, "input_delay": input_delay, "processing": 5.0,
+            "duration": duration}
+
+
+class TestDeviceProfile:
+    """Unit tests for the phone profiles."""
+
+    def test_apply_and_reset(self):
+        driver = FakeDriver()
+
+        DEVICES["redmi-9a"].apply(driver)
+        commands = dict(driver.commands)
+        assert commands["Emulation.setDeviceMetricsOverride"]["width"] == 360
+        assert commands["Emulation.setDeviceMetricsOverride"]["mobile"] is True
+        assert commands["Emulation.setCPUThrottlingRate"] == {"rate": 6}
+        assert "Android" in commands["Emulation.setUserAgentOverride"]["userAgent"]
+        assert driver.device.name == "redmi-9a"
+
+        reset_device(driver)
+        assert driver.commands[-1] == ("Emulation.setCPUThrottlingRate", {"rate": 1})
+        assert driver.device is None
+
+    def test_every_phone_uses_bottom_nav(self):
+        assert all(device.is_mobile_layout() for device in DEVICES.values())
+
+    def test_selection(self, monkeypatch):
+        monkeypatch.delenv("TEST_DEVICE", raising=False)
+        assert get_device() is None
+        assert get_device("desktop") is None
+
+        monkeypatch.setenv("TEST_DEVICE", "galaxy-a12")
+        assert get_device().cpu_throttle == 4
+
+        with pytest.raises(ValueError, match="pixel-7"):
+            get_device("nokia-3310")
+
+
+class TestTapLatency:
+    """Unit tests for tap-to-next-paint measurement."""
+
+    def test_slowest_tap_event_wins(self):
+        latency = tap_latency([event("pointerdown", 24.0), event("click", 88.0, input_delay=31.5),
+                               event("keydown", 400.0)])
+
+        assert latency == {"input_delay_ms": 31.5, "next_paint_ms": 88.0, "events": 2}
+
+    def test_fast_tap_has_no_entries(self):
+        assert tap_latency([])["next_paint_ms"] == 0.0
+
+    def test_measure_tap_drops_earlier_entries(self):
+        driver = FakeDriver(interactions=[event("click", 500.0)])
+
+        def tap():
+            driver.interactions = [event("click", 40.0)]
+
+        latency = measure_tap(driver, tap)
+
+        assert latency["next_paint_ms"] == 40.0
+        assert latency["route_ms"] >= 0
+
+
+class TestDeviceReport:
+    """Unit tests for the per-device report."""
+
+    def test_rows_by_device_then_route(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("TEST_DEVICES", raising=False)
+        assert device_matrix()[0] == "desktop"
+        report = DeviceReport(str(tmp_path / "devices.csv"))
+        taps = [{"route_ms": 300.0, "input_delay_ms": 10.0, "next_paint_ms": 60.0},
+                {"route_ms": 500.0, "input_delay_ms": 30.0, "next_paint_ms": 120.0},
+                {"route_ms": 400.0, "input_delay_ms": 20.0, "next_paint_ms": 90.0}]
+
+        report.add(DEVICES["redmi-9a"], "tenants", taps)
+        report.add(None, "properties", taps)
+        row = report.rows[0]
+
+        assert row["viewport"] == "360x720"
+        assert row["route_median_ms"] == 400.0
+        assert row["next_paint_max_ms"] == 120.0
+        lines = open(report.write()).read().splitlines()
+        assert [line.split(",")[0] for line in lines[1:]] == ["desktop", "redmi-9a"]
@@ -0,0 +1,69 @@
+"""
+test_driver_resolver.py - Chromedriver Resolver Unit Tests
+KosManager Automated Testing
+"""
+import os
+import stat
+
+import pytest
+
+from drivers import DriverResolver, DriverResolutionError
+
+
+def make_binary(tmp_path, name="chromedriver"):
+    """Create a fake executable chromedriver binary."""
+    path = tmp_path / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+class TestDriverResolver:
+    """Unit tests for DriverResolver caching and offline mode."""
+
+    def test_downloads_once_then_uses_cache(self, tmp_path):
+        binary = make_binary(tmp_path)
+        calls = []
+
+        def installer():
+            calls.append(1)
+            return binary
+
+        cache_file = str(tmp_path / "cache.json")
+        first = DriverResolver(cache_file=cache_file, explicit_path=None, offline=False,
+                               installer=installer, version_detector=lambda: "131.0.6778")
+        assert first.resolve().source == "download"
+
+        second = DriverResolver(cache_file=cache_file, explicit_path=None, offline=False,
+                                installer=installer, version_detector=lambda: "131.0.6778")
+        resolution = second.resolve()
+        assert resolution.source == "cache"
+        assert resolution.path == binary
+        assert len(calls) == 1
+
+    def test_new_chrome_version_misses_cache(self, tmp_path):
+        binary = make_binary(tmp_path)
+        cache_file = str(tmp_path / "cache.json")
+        DriverResolver(cache_file=cache_file, explicit_path=None, offline=False,
+                       installer=lambda: binary, version_detector=lambda: "130.0.1").resolve()
+        resolver = DriverResolver(cache_file=cache_file, explicit_path=None, offline=False,
+                                  installer=lambda: binary, version_detector=lambda: "131.0.1")
+        assert resolver.resolve().source == "download"
+
+    def test_offline_without_cache_fails_fast(self, tmp_path):
+        def installer():
+            raise AssertionError("offline mode must not download")
+
+        resolver = DriverResolver(cache_file=str(tmp_path / "cache.json"), explicit_path=None,
+                                  offline=True, installer=installer,
+                                  version_detector=lambda: "131.0.1")
+        with pytest.raises(DriverResolutionError):
+            resolver.resolve()
+
+    def test_explicit_path_wins(self, tmp_path):
+        binary = make_binary(tmp_path, "custom-driver")
+        resolver = DriverResolver(cache_file=str(tmp_path / "cache.json"), explicit_path=binary,
+                                  offline=True, installer=None, version_detector=lambda: None)
+        resolution = resolver.resolve()
+        assert resolution.path == binary
+        assert not os.path.exists(tmp_path / "cache.json")
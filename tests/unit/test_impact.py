@@ -0,0 +1,245 @@
+"""
+test_impact.py - Test-Impact Selection Unit Tests
+KosManager Automated Testing
+"""
+import subprocess
+
+import pytest
+
+from bench.scaling import measure
+from impact import (
+    ImpactError,
+    ImpactSelector,
+    SourceGraph,
+    StaticTestMap,
+    VisitLog,
+    VisitMap,
+    analyze,
+    changed_files,
+)
+
+SOURCES = {
+    "src/app/layout.tsx": 'import "./globals.css";\nimport { Providers } from "@/components/providers";\n',
+    "src/app/globals.css": "body {}\n",
+    "src/app/page.tsx": "export default function Home() {}\n",
+    "src/app/login/page.tsx": 'import { signIn } from "next-auth/react";\nsignIn("credentials");\n',
+    "src/app/dashboard/layout.tsx": 'import { Nav } from "@/components/nav";\n',
+    "src/app/dashboard/page.tsx": "export default function Dashboard() {}\n",
+    "src/app/dashboard/invoices/page.tsx": 'import {\n  Actions,\n} from "@/components/invoices/actions";\n',
+    "src/app/dashboard/properties/new/page.tsx": "export default function New() {}\n",
+    "src/app/dashboard/properties/[id]/page.tsx": 'import { Card } from "../../../../components/card";\n',
+    "src/app/api/invoices/[id]/route.ts": 'import { db } from "@/lib/db";\n',
+    "src/app/api/auth/[...nextauth]/route.ts": 'import { handlers } from "@/lib/auth";\n',
+    "src/components/providers.tsx": "export function Providers() {}\n",
+    "src/components/nav.tsx": "export function Nav() {}\n",
+    "src/components/card.tsx": "export function Card() {}\n",
+    "src/components/unused.tsx": 'import { Card } from "./card";\n',
+    "src/components/invoices/actions.tsx": "fetch(`/api/invoices/${invoice.id}`, { method: \"PATCH\" });\n",
+    "src/lib/db.ts": "export const db = {};\n",
+    "src/lib/auth.ts": 'import { db } from "./db";\n',
+}
+
+
+@pytest.fixture
+def app(tmp_path):
+    for path, text in SOURCES.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(text)
+    return SourceGraph(str(tmp_path))
+
+
+class TestSourceGraph:
+    """Unit tests for the route → source file map."""
+
+    def test_routes_and_matching(self, app):
+        assert sorted(app.routes) == [
+            "/", "/api/auth/[...nextauth]", "/api/invoices/[id]", "/dashboard",
+            "/dashboard/invoices", "/dashboard/properties/[id]", "/dashboard/properties/new", "/login",
+        ]
+        assert app.route_of("/dashboard/properties/new") == "/dashboard/properties/new"
+        assert app.route_of("/dashboard/properties/9b1d?tab=rooms") == "/dashboard/properties/[id]"
+        assert app.route_of("/api/auth/callback/credentials") == "/api/auth/[...nextauth]"
+        assert app.route_of("/nope") is None
+
+    def test_closure_follows_imports_layouts_and_fetches(self, app):
+        files = app.closure("/dashboard/invoices")
+
+        assert {"src/app/layout.tsx", "src/app/globals.css", "src/components/providers.tsx",
+                "src/app/dashboard/layout.tsx", "src/components/nav.tsx",
+                "src/components/invoices/actions.tsx", "src/app/api/invoices/[id]/route.ts",
+                "src/lib/db.ts"} <= files
+        assert "src/components/card.tsx" not in files
+
+    def test_routes_for(self, app):
+        assert app.routes_for("src/components/invoices/actions.tsx") == {"/dashboard/invoices"}
+        assert app.routes_for("src/components/card.tsx") == {"/dashboard/properties/[id]"}
+        assert app.routes_for("src/lib/auth.ts") == {"/api/auth/[...nextauth]", "/login"}
+        assert app.routes_for("src/components/unused.tsx") == set()
+
+
+class TestAnalyze:
+    """Unit tests for classifying changed files."""
+
+    def test_component_change_maps_to_its_routes(self, app):
+        impact = analyze(["src/components/nav.tsx", "README.md", "docs/setup.md",
+                          "tests/test_03_dashboard.py"], app)
+
+        assert not impact.full
+        assert impact.routes == {"/dashboard", "/dashboard/invoices", "/dashboard/properties/[id]",
+                                 "/dashboard/properties/new"}
+        assert impact.test_modules == {"tests/test_03_dashboard.py"}
+
+    @pytest.mark.parametrize("path", [
+        "package.json", "next.config.ts", "src/components/unused.tsx", "src/middleware.ts",
+        "tests/conftest.py", "tests/pages/dashboard_pages.py",
+    ])
+    def test_unknown_changes_run_everything(self, app, path):
+        impact = analyze(["src/components/nav.tsx", path], app)
+
+        assert impact.full
+        assert path in impact.reason
+
+
+class TestSelection:
+    """Unit tests for picking the affected tests."""
+
+    @pytest.fixture
+    def selector(self, app, tmp_path):
+        module = tmp_path / "tests" / "test_sample.py"
+        module.parent.mkdir()
+        module.write_text(
+            "from pages import DashboardPage, NewPropertyPage\n\n"
+            "ROUTES = [\"/api/invoices\", \"/dashboard\"]\n\n\n"
+            "def open_form(driver):\n"
+            "    NewPropertyPage(driver).open()\n\n\n"
+            "class TestSample:\n"
+            "    def test_dashboard(self, driver):\n"
+            "        DashboardPage(driver).open()\n\n"
+            "    def test_form(self, driver):\n"
+            "        open_form(driver)\n\n"
+            "    def test_invoice(self, api_client):\n"
+            "        api_client.update_invoice_status('x', 'paid')\n\n"
+            "    def test_unknown(self, driver):\n"
+            "        pass\n\n"
+            "    def test_measure(self, api_client, base_url):\n"
+            "        for route in ROUTES:\n"
+            "            measure(api_client.http, f\"{base_url}{route}\")\n"
+        )
+        visits = VisitMap("unused.json", {
+            "tests/test_sample.py::TestSample::test_dashboard": ["/dashboard/invoices"],
+        })
+
+        def make(changed):
+            return ImpactSelector(analyze(changed, app), app, StaticTestMap(root=str(tmp_path)),
+                                  visits, ("tests/unit/",))
+        return make
+
+    def affected(self, selector, name, fixturenames=()):
+        return selector.affected("tests/test_sample.py", f"TestSample::{name}",
+                                 f"tests/test_sample.py::TestSample::{name}", fixturenames)
+
+    def test_only_tests_on_changed_routes_run(self, selector):
+        chosen = selector(["src/components/invoices/actions.tsx"])
+
+        assert self.affected(chosen, "test_dashboard")  # recorded visit
+        assert not self.affected(chosen, "test_invoice")
+        assert not self.affected(chosen, "test_form")
+        assert self.affected(chosen, "test_unknown")  # nothing known: always runs
+        assert not chosen.affected("tests/unit/test_x.py", "test_y", "tests/unit/test_x.py::test_y")
+
+    def test_api_route_change_reaches_pages_that_fetch_it(self, selector):
+        chosen = selector(["src/app/api/invoices/[id]/route.ts"])
+
+        assert self.affected(chosen, "test_invoice")  # PATCH /api/invoices/x
+        assert self.affected(chosen, "test_dashboard")  # /dashboard/invoices fetches it
+        assert not self.affected(chosen, "test_form")
+
+    def test_helpers_and_fixtures_count(self, selector):
+        chosen = selector(["src/app/dashboard/properties/new/page.tsx"])
+
+        assert self.affected(chosen, "test_form")
+        assert not self.affected(chosen, "test_dashboard")
+        assert not self.affected(chosen, "test_dashboard", ["logged_in"])
+        assert self.affected(selector(["src/lib/auth.ts"]), "test_form", ["logged_in"])
+
+    def test_module_constants_count(self, selector):
+        assert self.affected(selector(["src/app/dashboard/page.tsx"]), "test_measure")
+        assert not self.affected(selector(["src/app/dashboard/properties/new/page.tsx"]), "test_measure")
+
+    def test_scaling_benchmark_follows_the_dashboard(self):
+        """BM001-01 times /dashboard through SCALING_ROUTES and bench.scaling.measure."""
+        graph = SourceGraph()
+        relpath = "tests/benchmarks/test_scaling_invoices.py"
+        qualname = "TestInvoiceScaling::test_BM001_01_measure_routes"
+        chosen = ImpactSelector(analyze(["src/app/dashboard/page.tsx"], graph), graph,
+                                StaticTestMap(), VisitMap("unused.json"), ("tests/unit/",))
+
+        assert chosen.affected(relpath, qualname, f"{relpath}::{qualname}[10_invoices]",
+                               ["seeded_owner", "base_url", "scaling_report"])
+
+    def test_changed_module_and_full_suite(self, selector):
+        assert self.affected(selector(["tests/test_sample.py"]), "test_form")
+        assert self.affected(selector(["package-lock.json"]), "test_form")
+        assert selector(["tests/unit/test_x.py"]).affected(
+            "tests/unit/test_x.py", "test_y", "tests/unit/test_x.py::test_y")
+
+
+class TestVisits:
+    """Unit tests for recording visited paths."""
+
+    def test_log_records_only_while_active(self):
+        log = VisitLog()
+        log.record("http://localhost:3000/dashboard")
+        log.begin()
+        log.record("http://localhost:3000/dashboard/properties?page=2")
+        log.record("/api/properties")
+
+        assert log.end() == ["/api/properties", "/dashboard/properties"]
+        assert not log.active
+
+    def test_scaling_measure_is_recorded(self):
+        class Response:
+            status_code = 200
+            content = b"{}"
+
+        class Http:
+            def get(self, url, **kwargs):
+                return Response()
+
+        log = VisitLog()
+        log.begin()
+        measure(Http(), "http://localhost:3000/dashboard", repeats=1, warmup=0, recorder=log)
+
+        assert log.end() == ["/dashboard"]
+
+    def test_map_round_trip(self, tmp_path):
+        visits = VisitMap(str(tmp_path / "impact.json"))
+        visits.update("tests/test_a.py::test_a", ["/login", "/dashboard", "/login"])
+        visits.save()
+
+        assert VisitMap.load(visits.path).paths("tests/test_a.py::test_a") == ["/dashboard", "/login"]
+        assert VisitMap.load(str(tmp_path / "missing.json")).tests == {}
+
+
+class TestChangedFiles:
+    """Unit tests for reading the branch diff from git."""
+
+    def git(self, root, *args):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=root,
+                       check=True, capture_output=True)
+
+    def test_committed_uncommitted_and_untracked(self, tmp_path):
+        self.git(tmp_path, "init", "-q", "-b", "main")
+        (tmp_path / "a.ts").write_text("a\n")
+        (tmp_path / "b.ts").write_text("b\n")
+        self.git(tmp_path, "add", ".")
+        self.git(tmp_path, "commit", "-q", "-m", "base")
+        self.git(tmp_path, "checkout", "-q", "-b", "feature")
+        self.git(tmp_path, "mv", "a.ts", "c.ts")
+        self.git(tmp_path, "commit", "-q", "-m", "rename")
+        (tmp_path / "b.ts").write_text("changed\n")
+        (tmp_path / "d.ts").write_text("new\n")
+
+        assert changed_files("main", root=str(tmp_path)) == ["a.ts", "b.ts", "c.ts", "d.ts"]
+        with pytest.raises(ImpactError):
+            changed_files("no-such-ref", root=str(tmp_path))
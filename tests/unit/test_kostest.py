@@ -0,0 +1,140 @@
+"""
+test_kostest.py - Cross-Platform Test Runner Unit Tests
+KosManager Automated Testing
+"""
+import json
+import subprocess
+
+import pytest
+
+from kostest import (
+    InstallError,
+    InstallStamp,
+    PhaseTimer,
+    RunPlan,
+    auto_profile,
+    auto_workers,
+    breakdown_lines,
+    browser_startups,
+    build_plan,
+    ci_shard,
+    ensure_requirements,
+    requirements_hash,
+)
+
+GIB = 1024 ** 3
+
+
+class FakePip:
+    def __init__(self, returncode=0):
+        self.returncode = returncode
+        self.calls = []
+
+    def __call__(self, command, **kwargs):
+        self.calls.append(command)
+        return subprocess.CompletedProcess(command, self.returncode)
+
+
+class TestInstall:
+    """Unit tests for skipping unchanged installs."""
+
+    def test_hash_ignores_comments_and_line_endings(self, tmp_path):
+        first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+        first.write_text("selenium==4.27.1\npytest==8.3.4\n")
+        second.write_bytes(b"# browser\r\nselenium==4.27.1  # pinned\r\n\r\npytest==8.3.4\r\n")
+
+        assert requirements_hash(str(first)) == requirements_hash(str(second))
+        first.write_text("selenium==4.28.0\npytest==8.3.4\n")
+        assert requirements_hash(str(first)) != requirements_hash(str(second))
+
+    def test_install_runs_once_per_requirements(self, tmp_path, monkeypatch):
+        requirements = tmp_path / "requirements.txt"
+        requirements.write_text("pytest==8.3.4\n")
+        pip = FakePip()
+        monkeypatch.setattr(subprocess, "run", pip)
+        stamp_path = str(tmp_path / "stamp.json")
+
+        assert ensure_requirements("/venv/bin/python", str(requirements), InstallStamp.load(stamp_path))
+        assert not ensure_requirements("/venv/bin/python", str(requirements), InstallStamp.load(stamp_path))
+        assert ensure_requirements("/other/python", str(requirements), InstallStamp.load(stamp_path))
+        requirements.write_text("pytest==8.3.5\n")
+        assert ensure_requirements("/venv/bin/python", str(requirements), InstallStamp.load(stamp_path))
+
+        assert len(pip.calls) == 3
+        assert pip.calls[0][:5] == ["/venv/bin/python", "-m", "pip", "install", "-r"]
+
+    def test_failed_install_is_not_stamped(self, tmp_path, monkeypatch):
+        requirements = tmp_path / "requirements.txt"
+        requirements.write_text("pytest==8.3.4\n")
+        monkeypatch.setattr(subprocess, "run", FakePip(returncode=1))
+        stamp = InstallStamp.load(str(tmp_path / "stamp.json"))
+
+        with pytest.raises(InstallError):
+            ensure_requirements("python", str(requirements), stamp)
+        assert stamp.installed == {}
+
+
+class TestPlan:
+    """Unit tests for picking workers, profile and shard."""
+
+    def test_workers(self):
+        assert auto_workers(cpus=8, memory=32 * GIB, ci=True) == 8
+        assert auto_workers(cpus=8, memory=32 * GIB) == 4
+        assert auto_workers(cpus=16, memory=3 * GIB, ci=True) == 3
+        assert auto_workers(cpus=64, memory=None, ci=True) == 8
+        assert auto_workers(cpus=1, memory=GIB // 2) == 1
+
+    def test_profile(self):
+        assert auto_profile(1, {"DISPLAY": ":0"}, "linux") == "debug"
+        assert auto_profile(1, {}, "win32") == "debug"
+        assert auto_profile(1, {}, "linux") == "ci"
+        assert auto_profile(4, {"DISPLAY": ":0"}, "linux") == "ci"
+        assert auto_profile(1, {"CI": "true"}, "darwin") == "ci"
+        assert auto_profile(4, {"TEST_BROWSER_PROFILE": "fast"}, "linux") == "fast"
+
+    def test_shard_from_ci(self):
+        assert ci_shard({}) == (1, 1)
+        assert ci_shard({"TEST_SHARDS": "4", "TEST_SHARD": "2"}) == (4, 2)
+        assert ci_shard({"CI_NODE_TOTAL": "3", "CI_NODE_INDEX": "3"}) == (3, 3)
+        assert ci_shard({"CIRCLE_NODE_TOTAL": "3", "CIRCLE_NODE_INDEX": "0"}) == (3, 1)
+        assert ci_shard({"BUILDKITE_PARALLEL_JOB_COUNT": "2", "BUILDKITE_PARALLEL_JOB": "1"}) == (2, 2)
+
+    def test_command(self):
+        plan = RunPlan("smoke", 4, "ci", shards=3, shard=2, run_id="r1", pytest_args=["-k", "login"])
+
+        assert plan.command("python") == [
+            "python", "-m", "pytest", "tests", "-m", "smoke", "-n", "4",
+            "--shards", "3", "--shard", "2", "--no-report-index", "-k", "login"]
+        assert RunPlan("tests/test_05_logout.py", 1, "debug").command("python")[3] == \
+            "tests/test_05_logout.py"
+        env = plan.environment({"PATH": "/bin"})
+        assert (env["TEST_BROWSER_PROFILE"], env["TEST_RUN_ID"]) == ("ci", "r1")
+
+    def test_build_plan_prefers_explicit_settings(self):
+        env = {"CI": "true", "CI_NODE_TOTAL": "2", "CI_NODE_INDEX": "1", "TEST_WORKERS": "3"}
+
+        plan = build_plan("auth", env=env, cpus=8, memory=16 * GIB)
+        assert (plan.workers, plan.profile, plan.shards, plan.shard) == (3, "ci", 2, 1)
+        plan = build_plan("auth", workers=1, profile="fast", shards=1, env=env)
+        assert (plan.workers, plan.profile, plan.shards) == (1, "fast", 1)
+
+
+class TestTiming:
+    """Unit tests for the timing breakdown."""
+
+    def test_breakdown(self, tmp_path):
+        for worker, startups, total in (("gw0", 2, 3.0), ("gw1", 1, 1.5)):
+            (tmp_path / worker).mkdir()
+            (tmp_path / worker / "profile_timings.json").write_text(
+                json.dumps({"profile": "ci", "startups": startups, "startup_total_s": total}))
+        timer = PhaseTimer()
+        timer.phases.update({"setup": 0.2, "tests": 42.0, "reporting": 0.4})
+        timer.note("setup", "requirements unchanged, install skipped")
+
+        browser = browser_startups(str(tmp_path))
+        lines = breakdown_lines(timer, browser)
+
+        assert browser == (3, 4.5, 2)
+        assert [line.split()[0] for line in lines[1:]] == ["setup", "browser", "tests", "reporting", "total"]
+        assert "4.5s  (3 start(s) on 2 worker(s), part of tests)" in lines[2]
+        assert "install skipped" in lines[1]
@@ -0,0 +1,59 @@
+"""
+test_load.py - Load Test Unit Tests
+KosManager Automated Testing
+"""
+import pytest
+
+from load import Endpoint, LoadStats, LoadTest, percentile
+
+
+class TestLoadStats:
+    """Unit tests for percentile and per-endpoint summaries."""
+
+    def test_nearest_rank_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 0.50) == 50
+        assert percentile(values, 0.95) == 95
+        assert percentile(values, 0.99) == 99
+        assert percentile([], 0.5) is None
+
+    def test_summary_per_endpoint(self):
+        stats = LoadStats()
+        stats.duration = 2.0
+        for seconds in (0.1, 0.2, 0.3):
+            stats.record("api/invoices", seconds, size=2048)
+        stats.record("api/invoices", 1.0, ok=False, error="HTTP 500")
+        row = stats.summary()["endpoints"][0]
+        assert row["requests"] == 4
+        assert row["error_rate"] == 0.25
+        assert row["rps"] == 2.0
+        assert row["p50_ms"] == 200.0
+        assert row["top_errors"] == [("HTTP 500", 1)]
+        assert stats.table_lines()[-1].startswith("TOTAL")
+
+
+class TestLoadTest:
+    """Unit tests for the virtual owner loop, without a server."""
+
+    def test_owners_log_in_and_hit_weighted_endpoints(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(LoadTest, "_login", lambda self, http, email, password: (True, 0.01, None))
+
+        def fake_get(self, http, path):
+            calls.append(path)
+            return path != "/broken", 0.005, 100, None if path != "/broken" else "HTTP 500"
+
+        monkeypatch.setattr(LoadTest, "_get", fake_get)
+        endpoints = [Endpoint("ok", "/ok", weight=1), Endpoint("broken", "/broken", weight=0)]
+        load_test = LoadTest("http://app.test", [("a@b.c", "secret")], users=3, duration=0.2,
+                             think_time=(0.01, 0.02), ramp_up=0, endpoints=endpoints, seed=1)
+        stats = load_test.run()
+
+        assert stats.endpoints["login"].requests == 3
+        assert stats.endpoints["ok"].requests > 3
+        assert "broken" not in stats.endpoints
+        assert set(calls) == {"/ok"}
+
+    def test_accounts_required(self):
+        with pytest.raises(ValueError):
+            LoadTest("http://app.test", [])
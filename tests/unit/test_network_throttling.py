@@ -0,0 +1,93 @@
+"""
+test_network_throttling.py - Network Throttling Unit Tests
+KosManager Automated Testing
+"""
+import pytest
+
+from bench import NetworkReport, network_profiles
+from drivers import NETWORK_PROFILES, get_network_profile, reset_network
+from pages.base_page import BasePage
+
+
+class FakeDriver:
+    """Records CDP commands."""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {}
+
+
+class TestNetworkProfile:
+    """Unit tests for the CDP network profiles."""
+
+    def test_conditions_in_bytes_per_second(self):
+        conditions = NETWORK_PROFILES["slow-3g"].conditions()
+
+        assert conditions["latency"] == 2000
+        assert conditions["downloadThroughput"] == 50_000
+        assert conditions["offline"] is False
+        assert NETWORK_PROFILES["offline"].conditions()["offline"] is True
+
+    def test_apply_and_reset(self):
+        driver = FakeDriver()
+
+        NETWORK_PROFILES["fast-3g"].apply(driver)
+        assert [command for command, _ in driver.commands] == [
+            "Network.enable", "Network.emulateNetworkConditions"]
+        assert driver.network_profile.name == "fast-3g"
+
+        reset_network(driver)
+        assert driver.commands[-1][1]["downloadThroughput"] == -1
+        assert driver.network_profile is None
+
+    def test_page_timeout_follows_profile(self):
+        driver = FakeDriver()
+        assert BasePage(driver).timeout == 10
+
+        NETWORK_PROFILES["slow-3g"].apply(driver)
+        assert BasePage(driver).timeout == NETWORK_PROFILES["slow-3g"].page_timeout
+
+    def test_selection(self, monkeypatch):
+        monkeypatch.delenv("TEST_NETWORK_PROFILE", raising=False)
+        assert get_network_profile() is None
+        assert get_network_profile("none") is None
+
+        monkeypatch.setenv("TEST_NETWORK_PROFILE", "4g")
+        assert get_network_profile().name == "4g"
+        assert get_network_profile("offline").offline
+
+        with pytest.raises(ValueError, match="slow-3g"):
+            get_network_profile("edge")
+
+
+class TestNetworkReport:
+    """Unit tests for the per-profile timings report."""
+
+    def test_profiles_from_env(self, monkeypatch):
+        monkeypatch.setenv("TEST_NETWORK_PROFILES", "none,slow-3g")
+
+        assert network_profiles() == ["none", "slow-3g"]
+
+    def test_rows_sorted_by_flow_then_speed(self, tmp_path):
+        report = NetworkReport(str(tmp_path / "network_profiles.csv"))
+        page_load = {
+            "navigation": {"ttfb": 2100.0, "transfer_size": 5000},
+            "paint": {"fcp": 4300.5, "lcp": 6100.0},
+            "resources": {"count": 12, "transfer_bytes": 250_000},
+        }
+        report.add("slow-3g", "landing", 9.5, 2.25, page_load)
+        report.add("none", "landing", 0.4, 0.1)
+        report.add("offline", "landing", 0.01, error="ERR_INTERNET_DISCONNECTED")
+
+        slow = report.rows[0]
+        assert slow["load_ms"] == 9500.0
+        assert slow["interaction_ms"] == 2250.0
+        assert slow["transfer_bytes"] == 255_000
+        assert slow["lcp_ms"] == 6100.0
+        assert report.rows[1]["transfer_bytes"] is None
+
+        lines = open(report.write()).read().splitlines()
+        assert [line.split(",")[0] for line in lines[1:]] == ["none", "slow-3g", "offline"]
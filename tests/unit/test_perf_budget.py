@@ -0,0 +1,52 @@
+"""
+test_perf_budget.py - Performance Budget Unit Tests
+KosManager Automated Testing
+"""
+import pytest
+
+from perf.budget import BudgetFile, DEFAULT_BUDGET_FILE
+
+
+def record(route, lcp=None, api_calls=0, transfer_bytes=0, duration=None):
+    """Build a perf record like PerfRecorder writes."""
+    navigation = {"duration": duration} if duration is not None else {"ttfb": 50.0}
+    return {
+        "route": route,
+        "wall_s": 0.5,
+        "navigation": navigation,
+        "paint": {"lcp": lcp},
+        "resources": {"count": api_calls, "api_calls": api_calls,
+                      "transfer_bytes": transfer_bytes},
+    }
+
+
+class TestBudgetFile:
+    """Unit tests for route matching and limit checks."""
+
+    def test_repo_budget_file_loads(self):
+        budgets = BudgetFile.load(DEFAULT_BUDGET_FILE)
+        assert "lcp_ms" in budgets.limits_for("/dashboard")
+
+    def test_route_limits_override_defaults(self):
+        budgets = BudgetFile({"/dashboard": {"api_calls": 2}}, defaults={"api_calls": 10})
+        assert budgets.limits_for("/dashboard")["api_calls"] == 2
+        assert budgets.limits_for("/login")["api_calls"] == 10
+
+    def test_pattern_routes(self):
+        budgets = BudgetFile({"/dashboard/properties/*": {"lcp_ms": 2000}})
+        assert budgets.limits_for("/dashboard/properties/abc")["lcp_ms"] == 2000
+
+    def test_violations_reported_per_metric(self):
+        budgets = BudgetFile({"/dashboard/tenants": {"lcp_ms": 1500, "transfer_kb": 500}})
+        violations = budgets.check(record("/dashboard/tenants", lcp=1800.0,
+                                          transfer_bytes=600 * 1024))
+        assert sorted(v.metric for v in violations) == ["lcp_ms", "transfer_kb"]
+
+    def test_unmeasured_metric_is_skipped(self):
+        budgets = BudgetFile({"/dashboard": {"lcp_ms": 1500, "navigation_ms": 1000}})
+        violations = budgets.check(record("/dashboard", duration=1200.0))
+        assert [v.metric for v in violations] == ["navigation_ms"]
+
+    def test_unknown_metric_rejected(self):
+        with pytest.raises(ValueError):
+            BudgetFile({"/": {"lcp_seconds": 2}})
@@ -0,0 +1,71 @@
+"""
+test_perf_recorder.py - Performance Recorder Unit Tests
+KosManager Automated Testing
+"""
+import json
+
+from perf import PerfRecorder
+
+
+def raw_metrics(now=900.0, since_resources=True):
+    """Shape of the object returned by PERFORMANCE_JS."""
+    resources = [
+        {"name": "http://app.test/api/invoices", "type": "fetch", "start": 500.0,
+         "duration": 120.5, "transfer_size": 2048, "body_size": 1800},
+        {"name": "http://app.test/_next/static/app.js", "type": "script", "start": 20.0,
+         "duration": 40.0, "transfer_size": 10000, "body_size": 9000},
+    ]
+    return {
+        "url": "http://app.test/dashboard/invoices",
+        "route": "/dashboard/invoices",
+        "now": now,
+        "navigation": {"type": "navigate", "ttfb": 35.25, "load": 410.0},
+        "paint": {"fp": 100.0, "fcp": 120.0, "lcp": 350.0},
+        "resources": resources if since_resources else [],
+    }
+
+
+class FakeDriver:
+    def __init__(self, raw):
+        self.raw = raw
+
+    def execute_async_script(self, script, since):
+        return self.raw
+
+    def execute_script(self, script):
+        return 300.0
+
+
+class FakeItem:
+    nodeid = "tests/test_03_dashboard.py::TestDashboard::test_TC004_07"
+
+
+class TestPerfRecorder:
+    """Unit tests for PerfRecorder records and JSONL output."""
+
+    def test_page_load_is_attached_and_written(self, tmp_path):
+        path = tmp_path / "run" / "perf.jsonl"
+        recorder = PerfRecorder(str(path), "run1", "gw0")
+        item = FakeItem()
+        recorder.begin(item)
+        recorder.record_load(FakeDriver(raw_metrics()), 0.5)
+        recorder.end()
+
+        record = json.loads(path.read_text().splitlines()[0])
+        assert record["route"] == "/dashboard/invoices"
+        assert record["paint"]["lcp"] == 350.0
+        assert record["resources"]["api_calls"] == 1
+        assert record["resources"]["transfer_bytes"] == 12048
+        assert record["test"] == item.nodeid
+        assert item.perf_entries[0]["kind"] == "load"
+
+    def test_soft_navigation_reports_elapsed_time(self, tmp_path):
+        recorder = PerfRecorder(str(tmp_path / "perf.jsonl"), "run1", "gw0")
+        metrics = recorder.record_navigation(FakeDriver(raw_metrics(now=900.0)), 300.0, 0.6)
+        assert metrics["kind"] == "navigation"
+        assert metrics["navigation"]["duration"] == 600.0
+
+    def test_full_reload_during_click_is_a_page_load(self, tmp_path):
+        recorder = PerfRecorder(str(tmp_path / "perf.jsonl"), "run1", "gw0")
+        metrics = recorder.record_navigation(FakeDriver(raw_metrics(now=50.0)), 300.0, 0.6)
+        assert metrics["kind"] == "load"
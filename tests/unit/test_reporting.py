@@ -0,0 +1,159 @@
+"""
+test_reporting.py - Streaming JSONL Report Unit Tests
+KosManager Automated Testing
+"""
+import json
+import os
+
+from reporting import (
+    EventWriter,
+    IndexBuilder,
+    build_index,
+    final_outcome,
+    merge_events,
+    phase_event,
+    read_events,
+)
+from reporting.__main__ import main
+from reporting.plugin import events_name
+
+
+class Node:
+    def __init__(self, worker):
+        self.workerinput = {"workerid": worker}
+
+
+class Report:
+    def __init__(self, nodeid, when, outcome, worker="gw0", longrepr=None, properties=(), **extra):
+        self.nodeid = nodeid
+        self.when = when
+        self.outcome = outcome
+        self.failed = outcome == "failed"
+        self.skipped = outcome == "skipped"
+        self.duration = 0.5
+        self.stop = 1760700000.0
+        self.longrepr = longrepr
+        self.sections = [("Captured stdout call", "x" * 20)]
+        self.user_properties = list(properties)
+        self.node = Node(worker)
+        for name, value in extra.items():
+            setattr(self, name, value)
+
+
+def make_events(nodeid, call="passed", worker="gw0", properties=(), **extra):
+    """Setup/call/teardown events of one test."""
+    longrepr = "AssertionError: total 0" if call == "failed" else None
+    return [phase_event(Report(nodeid, "setup", "passed", worker), "run1"),
+            phase_event(Report(nodeid, "call", call, worker, longrepr, properties, **extra), "run1"),
+            phase_event(Report(nodeid, "teardown", "passed", worker), "run1")]
+
+
+def write_events(path, events):
+    writer = EventWriter(str(path))
+    for event in events:
+        writer.write(event)
+    writer.close()
+    return str(path)
+
+
+class TestEvents:
+    """Unit tests for phase events and the JSONL stream."""
+
+    def test_phase_event(self):
+        passed = phase_event(Report("t.py::test_a", "call", "passed", "gw3"), "run1", "2/4")
+        failed = phase_event(Report("t.py::test_b", "call", "failed", longrepr="E" * 30000,
+                                    properties=[("artifacts", {"dom": "/r/dom.html"})]), "run1")
+        skipped = phase_event(Report("t.py::test_c", "setup", "skipped",
+                                     longrepr=("t.py", 3, "Skipped: no server")), "run1")
+
+        assert passed["worker"] == "gw3" and passed["shard"] == "2/4"
+        assert "longrepr" not in passed and "sections" not in passed
+        assert len(failed["longrepr"]) < 20100 and failed["sections"][0][0] == "Captured stdout call"
+        assert failed["properties"] == {"artifacts": {"dom": "/r/dom.html"}}
+        assert skipped["longrepr"] == "Skipped: no server"
+
+    def test_stream_survives_torn_lines_and_merges(self, tmp_path):
+        first = write_events(tmp_path / "a" / "events-shard1of2.jsonl", make_events("t.py::test_a"))
+        second = write_events(tmp_path / "b" / "events-shard2of2.jsonl", make_events("t.py::test_b"))
+        with open(second, "a", encoding="utf-8") as handle:
+            handle.write('{"event": "phase", "nod')  # killed mid-write
+
+        merged = str(tmp_path / "all.jsonl")
+        assert merge_events([str(tmp_path)], merged) == 7
+        assert [event["nodeid"] for event in read_events([merged])] == \
+            ["t.py::test_a"] * 3 + ["t.py::test_b"] * 3
+        assert len(list(read_events([first, second]))) == 6
+
+    def test_shard_file_names(self):
+        assert events_name(1, 1) == "events.jsonl"
+        assert events_name(4, 2) == "events-shard2of4.jsonl"
+
+
+class TestIndex:
+    """Unit tests for the chunked HTML index."""
+
+    def test_outcomes(self):
+        def phases(*outcomes):
+            return [{"when": when, "outcome": outcome}
+                    for when, outcome in zip(("setup", "call", "teardown"), outcomes)]
+        assert final_outcome(phases("passed", "passed", "passed")) == "passed"
+        assert final_outcome(phases("failed")) == "error"
+        assert final_outcome(phases("skipped")) == "skipped"
+        assert final_outcome(phases("passed", "passed", "failed")) == "error"
+        assert final_outcome(phases("passed", "failed", "failed")) == "failed"
+        xfail = phases("passed", "skipped", "passed")
+        xfail[1]["xfail"] = "bug #12"
+        assert final_outcome(xfail) == "xfailed"
+        assert final_outcome(phases("passed")) == "incomplete"
+
+    def test_builds_chunks_with_relative_artifacts(self, tmp_path):
+        shot = str(tmp_path / "gw1" / "artifacts" / "t.py__test_3" / "call.png")
+        events = []
+        for number in range(5):
+            properties = [("artifacts", {"screenshot": shot})] if number == 3 else []
+            events += make_events(f"t.py::test_{number}", "failed" if number == 3 else "passed",
+                                  worker=f"gw{number % 2}", properties=properties)
+        path = write_events(tmp_path / "events.jsonl", events)
+
+        index, builder = build_index([path], str(tmp_path), chunk_size=2)
+
+        assert builder.totals == {"passed": 4, "failed": 1}
+        assert sorted(os.listdir(tmp_path / "index-data")) == \
+            ["details-0000.js", "details-0001.js", "details-0002.js",
+             "rows-0000.js", "rows-0001.js", "rows-0002.js"]
+        rows = (tmp_path / "index-data" / "rows-0001.js").read_text()
+        assert rows.startswith("kosReport.rows(1,[[\"t.py::test_2\",\"passed\"")
+        details = (tmp_path / "index-data" / "details-0001.js").read_text()
+        payload = json.loads(details[len("kosReport.details(1,"):-len(");\n")])
+        assert payload["1"]["artifacts"] == {"call": {"screenshot": "gw1/artifacts/t.py__test_3/call.png"}}
+        assert payload["1"]["phases"][1]["longrepr"] == "AssertionError: total 0"
+        html = open(index, encoding="utf-8").read()
+        assert '"chunks": 3' in html and "index-data/rows-" in html
+
+    def test_memory_holds_only_running_tests(self, tmp_path):
+        builder = IndexBuilder(str(tmp_path), chunk_size=3)
+        for number in range(10):
+            for event in make_events(f"t.py::test_{number}"):
+                builder.add(event)
+            assert len(builder.pending) == 0 and len(builder.rows) < 3
+        builder.add(make_events("t.py::test_hung")[0])
+        builder.finish()
+
+        assert builder.totals == {"passed": 10, "incomplete": 1}
+
+    def test_payload_cannot_close_the_script(self, tmp_path):
+        events = make_events("t.py::test_x", "failed")
+        events[1]["longrepr"] = "</script><script>alert(1)</script>"
+        build_index([write_events(tmp_path / "events.jsonl", events)], str(tmp_path))
+
+        assert "</script>" not in (tmp_path / "index-data" / "details-0000.js").read_text()
+
+    def test_command_line(self, tmp_path, capsys):
+        write_events(tmp_path / "s1" / "events-shard1of2.jsonl", make_events("t.py::test_a"))
+        write_events(tmp_path / "s2" / "events-shard2of2.jsonl", make_events("t.py::test_b", "failed"))
+
+        assert main(["index", str(tmp_path), "--out", str(tmp_path / "ci")]) == 0
+        assert "Indexed 2 test(s) from 2 file(s)" in capsys.readouterr().out
+        assert (tmp_path / "ci" / "index.html").exists()
+        (tmp_path / "empty").mkdir()
+        assert main(["index", str(tmp_path / "empty")]) == 1
@@ -0,0 +1,125 @@
+"""
+test_seeding.py - Data Factory & Seeder Unit Tests
+KosManager Automated Testing
+"""
+from datetime import date
+
+import pytest
+
+from seeding import ApiSeeder, DataFactory, PRESETS, SeedError, get_preset, seed_account
+from seeding.factory import add_months, property_code, room_number
+
+ANCHOR = date(2025, 6, 1)
+
+
+class FakeClient:
+    """Records API calls and answers them with generated ids."""
+
+    def __init__(self):
+        self.calls = []
+        self.tenants = []
+
+    def _id(self, kind):
+        return f"{kind}-{len(self.calls)}"
+
+    def create_property(self, name, address):
+        self.calls.append(("property", name))
+        return {"id": self._id("p")}
+
+    def create_room(self, property_id, number, price, status="available", facilities=None):
+        self.calls.append(("room", property_id, number, status))
+        return {"id": self._id("r")}
+
+    def bulk_create_tenants(self, rows):
+        self.calls.append(("bulk", len(rows)))
+        for row in rows:
+            self.tenants.append({"id": self._id("t"), "roomNumber": row["roomNumber"],
+                                 "isActive": True})
+        return {"success": len(rows), "failed": 0, "errors": []}
+
+    def list_tenants(self):
+        return list(self.tenants)
+
+    def create_invoice(self, tenant_id, amount, period):
+        self.calls.append(("invoice", tenant_id, period))
+        return {"id": self._id("i")}
+
+    def update_invoice_status(self, invoice_id, status):
+        self.calls.append(("pay", invoice_id))
+
+    def list_invoices(self):
+        return []
+
+    def kinds(self, kind):
+        return [call for call in self.calls if call[0] == kind]
+
+
+class TestDataFactory:
+    """Unit tests for generated accounts."""
+
+    def test_same_seed_builds_same_account(self):
+        first = DataFactory(seed=7, anchor=ANCHOR).build(PRESETS["small"])
+        second = DataFactory(seed=7, anchor=ANCHOR).build(PRESETS["small"])
+        assert first.rooms == second.rooms
+        assert first.invoices == second.invoices
+
+    def test_counts_match_preset(self):
+        preset = PRESETS["free_owner_full"]
+        plan = DataFactory(anchor=ANCHOR).build(preset)
+        assert plan.counts() == preset.expected_counts()
+        occupied = [room for room in plan.rooms if room["status"] == "occupied"]
+        assert len(occupied) == len(plan.tenants)
+
+    def test_10k_preset_size(self):
+        assert PRESETS["10k_invoices"].expected_counts()["invoices"] >= 10_000
+
+    def test_room_numbers_unique_per_owner(self):
+        plan = DataFactory(anchor=ANCHOR).build(PRESETS["free_owner_full"])
+        numbers = [room["room_number"] for room in plan.rooms]
+        assert len(numbers) == len(set(numbers))
+
+    def test_invoices_cover_recent_months(self):
+        plan = DataFactory(anchor=ANCHOR).build(PRESETS["small"])
+        tenant = plan.tenants[0]
+        invoices = plan.invoices_of(tenant["id"])
+        assert [invoice["period"] for invoice in invoices] == [
+            date(2025, 4, 1), date(2025, 5, 1), date(2025, 6, 1)]
+        assert tenant["start_date"].replace(day=1) == date(2025, 4, 1)
+        assert invoices[-1]["status"] == "unpaid"
+        assert all(invoice["paid_at"] for invoice in invoices if invoice["status"] == "paid")
+
+    def test_upload_rows_match_tenant_upload_data(self):
+        plan = DataFactory(anchor=ANCHOR).build(PRESETS["small"])
+        row = plan.tenant_upload_rows()[0]
+        assert set(row) == {"name", "phoneNumber", "roomNumber", "startDate", "dueDate"}
+        assert row["phoneNumber"].startswith("08")
+
+    def test_helpers(self):
+        assert [property_code(i) for i in (0, 25, 26)] == ["A", "Z", "AA"]
+        assert room_number(1, 10) == "B201"
+        assert add_months(date(2025, 1, 1), -2) == date(2024, 11, 1)
+
+    def test_unknown_preset(self):
+        with pytest.raises(ValueError):
+            get_preset("huge")
+
+
+class TestApiSeeder:
+    """Unit tests for the order and batching of API calls."""
+
+    def test_single_property_uses_bulk_upload(self):
+        client = FakeClient()
+        plan = DataFactory(anchor=ANCHOR).build(PRESETS["small"])
+        result = ApiSeeder(client, workers=1, batch_size=4).seed(plan)
+
+        assert len(client.kinds("room")) == len(plan.rooms)
+        assert all(call[3] != "occupied" for call in client.kinds("room"))
+        assert [call[1] for call in client.kinds("bulk")] == [4, 2]
+        # The bulk route already created each tenant's first invoice
+        assert len(client.kinds("invoice")) == len(plan.invoices) - len(plan.tenants)
+        assert set(result.tenant_ids) == {tenant["id"] for tenant in plan.tenants}
+
+    def test_pro_preset_refused_over_api(self):
+        plan = DataFactory(anchor=ANCHOR).build(PRESETS["pro_owner_500_rooms"])
+        with pytest.raises(SeedError):
+            seed_account(FakeClient(), plan, backend="api")
@@ -0,0 +1,116 @@
+"""
+test_sharding.py - Duration-Aware Sharding Unit Tests
+KosManager Automated Testing
+"""
+import pytest
+
+from sharding import DurationHistory, ShardPlan, bundle_key, fixture_needs
+from sharding.plugin import make_duration_scheduling
+
+
+def history(durations, needs=None):
+    result = DurationHistory("unused.json")
+    for nodeid, duration in durations.items():
+        result.update(nodeid, duration, (needs or {}).get(nodeid))
+    return result
+
+
+class TestDurationHistory:
+    """Unit tests for recorded durations."""
+
+    def test_smoothing_and_defaults(self):
+        recorded = history({"a.py::test_a": 10.0, "b.py::test_b": 2.0, "c.py::test_c": 4.0})
+        recorded.update("a.py::test_a", 20.0)
+
+        assert recorded.duration("a.py::test_a") == 13.0
+        assert recorded.tests["a.py::test_a"]["runs"] == 2
+        assert recorded.duration("new.py::test_new") == 4.0
+        assert DurationHistory("unused.json").duration("x.py::test_x") == 5.0
+
+    def test_save_and_load(self, tmp_path):
+        recorded = history({"a.py::T::test_a": 1.5}, needs={"a.py::T::test_a": ["browser"]})
+        recorded.path = str(tmp_path / "durations.json")
+        recorded.save()
+
+        loaded = DurationHistory.load(recorded.path)
+        assert loaded.duration("a.py::T::test_a") == 1.5
+        assert loaded.needs("a.py::T::test_a") == ["browser"]
+        assert DurationHistory.load(str(tmp_path / "missing.json")).tests == {}
+
+    def test_fixture_needs(self):
+        assert fixture_needs(["request", "driver", "api_client"]) == \
+            ["browser", "logged_in", "mutating"]
+        assert fixture_needs(["tmp_path"]) == []
+
+
+class TestShardPlan:
+    """Unit tests for longest-job-first packing."""
+
+    def test_bundle_key(self):
+        assert bundle_key("tests/test_03_dashboard.py::TestDashboard::test_TC004_01") == \
+            "tests/test_03_dashboard.py::TestDashboard"
+        assert bundle_key("tests/unit/test_x.py::test_y[a::b]") == "tests/unit/test_x.py"
+
+    def test_balances_close_to_ideal(self):
+        durations = {f"m{i}.py::T::test_{j}": float(i + 1) for i in range(12) for j in range(3)}
+        plan = ShardPlan([(nodeid, []) for nodeid in durations], 4, history(durations))
+
+        assert plan.total == 234.0
+        assert plan.wall_time <= plan.ideal * 1.1
+        assert sorted(nodeid for shard in plan.shards for nodeid in shard.nodeids()) == \
+            sorted(durations)
+
+    def test_class_stays_together_in_collection_order(self):
+        tests = [("t1.py::TestLogin::test_a", []), ("t1.py::TestLogin::test_b", []),
+                 ("t2.py::TestLogout::test_a", []), ("t1.py::TestLogin::test_c", [])]
+        plan = ShardPlan(tests, 2, history({"t2.py::TestLogout::test_a": 30.0}, {}))
+
+        login = plan.shards[plan.shard_of("t1.py::TestLogin::test_a")]
+        assert login.nodeids() == ["t1.py::TestLogin::test_a", "t1.py::TestLogin::test_b",
+                                   "t1.py::TestLogin::test_c"]
+        assert plan.shard_of("t2.py::TestLogout::test_a") != login.index
+
+    def test_same_needs_share_a_shard_when_loads_tie(self):
+        tests = [("a.py::A::test", ["logged_in"]), ("b.py::B::test", []),
+                 ("c.py::C::test", ["logged_in"]), ("d.py::D::test", [])]
+        plan = ShardPlan(tests, 2, history({nodeid: 10.0 for nodeid, _ in tests}))
+
+        assert plan.shard_of("a.py::A::test") == plan.shard_of("c.py::C::test")
+        assert plan.wall_time == 20.0
+
+    def test_needs_one_shard(self):
+        with pytest.raises(ValueError):
+            ShardPlan([], 0, history({}))
+
+
+class TestDurationScheduling:
+    """Unit tests for the xdist scheduler."""
+
+    def test_longest_bundle_goes_first(self):
+        pytest.importorskip("xdist")
+
+        class Config:
+            duration_history = history({"a.py::A::test_1": 1.0, "b.py::B::test_1": 50.0,
+                                        "c.py::C::test_1": 8.0})
+
+            def getvalue(self, name):
+                return ["popen"] if name == "tx" else None
+
+        class Node:
+            def __init__(self):
+                self.sent = []
+
+            def send_runtest_some(self, indexes):
+                self.sent.append(indexes)
+
+        scheduler = make_duration_scheduling(Config(), log=None)
+        node = Node()
+        collection = ["a.py::A::test_1", "b.py::B::test_1", "c.py::C::test_1"]
+        scheduler.registered_collections[node] = collection
+        for nodeid in collection:
+            scheduler.workqueue[bundle_key(nodeid)] = {nodeid: False}
+
+        scheduler._assign_work_unit(node)
+        scheduler._assign_work_unit(node)
+
+        assert node.sent == [[1], [2]]
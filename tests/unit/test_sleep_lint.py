@@ -0,0 +1,44 @@
+"""
+test_sleep_lint.py - Hard Sleep Lint Unit Tests
+KosManager Automated Testing
+"""
+from pages.sleep_lint import find_hard_sleeps
+from pages.waits import HardSleepTracker
+
+
+SOURCE = '''
+import time
+
+def test_example(page):
+    page.wait(2)
+    time.sleep(0.5)
+    page.wait_for_network_idle()
+    page.wait(seconds)
+    time.sleep(1)  # hard-sleep: ok
+    release = threading.Event()
+    release.wait(5)
+    self.wait(1)
+    tenants_page.open().wait(3)
+    self.dashboard_page.wait(1)
+'''
+
+
+class TestSleepLint:
+    """Unit tests for the hard sleep scanner and runtime tracker."""
+
+    def test_finds_literal_sleeps_only(self):
+        found = find_hard_sleeps(SOURCE, "example.py")
+        assert [lineno for _, lineno, _ in found] == [5, 6, 12, 13, 14]
+        assert found[0][2] == "page.wait(2)"
+
+    def test_other_waits_are_not_sleeps(self):
+        found = find_hard_sleeps("done.wait(5)\nself.ready.wait(2)\ncondition.wait(0.1)\n")
+        assert found == []
+
+    def test_tracker_groups_by_call_site(self):
+        tracker = HardSleepTracker()
+        for _ in range(2):
+            tracker.record(1.5, stack_depth=2)
+        assert tracker.total_seconds == 3.0
+        assert sum(tracker.calls.values()) == 2
+        assert "test_sleep_lint.py" in tracker.summary_lines()[1]
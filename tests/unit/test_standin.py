@@ -0,0 +1,186 @@
+"""
+test_standin.py - Stand-in Backend Unit Tests
+KosManager Automated Testing
+"""
+import time
+
+import pytest
+import requests
+
+from api import ApiError, AuthError, KosManagerClient
+from seeding import PRESETS, DataFactory
+from standin import Faults, StandinServer, Store
+
+OWNER_EMAIL = "test@example.com"
+OWNER_PASSWORD = "password123"
+
+
+@pytest.fixture
+def standin():
+    with StandinServer(Store.from_file()) as server:
+        yield server
+
+
+@pytest.fixture
+def client(standin):
+    with KosManagerClient(standin.url) as client:
+        client.login(OWNER_EMAIL, OWNER_PASSWORD)
+        yield client
+
+
+class TestAuth:
+    """Unit tests for the NextAuth stand-in."""
+
+    def test_login_and_session(self, standin, client):
+        session = client.http.get(f"{standin.url}/api/auth/session").json()
+
+        assert session["user"]["email"] == OWNER_EMAIL
+        assert session["expires"].endswith("Z")
+
+    def test_wrong_password(self, standin):
+        with KosManagerClient(standin.url) as client:
+            with pytest.raises(AuthError, match="CredentialsSignin"):
+                client.login(OWNER_EMAIL, "wrong-password")
+            with pytest.raises(ApiError) as error:
+                client.list_properties()
+        assert error.value.status == 401
+
+    def test_register_then_login(self, standin):
+        with KosManagerClient(standin.url) as client:
+            user = client.register("Owner Baru", "baru@kosmanager.com", "rahasia123")
+            client.login("baru@kosmanager.com", "rahasia123")
+
+            assert user["fullName"] == "Owner Baru"
+            assert client.list_properties() == []
+            with pytest.raises(ApiError, match="Email sudah terdaftar"):
+                client.register("Owner Baru", "baru@kosmanager.com", "rahasia123")
+
+    def test_dashboard_redirects_without_session(self, standin, client):
+        anonymous = requests.get(f"{standin.url}/dashboard", allow_redirects=False)
+        logged_in = client.http.get(f"{standin.url}/dashboard/tenants")
+
+        assert anonymous.status_code == 307
+        assert anonymous.headers["Location"] == "/login"
+        assert logged_in.status_code == 200
+
+
+class TestRoutes:
+    """Unit tests for the /api contracts over the fixtures."""
+
+    def test_fixtures_are_listed(self, client):
+        invoices = client.list_invoices()
+
+        assert [prop["name"] for prop in client.list_properties()] == ["Kos Melati A"]
+        assert [room["roomNumber"] for room in client.list_available_rooms()] == ["A103"]
+        assert len(client.list_active_tenants()) == 2
+        assert len(invoices) == 5
+        assert {"tenantName", "roomNumber", "propertyName", "paidAt"} <= set(invoices[0])
+
+    def test_check_in_bill_and_check_out(self, client):
+        room = client.list_available_rooms()[0]
+        tenant = client.create_tenant(room["id"], "Andi Pratama", "081298765432", "2026-10-01", 1)
+        invoice = client.create_invoice(tenant["id"], room["price"], "2026-10-01")
+        paid = client.update_invoice_status(invoice["id"], "paid")
+
+        assert client.list_available_rooms() == []
+        assert paid["paidAt"].endswith("Z")
+        with pytest.raises(ApiError, match="periode ini sudah ada"):
+            client.create_invoice(tenant["id"], room["price"], "2026-10-01")
+
+        client.checkout_tenant(tenant["id"])
+        detail = client.get_tenant(tenant["id"])
+        assert detail["isActive"] is False
+        assert detail["room"]["property"]["name"] == "Kos Melati A"
+        assert [row["status"] for row in detail["invoices"]] == ["paid"]
+
+    def test_validation_messages(self, client):
+        prop_id = client.list_properties()[0]["id"]
+
+        with pytest.raises(ApiError, match="Harga minimal Rp 100.000"):
+            client.create_room(prop_id, "A105", 50000)
+        with pytest.raises(ApiError, match="Nomor kamar sudah ada"):
+            client.create_room(prop_id, "A101", 1500000)
+        with pytest.raises(ApiError, match="Format nomor telepon"):
+            client.create_tenant(client.list_available_rooms()[0]["id"], "Andi", "12345678901",
+                                 "2026-10-01", 1)
+
+    def test_free_plan_limit_and_cascade(self, client):
+        prop = client.create_property("Kos Mawar B", "Jl. Mawar No. 3, Depok")
+        with pytest.raises(ApiError) as error:
+            client.create_property("Kos Kenanga C", "Jl. Kenanga No. 9, Malang")
+        assert error.value.status == 403
+        assert error.value.body["upgradeRequired"] is True
+
+        room = client.create_room(prop["id"], "B101", 900000, facilities=["WiFi"])
+        client.delete_created()
+        with pytest.raises(ApiError) as error:
+            client.update_room(room["id"], "B101", 900000)
+        assert error.value.status == 404
+
+    def test_other_owners_rows_are_hidden(self, standin, client):
+        tenant_id = client.list_tenants()[0]["id"]
+        with KosManagerClient(standin.url) as other:
+            other.login("testuser@kosmanager.com", "TestPassword123")
+
+            assert other.list_invoices() == []
+            with pytest.raises(ApiError) as error:
+                other.get_tenant(tenant_id)
+        assert error.value.status == 403
+
+
+class TestSeeding:
+    """Unit tests for loading SeedPlans into the store."""
+
+    def test_bulk_upload_only_for_single_property_owners(self):
+        store = Store()
+        plan = DataFactory(seed=1).build(PRESETS["free_owner_full"], email="full@kosmanager.com")
+        store.seed(plan, OWNER_PASSWORD)
+        counts = store.counts()
+
+        with StandinServer(store) as server, KosManagerClient(server.url) as client:
+            client.login("full@kosmanager.com", OWNER_PASSWORD)
+            free_room = client.list_available_rooms()[0]
+            result = client.bulk_create_tenants([{
+                "name": "Dewi Kusuma", "phoneNumber": "081311112222",
+                "roomNumber": free_room["roomNumber"], "startDate": "2026-10-01", "dueDate": "1",
+            }])
+
+        assert counts["invoices"] == len(plan.invoices)
+        assert result["success"] == 0
+        assert "tidak ditemukan atau sudah terisi" in result["errors"][0]["error"]
+
+
+class TestFaults:
+    """Unit tests for artificial latency and error injection."""
+
+    def test_error_rate_only_on_fault_paths(self):
+        faults = Faults(error_rate=1.0, paths=["/api/invoices"])
+        with StandinServer(Store.from_file(), faults=faults) as server, \
+                KosManagerClient(server.url) as client:
+            client.login(OWNER_EMAIL, OWNER_PASSWORD)
+
+            assert client.list_properties()
+            with pytest.raises(ApiError) as error:
+                client.list_invoices()
+        assert error.value.status == 500
+        assert error.value.body == {"error": "Terjadi kesalahan server"}
+
+    def test_latency(self):
+        with StandinServer(faults=Faults(latency_ms=50, paths=["/dashboard"])) as server:
+            started = time.perf_counter()
+            requests.get(f"{server.url}/dashboard", allow_redirects=False)
+            elapsed = time.perf_counter() - started
+
+        assert elapsed >= 0.05
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("TEST_STANDIN_LATENCY_MS", "120")
+        monkeypatch.setenv("TEST_STANDIN_ERROR_RATE", "0.25")
+        monkeypatch.setenv("TEST_STANDIN_FAULT_PATHS", "/api/tenants")
+        faults = Faults.from_env()
+
+        assert (faults.latency_ms, faults.error_rate) == (120, 0.25)
+        assert faults.applies_to("/api/tenants/bulk")
+        assert not faults.applies_to("/api/invoices")
+        with pytest.raises(ValueError):
+            Faults(error_rate=1.5)